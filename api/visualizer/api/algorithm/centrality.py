@@ -0,0 +1,138 @@
+"""
+Centrality measures over the adjacency matrix of a graph (see `Graph.to_adjacency`).
+
+The measures rank the nodes by their importance in the structure of the graph. They visit every
+edge many times, so on large graphs they are meant to be computed once per version of the graph,
+away from the threads that serve users (see `CentralityIndex`). Nodes are identified by their
+index in the matrix, and the scores are returned as float arrays in the order of the indices.
+"""
+import math
+import random
+from array import array
+from operator import sub
+from typing import List, Sequence
+
+from visualizer.api.model.adjacency import AdjacencyMatrix
+
+SCORE_TYPE: str = "d"
+
+
+def pagerank(adjacency: AdjacencyMatrix, damping: float = 0.85, tolerance: float = 1e-6,
+             max_iterations: int = 100) -> array:
+    """
+    Compute the PageRank of every node by power iteration over the sparse matrix.
+
+    Every iteration lets each node pull the shares of rank of its predecessors through the
+    transposed matrix. The rank of nodes without outgoing edges is spread over all nodes, so the
+    ranks always sum up to 1.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+    :param damping: The probability of following an edge rather than jumping to any node.
+    :type damping: float
+    :param tolerance: The change of the ranks (as the sum of the absolute differences) below
+                      which they are considered converged.
+    :type tolerance: float
+    :param max_iterations: The maximum number of iterations.
+    :type max_iterations: int
+
+    :return: The rank of every node, by index.
+    :rtype: array
+
+    :raises ValueError: If the damping is not between 0 and 1.
+    """
+    if not 0 <= damping <= 1:
+        raise ValueError(f"Invalid damping: Expected a number between 0 and 1, but got {damping}.")
+    node_count: int = adjacency.get_node_count()
+    if node_count == 0:
+        return array(SCORE_TYPE)
+
+    offsets: array = adjacency.offsets
+    out_degrees: List[int] = [offsets[row + 1] - offsets[row] for row in range(node_count)]
+    dangling: List[int] = [row for row, degree in enumerate(out_degrees) if degree == 0]
+    transposed: AdjacencyMatrix = adjacency.transpose()
+    in_offsets: array = transposed.offsets
+    sources: array = transposed.targets
+
+    ranks: List[float] = [1 / node_count] * node_count
+    for _ in range(max_iterations):
+        shares: List[float] = [rank / degree if degree else 0.0 for rank, degree in zip(ranks, out_degrees)]
+        share = shares.__getitem__
+        base: float = (1 - damping + damping * math.fsum(ranks[row] for row in dangling)) / node_count
+        next_ranks: List[float] = [
+            base + damping * sum(map(share, sources[in_offsets[row]:in_offsets[row + 1]])) for row in range(node_count)
+        ]
+        change: float = math.fsum(map(abs, map(sub, next_ranks, ranks)))
+        ranks = next_ranks
+        if change < tolerance:
+            break
+    return array(SCORE_TYPE, ranks)
+
+
+def betweenness(adjacency: AdjacencyMatrix, samples: int = 32, seed: int = 0) -> array:
+    """
+    Estimate the betweenness of every node: the share of the shortest paths between other nodes
+    that pass through it, following the direction of the edges.
+
+    The shortest paths are counted from a random sample of source nodes only (Brandes' algorithm
+    with sampled pivots), and the counts are scaled up to all sources. With at least as many
+    samples as nodes, the result is exact. The scores are normalized by the number of pairs of
+    other nodes, so they are between 0 and 1.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+    :param samples: The number of source nodes to count the shortest paths from.
+    :type samples: int
+    :param seed: The seed of the random choice of the sources, so results are reproducible.
+    :type seed: int
+
+    :return: The estimated betweenness of every node, by index.
+    :rtype: array
+
+    :raises ValueError: If the number of samples is less than 1.
+    """
+    if samples < 1:
+        raise ValueError(f"Invalid number of samples: Expected at least 1, but got {samples}.")
+    node_count: int = adjacency.get_node_count()
+    scores: List[float] = [0.0] * node_count
+    if node_count < 3:
+        return array(SCORE_TYPE, scores)
+
+    sources: Sequence[int] = range(node_count) if samples >= node_count else \
+        random.Random(seed).sample(range(node_count), samples)
+    for source in sources:
+        __accumulate(adjacency, source, scores)
+    scale: float = node_count / len(sources) / ((node_count - 1) * (node_count - 2))
+    return array(SCORE_TYPE, [score * scale for score in scores])
+
+
+def __accumulate(adjacency: AdjacencyMatrix, source: int, scores: List[float]) -> None:
+    # count the shortest paths from the source breadth-first, then add the dependencies of the
+    # source on every node, from the farthest nodes back through the edges of the shortest paths
+    offsets: array = adjacency.offsets
+    targets: array = adjacency.targets
+    node_count: int = len(offsets) - 1
+    distances: List[int] = [-1] * node_count
+    paths: List[int] = [0] * node_count
+    distances[source] = 0
+    paths[source] = 1
+    order: List[int] = [source]
+    for node in order:
+        next_distance: int = distances[node] + 1
+        for successor in targets[offsets[node]:offsets[node + 1]]:
+            if distances[successor] < 0:
+                distances[successor] = next_distance
+                order.append(successor)
+            if distances[successor] == next_distance:
+                paths[successor] += paths[node]
+
+    dependencies: List[float] = [0.0] * node_count
+    for node in reversed(order):
+        next_distance = distances[node] + 1
+        dependency: float = 0.0
+        for successor in targets[offsets[node]:offsets[node + 1]]:
+            if distances[successor] == next_distance:
+                dependency += (1 + dependencies[successor]) / paths[successor]
+        dependencies[node] = dependency = dependency * paths[node]
+        if node != source:
+            scores[node] += dependency
@@ -0,0 +1,175 @@
+"""
+Shortest paths between two nodes of a graph.
+
+Unlike the traversals in `traversal`, which expand whole frontiers over the adjacency matrix,
+these searches stop as soon as the path is found and follow the edges of the storage directly,
+so a query only visits the part of the graph around its endpoints and does not have to build
+the matrix of the whole graph first.
+"""
+import heapq
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+
+
+def shortest_path(graph: Graph, source: Node, destination: Node) -> Optional[List[Node]]:
+    """
+    Find a path with the fewest edges from one node to another, following the direction of the
+    edges.
+
+    The search is a bidirectional breadth-first search: it expands a level forward from the
+    source or backward from the destination, whichever frontier is smaller, until they meet.
+
+    :param graph: The graph to search.
+    :type graph: Graph
+    :param source: The node the path starts at.
+    :type source: Node
+    :param destination: The node the path ends at.
+    :type destination: Node
+
+    :return: The nodes of the path from `source` to `destination`, or `None` if there is none.
+    :rtype: Optional[List[Node]]
+
+    :raises ValueError: If a node is not in the graph.
+    """
+    __check_nodes(graph, source, destination)
+    if source.id == destination.id:
+        return [source]
+
+    # the node every reached node was reached from, and its distance from the start of its side
+    forward: Dict[str, Tuple[Optional[Node], int]] = {source.id: (None, 0)}
+    backward: Dict[str, Tuple[Optional[Node], int]] = {destination.id: (None, 0)}
+    forward_frontier: List[Node] = [source]
+    backward_frontier: List[Node] = [destination]
+    storage = graph.storage
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = __expand(forward_frontier, storage.successors, forward, backward)
+        else:
+            backward_frontier, meeting = __expand(backward_frontier, storage.predecessors, backward, forward)
+        if meeting is not None:
+            path: List[Node] = list(__trace(forward, meeting))
+            path.reverse()
+            return path + list(__trace(backward, meeting))[1:]
+    return None
+
+
+def weighted_shortest_path(graph: Graph, source: Node, destination: Node,
+                           weight_key: str) -> Optional[Tuple[float, List[Node]]]:
+    """
+    Find the path with the lowest total weight from one node to another, following the direction
+    of the edges.
+
+    The weight of an edge is its property `weight_key`. Edges without the property weigh 1.
+    The search is a bidirectional Dijkstra's algorithm with a binary heap per direction: it settles
+    the closest node forward from the source or backward from the destination, whichever is
+    closer, and stops once no path through an unsettled node can be lighter than the lightest one
+    found where the searches met.
+
+    :param graph: The graph to search.
+    :type graph: Graph
+    :param source: The node the path starts at.
+    :type source: Node
+    :param destination: The node the path ends at.
+    :type destination: Node
+    :param weight_key: The name of the edge property holding the weight.
+    :type weight_key: str
+
+    :return: The total weight and the nodes of the path from `source` to `destination`, or
+             `None` if there is no path.
+    :rtype: Optional[Tuple[float, List[Node]]]
+
+    :raises ValueError: If a node is not in the graph, or if an edge on the way has a weight that
+                        is not a number or negative.
+    """
+    __check_nodes(graph, source, destination)
+    if source.id == destination.id:
+        return 0, [source]
+
+    storage = graph.storage
+    # the node every reached node was reached from, and its distance from the start of its side
+    forward: Dict[str, Tuple[Optional[Node], float]] = {source.id: (None, 0)}
+    backward: Dict[str, Tuple[Optional[Node], float]] = {destination.id: (None, 0)}
+    # the counter orders entries of equal distance, so nodes are never compared
+    order: Iterator[int] = count()
+    forward_heap: List[Tuple[float, int, Node]] = [(0, next(order), source)]
+    backward_heap: List[Tuple[float, int, Node]] = [(0, next(order), destination)]
+    best: float = float("inf")
+    meeting: Optional[Node] = None
+    while forward_heap and backward_heap and forward_heap[0][0] + backward_heap[0][0] < best:
+        if forward_heap[0][0] <= backward_heap[0][0]:
+            heap, reached, other = forward_heap, forward, backward
+            edges, end = storage.out_edges, __destination
+        else:
+            heap, reached, other = backward_heap, backward, forward
+            edges, end = storage.in_edges, __source
+        distance, _, node = heapq.heappop(heap)
+        if distance > reached[node.id][1]:
+            continue  # an outdated entry of a node that was reached on a shorter way since
+        for edge in edges(node):
+            next_node: Node = end(edge)
+            next_distance: float = distance + __weight(edge.peek_properties(), weight_key, edge)
+            known: Optional[Tuple[Optional[Node], float]] = reached.get(next_node.id, None)
+            if known is None or next_distance < known[1]:
+                reached[next_node.id] = (node, next_distance)
+                heapq.heappush(heap, (next_distance, next(order), next_node))
+            other_side: Optional[Tuple[Optional[Node], float]] = other.get(next_node.id, None)
+            if other_side is not None and next_distance + other_side[1] < best:
+                best, meeting = next_distance + other_side[1], next_node
+
+    if meeting is None:
+        return None
+    path: List[Node] = list(__trace(forward, meeting))
+    path.reverse()
+    return best, path + list(__trace(backward, meeting))[1:]
+
+
+def __expand(frontier: List[Node], neighbors: Callable[[Node], Iterable[Node]],
+             reached: Dict[str, Tuple[Optional[Node], int]],
+             other: Dict[str, Tuple[Optional[Node], int]]) -> Tuple[List[Node], Optional[Node]]:
+    # expand the whole level, so the meeting node closest to the other end can be chosen
+    next_frontier: List[Node] = []
+    meeting: Optional[Node] = None
+    meeting_distance: int = 0
+    distance: int = reached[frontier[0].id][1] + 1
+    for node in frontier:
+        for neighbor in neighbors(node):
+            if neighbor.id in reached:
+                continue
+            reached[neighbor.id] = (node, distance)
+            next_frontier.append(neighbor)
+            other_side: Optional[Tuple[Optional[Node], int]] = other.get(neighbor.id, None)
+            if other_side is not None and (meeting is None or other_side[1] < meeting_distance):
+                meeting, meeting_distance = neighbor, other_side[1]
+    return next_frontier, meeting
+
+
+def __source(edge: Edge) -> Node:
+    return edge.source
+
+
+def __destination(edge: Edge) -> Node:
+    return edge.destination
+
+
+def __trace(reached: Dict[str, Tuple[Optional[Node], Any]], node: Node) -> Iterator[Node]:
+    # follow the nodes every node was reached from, back to the start of the search
+    while node is not None:
+        yield node
+        node = reached[node.id][0]
+
+
+def __weight(properties: Dict[str, Any], weight_key: str, edge: Edge) -> float:
+    weight: Any = properties.get(weight_key, 1)
+    if type(weight) not in (int, float) or not weight >= 0:
+        raise ValueError(f"Invalid weight of edge {edge}: Expected a number of at least 0, but got {weight!r}.")
+    return weight
+
+
+def __check_nodes(graph: Graph, *nodes: Node) -> None:
+    for node in nodes:
+        if graph.get_node(node.id) is None:
+            raise ValueError(f"Node with ID '{node.id}' not found in the graph.")
@@ -0,0 +1,369 @@
+"""
+Traversals over the adjacency matrix of a graph (see `Graph.to_adjacency`).
+
+The traversals are frontier-based: every step expands a whole frontier of node indices through
+the CSR arrays of the matrix and marks the visited nodes in a byte array, so no `Node` or `Edge`
+objects are touched. Nodes are identified by their index in the matrix.
+"""
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+from visualizer.api.model.adjacency import INDEX_TYPE, AdjacencyMatrix
+
+
+def bfs(adjacency: AdjacencyMatrix, sources: Iterable[int], visited: Optional[bytearray] = None,
+        depth: Optional[int] = None) -> List[int]:
+    """
+    Visit the nodes reachable from the sources in breadth-first order.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+    :param sources: The indices of the nodes to start from.
+    :type sources: Iterable[int]
+    :param visited: Marks of the nodes that were already visited. They are neither visited nor
+                    traversed again, and the newly visited nodes are marked. Defaults to no marks.
+    :type visited: Optional[bytearray]
+    :param depth: The maximal number of edges from the sources, or `None` for no limit.
+    :type depth: Optional[int]
+
+    :return: The indices of the newly visited nodes, level by level.
+    :rtype: List[int]
+    """
+    if visited is None:
+        visited = bytearray(adjacency.get_node_count())
+    frontier: List[int] = __mark(sources, visited)
+    order: List[int] = list(frontier)
+    level: int = 0
+    while frontier and (depth is None or level < depth):
+        frontier = __expand(adjacency, frontier, visited)
+        order.extend(frontier)
+        level += 1
+    return order
+
+
+def bfs_levels(adjacency: AdjacencyMatrix, sources: Iterable[int]) -> array:
+    """
+    Compute the number of edges on the shortest path from the sources to every node.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+    :param sources: The indices of the nodes to start from.
+    :type sources: Iterable[int]
+
+    :return: The distance of every node by index, or -1 for nodes that cannot be reached.
+    :rtype: array
+    """
+    levels: array = array(INDEX_TYPE, [-1]) * adjacency.get_node_count()
+    visited: bytearray = bytearray(adjacency.get_node_count())
+    frontier: List[int] = __mark(sources, visited)
+    level: int = 0
+    while frontier:
+        for node in frontier:
+            levels[node] = level
+        frontier = __expand(adjacency, frontier, visited)
+        level += 1
+    return levels
+
+
+def reachable(adjacency: AdjacencyMatrix, sources: Iterable[int]) -> bytearray:
+    """
+    Find the nodes reachable from the sources, including the sources themselves.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+    :param sources: The indices of the nodes to start from.
+    :type sources: Iterable[int]
+
+    :return: A mark for every node by index: 1 if it can be reached, 0 otherwise.
+    :rtype: bytearray
+    """
+    visited: bytearray = bytearray(adjacency.get_node_count())
+    bfs(adjacency, sources, visited)
+    return visited
+
+
+def neighborhood(adjacency: AdjacencyMatrix, source: int, depth: int, directed: bool = True) -> List[int]:
+    """
+    Find the nodes at most `depth` edges away from a node.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+    :param source: The index of the node in the middle of the neighborhood.
+    :type source: int
+    :param depth: The maximal number of edges from the node.
+    :type depth: int
+    :param directed: Whether only edges leaving the nodes are followed, or edges in both directions.
+    :type directed: bool
+
+    :return: The indices of the nodes in the neighborhood, starting with `source`, level by level.
+    :rtype: List[int]
+    """
+    return bfs(adjacency if directed else undirected(adjacency), [source], depth=depth)
+
+
+def traversal_roots(adjacency: AdjacencyMatrix) -> List[int]:
+    """
+    Choose the nodes to start traversals from so that every node is reached.
+
+    The nodes are taken in the order of the matrix: a node that is not reachable from the roots
+    chosen before it becomes a root itself.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+
+    :return: The indices of the roots, in ascending order.
+    :rtype: List[int]
+    """
+    visited: bytearray = bytearray(adjacency.get_node_count())
+    roots: List[int] = []
+    start: int = visited.find(0)
+    while start >= 0:
+        roots.append(start)
+        bfs(adjacency, [start], visited)
+        start = visited.find(0, start + 1)
+    return roots
+
+
+def condensation_roots(adjacency: AdjacencyMatrix) -> List[int]:
+    """
+    Choose the nodes to start traversals from so that every node is reached, one per strongly
+    connected component without incoming edges from other components.
+
+    Contracting the strongly connected components leaves an acyclic graph, whose components
+    without incoming edges reach all others. Unlike `traversal_roots`, a node that merely comes
+    first in a cycle is not chosen unless nothing outside the cycle leads to it.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+
+    :return: The indices of the roots, the lowest of every such component, in ascending order.
+    :rtype: List[int]
+    """
+    node_count: int = adjacency.get_node_count()
+    count, labels = strongly_connected_components(adjacency)
+    offsets: array = adjacency.offsets
+    targets: array = adjacency.targets
+    entered: bytearray = bytearray(count)
+    for source in range(node_count):
+        label: int = labels[source]
+        for target in targets[offsets[source]:offsets[source + 1]]:
+            if labels[target] != label:
+                entered[labels[target]] = 1
+    roots: List[int] = []
+    for node in range(node_count):
+        if not entered[labels[node]]:
+            entered[labels[node]] = 1  # the other nodes of the component are no roots
+            roots.append(node)
+    return roots
+
+
+def back_edges(adjacency: AdjacencyMatrix, roots: Iterable[int]) -> bytearray:
+    """
+    Mark the edges that close a cycle in a depth-first traversal from the roots, i.e. the edges
+    leading back to a node on the path to them, including edges from a node to itself.
+
+    Every cycle contains such an edge, so following only unmarked edges never visits a node twice
+    on the same path.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+    :param roots: The indices of the nodes to start from, e.g. from `condensation_roots`.
+    :type roots: Iterable[int]
+
+    :return: A mark for every edge, by its position in `targets`. Edges of nodes that are not
+             reached from the roots are not marked.
+    :rtype: bytearray
+    """
+    offsets: array = adjacency.offsets
+    targets: array = adjacency.targets
+    marks: bytearray = bytearray(len(targets))
+    # 0 for nodes not visited yet, 1 for nodes on the path, 2 for nodes whose edges are done
+    states: bytearray = bytearray(adjacency.get_node_count())
+    for root in roots:
+        if states[root]:
+            continue
+        states[root] = 1
+        path: List[List[int]] = [[root, offsets[root]]]
+        while path:
+            position: List[int] = path[-1]
+            node: int = position[0]
+            end: int = offsets[node + 1]
+            while position[1] < end:
+                edge: int = position[1]
+                position[1] += 1
+                target: int = targets[edge]
+                if states[target] == 0:
+                    states[target] = 1
+                    path.append([target, offsets[target]])
+                    break
+                if states[target] == 1:
+                    marks[edge] = 1
+            else:
+                states[node] = 2
+                path.pop()
+    return marks
+
+
+def connected_components(adjacency: AdjacencyMatrix) -> Tuple[int, array]:
+    """
+    Label the weakly connected components of the graph, i.e. the groups of nodes connected when
+    the direction of the edges is ignored.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+
+    :return: The number of components and the component of every node by index. Components are
+             numbered from 0 in the order of their first node.
+    :rtype: Tuple[int, array]
+    """
+    symmetric: AdjacencyMatrix = undirected(adjacency)
+    labels: array = array(INDEX_TYPE, [-1]) * adjacency.get_node_count()
+    visited: bytearray = bytearray(adjacency.get_node_count())
+    count: int = 0
+    start: int = visited.find(0)
+    while start >= 0:
+        for node in bfs(symmetric, [start], visited):
+            labels[node] = count
+        count += 1
+        start = visited.find(0, start + 1)
+    return count, labels
+
+
+def strongly_connected_components(adjacency: AdjacencyMatrix) -> Tuple[int, array]:
+    """
+    Label the strongly connected components of the graph, i.e. the groups of nodes that can all
+    reach each other (Tarjan's algorithm, without recursion).
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+
+    :return: The number of components and the component of every node by index. Components are
+             numbered in reverse topological order: an edge between two components always leads
+             from the higher to the lower number.
+    :rtype: Tuple[int, array]
+    """
+    offsets: array = adjacency.offsets
+    targets: array = adjacency.targets
+    node_count: int = adjacency.get_node_count()
+    labels: array = array(INDEX_TYPE, [-1]) * node_count
+    # the discovery order of every node, and the lowest discovery order it can get back to
+    order: array = array(INDEX_TYPE, [-1]) * node_count
+    low: array = array(INDEX_TYPE, [0]) * node_count
+    on_stack: bytearray = bytearray(node_count)
+    stack: List[int] = []
+    counter: int = 0
+    count: int = 0
+    for root in range(node_count):
+        if order[root] >= 0:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # the nodes on the current path, each with the position of its next edge to follow
+        path: List[List[int]] = [[root, offsets[root]]]
+        while path:
+            step: List[int] = path[-1]
+            node: int = step[0]
+            end: int = offsets[node + 1]
+            while step[1] < end:
+                target: int = targets[step[1]]
+                step[1] += 1
+                if order[target] < 0:
+                    order[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    path.append([target, offsets[target]])
+                    break
+                if on_stack[target] and order[target] < low[node]:
+                    low[node] = order[target]
+            else:
+                path.pop()
+                if low[node] == order[node]:
+                    member: int = -1
+                    while member != node:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        labels[member] = count
+                    count += 1
+                if path and low[node] < low[path[-1][0]]:
+                    low[path[-1][0]] = low[node]
+    return count, labels
+
+
+def condensation(adjacency: AdjacencyMatrix, count: int, labels: array) -> AdjacencyMatrix:
+    """
+    Get the matrix of the graph with every strongly connected component contracted to a node.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+    :param count: The number of components, as returned by `strongly_connected_components`.
+    :type count: int
+    :param labels: The component of every node, as returned by `strongly_connected_components`.
+    :type labels: array
+
+    :return: The acyclic matrix over the components, whose node IDs are the component numbers
+             as strings. Every pair of connected components has a single edge.
+    :rtype: AdjacencyMatrix
+    """
+    offsets: array = adjacency.offsets
+    targets: array = adjacency.targets
+    members: List[List[int]] = [[] for _ in range(count)]
+    for node, label in enumerate(labels):
+        members[label].append(node)
+    # the last component that got an edge to every component, so edges are added only once
+    linked: array = array(INDEX_TYPE, [-1]) * count
+    component_offsets: array = array(INDEX_TYPE, [0])
+    component_targets: array = array(INDEX_TYPE)
+    for component in range(count):
+        linked[component] = component
+        for node in members[component]:
+            for target in map(labels.__getitem__, targets[offsets[node]:offsets[node + 1]]):
+                if linked[target] != component:
+                    linked[target] = component
+                    component_targets.append(target)
+        component_offsets.append(len(component_targets))
+    return AdjacencyMatrix([str(component) for component in range(count)], component_offsets, component_targets)
+
+
+def undirected(adjacency: AdjacencyMatrix) -> AdjacencyMatrix:
+    """
+    Get the matrix of the graph with an edge in both directions for every edge.
+
+    :param adjacency: The adjacency matrix of the graph.
+    :type adjacency: AdjacencyMatrix
+
+    :return: The symmetric matrix. The successors of a node are its successors in `adjacency`
+             followed by its predecessors; a node connected in both directions is listed twice.
+    :rtype: AdjacencyMatrix
+    """
+    transposed: AdjacencyMatrix = adjacency.transpose()
+    offsets: array = array(INDEX_TYPE, [0])
+    targets: array = array(INDEX_TYPE)
+    for node in range(adjacency.get_node_count()):
+        targets.extend(adjacency.successors(node))
+        targets.extend(transposed.successors(node))
+        offsets.append(len(targets))
+    return AdjacencyMatrix(adjacency.node_ids, offsets, targets)
+
+
+def __mark(nodes: Iterable[int], visited: bytearray) -> List[int]:
+    marked: List[int] = []
+    for node in nodes:
+        if not visited[node]:
+            visited[node] = 1
+            marked.append(node)
+    return marked
+
+
+def __expand(adjacency: AdjacencyMatrix, frontier: List[int], visited: bytearray) -> List[int]:
+    offsets: array = adjacency.offsets
+    targets: array = adjacency.targets
+    next_frontier: List[int] = []
+    for node in frontier:
+        for target in targets[offsets[node]:offsets[node + 1]]:
+            if not visited[target]:
+                visited[target] = 1
+                next_frontier.append(target)
+    return next_frontier
@@ -0,0 +1,247 @@
+from array import array
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .node import Node
+
+INDEX_TYPE: str = "q"
+
+
+class AdjacencyMatrix:
+    """
+    An immutable snapshot of the structure of a graph as a sparse adjacency matrix in compressed
+    sparse row (CSR) form.
+
+    Every node is identified by its index, which is its position in the order of the graph, and
+    `node_ids` maps the indices back to node IDs. The destinations of the edges leaving node `i`
+    are `targets[offsets[i]:offsets[i + 1]]`, in the order the graph reports them. Edge
+    properties are not part of the matrix.
+
+    The arrays have the same layout as the `indptr` and `indices` arrays of a SciPy CSR matrix,
+    so `to_scipy` shares them with the SciPy matrix instead of copying them. SciPy is an optional
+    dependency and is only imported by `to_scipy` and `from_scipy`.
+    """
+
+    __slots__ = ["__node_ids", "__indices", "__offsets", "__targets"]
+
+    def __init__(self, node_ids: Sequence[str], offsets: Iterable[int], targets: Iterable[int]) -> None:
+        """
+        Initialize a matrix from CSR arrays.
+
+        :param node_ids: The IDs of the nodes, by index.
+        :type node_ids: Sequence[str]
+        :param offsets: The start of the targets of every node, followed by the number of edges.
+        :type offsets: Iterable[int]
+        :param targets: The destination indices of all edges, grouped by source.
+        :type targets: Iterable[int]
+
+        :raises ValueError: If the arrays do not describe a matrix over the given nodes.
+        """
+        self.__node_ids: List[str] = list(node_ids)
+        self.__offsets: array = array(INDEX_TYPE, offsets)
+        self.__targets: array = array(INDEX_TYPE, targets)
+        self.__indices: Optional[Dict[str, int]] = None
+        node_count: int = len(self.__node_ids)
+        if len(self.__offsets) != node_count + 1 or self.__offsets[0] != 0 or self.__offsets[-1] != len(self.__targets):
+            raise ValueError(f"Invalid adjacency: Expected {node_count + 1} offsets from 0 to {len(self.__targets)}.")
+        if self.__targets and (min(self.__targets) < 0 or max(self.__targets) >= node_count):
+            raise ValueError(f"Invalid adjacency: Edge targets must be between 0 and {node_count - 1}.")
+
+    @classmethod
+    def build(cls, nodes: Sequence[Node], successors: Callable[[Node], Iterable[Node]]) -> "AdjacencyMatrix":
+        """
+        Build the matrix of a graph from its nodes and a function listing their successors.
+
+        :param nodes: The nodes of the graph, in the order that defines their indices.
+        :type nodes: Sequence[Node]
+        :param successors: A function returning the destinations of the edges leaving a node.
+                           Destinations that are not among `nodes` are left out.
+        :type successors: Callable[[Node], Iterable[Node]]
+
+        :return: The adjacency matrix.
+        :rtype: AdjacencyMatrix
+        """
+        node_ids: List[str] = [node.id for node in nodes]
+        indices: Dict[str, int] = {node_id: index for index, node_id in enumerate(node_ids)}
+        offsets: array = array(INDEX_TYPE, [0])
+        targets: array = array(INDEX_TYPE)
+        for node in nodes:
+            targets.extend(
+                index for index in (indices.get(successor.id, -1) for successor in successors(node)) if index >= 0
+            )
+            offsets.append(len(targets))
+        matrix: AdjacencyMatrix = cls(node_ids, offsets, targets)
+        matrix.__indices = indices
+        return matrix
+
+    @classmethod
+    def from_scipy(cls, matrix: Any, node_ids: Optional[Sequence[str]] = None) -> "AdjacencyMatrix":
+        """
+        Create a matrix from a square SciPy sparse matrix. Every stored entry is an edge, whatever
+        its value, and the edges of a node are ordered by destination.
+
+        :param matrix: The sparse matrix, in any SciPy sparse format.
+        :type matrix: scipy.sparse.spmatrix
+        :param node_ids: The IDs of the nodes by index. Defaults to the indices as strings.
+        :type node_ids: Optional[Sequence[str]]
+
+        :return: The adjacency matrix.
+        :rtype: AdjacencyMatrix
+
+        :raises ValueError: If the matrix is not square or does not match the node IDs.
+        """
+        rows, columns = matrix.shape
+        if rows != columns:
+            raise ValueError(f"Invalid adjacency: Expected a square matrix, but got shape {matrix.shape}.")
+        csr: Any = matrix.tocsr()
+        csr.sum_duplicates()
+        if node_ids is None:
+            node_ids = [str(index) for index in range(rows)]
+        if len(node_ids) != rows:
+            raise ValueError(f"Invalid adjacency: Expected {rows} node IDs, but got {len(node_ids)}.")
+        return cls(node_ids, csr.indptr.tolist(), csr.indices.tolist())
+
+    @property
+    def node_ids(self) -> List[str]:
+        """
+        Get the IDs of the nodes by index. The list must not be modified.
+
+        :return: The node IDs.
+        :rtype: List[str]
+        """
+        return self.__node_ids
+
+    @property
+    def offsets(self) -> array:
+        """
+        Get the offsets of the targets of every node (the `indptr` of a CSR matrix). The array
+        must not be modified.
+
+        :return: The offsets.
+        :rtype: array
+        """
+        return self.__offsets
+
+    @property
+    def targets(self) -> array:
+        """
+        Get the destination indices of all edges, grouped by source (the `indices` of a CSR
+        matrix). The array must not be modified.
+
+        :return: The targets.
+        :rtype: array
+        """
+        return self.__targets
+
+    def get_node_count(self) -> int:
+        """
+        Get the number of nodes.
+
+        :return: The number of rows (and columns) of the matrix.
+        :rtype: int
+        """
+        return len(self.__node_ids)
+
+    def get_edge_count(self) -> int:
+        """
+        Get the number of edges.
+
+        :return: The number of stored entries of the matrix.
+        :rtype: int
+        """
+        return len(self.__targets)
+
+    def index_of(self, node_id: str) -> int:
+        """
+        Get the index of a node.
+
+        :param node_id: The ID of the node.
+        :type node_id: str
+
+        :return: The index of the node.
+        :rtype: int
+
+        :raises KeyError: If the node is not in the matrix.
+        """
+        if self.__indices is None:
+            self.__indices = {node_id: index for index, node_id in enumerate(self.__node_ids)}
+        return self.__indices[node_id]
+
+    def successors(self, index: int) -> array:
+        """
+        Get the destinations of the edges leaving a node.
+
+        :param index: The index of the node.
+        :type index: int
+
+        :return: The indices of the destinations.
+        :rtype: array
+        """
+        return self.__targets[self.__offsets[index]:self.__offsets[index + 1]]
+
+    def transpose(self) -> "AdjacencyMatrix":
+        """
+        Get the matrix of the graph with every edge reversed, which lists the predecessors of
+        every node.
+
+        :return: The transposed matrix.
+        :rtype: AdjacencyMatrix
+        """
+        node_count: int = len(self.__node_ids)
+        counts: List[int] = [0] * (node_count + 1)
+        for target in self.__targets:
+            counts[target + 1] += 1
+        offsets: List[int] = list(accumulate(counts))
+        positions: List[int] = offsets[:-1]
+        sources: array = array(INDEX_TYPE, [0]) * len(self.__targets)
+        for source in range(node_count):
+            for target in self.__targets[self.__offsets[source]:self.__offsets[source + 1]]:
+                sources[positions[target]] = source
+                positions[target] += 1
+        matrix: AdjacencyMatrix = AdjacencyMatrix(self.__node_ids, offsets, sources)
+        matrix.__indices = self.__indices
+        return matrix
+
+    def subgraph(self, indices: Sequence[int]) -> "AdjacencyMatrix":
+        """
+        Get the matrix of the subgraph induced by some of the nodes.
+
+        :param indices: The indices of the nodes to keep. Their order defines the new indices.
+        :type indices: Sequence[int]
+
+        :return: The matrix of the kept nodes and the edges between them.
+        :rtype: AdjacencyMatrix
+        """
+        renumbered: array = array(INDEX_TYPE, [-1]) * len(self.__node_ids)
+        for new_index, index in enumerate(indices):
+            renumbered[index] = new_index
+        offsets: array = array(INDEX_TYPE, [0])
+        targets: array = array(INDEX_TYPE)
+        for index in indices:
+            targets.extend(
+                target for target in map(renumbered.__getitem__, self.successors(index)) if target >= 0
+            )
+            offsets.append(len(targets))
+        return AdjacencyMatrix([self.__node_ids[index] for index in indices], offsets, targets)
+
+    def to_scipy(self) -> Any:
+        """
+        Convert the matrix to a SciPy CSR matrix with a 1 for every edge.
+
+        :return: The sparse matrix.
+        :rtype: scipy.sparse.csr_matrix
+
+        :raises ImportError: If SciPy is not installed.
+        """
+        import numpy
+        from scipy.sparse import csr_matrix
+
+        node_count: int = len(self.__node_ids)
+        return csr_matrix(
+            (
+                numpy.ones(len(self.__targets), dtype=numpy.int8),
+                numpy.frombuffer(self.__targets, dtype=numpy.int64),
+                numpy.frombuffer(self.__offsets, dtype=numpy.int64)
+            ),
+            shape=(node_count, node_count)
+        )
@@ -1,7 +1,9 @@
 import copy
-from typing import Dict, Tuple, Any, TypedDict
+from typing import Dict, Hashable, Optional, Tuple, Any, TypedDict
 
+from .edge_label import EdgeLabel, intern_label
 from .node import Node
+from .observable import MISSING, PropertyObservable
 
 
 class EdgeDict(TypedDict):
@@ -17,14 +19,19 @@ class EdgeDict(TypedDict):
     destination: str
     properties: Dict[str, Any]
 
-class Edge:
+class Edge(PropertyObservable):
     """
     Edge class that represents a directed edge between two nodes.
 
     This class stores the source and destination nodes of the edge, along with
-    optional properties associated with the edge.
+    optional properties associated with the edge. Property changes made through the Edge's
+    methods are reported to its listeners (see `PropertyObservable`).
+
+    An edge created with `labeled` has a single property given by a shared `EdgeLabel` and no
+    properties dictionary of its own. The dictionary is only created when `properties` is
+    accessed or changed; `to_dict` and `peek_properties` read the label without creating it.
     """
-    __slots__ = ['__source', '__destination', '__properties']
+    __slots__ = ['__source', '__destination', '__properties', '__label']
 
     def __init__(self, source: Node, destination: Node, **properties) -> None:
         """
@@ -42,9 +49,37 @@ class Edge:
             raise TypeError(f"expected source to be a Node, but got { type(source) }")
         if not isinstance(destination, Node):
             raise TypeError(f"expected destination to be a Node, but got {type(destination)}")
+        super().__init__()
         self.__source: Node = source
         self.__destination: Node = destination
-        self.__properties: Dict[str, Any] = properties
+        self.__properties: Optional[Dict[str, Any]] = properties
+        self.__label: Optional[EdgeLabel] = None
+
+    @classmethod
+    def labeled(cls, source: Node, destination: Node, key: str, value: Hashable = True) -> "Edge":
+        """
+        Create an edge whose only property is an interned label, e.g. the relation a loader
+        derived the edge from.
+
+        :param source: The source node of the edge.
+        :type source: Node
+        :param destination: The destination node of the edge.
+        :type destination: Node
+        :param key: The name of the property.
+        :type key: str
+        :param value: The value of the property.
+        :type value: Hashable
+
+        :return: The new edge, with the properties `{key: value}`.
+        :rtype: Edge
+
+        :raises TypeError: If either node is not a Node object, the key is not a string or the
+                           value is not hashable.
+        """
+        edge: Edge = cls(source, destination)
+        edge.__label = intern_label(key, value)
+        edge.__properties = None
+        return edge
 
     @property
     def source(self) -> Node:
@@ -94,6 +129,18 @@ class Edge:
             raise TypeError(f'Error: expected Node but got { type(destination) }')
         self.__destination = destination
 
+    @property
+    def label(self) -> Optional[EdgeLabel]:
+        """
+        Get the label that makes up the properties of the edge.
+
+        :return: The label of an edge created with `labeled`, or `None` if the edge has no label
+                 or its properties dictionary was created, after which it may hold other
+                 properties as well.
+        :rtype: Optional[EdgeLabel]
+        """
+        return self.__label if self.__properties is None else None
+
     @property
     def properties(self) -> Dict[str, Any]:
         """
@@ -102,8 +149,20 @@ class Edge:
         :return: The properties of the edge.
         :rtype: Dict[str, Any]
         """
+        if self.__properties is None:
+            self.__properties = self.__label.to_properties()
         return self.__properties
 
+    def peek_properties(self) -> Dict[str, Any]:
+        """
+        Get the properties of the edge for reading, without creating the properties dictionary
+        of a labeled edge.
+
+        :return: The properties of the edge, which must be treated as read-only.
+        :rtype: Dict[str, Any]
+        """
+        return self.__properties if self.__properties is not None else self.__label.to_properties()
+
     @properties.setter
     def properties(self, properties: Dict[str, Any]) -> None:
         """
@@ -116,7 +175,9 @@ class Edge:
         """
         if not isinstance(properties, dict):
             raise TypeError(f'Error: expected dict but got { type(properties) }')
+        old_properties = self.properties
         self.__properties = properties
+        self._notify_listeners(None, old_properties, properties)
 
     def add_property(self, key: str, value: Any) -> None:
         """
@@ -134,7 +195,13 @@ class Edge:
         """
         if not isinstance(key, str):
             raise TypeError(f'Error: expected str but got { type(key) }')
-        self.__properties[key] = value
+        properties: Dict[str, Any] = self.properties
+        if self._has_listeners():
+            old_value = properties.get(key, MISSING)
+            properties[key] = value
+            self._notify_listeners(key, old_value, value)
+        else:
+            properties[key] = value
 
     def add_properties(self, **properties: Dict[str, Any]) -> None:
         """
@@ -153,7 +220,11 @@ class Edge:
         for key in properties:
             if not isinstance(key, str):
                 raise TypeError(f'expected str but got {type(key)}')
-        self.__properties.update(properties)
+        if self._has_listeners():
+            for key, value in properties.items():
+                self.add_property(key, value)
+        else:
+            self.properties.update(properties)
 
     def get_endpoints(self) -> Tuple[Node, Node]:
         """
@@ -167,7 +238,7 @@ class Edge:
         """
         return self.__source, self.__destination
 
-    def to_dict(self) -> EdgeDict:
+    def to_dict(self, deep_copy: bool = True) -> EdgeDict:
         """
         Return a dictionary representation of the edge using only JSON-serializable types.
 
@@ -176,6 +247,11 @@ class Edge:
             - 'destination': ID of the destination node
             - 'properties': dictionary of properties associated with the edge
 
+        :param deep_copy: Whether to deep-copy the properties. If `False`, the returned dictionary
+                          shares the edge's own properties dictionary, which must then be treated
+                          as read-only.
+        :type deep_copy: bool
+
         :return: A dictionary representation of the edge.
         :rtype: EdgeDict
         """
@@ -183,7 +259,7 @@ class Edge:
         return {
             'source': self.source.id,
             'destination': self.destination.id,
-            'properties': copy.deepcopy(self.properties)
+            'properties': copy.deepcopy(self.peek_properties()) if deep_copy else self.peek_properties()
         }
 
     def __eq__(self, other: object) -> bool:
@@ -227,5 +303,5 @@ class Edge:
         :return: A string representing the edge and its properties.
         :rtype: str
         """
-        properties_str = ', '.join(f'{key}: {value}' for key, value in self.__properties.items())
+        properties_str = ', '.join(f'{key}: {value}' for key, value in self.peek_properties().items())
         return f'Edge({self.__source}  --[{properties_str}]-> {self.__destination})'
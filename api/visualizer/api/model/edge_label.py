@@ -0,0 +1,114 @@
+import threading
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+class EdgeLabel:
+    """
+    An interned property shared by many edges, such as the relation of the edges a loader
+    creates (e.g. `contains: True` or `predicate: 'knows'`).
+
+    Labels are kept in a process-wide table and created with `intern_label`, which returns the
+    same label for the same key and value. An edge created with `Edge.labeled` refers to its
+    label instead of owning a properties dictionary, so the key and value are stored once for
+    all edges with that label.
+    """
+
+    __slots__ = ["__id", "__key", "__value"]
+
+    def __init__(self, label_id: int, key: str, value: Hashable) -> None:
+        self.__id: int = label_id
+        self.__key: str = key
+        self.__value: Hashable = value
+
+    @property
+    def id(self) -> int:
+        """
+        Get the position of the label in the label table.
+
+        :return: The label ID.
+        :rtype: int
+        """
+        return self.__id
+
+    @property
+    def key(self) -> str:
+        """
+        Get the name of the property the label stands for.
+
+        :return: The property name.
+        :rtype: str
+        """
+        return self.__key
+
+    @property
+    def value(self) -> Hashable:
+        """
+        Get the value of the property the label stands for.
+
+        :return: The property value.
+        :rtype: Hashable
+        """
+        return self.__value
+
+    def to_properties(self) -> Dict[str, Any]:
+        """
+        Create a properties dictionary holding the label.
+
+        :return: A new dictionary with the key and value of the label.
+        :rtype: Dict[str, Any]
+        """
+        return {self.__key: self.__value}
+
+    def __repr__(self) -> str:
+        return f"EdgeLabel({self.__id}: {self.__key}={self.__value!r})"
+
+
+__labels: List[EdgeLabel] = []
+__labels_by_content: Dict[Tuple[str, type, Hashable], EdgeLabel] = {}
+__lock: threading.Lock = threading.Lock()
+
+
+def intern_label(key: str, value: Hashable = True) -> EdgeLabel:
+    """
+    Get the label for a property, adding it to the label table if it is new.
+
+    :param key: The name of the property.
+    :type key: str
+    :param value: The value of the property. Values of different types (e.g. `1` and `True`)
+                  get different labels.
+    :type value: Hashable
+
+    :return: The shared label.
+    :rtype: EdgeLabel
+
+    :raises TypeError: If the key is not a string or the value is not hashable.
+    """
+    if not isinstance(key, str):
+        raise TypeError(f"expected key to be a str, but got { type(key) }")
+    content: Tuple[str, type, Hashable] = (key, type(value), value)
+    label: EdgeLabel = __labels_by_content.get(content, None)
+    if label is None:
+        with __lock:
+            label = __labels_by_content.get(content, None)
+            if label is None:
+                label = EdgeLabel(len(__labels), key, value)
+                __labels.append(label)
+                __labels_by_content[content] = label
+    return label
+
+
+def get_label(label_id: int) -> EdgeLabel:
+    """
+    Get a label by its ID.
+
+    :param label_id: The ID of the label.
+    :type label_id: int
+
+    :return: The label.
+    :rtype: EdgeLabel
+
+    :raises IndexError: If there is no label with the given ID.
+    """
+    if label_id < 0:
+        raise IndexError(f"No edge label with ID {label_id}.")
+    return __labels[label_id]
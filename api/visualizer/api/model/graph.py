@@ -1,9 +1,26 @@
-from typing import Dict, Iterator, Optional, TypedDict, List, overload, Union
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Set, Tuple, TypedDict, List, overload, Union
+from weakref import WeakSet
 
 from visualizer.api.exception.node_exception import NodeHasEdgesError
 
+from .adjacency import AdjacencyMatrix
 from .edge import Edge, EdgeDict
+from .graph_change import ChangeType, GraphChange
+from .graph_diff import GraphDiff
+from .graph_stats import GraphStats
+from .index.centrality_index import CentralityIndex
+from .index.column_store import ColumnStore
+from .index.degree_index import DegreeIndex
+from .index.property_index import PropertyIndex
+from .index.reachability_index import ReachabilityIndex
+from .index.text_index import TextIndex
 from .node import Node, NodeDict
+from .observable import PropertyListener
+from .storage.dict_storage import DictStorage
+from .storage.graph_storage import GraphStorage
+from .storage.mapped_storage import MappedStorage, write_snapshot
 
 
 class GraphDict(TypedDict):
@@ -17,31 +34,374 @@ class GraphDict(TypedDict):
     nodes: List[NodeDict]
     edges: List[EdgeDict]
 
+class GraphSnapshot:
+    """
+    The contents of a graph at the time `Graph.snapshot` was called, which can be brought back
+    with `Graph.restore`.
+
+    A snapshot shares the storage with its graph; the graph copies the storage before it is next
+    changed structurally and only while the snapshot is still referenced (copy-on-write).
+    Taking a snapshot is therefore O(1). Nodes, edges and their properties are shared as well:
+    the snapshot preserves which nodes and edges the graph contains, not the values of their
+    properties.
+    """
+
+    __slots__ = ["__graph", "__storage", "__version", "__weakref__"]
+
+    def __init__(self, graph: "Graph", storage: GraphStorage, version: int) -> None:
+        self.__graph: Graph = graph
+        self.__storage: GraphStorage = storage
+        self.__version: int = version
+
+    @property
+    def graph(self) -> "Graph":
+        """
+        Get the graph the snapshot was taken of.
+
+        :return: The graph.
+        :rtype: Graph
+        """
+        return self.__graph
+
+    @property
+    def storage(self) -> GraphStorage:
+        """
+        Get the storage holding the contents of the snapshot. It must not be modified.
+
+        :return: The storage.
+        :rtype: GraphStorage
+        """
+        return self.__storage
+
+    @property
+    def version(self) -> int:
+        """
+        Get the version the graph had when the snapshot was taken.
+
+        :return: The version.
+        :rtype: int
+        """
+        return self.__version
+
+
 class Graph:
     """
     Graph class to represent a graph with nodes and edges.
 
-    The graph uses dictionaries to track outgoing and incoming edges for each node.
+    The graph validates every mutation and delegates the bookkeeping of nodes and edges to a
+    `GraphStorage`. The default `DictStorage` uses dictionaries to track outgoing and incoming
+    edges for each node.
     - `outgoing` contains edges from a node to its destination nodes.
     - `incoming` contains edges to a node from its source nodes.
+
+    Every change to the graph, including property changes of the nodes and edges it contains,
+    increments its `version`. Consumers can key caches on the version, subscribe to the
+    individual changes, or read them back from an optional bounded journal.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, storage: Optional[GraphStorage] = None, journal_size: int = 0) -> None:
         """
-        Initialize a Graph object with empty outgoing and incoming edge dictionaries.
+        Initialize an empty Graph object backed by the given storage.
 
-        This method sets up two dictionaries:
-        - `__outgoing`: A dictionary where each key is a `Node` object, and the value is
+        When no storage is provided, a `DictStorage` is used. It keeps two dictionaries:
+        - `outgoing`: A dictionary where each key is a `Node` object, and the value is
           another dictionary mapping destination `Node` objects to `Edge` objects.
-        - `__incoming`: A dictionary where each key is a `Node` object, and the value is
+        - `incoming`: A dictionary where each key is a `Node` object, and the value is
           another dictionary mapping source `Node` objects to `Edge` objects.
 
-        These dictionaries allow the graph to efficiently track the edges going out of
-        or coming into a particular node.
+        A `CompactStorage` can be passed instead to keep adjacency in integer arrays,
+        which uses far less memory on large graphs.
+
+        :param storage: The storage engine used to keep nodes and edges.
+        :type storage: Optional[GraphStorage]
+        :param journal_size: The number of most recent changes to keep in the journal (0 disables it).
+        :type journal_size: int
+        """
+        self.__storage: GraphStorage = storage if storage is not None else DictStorage()
+        self.__version: int = 0
+        # the version of the last change that added or removed nodes or edges
+        self.__structure_version: int = 0
+        self.__serialized: Optional[Tuple[int, GraphDict]] = None
+        self.__adjacency: Optional[Tuple[int, AdjacencyMatrix]] = None
+        self.__journal: Optional[Deque[GraphChange]] = None
+        self.__subscribers: List[Callable[[GraphChange], None]] = []
+        self.__snapshots: WeakSet[GraphSnapshot] = WeakSet()
+        self.__indexes: Dict[str, PropertyIndex] = {}
+        self.__text_index: Optional[TextIndex] = None
+        self.__column_store: Optional[ColumnStore] = None
+        self.__degree_index: Optional[DegreeIndex] = None
+        self.__reachability_index: Optional[ReachabilityIndex] = None
+        self.__centrality_index: Optional[CentralityIndex] = None
+        self.__stats: Optional[GraphStats] = None
+        self.journal_size = journal_size
+        self.__property_listener: PropertyListener = self.__on_property_change
+        self.__storage.set_property_listener(self.__property_listener)
+
+    @property
+    def storage(self) -> GraphStorage:
+        """
+        Get the storage engine that keeps the nodes and edges of the graph.
+
+        The storage may be shared with snapshots (see `snapshot`), so it should only be changed
+        through the graph.
+
+        :return: The storage engine.
+        :rtype: GraphStorage
+        """
+        return self.__storage
+
+    @property
+    def version(self) -> int:
+        """
+        Get the version of the graph.
+
+        The version starts at 0 and increases by one with every change: insertion or removal of
+        a node or edge, a property change of a contained node or edge, or clearing the graph.
+        Two reads that return the same version see the same graph.
+
+        :return: The current version.
+        :rtype: int
+        """
+        return self.__version
+
+    @property
+    def journal_size(self) -> int:
+        """
+        Get the number of most recent changes kept in the journal.
+
+        :return: The maximum length of the journal, or 0 if the journal is disabled.
+        :rtype: int
+        """
+        return self.__journal.maxlen if self.__journal is not None else 0
+
+    @journal_size.setter
+    def journal_size(self, size: int) -> None:
+        """
+        Set the number of most recent changes kept in the journal.
+
+        Shrinking the journal drops the oldest changes. Changes made while the journal was
+        disabled are never recorded.
+
+        :param size: The maximum length of the journal, or 0 to disable it.
+        :type size: int
+
+        :raises ValueError: If the size is negative.
+        """
+        if size < 0:
+            raise ValueError(f"Invalid journal size: Expected a non-negative number, but got {size}.")
+        if size == 0:
+            self.__journal = None
+        else:
+            self.__journal = deque(self.__journal if self.__journal is not None else (), maxlen=size)
+
+    def subscribe(self, callback: Callable[[GraphChange], None]) -> None:
+        """
+        Register a callback that is called after every change to the graph.
+
+        :param callback: The function to call with each `GraphChange`.
+        :type callback: Callable[[GraphChange], None]
+        """
+        self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[GraphChange], None]) -> None:
+        """
+        Unregister a previously registered callback.
+
+        :param callback: The function to unregister.
+        :type callback: Callable[[GraphChange], None]
+
+        :raises ValueError: If the callback is not registered.
+        """
+        self.__subscribers.remove(callback)
+
+    def changes_since(self, version: int) -> Optional[List[GraphChange]]:
+        """
+        Get the changes made after the given version from the journal.
+
+        :param version: A version previously read from `version`.
+        :type version: int
+
+        :return: The changes in the order they were made, or `None` if the journal does not
+                 reach back to the given version. In that case, everything derived from the
+                 graph has to be rebuilt.
+        :rtype: Optional[List[GraphChange]]
+
+        :raises ValueError: If the version is newer than the current version.
+        """
+        if version > self.__version:
+            raise ValueError(f"Invalid version: {version} is newer than the current version {self.__version}.")
+        if version == self.__version:
+            return []
+        if not self.__journal or self.__journal[0].version > version + 1:
+            return None
+        return list(islice(self.__journal, version + 1 - self.__journal[0].version, None))
+
+    def create_index(self, key: str) -> PropertyIndex:
+        """
+        Create an index over the values of a node property, or get the existing one.
+
+        The index is kept up to date with every change to the graph, which makes each change
+        somewhat more expensive, and lets `filter` find the matching nodes without a scan.
+
+        :param key: The name of the node property to index.
+        :type key: str
+
+        :return: The index over the property.
+        :rtype: PropertyIndex
+        """
+        if key not in self.__indexes:
+            self.__indexes[key] = PropertyIndex(self, key)
+        return self.__indexes[key]
+
+    def drop_index(self, key: str) -> None:
+        """
+        Remove the index over a node property, if there is one.
+
+        :param key: The name of the indexed node property.
+        :type key: str
+        """
+        index: Optional[PropertyIndex] = self.__indexes.pop(key, None)
+        if index is not None:
+            index.close()
+
+    def get_index(self, key: str) -> Optional[PropertyIndex]:
+        """
+        Get the index over a node property.
+
+        :param key: The name of the indexed node property.
+        :type key: str
+
+        :return: The index, or `None` if the property is not indexed.
+        :rtype: Optional[PropertyIndex]
+        """
+        return self.__indexes.get(key, None)
+
+    def get_text_index(self) -> TextIndex:
+        """
+        Get the full-text index over the nodes, creating it on the first call.
+
+        The index is built on its first lookup and then kept up to date with every change to
+        the graph, which lets `search` check only the nodes that may match.
+
+        :return: The full-text index.
+        :rtype: TextIndex
+        """
+        if self.__text_index is None:
+            self.__text_index = TextIndex(self)
+        return self.__text_index
+
+    def drop_text_index(self) -> None:
+        """ Remove the full-text index, if there is one. """
+        if self.__text_index is not None:
+            self.__text_index.close()
+            self.__text_index = None
+
+    def get_column_store(self) -> ColumnStore:
+        """
+        Get the columnar index of the node properties, creating it on the first call.
+
+        The store builds the column of a property on its first lookup and then keeps it up to
+        date with every change to the graph, which lets `filter` compare whole columns instead of
+        the properties of every node. The columns are copies next to the properties of the nodes,
+        which remain their only source.
+
+        :return: The columnar property store.
+        :rtype: ColumnStore
+        """
+        if self.__column_store is None:
+            self.__column_store = ColumnStore(self)
+        return self.__column_store
+
+    def drop_column_store(self) -> None:
+        """ Remove the columnar property store and its columns, if there is one. """
+        if self.__column_store is not None:
+            self.__column_store.close()
+            self.__column_store = None
+
+    def get_degree_index(self) -> DegreeIndex:
+        """
+        Get the index over the in-degrees and out-degrees of the nodes, creating it on the first
+        call.
+
+        The index counts the edges of every node on its first lookup and then updates the counts
+        with every inserted or removed edge, which lets `filter` select nodes by degree and
+        `DegreeIndex.top` rank them without visiting the edges of every node.
+
+        :return: The degree index.
+        :rtype: DegreeIndex
+        """
+        if self.__degree_index is None:
+            self.__degree_index = DegreeIndex(self)
+        return self.__degree_index
+
+    def drop_degree_index(self) -> None:
+        """ Remove the degree index, if there is one. """
+        if self.__degree_index is not None:
+            self.__degree_index.close()
+            self.__degree_index = None
+
+    def get_reachability_index(self) -> ReachabilityIndex:
         """
-        self.__outgoing: Dict[Node,Dict[Node, Edge]] = {}
-        self.__incoming: Dict[Node,Dict[Node, Edge]] = {}
-        self.__nodes_by_id: Dict[str, Node] = {}
+        Get the index over which nodes can reach which others, creating it on the first call.
+
+        The index is built on its first query from the strongly connected components of the
+        graph and rebuilt after a change that may connect or disconnect nodes, so repeated
+        queries between changes do not traverse the edges of the graph again.
+
+        :return: The reachability index.
+        :rtype: ReachabilityIndex
+        """
+        if self.__reachability_index is None:
+            self.__reachability_index = ReachabilityIndex(self)
+        return self.__reachability_index
+
+    def drop_reachability_index(self) -> None:
+        """ Remove the reachability index, if there is one. """
+        if self.__reachability_index is not None:
+            self.__reachability_index.close()
+            self.__reachability_index = None
+
+    def get_centrality_index(self) -> CentralityIndex:
+        """
+        Get the index over the PageRank and betweenness of the nodes, creating it on the first
+        call.
+
+        The index is not computed on a lookup. It holds the scores of the last call of
+        `CentralityIndex.compute`, usually made by a background thread, until nodes or edges are
+        inserted or removed.
+
+        :return: The centrality index.
+        :rtype: CentralityIndex
+        """
+        if self.__centrality_index is None:
+            self.__centrality_index = CentralityIndex(self)
+        return self.__centrality_index
+
+    def drop_centrality_index(self) -> None:
+        """ Remove the centrality index, if there is one. """
+        if self.__centrality_index is not None:
+            self.__centrality_index.close()
+            self.__centrality_index = None
+
+    def get_stats(self) -> GraphStats:
+        """
+        Get the statistics of the structure of the graph, creating them on the first call.
+
+        The statistics follow the changes of the graph, so reading them does not visit the nodes
+        or edges. Counts that a change made outdated are rebuilt by `GraphStats.refresh`.
+
+        :return: The statistics.
+        :rtype: GraphStats
+        """
+        if self.__stats is None:
+            self.__stats = GraphStats(self)
+        return self.__stats
+
+    def drop_stats(self) -> None:
+        """ Remove the statistics, if there are any. """
+        if self.__stats is not None:
+            self.__stats.close()
+            self.__stats = None
 
     @property
     def outgoing(self) -> Dict[Node,Dict[Node, Edge]]:
@@ -52,10 +412,12 @@ class Graph:
         the source nodes) and the values are dictionaries mapping destination nodes to the
         corresponding `Edge` objects.
 
+        Storages that do not keep `Edge` objects build this dictionary on every access.
+
         :return: The dictionary of outgoing edges.
         :rtype: Dict[Node, Dict[Node, Edge]]
         """
-        return self.__outgoing
+        return self.__storage.outgoing
 
     @outgoing.setter
     def outgoing(self, value: Dict[Node, Dict[Node, Edge]]) -> None:
@@ -71,11 +433,15 @@ class Graph:
         :type value: Dict[Node, Dict[Node, Edge]]
 
         :raises TypeError: If the provided value is not a dictionary.
+        :raises AttributeError: If the storage does not support replacing its adjacency.
         """
         if not isinstance(value, dict):
             raise TypeError(
                 f"Invalid value for 'outgoing': Expected type Dict[Node, Dict[Node, Edge]], but got {type(value).__name__}")
-        self.__outgoing = value
+        self.__ensure_writable()
+        self.__storage.outgoing = value
+        self.__attach_adjacency(value)
+        self.__record(ChangeType.CLEARED)
 
     @property
     def incoming(self) -> Dict[Node,Dict[Node, Edge]]:
@@ -86,10 +452,12 @@ class Graph:
         the destination nodes) and the values are dictionaries mapping source nodes to the
         corresponding `Edge` objects.
 
+        Storages that do not keep `Edge` objects build this dictionary on every access.
+
         :return: The dictionary of incoming edges.
         :rtype: Dict[Node, Dict[Node, Edge]]
         """
-        return self.__incoming
+        return self.__storage.incoming
 
     @incoming.setter
     def incoming(self, value: Dict[Node, Dict[Node, Edge]]) -> None:
@@ -105,34 +473,53 @@ class Graph:
         :type value: Dict[Node, Dict[Node, Edge]]
 
         :raises TypeError: If the provided value is not a dictionary.
+        :raises AttributeError: If the storage does not support replacing its adjacency.
         """
         if not isinstance(value, dict):
             raise TypeError(
                 f"Invalid value for 'incoming': Expected type Dict[Node, Dict[Node, Edge]], but got {type(value).__name__}")
-        self.__incoming = value
+        self.__ensure_writable()
+        self.__storage.incoming = value
+        self.__attach_adjacency(value)
+        self.__record(ChangeType.CLEARED)
 
     def update_node_id(self, old_id: str, new_id: str) -> None:
         """
         Update the ID of an existing node in the graph.
 
-        This method changes the ID of a node already in the graph. It retrieves the node using
-        `old_id`, updates its `id` attribute to `new_id`, and updates the internal lookup
-        dictionary accordingly.
+        The node is replaced by a new node with the ID `new_id` and a copy of its properties,
+        which is moved to the end of the graph, and its edges are moved to the new node. The old
+        node object keeps its ID, since snapshots of the graph may still contain it.
 
         :param old_id: The current ID of the node.
         :type old_id: str
         :param new_id: The new ID to assign to the node.
         :type new_id: str
 
-        :raises ValueError: If a node with `old_id` does not exist in the graph.
+        :raises ValueError: If a node with `old_id` does not exist in the graph, or a node with
+                            `new_id` already does.
         """
         node: Optional[Node] = self.get_node(old_id)
         if not node:
             raise ValueError(f"Cannot update node ID: No node found with id '{old_id}'.")
+        if self.__storage.get_node(new_id) is not None:
+            raise ValueError(f"Cannot update node ID: A node with id '{new_id}' already exists.")
 
+        renamed: Node = Node(new_id, **node.properties)
+        # a self-loop is both an outgoing and an incoming edge, but is moved once
+        edges: List[Edge] = list(self.__storage.out_edges(node)) + [
+            edge for edge in self.__storage.in_edges(node) if edge.source is not node
+        ]
+        moved_edges: List[Edge] = []
+        for edge in edges:
+            self.remove_edge(edge.source, edge.destination)
+            moved: Edge = Edge(renamed if edge.source is node else edge.source,
+                               renamed if edge.destination is node else edge.destination)
+            moved.properties = dict(edge.peek_properties())
+            moved_edges.append(moved)
         self.remove_node(node)
-        node.id = new_id
-        self.insert_node(node)
+        self.insert_node(renamed)
+        self.insert_edges(*moved_edges)
 
 
     def insert_node(self, node: Node) -> None:
@@ -152,12 +539,13 @@ class Graph:
         if not isinstance(node, Node):
             raise TypeError(f"Invalid node: Expected type 'Node', but got {type(node).__name__}")
 
-        if node.id in self.__nodes_by_id.keys():
+        if self.__storage.get_node(node.id) is not None:
             raise ValueError(f"Node insertion failed: Node with id '{node.id}' already exists in the graph.")
 
-        self.outgoing[node] = {}
-        self.incoming[node] = {}
-        self.__nodes_by_id[node.id] = node
+        self.__ensure_writable()
+        self.__storage.add_node(node)
+        node.add_listener(self.__property_listener)
+        self.__record(ChangeType.NODE_INSERTED, node)
 
     def insert_nodes(self, *nodes: Node) -> None:
         """
@@ -205,12 +593,13 @@ class Graph:
         if node is None:
             raise ValueError(f"Cannot remove node: Node with ID '{node_or_id}' not found in the graph.")
 
-        if len(self.__outgoing[node]) > 0 or len(self.__incoming[node]) > 0:
+        if self.__storage.out_degree(node) > 0 or self.__storage.in_degree(node) > 0:
             raise NodeHasEdgesError(node)
 
-        del self.__outgoing[node]
-        del self.__incoming[node]
-        del self.__nodes_by_id[node.id]
+        self.__ensure_writable()
+        self.__storage.remove_node(node)
+        # the node keeps the listener, since restoring a snapshot may bring it back
+        self.__record(ChangeType.NODE_REMOVED, node, old_value=node.id)
 
     def insert_edge(self, edge: Edge) -> None:
         """
@@ -236,13 +625,16 @@ class Graph:
         if not self.contains_node(edge.destination):
             raise ValueError(f"Edge insertion failed: Destination node '{edge.destination}' is not in the graph.")
 
-        existing_edge: Optional[Edge] = self.get_edge(edge.source, edge.destination)
+        existing_edge: Optional[Edge] = self.__storage.get_edge(edge.source, edge.destination)
         if existing_edge:
-            existing_edge.add_properties(**edge.properties)
+            existing_edge.add_listener(self.__property_listener)
+            existing_edge.add_properties(**edge.peek_properties())
             return
 
-        self.outgoing[edge.source][edge.destination] = edge
-        self.incoming[edge.destination][edge.source] = edge
+        self.__ensure_writable()
+        self.__storage.add_edge(edge)
+        edge.add_listener(self.__property_listener)
+        self.__record(ChangeType.EDGE_INSERTED, edge)
 
     def insert_edges(self, *edges: Edge) -> None:
         """
@@ -261,17 +653,100 @@ class Graph:
         for edge in edges:
             self.insert_edge(edge)
 
+    def bulk_load(self, nodes: Iterable[Node], edges: Iterable[Edge]) -> None:
+        """
+        Insert many nodes and edges in a single batch.
+
+        Unlike `insert_nodes` and `insert_edges`, which validate every item against the graph
+        one call at a time, this method collects the whole batch first and validates it once:
+        node IDs must be unique and every edge endpoint must be either in the batch or already
+        in the graph. Duplicate edges are merged in the same pass, the properties of later edges
+        overriding earlier ones, just like repeated calls to `insert_edge` would. The storage then
+        receives all items at once.
+
+        The batch is applied atomically: if validation fails, the graph is left unchanged.
+
+        :param nodes: The nodes to insert into the graph.
+        :type nodes: Iterable[Node]
+        :param edges: The edges to insert into the graph.
+        :type edges: Iterable[Edge]
+
+        :raises TypeError: If any item is not a `Node` or `Edge` respectively.
+        :raises ValueError: If a node ID is repeated or already exists, or if an edge endpoint
+                            is neither in the batch nor in the graph.
+        """
+        new_nodes: Dict[str, Node] = {}
+        for node in nodes:
+            if not isinstance(node, Node):
+                raise TypeError(f"Invalid node: Expected type 'Node', but got {type(node).__name__}")
+            if node.id in new_nodes or self.__storage.get_node(node.id) is not None:
+                raise ValueError(f"Node insertion failed: Node with id '{node.id}' already exists in the graph.")
+            new_nodes[node.id] = node
+
+        merged_edges: Dict[Tuple[str, str], Edge] = {}
+        for edge in edges:
+            if not isinstance(edge, Edge):
+                raise TypeError(f"Invalid edge: Expected type 'Edge', but got {type(edge).__name__}")
+            key: Tuple[str, str] = (edge.source.id, edge.destination.id)
+            merged_edge: Optional[Edge] = merged_edges.get(key, None)
+            if merged_edge is None:
+                merged_edges[key] = edge
+            else:
+                merged_edge.add_properties(**edge.peek_properties())
+
+        new_edges: List[Edge] = []
+        for (source_id, destination_id), edge in merged_edges.items():
+            if source_id not in new_nodes and self.__storage.get_node(source_id) is None:
+                raise ValueError(f"Edge insertion failed: Source node '{edge.source}' is not in the graph.")
+            if destination_id not in new_nodes and self.__storage.get_node(destination_id) is None:
+                raise ValueError(f"Edge insertion failed: Destination node '{edge.destination}' is not in the graph.")
+            new_edges.append(edge)
+
+        if self.__storage.edge_count() > 0:
+            missing_edges: List[Edge] = []
+            for edge in new_edges:
+                existing_edge: Optional[Edge] = self.__storage.get_edge(edge.source, edge.destination)
+                if existing_edge:
+                    existing_edge.add_listener(self.__property_listener)
+                    existing_edge.add_properties(**edge.peek_properties())
+                else:
+                    missing_edges.append(edge)
+            new_edges = missing_edges
+
+        if new_nodes or new_edges:
+            self.__ensure_writable()
+            self.__storage.add_all(list(new_nodes.values()), new_edges)
+        for node in new_nodes.values():
+            node.add_listener(self.__property_listener)
+        for edge in new_edges:
+            edge.add_listener(self.__property_listener)
+
+        if self.__journal is None and not self.__subscribers:
+            self.__version += len(new_nodes) + len(new_edges)
+            self.__structure_version = self.__version
+            return
+        for node in new_nodes.values():
+            self.__record(ChangeType.NODE_INSERTED, node)
+        for edge in new_edges:
+            self.__record(ChangeType.EDGE_INSERTED, edge)
+
     def get_node_count(self) -> int:
         """
         Get the number of nodes in the graph.
 
-        This method returns the total number of nodes in the graph by checking the length of
-        the `outgoing` dictionary (since each key represents a node).
-
         :return: The number of nodes in the graph.
         :rtype: int
         """
-        return len(self.outgoing)
+        return self.__storage.node_count()
+
+    def get_edge_count(self) -> int:
+        """
+        Get the number of edges in the graph.
+
+        :return: The number of edges in the graph.
+        :rtype: int
+        """
+        return self.__storage.edge_count()
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """
@@ -285,26 +760,22 @@ class Graph:
         :return: The node with the specified ID, or `None` if it does not exist.
         :rtype: Optional[Node]
         """
-        return self.__nodes_by_id.get(node_id, None)
+        return self.__storage.get_node(node_id)
 
     def get_nodes(self) -> Iterator[Node]:
         """
         Get an iterator over all nodes in the graph.
 
-        This method returns an iterator over the keys of the `outgoing` dictionary, which
-        represents all the nodes in the graph.
-
         :return: An iterator over the nodes in the graph.
         :rtype: Iterator[Node]
         """
-        yield from self.outgoing.keys()
+        yield from self.__storage.nodes()
 
     def get_incident_edges(self, node: Node) -> Iterator[Edge]:
         """
         Get all edges incident to a node (outgoing edges from the node).
 
         This method returns an iterator over the edges where the given node is the source node.
-        It iterates over the dictionary of outgoing edges for the node.
 
         :param node: The node for which to get the incident edges.
         :type node: Node
@@ -317,7 +788,8 @@ class Graph:
         if not self.contains_node(node):
             raise KeyError(f"Cannot retrieve incident edges: Node '{node}' is not present in the graph.")
 
-        for edge in self.outgoing[node].values():
+        for edge in self.__storage.out_edges(node):
+            edge.add_listener(self.__property_listener)
             yield edge
 
     def get_edge(self, source: Node, destination: Node) -> Optional[Edge]:
@@ -335,9 +807,10 @@ class Graph:
         :return: The edge from the source node to the destination node, or `None` if no such edge exists.
         :rtype: Optional[Edge]
         """
-        if not self.contains_node(source) or not self.contains_node(destination):
-            return None
-        return self.outgoing[source].get(destination, None)
+        edge: Optional[Edge] = self.__storage.get_edge(source, destination)
+        if edge is not None:
+            edge.add_listener(self.__property_listener)
+        return edge
 
     @overload
     def contains_node(self, node: Node) -> bool:
@@ -351,8 +824,7 @@ class Graph:
         """
         Check if a node exists in the graph.
 
-        This method checks if the given node is present in the graph by looking for it
-        in the `outgoing` dictionary.
+        This method checks if a node with the same ID is present in the graph.
 
         :param node_or_id: The node to check for existence in the graph.
         :type node_or_id: Union[Node, str]
@@ -360,17 +832,15 @@ class Graph:
         :return: `True` if the node exists, `False` otherwise.
         :rtype: bool
         """
-        if isinstance(node_or_id, Node):
-            return node_or_id in self.outgoing
-        else:
-            return node_or_id in self.__nodes_by_id
+        node_id: str = node_or_id.id if isinstance(node_or_id, Node) else node_or_id
+        return self.__storage.get_node(node_id) is not None
 
     def contains_edge(self, edge: Edge) -> bool:
         """
         Check if an edge exists in the graph.
 
         This method checks if an edge from the source node to the destination node exists in
-        the graph's outgoing edges.
+        the graph.
 
         :param edge: The edge to check for existence in the graph.
         :type edge: Edge
@@ -401,21 +871,84 @@ class Graph:
         :param destination: The destination node of the edge to remove.
         :type destination: Node
         """
-        if source in self.__outgoing and destination in self.__outgoing[source]:
-            del self.__outgoing[source][destination]
-        if destination in self.__incoming and source in self.__incoming[destination]:
-            del self.__incoming[destination][source]
+        edge: Optional[Edge] = self.__storage.get_edge(source, destination)
+        if edge is None:
+            return
+        self.__ensure_writable()
+        if self.__storage.remove_edge(source, destination):
+            self.__record(ChangeType.EDGE_REMOVED, edge)
 
     def clear(self) -> None:
         """
         Remove all nodes and edges from the graph.
 
-        This clears the outgoing and incoming edge dictionaries, as well as
-        the node lookup by ID.
+        This clears the underlying storage, including the node lookup by ID. If the storage is
+        shared with a snapshot, it is replaced by an empty one instead.
+        """
+        if self.__is_shared():
+            self.__storage = self.__storage.create_empty()
+        else:
+            self.__storage.clear()
+        self.__record(ChangeType.CLEARED)
+
+    def retain_nodes(self, nodes: Iterable[Node]) -> None:
+        """
+        Remove all nodes except the given ones, together with the edges attached to them.
+
+        The remaining nodes keep their order and the edges between them are kept. The graph is
+        rebuilt into a new storage in a single pass, so the previous storage stays intact for
+        snapshots that share it.
+
+        :param nodes: The nodes to keep. Nodes that are not in the graph are ignored.
+        :type nodes: Iterable[Node]
         """
-        self.__outgoing.clear()
-        self.__incoming.clear()
-        self.__nodes_by_id.clear()
+        kept_ids: Set[str] = {node.id for node in nodes}
+        kept_nodes: List[Node] = [node for node in self.__storage.nodes() if node.id in kept_ids]
+        kept_edges: List[Edge] = [
+            edge for node in kept_nodes for edge in self.__storage.out_edges(node) if edge.destination.id in kept_ids
+        ]
+
+        storage: GraphStorage = self.__storage.create_empty()
+        storage.add_all(kept_nodes, kept_edges)
+        for node in kept_nodes:
+            node.add_listener(self.__property_listener)
+        for edge in kept_edges:
+            edge.add_listener(self.__property_listener)
+        self.__storage = storage
+        self.__record(ChangeType.CLEARED)
+
+    def snapshot(self) -> GraphSnapshot:
+        """
+        Take a copy-on-write snapshot of the graph in O(1).
+
+        The graph shares its storage with the snapshot until the next structural change, which
+        copies the storage first if the snapshot is still referenced.
+
+        :return: The snapshot of the current contents.
+        :rtype: GraphSnapshot
+        """
+        snapshot: GraphSnapshot = GraphSnapshot(self, self.__storage, self.__version)
+        self.__snapshots.add(snapshot)
+        return snapshot
+
+    def restore(self, snapshot: GraphSnapshot) -> None:
+        """
+        Bring back the contents of the graph from a snapshot in O(1).
+
+        The version is not reset; restoring counts as a change that replaces the whole graph.
+        The snapshot remains valid and can be restored again. Nodes and edges removed since the
+        snapshot was taken kept the listener of the graph, so their property changes are
+        recorded again once they are back.
+
+        :param snapshot: A snapshot taken of this graph.
+        :type snapshot: GraphSnapshot
+
+        :raises ValueError: If the snapshot was taken of a different graph.
+        """
+        if snapshot.graph is not self:
+            raise ValueError("Cannot restore graph: The snapshot was taken of a different graph.")
+        self.__storage = snapshot.storage
+        self.__record(ChangeType.CLEARED)
 
     def to_dict(self) -> GraphDict:
         """
@@ -425,16 +958,220 @@ class Graph:
             - 'nodes': a list of dictionaries, each representing a node with the keys: 'id' and 'properties'.
             - 'edges': a list of dictionaries, each representing an edge with the keys: 'source', 'destination' and 'properties'.
 
+        The representation is built once and returned again by later calls until the graph or
+        one of its nodes or edges changes. It is therefore shared and must be treated as
+        read-only: the 'properties' entries are the live property dictionaries of the nodes and
+        edges, not copies. Callers that need to modify the result must copy the parts they change.
+
         :return: A dictionary with 'nodes' and 'edges' as keys.
         :rtype: GraphDict
         """
-        nodes = [node.to_dict() for node in self.get_nodes()]
-        edges = [
-            edge.to_dict()
-            for destinations in self.outgoing.values()
-            for edge in destinations.values()
+        if self.__serialized is not None and self.__serialized[0] == self.__version:
+            return self.__serialized[1]
+
+        nodes = [node.to_dict(deep_copy=False) for node in self.__storage.nodes()]
+        edges = [edge.to_dict(deep_copy=False) for edge in self.__storage.edges()]
+        graph_dict: GraphDict = {'nodes': nodes, 'edges': edges}
+        self.__serialized = (self.__version, graph_dict)
+        return graph_dict
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Save the nodes and edges of the graph, with their properties, to a binary snapshot file.
+
+        The properties are stored with `pickle`. The journal, subscribers and indexes of the
+        graph are not saved.
+
+        :param path: The path of the snapshot file. An existing file is replaced.
+        :type path: str
+        """
+        write_snapshot(path, self.__storage)
+
+    @classmethod
+    def open_snapshot(cls, path: str) -> "Graph":
+        """
+        Open a snapshot file saved by `save_snapshot` as a new graph.
+
+        The file is memory-mapped and nodes and edges are read from it only when they are first
+        requested, so opening takes about the same time for any size of graph. The graph copies
+        its contents into memory before its first change. Only files from a trusted source may
+        be opened, since the properties are unpickled.
+
+        :param path: The path of the snapshot file.
+        :type path: str
+
+        :return: The graph stored in the file.
+        :rtype: Graph
+
+        :raises ValueError: If the file is not a snapshot or has an unsupported format version.
+        """
+        return cls(MappedStorage(path))
+
+    def to_adjacency(self) -> AdjacencyMatrix:
+        """
+        Return the structure of the graph as a sparse adjacency matrix.
+
+        The indices of the matrix follow the order of `get_nodes`. Like `to_dict`, the matrix is
+        built once and returned again by later calls until the structure of the graph changes.
+
+        :return: The adjacency matrix of the graph.
+        :rtype: AdjacencyMatrix
+        """
+        if self.__adjacency is None or self.__adjacency[0] != self.__structure_version:
+            adjacency: AdjacencyMatrix = AdjacencyMatrix.build(list(self.__storage.nodes()), self.__storage.successors)
+            self.__adjacency = (self.__structure_version, adjacency)
+        return self.__adjacency[1]
+
+    @classmethod
+    def from_adjacency(cls, adjacency: AdjacencyMatrix, storage: Optional[GraphStorage] = None) -> "Graph":
+        """
+        Create a graph with a node without properties for every row of an adjacency matrix and
+        an edge without properties for every entry.
+
+        :param adjacency: The adjacency matrix.
+        :type adjacency: AdjacencyMatrix
+        :param storage: The storage engine of the new graph.
+        :type storage: Optional[GraphStorage]
+
+        :return: The new graph.
+        :rtype: Graph
+        """
+        nodes: List[Node] = [Node(node_id) for node_id in adjacency.node_ids]
+        offsets, targets = adjacency.offsets, adjacency.targets
+        edges: List[Edge] = [
+            Edge(nodes[source], nodes[targets[position]])
+            for source in range(len(nodes)) for position in range(offsets[source], offsets[source + 1])
         ]
-        return {'nodes': nodes, 'edges': edges}
+        graph: Graph = cls(storage)
+        graph.bulk_load(nodes, edges)
+        return graph
+
+    def diff(self, other: "Graph") -> GraphDiff:
+        """
+        Compare the graph with another graph.
+
+        Nodes are matched through the ID lookups of the storages, and the edges leaving a node
+        through a hash table of their destination IDs, so the comparison takes time linear in the
+        size of both graphs.
+
+        :param other: The graph to compare with, e.g. a newer version of the same data.
+        :type other: Graph
+
+        :return: The changes that turn this graph into `other`.
+        :rtype: GraphDiff
+        """
+        graph_diff: GraphDiff = GraphDiff()
+        other_storage: GraphStorage = other.storage
+        for node in other_storage.nodes():
+            own_node: Optional[Node] = self.__storage.get_node(node.id)
+            own_edges: Dict[str, Edge] = {}
+            if own_node is None:
+                graph_diff.added_nodes.append(node)
+            else:
+                if own_node.properties != node.properties:
+                    graph_diff.changed_nodes.append(node)
+                own_edges = {edge.destination.id: edge for edge in self.__storage.out_edges(own_node)}
+
+            for edge in other_storage.out_edges(node):
+                own_edge: Optional[Edge] = own_edges.pop(edge.destination.id, None)
+                if own_edge is None:
+                    graph_diff.added_edges.append(edge)
+                elif own_edge.peek_properties() != edge.peek_properties():
+                    graph_diff.changed_edges.append(edge)
+            graph_diff.removed_edges.extend(own_edges.values())
+
+        for node in self.__storage.nodes():
+            if other_storage.get_node(node.id) is None:
+                graph_diff.removed_nodes.append(node)
+                graph_diff.removed_edges.extend(self.__storage.out_edges(node))
+        return graph_diff
+
+    def apply_patch(self, graph_diff: GraphDiff) -> None:
+        """
+        Apply the changes returned by `diff` to the graph.
+
+        Only the nodes and edges in the diff are changed, and every change is reported to the
+        subscribers of the graph, so indexes and views only process the delta. New nodes and
+        edges are copies of the ones in the diff, and changed ones get a copy of the new
+        property dictionary; the property values themselves are shared.
+
+        :param graph_diff: The changes to apply, computed against this graph.
+        :type graph_diff: GraphDiff
+
+        :raises ValueError: If the diff does not match the graph, e.g. a removed node is not in
+                            the graph or an added node already is.
+        """
+        for edge in graph_diff.removed_edges:
+            self.remove_edge(edge.source, edge.destination)
+        for node in graph_diff.removed_nodes:
+            self.remove_node(node.id)
+        self.bulk_load([Node(node.id, **node.properties) for node in graph_diff.added_nodes], [])
+        for node in graph_diff.changed_nodes:
+            self.__patched(self.__storage.get_node(node.id), node).properties = dict(node.properties)
+
+        self.bulk_load([], [
+            Edge(
+                self.__patched(self.__storage.get_node(edge.source.id), edge.source),
+                self.__patched(self.__storage.get_node(edge.destination.id), edge.destination),
+                **edge.peek_properties()
+            )
+            for edge in graph_diff.added_edges
+        ])
+        for edge in graph_diff.changed_edges:
+            self.__patched(self.get_edge(edge.source, edge.destination), edge).properties = dict(edge.peek_properties())
+
+    @staticmethod
+    def __patched(own: Optional[Union[Node, Edge]], patched: Union[Node, Edge]) -> Union[Node, Edge]:
+        if own is None:
+            raise ValueError(f"Cannot apply patch: {patched} is not in the graph.")
+        return own
+
+    def __record(self, change_type: ChangeType, entity: Optional[Union[Node, Edge]] = None,
+                 key: Optional[str] = None, old_value: Any = None, new_value: Any = None) -> None:
+        self.__version += 1
+        if change_type != ChangeType.PROPERTY_CHANGED:
+            self.__structure_version = self.__version
+        if self.__journal is None and not self.__subscribers:
+            return
+
+        change = GraphChange(self.__version, change_type, entity, key, old_value, new_value)
+        if self.__journal is not None:
+            self.__journal.append(change)
+        for subscriber in list(self.__subscribers):
+            subscriber(change)
+
+    def __is_shared(self) -> bool:
+        # a read-only storage must not be changed either, so it is treated like a shared one
+        return self.__storage.read_only or any(snapshot.storage is self.__storage for snapshot in self.__snapshots)
+
+    def __ensure_writable(self) -> None:
+        if self.__is_shared():
+            self.__storage = self.__storage.copy()
+
+    def __attach_adjacency(self, adjacency: Dict[Node, Dict[Node, Edge]]) -> None:
+        for node, edges in adjacency.items():
+            node.add_listener(self.__property_listener)
+            for edge in edges.values():
+                edge.add_listener(self.__property_listener)
+
+    def __on_property_change(self, entity: Union[Node, Edge], key: Optional[str], old_value: Any, new_value: Any) -> None:
+        # Nodes and edges keep the listener after they were replaced or removed through the
+        # storage directly, so ignore changes of objects the graph no longer contains.
+        if isinstance(entity, Node):
+            if self.__storage.get_node(entity.id) is not entity:
+                return
+        else:
+            # the storages of snapshots may keep the properties of the edge too, so a replaced
+            # dictionary must reach them as well, or restoring one would bring back stale values
+            storages: List[GraphStorage] = [self.__storage]
+            for snapshot in list(self.__snapshots):
+                if all(snapshot.storage is not storage for storage in storages):
+                    storages.append(snapshot.storage)
+            for storage in storages:
+                storage.sync_edge_properties(entity, key, old_value)
+            if self.__storage.get_edge(entity.source, entity.destination) is None:
+                return
+        self.__record(ChangeType.PROPERTY_CHANGED, entity, key, old_value, new_value)
 
     def __str__(self) -> str:
         """
@@ -450,10 +1187,6 @@ class Graph:
         :return: A formatted string representing the nodes and edges of the graph.
         :rtype: str
         """
-        nodes_str = ''.join(f'{node}\n' for node in self.outgoing)
-        edges_str = ''.join(
-            f'{ edge }\n'
-            for node_edges in self.outgoing.values()
-            for edge in node_edges.values()
-        )
+        nodes_str = ''.join(f'{node}\n' for node in self.__storage.nodes())
+        edges_str = ''.join(f'{ edge }\n' for edge in self.__storage.edges())
         return f'Nodes:\n { nodes_str }\n  Edges:\n { edges_str }\n)'
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional, Union
+
+from .edge import Edge
+from .node import Node
+
+
+class ChangeType(str, Enum):
+    """
+    Enum representing the kinds of changes a graph reports.
+
+    Attributes:
+        NODE_INSERTED: A node was inserted.
+        NODE_REMOVED: A node was removed.
+        EDGE_INSERTED: An edge was inserted.
+        EDGE_REMOVED: An edge was removed.
+        PROPERTY_CHANGED: A property of a node or an edge was added, changed or removed.
+        CLEARED: The contents of the graph were replaced as a whole (e.g. by `Graph.clear`).
+                 Consumers should rebuild everything they derived from the graph.
+    """
+    NODE_INSERTED = "node_inserted"
+    NODE_REMOVED = "node_removed"
+    EDGE_INSERTED = "edge_inserted"
+    EDGE_REMOVED = "edge_removed"
+    PROPERTY_CHANGED = "property_changed"
+    CLEARED = "cleared"
+
+
+@dataclass(frozen=True)
+class GraphChange:
+    """
+    Represents a single change applied to a graph.
+
+    Changing the ID of a node is reported as the removal of the node under its old ID followed
+    by its insertion under the new one.
+
+    :param version: The version of the graph right after the change.
+    :type version: int
+    :param type: The kind of change.
+    :type type: ChangeType
+    :param entity: The node or edge that changed, or `None` for `ChangeType.CLEARED`.
+    :type entity: Optional[Union[Node, Edge]]
+    :param key: The changed property for `ChangeType.PROPERTY_CHANGED`, or `None` when all
+                properties were replaced at once.
+    :type key: Optional[str]
+    :param old_value: The previous property value (`MISSING` if it did not exist). When a node
+                      is removed, the ID it had in the graph.
+    :type old_value: Any
+    :param new_value: The new property value (`MISSING` if it was removed).
+    :type new_value: Any
+    """
+    version: int
+    type: ChangeType
+    entity: Optional[Union[Node, Edge]] = None
+    key: Optional[str] = None
+    old_value: Any = None
+    new_value: Any = None
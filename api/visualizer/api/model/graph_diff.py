@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from .edge import Edge
+from .node import Node
+
+
+@dataclass(frozen=True)
+class GraphDiff:
+    """
+    The differences between two graphs, as returned by `Graph.diff`.
+
+    Nodes are matched by ID and edges by the IDs of their endpoints. A node or edge that is in
+    both graphs has changed if its properties differ. Changing the ID of a node therefore shows
+    up as the removal of the node and the insertion of a new one.
+
+    :param added_nodes: The nodes of the other graph that are not in the graph.
+    :type added_nodes: List[Node]
+    :param removed_nodes: The nodes of the graph that are not in the other graph.
+    :type removed_nodes: List[Node]
+    :param changed_nodes: The nodes of the other graph whose properties differ from the node
+                          with the same ID in the graph.
+    :type changed_nodes: List[Node]
+    :param added_edges: The edges of the other graph that are not in the graph.
+    :type added_edges: List[Edge]
+    :param removed_edges: The edges of the graph that are not in the other graph.
+    :type removed_edges: List[Edge]
+    :param changed_edges: The edges of the other graph whose properties differ from the edge
+                          between the same nodes in the graph.
+    :type changed_edges: List[Edge]
+    """
+    added_nodes: List[Node] = field(default_factory=list)
+    removed_nodes: List[Node] = field(default_factory=list)
+    changed_nodes: List[Node] = field(default_factory=list)
+    added_edges: List[Edge] = field(default_factory=list)
+    removed_edges: List[Edge] = field(default_factory=list)
+    changed_edges: List[Edge] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """
+        Check if the graphs are the same.
+
+        :return: `True` if there are no differences, `False` otherwise.
+        :rtype: bool
+        """
+        return not (self.added_nodes or self.removed_nodes or self.changed_nodes or
+                    self.added_edges or self.removed_edges or self.changed_edges)
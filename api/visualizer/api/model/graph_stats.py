@@ -0,0 +1,234 @@
+from array import array
+from typing import Any, Dict, List, Optional
+
+from visualizer.api.algorithm.traversal import connected_components
+
+from .adjacency import AdjacencyMatrix
+from .graph_change import ChangeType, GraphChange
+
+
+class GraphStats:
+    """
+    Counts describing the structure of a graph, kept up to date with its changes, so reading them
+    never visits the nodes or edges: the weakly connected components, the self-loops and the
+    pairs of nodes with edges in both directions. The node and edge counts and the average degree
+    are read from the storage.
+
+    The components are tracked in a union-find structure over the node IDs, where inserting a
+    node adds a component and inserting an edge may merge two. Union-find cannot split
+    components, so removing the only edge between two nodes marks the component count as
+    outdated, and replacing the contents of the graph (e.g. by `retain_nodes`) marks every count
+    as outdated. Outdated counts read as `None` until `refresh` rebuilds them in a single pass,
+    which the code that changes the graph calls once it is done (e.g. after every command).
+    """
+
+    __slots__ = ["__graph", "__stale", "__components_stale", "__parents", "__sizes", "__component_count",
+                 "__self_loop_count", "__reciprocal_pair_count"]
+
+    def __init__(self, graph: Any) -> None:
+        """
+        Initialize the statistics of `graph` and subscribe to the changes of the graph. The counts
+        are outdated until the first `refresh`.
+
+        :param graph: The graph to describe.
+        :type graph: Graph
+        """
+        self.__graph = graph
+        self.__stale: bool = True
+        self.__components_stale: bool = True
+        graph.subscribe(self.on_change)
+
+    def close(self) -> None:
+        """ Stop following the changes of the graph. """
+        self.__graph.unsubscribe(self.on_change)
+
+    @property
+    def node_count(self) -> int:
+        """
+        Get the number of nodes.
+
+        :return: The number of nodes.
+        :rtype: int
+        """
+        return self.__graph.get_node_count()
+
+    @property
+    def edge_count(self) -> int:
+        """
+        Get the number of edges.
+
+        :return: The number of edges.
+        :rtype: int
+        """
+        return self.__graph.get_edge_count()
+
+    @property
+    def average_degree(self) -> float:
+        """
+        Get the average number of edges starting or ending at a node.
+
+        :return: The average degree, or 0 if the graph has no nodes.
+        :rtype: float
+        """
+        node_count: int = self.node_count
+        return 2 * self.edge_count / node_count if node_count else 0.0
+
+    @property
+    def component_count(self) -> Optional[int]:
+        """
+        Get the number of weakly connected components, i.e. groups of nodes connected when the
+        direction of the edges is ignored.
+
+        :return: The number of components, or `None` if it is outdated.
+        :rtype: Optional[int]
+        """
+        return None if self.__components_stale else self.__component_count
+
+    @property
+    def self_loop_count(self) -> Optional[int]:
+        """
+        Get the number of edges from a node to itself.
+
+        :return: The number of self-loops, or `None` if it is outdated.
+        :rtype: Optional[int]
+        """
+        return None if self.__stale else self.__self_loop_count
+
+    @property
+    def reciprocal_pair_count(self) -> Optional[int]:
+        """
+        Get the number of pairs of distinct nodes connected by edges in both directions.
+
+        :return: The number of reciprocal pairs, or `None` if it is outdated.
+        :rtype: Optional[int]
+        """
+        return None if self.__stale else self.__reciprocal_pair_count
+
+    def refresh(self) -> None:
+        """
+        Rebuild the outdated counts, in a single pass over the adjacency matrix of the graph.
+        Does nothing if all counts are current.
+        """
+        if not self.__stale and not self.__components_stale:
+            return
+        adjacency: AdjacencyMatrix = self.__graph.to_adjacency()
+        if self.__stale:
+            self.__count_edges(adjacency)
+        self.__build_components(adjacency)
+        self.__stale = self.__components_stale = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get all statistics as a JSON-serializable dictionary. Outdated counts are `None`.
+
+        :return: The statistics by name.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "nodes": self.node_count,
+            "edges": self.edge_count,
+            "components": self.component_count,
+            "average_degree": self.average_degree,
+            "self_loops": self.self_loop_count,
+            "reciprocal_pairs": self.reciprocal_pair_count
+        }
+
+    def on_change(self, change: GraphChange) -> None:
+        """
+        Update the statistics after a change of the graph.
+
+        :param change: The change made to the graph.
+        :type change: GraphChange
+        """
+        if change.type == ChangeType.PROPERTY_CHANGED or self.__stale:
+            return
+        if change.type == ChangeType.CLEARED:
+            self.__stale = self.__components_stale = True
+        elif change.type == ChangeType.EDGE_INSERTED:
+            source_id: str = change.entity.source.id
+            destination_id: str = change.entity.destination.id
+            if source_id == destination_id:
+                self.__self_loop_count += 1
+                return
+            if self.__reversed(change) is not None:
+                self.__reciprocal_pair_count += 1
+            if not self.__components_stale:
+                self.__union(source_id, destination_id)
+        elif change.type == ChangeType.EDGE_REMOVED:
+            if change.entity.source.id == change.entity.destination.id:
+                self.__self_loop_count -= 1
+            elif self.__reversed(change) is not None:
+                self.__reciprocal_pair_count -= 1  # the nodes stay connected by the other edge
+            else:
+                self.__components_stale = True
+        elif not self.__components_stale:
+            self.__change_node(change)
+
+    def __reversed(self, change: GraphChange) -> Any:
+        return self.__graph.storage.get_edge(change.entity.destination, change.entity.source)
+
+    def __change_node(self, change: GraphChange) -> None:
+        storage = self.__graph.storage
+        if change.type == ChangeType.NODE_INSERTED:
+            node_id: str = change.entity.id
+            if storage.out_degree(change.entity) or storage.in_degree(change.entity):
+                # a node whose ID changed keeps its edges
+                self.__components_stale = True
+                return
+            self.__parents[node_id] = node_id
+            self.__sizes[node_id] = 1
+            self.__component_count += 1
+        elif change.type == ChangeType.NODE_REMOVED:
+            node_id = change.old_value
+            if self.__sizes.get(node_id, 0) != 1:
+                self.__components_stale = True  # not a component of its own
+                return
+            del self.__parents[node_id]
+            del self.__sizes[node_id]
+            self.__component_count -= 1
+
+    def __find(self, node_id: str) -> str:
+        parents: Dict[str, str] = self.__parents
+        while parents[node_id] != node_id:
+            # point every other node on the way to its grandparent, which halves the path
+            parents[node_id] = parents[parents[node_id]]
+            node_id = parents[node_id]
+        return node_id
+
+    def __union(self, first_id: str, second_id: str) -> None:
+        first: str = self.__find(first_id)
+        second: str = self.__find(second_id)
+        if first == second:
+            return
+        if self.__sizes[first] < self.__sizes[second]:
+            first, second = second, first
+        self.__parents[second] = first
+        self.__sizes[first] += self.__sizes.pop(second)
+        self.__component_count -= 1
+
+    def __count_edges(self, adjacency: AdjacencyMatrix) -> None:
+        offsets: array = adjacency.offsets
+        targets: array = adjacency.targets
+        self_loops: int = 0
+        reciprocal_pairs: int = 0
+        for source in range(adjacency.get_node_count()):
+            for target in targets[offsets[source]:offsets[source + 1]]:
+                if target == source:
+                    self_loops += 1
+                elif target > source and source in targets[offsets[target]:offsets[target + 1]]:
+                    reciprocal_pairs += 1
+        self.__self_loop_count: int = self_loops
+        self.__reciprocal_pair_count: int = reciprocal_pairs
+
+    def __build_components(self, adjacency: AdjacencyMatrix) -> None:
+        # every component starts out as a tree of depth one, rooted at its first node
+        count, labels = connected_components(adjacency)
+        node_ids: List[str] = adjacency.node_ids
+        roots: List[str] = [""] * count
+        sizes: List[int] = [0] * count
+        for node_id, label in zip(reversed(node_ids), reversed(labels)):
+            roots[label] = node_id
+            sizes[label] += 1
+        self.__parents: Dict[str, str] = {node_id: roots[label] for node_id, label in zip(node_ids, labels)}
+        self.__sizes: Dict[str, int] = dict(zip(roots, sizes))
+        self.__component_count: int = count
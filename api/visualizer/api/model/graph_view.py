@@ -0,0 +1,280 @@
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union, overload
+
+from .adjacency import AdjacencyMatrix
+from .edge import Edge
+from .graph import Graph, GraphDict
+from .node import Node
+
+
+class GraphView:
+    """
+    A read-only view of a graph that shows only the nodes matching a predicate.
+
+    The view does not copy or change the graph it is based on. It offers the same read API as
+    `Graph`, so views and visualizers can render it in place of a graph. Only the edges whose
+    both endpoints are visible are shown.
+
+    Views can be stacked by basing a view on another view; the predicate of a stacked view is
+    then evaluated only for the nodes visible in its base. The visible nodes are computed lazily
+    and cached until the `version` of the underlying graph changes. Views are shared by the
+    threads reading a workspace, so the caches are rebuilt under a lock of the view.
+    """
+
+    __slots__ = ["__base", "__predicate", "__candidates", "__nodes", "__nodes_version", "__edge_count", "__serialized", "__adjacency",
+                 "__lock", "__weakref__"]
+
+    def __init__(
+        self,
+        base: Union[Graph, "GraphView"],
+        predicate: Callable[[Node], bool],
+        candidates: Optional[Callable[[], Optional[Iterable[Node]]]] = None
+    ) -> None:
+        """
+        Initialize a view of the nodes of `base` that match `predicate`.
+
+        :param base: The graph or view to show a part of.
+        :type base: Union[Graph, GraphView]
+        :param predicate: A function that returns `True` for the nodes that should be visible.
+        :type predicate: Callable[[Node], bool]
+        :param candidates: An optional function returning the nodes of the underlying graph that
+                           may match, in the order of the graph (e.g. looked up in a
+                           `PropertyIndex`), or `None` if all nodes of the base have to be checked.
+                           Only the candidates visible in the base are checked with `predicate`.
+        :type candidates: Optional[Callable[[], Optional[Iterable[Node]]]]
+
+        :raises TypeError: If the base is neither a `Graph` nor a `GraphView`.
+        """
+        if not isinstance(base, (Graph, GraphView)):
+            raise TypeError(f"Invalid base: Expected type 'Graph' or 'GraphView', but got {type(base).__name__}")
+        self.__base: Union[Graph, GraphView] = base
+        self.__predicate: Callable[[Node], bool] = predicate
+        self.__candidates: Optional[Callable[[], Optional[Iterable[Node]]]] = candidates
+        self.__nodes: Optional[Dict[str, Node]] = None
+        self.__nodes_version: int = -1
+        self.__edge_count: Optional[int] = None
+        self.__serialized: Optional[GraphDict] = None
+        self.__adjacency: Optional[AdjacencyMatrix] = None
+        # reentrant, since the edges are filtered by the visible nodes while the caches are built
+        self.__lock: threading.RLock = threading.RLock()
+
+    @property
+    def base(self) -> Union[Graph, "GraphView"]:
+        """
+        Get the graph or view this view is based on.
+
+        :return: The base of the view.
+        :rtype: Union[Graph, GraphView]
+        """
+        return self.__base
+
+    @property
+    def graph(self) -> Graph:
+        """
+        Get the graph at the bottom of the stack of views.
+
+        :return: The underlying graph.
+        :rtype: Graph
+        """
+        base: Union[Graph, GraphView] = self.__base
+        return base if isinstance(base, Graph) else base.graph
+
+    @property
+    def version(self) -> int:
+        """
+        Get the version of the underlying graph. The contents of the view change only when
+        the version does.
+
+        :return: The current version.
+        :rtype: int
+        """
+        return self.__base.version
+
+    def get_node_count(self) -> int:
+        """
+        Get the number of visible nodes.
+
+        :return: The number of nodes in the view.
+        :rtype: int
+        """
+        return len(self.__visible_nodes())
+
+    def get_edge_count(self) -> int:
+        """
+        Get the number of visible edges.
+
+        :return: The number of edges in the view.
+        :rtype: int
+        """
+        with self.__lock:
+            nodes: Dict[str, Node] = self.__visible_nodes()
+            if self.__edge_count is None:
+                self.__edge_count = sum(1 for node in nodes.values() for _ in self.__visible_edges(node))
+            return self.__edge_count
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        """
+        Retrieve a visible node by its ID.
+
+        :param node_id: The ID of the node to retrieve.
+        :type node_id: str
+
+        :return: The node with the specified ID, or `None` if it does not exist or is not visible.
+        :rtype: Optional[Node]
+        """
+        return self.__visible_nodes().get(node_id, None)
+
+    def get_nodes(self) -> Iterator[Node]:
+        """
+        Get an iterator over the visible nodes, in the order of the underlying graph.
+
+        :return: An iterator over the nodes in the view.
+        :rtype: Iterator[Node]
+        """
+        yield from self.__visible_nodes().values()
+
+    def get_incident_edges(self, node: Node) -> Iterator[Edge]:
+        """
+        Get the visible edges leaving a visible node.
+
+        :param node: The node for which to get the incident edges.
+        :type node: Node
+
+        :return: An iterator over the outgoing edges from the node.
+        :rtype: Iterator[Edge]
+
+        :raises KeyError: If the node is not in the view.
+        """
+        if not self.contains_node(node):
+            raise KeyError(f"Cannot retrieve incident edges: Node '{node}' is not present in the view.")
+
+        yield from self.__visible_edges(node)
+
+    def get_edge(self, source: Node, destination: Node) -> Optional[Edge]:
+        """
+        Get the edge between two visible nodes if it exists.
+
+        :param source: The source node of the edge.
+        :type source: Node
+        :param destination: The destination node of the edge.
+        :type destination: Node
+
+        :return: The edge from the source node to the destination node, or `None` if no such
+                 edge is visible.
+        :rtype: Optional[Edge]
+        """
+        if not self.contains_node(source) or not self.contains_node(destination):
+            return None
+        return self.__base.get_edge(source, destination)
+
+    @overload
+    def contains_node(self, node: Node) -> bool:
+        ...
+
+    @overload
+    def contains_node(self, node_id: str) -> bool:
+        ...
+
+    def contains_node(self, node_or_id: Union[Node, str]) -> bool:
+        """
+        Check if a node is visible in the view.
+
+        :param node_or_id: The node or node ID to check.
+        :type node_or_id: Union[Node, str]
+
+        :return: `True` if the node is visible, `False` otherwise.
+        :rtype: bool
+        """
+        node_id: str = node_or_id.id if isinstance(node_or_id, Node) else node_or_id
+        return node_id in self.__visible_nodes()
+
+    def contains_edge(self, edge: Edge) -> bool:
+        """
+        Check if an edge is visible in the view.
+
+        :param edge: The edge to check.
+        :type edge: Edge
+
+        :return: `True` if the edge is visible, `False` otherwise.
+        :rtype: bool
+        """
+        return self.get_edge(edge.source, edge.destination) is not None
+
+    def is_empty(self) -> bool:
+        """
+        Check if the view shows no nodes.
+
+        :return: `True` if the view is empty, `False` otherwise.
+        :rtype: bool
+        """
+        return not self.__visible_nodes()
+
+    def to_dict(self) -> GraphDict:
+        """
+        Return a dictionary representation of the view, in the same form as `Graph.to_dict`.
+
+        Like the one of a graph, the representation is shared between calls until the graph
+        changes and must be treated as read-only.
+
+        :return: A dictionary with 'nodes' and 'edges' as keys.
+        :rtype: GraphDict
+        """
+        with self.__lock:
+            nodes: Dict[str, Node] = self.__visible_nodes()
+            if self.__serialized is None:
+                edges: List[Edge] = [edge for node in nodes.values() for edge in self.__visible_edges(node)]
+                self.__serialized = {
+                    'nodes': [node.to_dict(deep_copy=False) for node in nodes.values()],
+                    'edges': [edge.to_dict(deep_copy=False) for edge in edges]
+                }
+            return self.__serialized
+
+    def to_adjacency(self) -> AdjacencyMatrix:
+        """
+        Return the structure of the view as a sparse adjacency matrix, in the same form as
+        `Graph.to_adjacency`. The matrix is taken from the one of the base.
+
+        :return: The adjacency matrix of the view.
+        :rtype: AdjacencyMatrix
+        """
+        with self.__lock:
+            nodes: Dict[str, Node] = self.__visible_nodes()
+            if self.__adjacency is None:
+                base: AdjacencyMatrix = self.__base.to_adjacency()
+                self.__adjacency = base.subgraph([base.index_of(node_id) for node_id in nodes])
+            return self.__adjacency
+
+    def __visible_nodes(self) -> Dict[str, Node]:
+        with self.__lock:
+            version: int = self.__base.version
+            if self.__nodes is None or self.__nodes_version != version:
+                candidates: Optional[Iterable[Node]] = self.__candidates() if self.__candidates is not None else None
+                if candidates is None:
+                    self.__nodes = {node.id: node for node in self.__base.get_nodes() if self.__predicate(node)}
+                else:
+                    self.__nodes = {
+                        node.id: node for node in candidates
+                        if self.__base.get_node(node.id) is node and self.__predicate(node)
+                    }
+                self.__nodes_version = version
+                self.__edge_count = None
+                self.__serialized = None
+                self.__adjacency = None
+            return self.__nodes
+
+    def __visible_edges(self, node: Node) -> Iterator[Edge]:
+        nodes: Dict[str, Node] = self.__visible_nodes()
+        for edge in self.__base.get_incident_edges(node):
+            if edge.destination.id in nodes:
+                yield edge
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the view, listing its nodes and edges.
+
+        :return: A formatted string representing the nodes and edges of the view.
+        :rtype: str
+        """
+        nodes_str = ''.join(f'{node}\n' for node in self.get_nodes())
+        edges_str = ''.join(f'{edge}\n' for node in self.get_nodes() for edge in self.__visible_edges(node))
+        return f'Nodes:\n { nodes_str }\n  Edges:\n { edges_str }\n)'
@@ -0,0 +1,94 @@
+import sys
+import uuid
+from abc import ABC, abstractmethod
+from typing import Dict, Type
+
+
+class IdAllocator(ABC):
+    """
+    Abstract base class for the strategies that generate the IDs of nodes created without one.
+    """
+
+    @abstractmethod
+    def allocate(self) -> str:
+        """
+        Generate a new node ID.
+
+        :return: An ID not returned before by this allocator.
+        :rtype: str
+        """
+        ...
+
+
+class UuidIdAllocator(IdAllocator):
+    """
+    Generates random UUIDs, which are unique across allocators but differ every time.
+    """
+
+    def allocate(self) -> str:
+        return str(uuid.uuid4())
+
+
+class SequentialIdAllocator(IdAllocator):
+    """
+    Generates short sequential IDs ('n0', 'n1', ...).
+
+    The IDs are interned, so comparing and hashing them is cheap, and the same sequence of
+    allocations always produces the same IDs. A loader that uses a new allocator for every load
+    therefore gives the nodes of the same input the same IDs on every reload, which lets caches
+    keyed on node IDs survive reloads.
+
+    The IDs are only unique among the IDs of the same allocator; they may collide with IDs taken
+    from the input.
+    """
+
+    __slots__ = ["__prefix", "__next"]
+
+    def __init__(self, prefix: str = "n", start: int = 0) -> None:
+        """
+        Initialize an allocator that generates IDs from `prefix` followed by a counter.
+
+        :param prefix: The text every ID starts with.
+        :type prefix: str
+        :param start: The number of the first ID.
+        :type start: int
+        """
+        self.__prefix: str = prefix
+        self.__next: int = start
+
+    def allocate(self) -> str:
+        node_id: str = sys.intern(f"{self.__prefix}{self.__next}")
+        self.__next += 1
+        return node_id
+
+    def reset(self, start: int = 0) -> None:
+        """
+        Restart the counter, so the same IDs are generated again.
+
+        :param start: The number of the next ID.
+        :type start: int
+        """
+        self.__next = start
+
+
+ID_ALLOCATORS: Dict[str, Type[IdAllocator]] = {
+    "uuid": UuidIdAllocator,
+    "sequential": SequentialIdAllocator,
+}
+
+
+def create_id_allocator(name: str) -> IdAllocator:
+    """
+    Create a node ID allocator by its name.
+
+    :param name: The name of the allocator ('uuid' or 'sequential').
+    :type name: str
+
+    :return: A new allocator.
+    :rtype: IdAllocator
+
+    :raises ValueError: If no allocator is registered under the given name.
+    """
+    if name not in ID_ALLOCATORS:
+        raise ValueError(f"Unknown ID allocator '{name}'. Expected one of: {', '.join(ID_ALLOCATORS)}.")
+    return ID_ALLOCATORS[name]()
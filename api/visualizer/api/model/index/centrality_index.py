@@ -0,0 +1,214 @@
+import threading
+from array import array
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import compress, repeat
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+from visualizer.api.algorithm.centrality import betweenness, pagerank
+
+from ..adjacency import AdjacencyMatrix
+from ..graph_change import ChangeType, GraphChange
+from ..node import Node
+from .column_store import OPERATORS
+
+PAGERANK: str = "pagerank"
+BETWEENNESS: str = "betweenness"
+# the virtual keys `filter` looks up in the centrality index instead of the node properties
+CENTRALITY_KEYS: Tuple[str, ...] = (PAGERANK, BETWEENNESS)
+
+
+@dataclass(frozen=True)
+class _Scores:
+    # the scores of one structure of the graph, replaced as a whole so readers never mix them
+    version: int
+    adjacency: AdjacencyMatrix
+    nodes: List[Node]
+    measures: Dict[str, array]
+
+
+class CentralityIndex:
+    """
+    The PageRank and the estimated betweenness of every node of a graph, by version of the graph.
+
+    Unlike the other indexes, this one never computes anything on a lookup, since the measures
+    visit every edge many times: `compute` is meant to run in a background thread, while lookups
+    only read the scores of the last computation and fail right away if there are none. That
+    also lets visualizers size nodes by their scores (checking `ready` first) without waiting.
+
+    Nothing is computed for a graph whose scores are never looked up: a lookup that finds no
+    scores marks them as `wanted`, which is what the computing thread waits for.
+
+    The scores are kept with the version of the graph they were computed for. Property changes
+    keep them valid, while inserting or removing nodes or edges drops them, and a computation that
+    started before such a change does not store its outdated scores.
+    """
+
+    __slots__ = ["__graph", "__lock", "__structure_version", "__scores", "__wanted"]
+
+    def __init__(self, graph: Any) -> None:
+        """
+        Initialize a centrality index over `graph` and subscribe to the changes of the graph.
+
+        :param graph: The graph whose nodes are ranked.
+        :type graph: Graph
+        """
+        self.__graph = graph
+        # guards the scores against computations in other threads
+        self.__lock: threading.Lock = threading.Lock()
+        # the version of the last change that inserted or removed nodes or edges
+        self.__structure_version: int = 0
+        self.__scores: Optional[_Scores] = None
+        self.__wanted: bool = False
+        graph.subscribe(self.on_change)
+
+    def close(self) -> None:
+        """ Stop following the changes of the graph. """
+        self.__graph.unsubscribe(self.on_change)
+
+    @property
+    def version(self) -> Optional[int]:
+        """
+        Get the version of the graph the scores were computed for.
+
+        :return: The version, or `None` if there are no valid scores.
+        :rtype: Optional[int]
+        """
+        scores: Optional[_Scores] = self.__scores
+        return scores.version if scores is not None else None
+
+    @property
+    def wanted(self) -> bool:
+        """
+        Check whether scores were looked up, but missing, since the last computation.
+
+        :return: True if the scores should be computed.
+        :rtype: bool
+        """
+        return self.__wanted
+
+    def ready(self, key: Optional[str] = None) -> bool:
+        """
+        Check whether a measure has been computed for the current structure of the graph. If it
+        has not, the scores are marked as `wanted`.
+
+        :param key: One of 'pagerank' and 'betweenness', or `None` for both.
+        :type key: Optional[str]
+
+        :return: Whether the scores can be looked up.
+        :rtype: bool
+        """
+        if self.__ready(key):
+            return True
+        self.__wanted = True
+        return False
+
+    def compute(self, read: Callable[[], ContextManager] = nullcontext, samples: int = 32) -> bool:
+        """
+        Compute the scores for the current structure of the graph, unless they are known already.
+
+        Only reading the structure needs the graph to stay unchanged, so the caller passes the
+        read side of the lock that guards the graph, which is held for just that. PageRank is
+        stored before the betweenness is computed, since it is the faster of the two.
+
+        :param read: Returns a context manager holding the graph unchanged while it is read.
+        :type read: Callable[[], ContextManager]
+        :param samples: The number of source nodes the betweenness is estimated from.
+        :type samples: int
+
+        :return: Whether the scores were stored, which fails if the structure of the graph
+                 changed during the computation.
+        :rtype: bool
+        """
+        if self.__ready():
+            return True
+        with read():
+            version: int = self.__graph.version
+            adjacency: AdjacencyMatrix = self.__graph.to_adjacency()
+            nodes: List[Node] = list(self.__graph.get_nodes())
+
+        measures: Dict[str, Callable[[AdjacencyMatrix], array]] = {
+            PAGERANK: pagerank, BETWEENNESS: lambda matrix: betweenness(matrix, samples)
+        }
+        for key, measure in measures.items():
+            result: array = measure(adjacency)
+            with self.__lock:
+                if self.__structure_version > version:
+                    return False
+                scores: Optional[_Scores] = self.__scores
+                known: Dict[str, array] = scores.measures if scores is not None and scores.version == version else {}
+                self.__scores = _Scores(version, adjacency, nodes, {**known, key: result})
+        with self.__lock:
+            self.__wanted = False
+        return True
+
+    def get(self, key: str, node: Node) -> float:
+        """
+        Get a score of a node.
+
+        :param key: One of 'pagerank' and 'betweenness'.
+        :type key: str
+        :param node: A node of the graph.
+        :type node: Node
+
+        :return: The score of the node.
+        :rtype: float
+
+        :raises ValueError: If the key does not name a measure, or the measure has not been
+                            computed for the current structure of the graph yet.
+        :raises KeyError: If the node is not in the graph.
+        """
+        scores: _Scores = self.__ready_scores(key)
+        return scores.measures[key][scores.adjacency.index_of(node.id)]
+
+    def find(self, key: str, operator: str, compare_value: Any) -> Optional[List[Node]]:
+        """
+        Find the nodes whose score compares to `compare_value` with `operator`.
+
+        :param key: One of 'pagerank' and 'betweenness'.
+        :type key: str
+        :param operator: One of '==', '!=', '<', '<=', '>' and '>='.
+        :type operator: str
+        :param compare_value: The number to compare the scores with.
+        :type compare_value: Any
+
+        :return: The matching nodes in the order of the graph, or `None` if `compare_value` is
+                 not a number and the nodes have to be scanned instead.
+        :rtype: Optional[List[Node]]
+
+        :raises ValueError: If the key does not name a measure, or the measure has not been
+                            computed for the current structure of the graph yet.
+        """
+        scores: _Scores = self.__ready_scores(key)
+        compare: Optional[Callable[[Any, Any], bool]] = OPERATORS.get(operator, None)
+        if compare is None or type(compare_value) not in (int, float, bool):
+            return None
+        return list(compress(scores.nodes, map(compare, scores.measures[key], repeat(compare_value))))
+
+    def on_change(self, change: GraphChange) -> None:
+        """
+        Drop the scores after a change of the structure of the graph.
+
+        :param change: The change made to the graph.
+        :type change: GraphChange
+        """
+        if change.type == ChangeType.PROPERTY_CHANGED:
+            return
+        with self.__lock:
+            self.__structure_version = change.version
+            self.__scores = None
+
+    def __ready(self, key: Optional[str] = None) -> bool:
+        scores: Optional[_Scores] = self.__scores
+        if scores is None:
+            return False
+        return all(measure in scores.measures for measure in ((key,) if key is not None else CENTRALITY_KEYS))
+
+    def __ready_scores(self, key: str) -> _Scores:
+        if key not in CENTRALITY_KEYS:
+            raise ValueError(f"Unknown centrality '{key}'. Expected one of: {', '.join(CENTRALITY_KEYS)}.")
+        scores: Optional[_Scores] = self.__scores
+        if scores is None or key not in scores.measures:
+            self.__wanted = True
+            raise ValueError(f"The {key} of the nodes is still being computed. Try again in a moment.")
+        return scores
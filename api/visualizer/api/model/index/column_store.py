@@ -0,0 +1,398 @@
+import operator as operators
+from array import array
+from enum import Enum
+from collections import Counter
+from itertools import compress, repeat
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from ..graph_change import ChangeType, GraphChange
+from ..node import Node
+from ..observable import MISSING
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operators.eq,
+    "!=": operators.ne,
+    "<": operators.lt,
+    "<=": operators.le,
+    ">": operators.gt,
+    ">=": operators.ge
+}
+
+# the state of a row of a column
+ABSENT: int = 0
+NULL: int = 1
+VALUE: int = 2
+
+# translation tables selecting the rows in the given states
+VALUE_ROWS: bytes = bytes(1 if state == VALUE else 0 for state in range(256))
+NULL_ROWS: bytes = bytes(1 if state == NULL else 0 for state in range(256))
+
+INT_MIN: int = -2 ** 63
+INT_MAX: int = 2 ** 63 - 1
+# integers up to this magnitude are represented exactly by a float
+EXACT_FLOAT_MAX: int = 2 ** 53
+
+
+class ColumnType(str, Enum):
+    """
+    Enum representing how a column stores its values.
+
+    Attributes:
+        INT: Integers (and booleans, which compare like integers) in a 64-bit integer array.
+        FLOAT: Numbers in a double array. Integers are only stored if a float keeps them exactly.
+        CATEGORY: Strings, stored once each, and a code per row.
+        OBJECT: Any other or mixed values, in a list.
+    """
+    INT = "int"
+    FLOAT = "float"
+    CATEGORY = "category"
+    OBJECT = "object"
+
+
+class Column:
+    """
+    The values of one node property, stored by row.
+
+    Every row has a state in a byte array (the null mask): the node lacks the property, its value
+    is `None`, or it has a value. The values are kept in a typed array where possible, so a
+    comparison runs over the whole array in C (`map` and `compress`) instead of over the property
+    dictionaries of the nodes, and a string column only compares each distinct string once.
+
+    Strings are stored lowercased, the way `filter` compares them. A value that does not fit the
+    type of the column changes the type to a more general one.
+    """
+
+    __slots__ = ["__type", "__states", "__values", "__categories", "__codes"]
+
+    def __init__(self, values: List[Any]) -> None:
+        """
+        Initialize a column from the values of its rows.
+
+        :param values: The value of every row, or `MISSING` for rows without one. Strings must
+                       already be lowercased.
+        :type values: List[Any]
+        """
+        self.__states: bytearray = bytearray(VALUE if value is not None else NULL for value in values)
+        for row in compress(range(len(values)), map(operators.is_, values, repeat(MISSING))):
+            self.__states[row] = ABSENT
+        self.__categories: List[str] = []
+        self.__codes: Dict[str, int] = {}
+
+        types = set(map(type, compress(values, self.__states.translate(VALUE_ROWS))))
+        if types <= {int, bool}:
+            self.__type = ColumnType.INT
+            try:
+                self.__values = array("q", self.__placeholders(values, 0))
+                return
+            except OverflowError:
+                pass
+        elif types <= {int, bool, float} and self.__exact_floats(values):
+            self.__type = ColumnType.FLOAT
+            self.__values = array("d", self.__placeholders(values, 0.0))
+            return
+        elif types == {str}:
+            self.__type = ColumnType.CATEGORY
+            self.__values = array("I", (
+                self.__code(value) if state == VALUE else 0 for state, value in zip(self.__states, values)
+            ))
+            return
+        self.__type = ColumnType.OBJECT
+        self.__values = [value if value is not None else MISSING for value in values]
+
+    @property
+    def type(self) -> ColumnType:
+        """
+        Get how the column stores its values.
+
+        :return: The type of the column.
+        :rtype: ColumnType
+        """
+        return self.__type
+
+    def __len__(self) -> int:
+        return len(self.__states)
+
+    def get(self, row: int) -> Any:
+        """
+        Get the value of a row.
+
+        :param row: The row.
+        :type row: int
+
+        :return: The value (strings lowercased), or `MISSING` if the row has no value.
+        :rtype: Any
+        """
+        state: int = self.__states[row] if row < len(self.__states) else ABSENT
+        if state != VALUE:
+            return None if state == NULL else MISSING
+        if self.__type == ColumnType.CATEGORY:
+            return self.__categories[self.__values[row]]
+        return self.__values[row]
+
+    def set(self, row: int, value: Any) -> None:
+        """
+        Set the value of a row, adding rows up to it if needed.
+
+        :param row: The row.
+        :type row: int
+        :param value: The new value, or `MISSING` to remove the value. Strings must already be
+                      lowercased.
+        :type value: Any
+        """
+        if row >= len(self.__states):
+            self.__grow(row + 1)
+        if value is MISSING or value is None:
+            self.__states[row] = ABSENT if value is MISSING else NULL
+            return
+        self.__states[row] = VALUE
+        if self.__type == ColumnType.INT and type(value) in (int, bool) and INT_MIN <= value <= INT_MAX:
+            self.__values[row] = value
+        elif self.__type == ColumnType.INT and type(value) is float and self.__exact_floats(self.__values):
+            self.__convert(ColumnType.FLOAT)
+            self.__values[row] = value
+        elif self.__type == ColumnType.FLOAT and type(value) in (int, bool, float) and self.__exact_floats([value]):
+            self.__values[row] = value
+        elif self.__type == ColumnType.CATEGORY and type(value) is str:
+            self.__values[row] = self.__code(value)
+        else:
+            if self.__type != ColumnType.OBJECT:
+                self.__convert(ColumnType.OBJECT)
+            self.__values[row] = value
+
+    def find(self, operator: str, compare_value: Any) -> Optional[List[int]]:
+        """
+        Find the rows whose value compares to `compare_value` with `operator`, following the
+        rules of `CompareUtil`: `None` is only equal to `None` and never in a range.
+
+        :param operator: One of '==', '!=', '<', '<=', '>' and '>='.
+        :type operator: str
+        :param compare_value: The value to compare the values with.
+        :type compare_value: Any
+
+        :return: The matching rows in ascending order, or `None` if some value cannot be
+                 compared with `compare_value` and the nodes have to be scanned instead.
+        :rtype: Optional[List[int]]
+        """
+        compare: Optional[Callable[[Any, Any], bool]] = OPERATORS.get(operator, None)
+        if compare is None:
+            return None
+
+        nulls_match: bool = (compare_value is None) == (operator == "==") and operator in ("==", "!=")
+        if compare_value is None:
+            rows: List[int] = [] if operator != "!=" else self.__rows(VALUE_ROWS)
+        else:
+            try:
+                rows = list(compress(range(len(self.__states)), self.__matches(compare, compare_value)))
+            except TypeError:
+                return None
+        if nulls_match and NULL in self.__states:
+            rows = sorted(rows + self.__rows(NULL_ROWS))
+        return rows
+
+    def value_count(self) -> int:
+        """
+        Count the rows that have a value, including `None`.
+
+        :return: The number of rows with a value.
+        :rtype: int
+        """
+        return len(self.__states) - self.__states.count(ABSENT)
+
+    def counts(self) -> Optional[Dict[Optional[str], int]]:
+        """
+        Count the rows of every string of a category column.
+
+        :return: The number of rows of every (lowercased) string, and of `None` if some rows are
+                 `None`, or `None` if the column does not store categories and the values have to
+                 be counted from the nodes instead.
+        :rtype: Optional[Dict[Optional[str], int]]
+        """
+        if self.__type != ColumnType.CATEGORY:
+            return None
+        codes: Counter = Counter(compress(self.__values, self.__states.translate(VALUE_ROWS)))
+        counts: Dict[Optional[str], int] = {self.__categories[code]: count for code, count in codes.items()}
+        nulls: int = self.__states.count(NULL)
+        if nulls:
+            counts[None] = nulls
+        return counts
+
+    def numbers(self) -> Optional[List[Union[int, float]]]:
+        """
+        Get the values of the rows of a numeric column.
+
+        :return: The values of the rows that have one, booleans as integers, or `None` if the
+                 column is not numeric and the values have to be read from the nodes instead.
+        :rtype: Optional[List[Union[int, float]]]
+        """
+        if self.__type not in (ColumnType.INT, ColumnType.FLOAT):
+            return None
+        return list(compress(self.__values, self.__states.translate(VALUE_ROWS)))
+
+    def __matches(self, compare: Callable[[Any, Any], bool], compare_value: Any) -> Iterator[Any]:
+        valid: bytes = self.__states.translate(VALUE_ROWS)
+        if self.__type == ColumnType.CATEGORY:
+            table: bytes = bytes(compare(category, compare_value) for category in self.__categories)
+            return map(operators.and_, valid, map(table.__getitem__, self.__values))
+        if self.__type == ColumnType.OBJECT:
+            return (
+                is_valid and compare(value, compare_value) for is_valid, value in zip(valid, self.__values)
+            )
+        return map(operators.and_, valid, map(compare, self.__values, repeat(compare_value)))
+
+    def __rows(self, table: bytes) -> List[int]:
+        return list(compress(range(len(self.__states)), self.__states.translate(table)))
+
+    def __code(self, category: str) -> int:
+        code: Optional[int] = self.__codes.get(category, None)
+        if code is None:
+            code = self.__codes[category] = len(self.__categories)
+            self.__categories.append(category)
+        return code
+
+    def __grow(self, length: int) -> None:
+        count: int = length - len(self.__states)
+        self.__states.extend(bytes(count))
+        if self.__type == ColumnType.OBJECT:
+            self.__values.extend(repeat(MISSING, count))
+        else:
+            self.__values.extend(repeat(0, count))
+
+    def __convert(self, column_type: ColumnType) -> None:
+        values: List[Any] = [self.get(row) for row in range(len(self.__states))]
+        if column_type == ColumnType.FLOAT:
+            self.__values = array("d", self.__placeholders(values, 0.0))
+        else:
+            self.__values = [value if value is not None else MISSING for value in values]
+        self.__type = column_type
+
+    def __placeholders(self, values: List[Any], placeholder: Any) -> Iterator[Any]:
+        # rows without a value hold a placeholder of the column type, which `find` masks out
+        return (value if state == VALUE else placeholder for state, value in zip(self.__states, values))
+
+    @staticmethod
+    def __exact_floats(values: Any) -> bool:
+        return all(
+            type(value) is float or -EXACT_FLOAT_MAX <= value <= EXACT_FLOAT_MAX
+            for value in values if type(value) in (int, bool, float)
+        )
+
+
+class ColumnStore:
+    """
+    A secondary read index over node properties, with one `Column` per property key, kept up to
+    date with the graph like the other indexes.
+
+    It is not a storage layout: the nodes keep their property dictionaries, which remain the only
+    source of truth, and a column is an extra copy of one property that costs memory on top of
+    them. In exchange, repeated filters over the same property compare a whole column instead of
+    visiting every node.
+
+    Every node of the graph has a row, assigned in the order of the graph. The column of a key
+    is built on its first lookup and then updated with every change of the graph. The store can
+    be dropped at any time. Changes made inside a property value (e.g. appending to a list) are
+    not reported by the graph and are not seen by the store; such properties should be replaced
+    instead. Comparisons a column cannot answer exactly like a scan, e.g. of strings with
+    numbers or NaN, make `find` return `None`, so the caller scans the nodes instead.
+    """
+
+    __slots__ = ["__graph", "__stale", "__rows", "__nodes", "__columns"]
+
+    def __init__(self, graph: Any) -> None:
+        """
+        Initialize a store for the node properties of `graph` and subscribe to the changes of
+        the graph.
+
+        :param graph: The graph whose node properties are stored.
+        :type graph: Graph
+        """
+        self.__graph = graph
+        self.__stale: bool = True
+        graph.subscribe(self.on_change)
+
+    def close(self) -> None:
+        """ Stop following the changes of the graph. """
+        self.__graph.unsubscribe(self.on_change)
+
+    def column(self, key: str) -> Column:
+        """
+        Get the column of a property, building it on the first call.
+
+        :param key: The name of the node property.
+        :type key: str
+
+        :return: The column, with a row for every node that was ever in the graph since the
+                 store was last rebuilt. Rows of removed nodes have no value.
+        :rtype: Column
+        """
+        if self.__stale:
+            self.__rebuild()
+        column: Optional[Column] = self.__columns.get(key, None)
+        if column is None:
+            column = self.__columns[key] = Column([
+                self.__value(node, key) if node is not None else MISSING for node in self.__nodes
+            ])
+        return column
+
+    def find(self, key: str, operator: str, compare_value: Any) -> Optional[List[Node]]:
+        """
+        Find the nodes whose property `key` compares to `compare_value` with `operator`.
+
+        Strings in `compare_value` must already be lowercased, as `filter` does.
+
+        :param key: The name of the node property.
+        :type key: str
+        :param operator: One of '==', '!=', '<', '<=', '>' and '>='.
+        :type operator: str
+        :param compare_value: The value to compare the property values with.
+        :type compare_value: Any
+
+        :return: The matching nodes in the order of the graph, or `None` if the store cannot
+                 answer the query and the nodes have to be scanned instead.
+        :rtype: Optional[List[Node]]
+        """
+        rows: Optional[List[int]] = self.column(key).find(operator, compare_value)
+        if rows is None:
+            return None
+        return list(map(self.__nodes.__getitem__, rows))
+
+    def on_change(self, change: GraphChange) -> None:
+        """
+        Update the store after a change of the graph.
+
+        :param change: The change made to the graph.
+        :type change: GraphChange
+        """
+        if self.__stale:
+            return
+        if change.type == ChangeType.CLEARED:
+            self.__stale = True
+        elif change.type == ChangeType.NODE_INSERTED:
+            row: int = len(self.__nodes)
+            self.__rows[change.entity.id] = row
+            self.__nodes.append(change.entity)
+            for key, column in self.__columns.items():
+                column.set(row, self.__value(change.entity, key))
+        elif change.type == ChangeType.NODE_REMOVED:
+            row = self.__rows.pop(change.old_value)
+            self.__nodes[row] = None
+            for column in self.__columns.values():
+                column.set(row, MISSING)
+            # rows are never reused, so start over once most of them belong to removed nodes
+            if len(self.__rows) < len(self.__nodes) // 2:
+                self.__stale = True
+        elif change.type == ChangeType.PROPERTY_CHANGED and isinstance(change.entity, Node):
+            row = self.__rows[change.entity.id]
+            for key, column in self.__columns.items():
+                if change.key is None or change.key == key:
+                    column.set(row, self.__value(change.entity, key))
+
+    def __rebuild(self) -> None:
+        self.__nodes: List[Optional[Node]] = list(self.__graph.get_nodes())
+        self.__rows: Dict[str, int] = {node.id: row for row, node in enumerate(self.__nodes)}
+        self.__columns: Dict[str, Column] = {}
+        self.__stale = False
+
+    @staticmethod
+    def __value(node: Node, key: str) -> Any:
+        value: Any = node.properties.get(key, MISSING)
+        return value.lower() if isinstance(value, str) else value
@@ -0,0 +1,217 @@
+import heapq
+import operator as operators
+from array import array
+from itertools import compress, repeat
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..graph_change import ChangeType, GraphChange
+from ..node import Node
+from .column_store import OPERATORS
+
+IN_DEGREE: str = "in_degree"
+OUT_DEGREE: str = "out_degree"
+DEGREE: str = "degree"
+# the virtual keys `filter` looks up in the degree index instead of the node properties
+DEGREE_KEYS: Tuple[str, ...] = (DEGREE, IN_DEGREE, OUT_DEGREE)
+
+
+class DegreeIndex:
+    """
+    The in-degree and out-degree of every node of a graph, kept up to date with the graph.
+
+    Every node has a row, assigned in the order of the graph, and the degrees are counters in
+    integer arrays that every inserted or removed edge increments or decrements. Finding the
+    nodes with a degree in a range therefore compares whole arrays instead of asking the storage
+    for the edges of every node, and the nodes with the highest degrees are selected with a heap.
+
+    The degree of a node is the sum of its in-degree and out-degree, so an edge from a node to
+    itself counts twice.
+    """
+
+    __slots__ = ["__graph", "__stale", "__rows", "__nodes", "__present", "__in_degrees", "__out_degrees"]
+
+    def __init__(self, graph: Any) -> None:
+        """
+        Initialize an index over the degrees of the nodes of `graph` and subscribe to the changes
+        of the graph.
+
+        :param graph: The graph whose degrees are indexed.
+        :type graph: Graph
+        """
+        self.__graph = graph
+        self.__stale: bool = True
+        graph.subscribe(self.on_change)
+
+    def close(self) -> None:
+        """ Stop following the changes of the graph. """
+        self.__graph.unsubscribe(self.on_change)
+
+    def in_degree(self, node: Node) -> int:
+        """
+        Get the number of edges ending at a node.
+
+        :param node: A node of the graph.
+        :type node: Node
+
+        :return: The in-degree of the node.
+        :rtype: int
+
+        :raises KeyError: If the node is not in the graph.
+        """
+        row: int = self.__row(node)
+        return self.__in_degrees[row]
+
+    def out_degree(self, node: Node) -> int:
+        """
+        Get the number of edges starting at a node.
+
+        :param node: A node of the graph.
+        :type node: Node
+
+        :return: The out-degree of the node.
+        :rtype: int
+
+        :raises KeyError: If the node is not in the graph.
+        """
+        row: int = self.__row(node)
+        return self.__out_degrees[row]
+
+    def degree(self, node: Node) -> int:
+        """
+        Get the number of edges starting or ending at a node.
+
+        :param node: A node of the graph.
+        :type node: Node
+
+        :return: The degree of the node.
+        :rtype: int
+
+        :raises KeyError: If the node is not in the graph.
+        """
+        row: int = self.__row(node)
+        return self.__in_degrees[row] + self.__out_degrees[row]
+
+    def get(self, key: str, node: Node) -> int:
+        """
+        Get a degree of a node by the name `filter` uses for it.
+
+        :param key: One of 'degree', 'in_degree' and 'out_degree'.
+        :type key: str
+        :param node: A node of the graph.
+        :type node: Node
+
+        :return: The degree of the node.
+        :rtype: int
+
+        :raises ValueError: If the key does not name a degree.
+        :raises KeyError: If the node is not in the graph.
+        """
+        if key == IN_DEGREE:
+            return self.in_degree(node)
+        if key == OUT_DEGREE:
+            return self.out_degree(node)
+        if key == DEGREE:
+            return self.degree(node)
+        raise ValueError(f"Unknown degree '{key}'. Expected one of: {', '.join(DEGREE_KEYS)}.")
+
+    def find(self, key: str, operator: str, compare_value: Any) -> Optional[List[Node]]:
+        """
+        Find the nodes whose degree compares to `compare_value` with `operator`.
+
+        :param key: One of 'degree', 'in_degree' and 'out_degree'.
+        :type key: str
+        :param operator: One of '==', '!=', '<', '<=', '>' and '>='.
+        :type operator: str
+        :param compare_value: The number to compare the degrees with.
+        :type compare_value: Any
+
+        :return: The matching nodes in the order of the graph, or `None` if `compare_value` is
+                 not a number and the nodes have to be scanned instead.
+        :rtype: Optional[List[Node]]
+
+        :raises ValueError: If the key does not name a degree.
+        """
+        compare: Optional[Callable[[Any, Any], bool]] = OPERATORS.get(operator, None)
+        if compare is None or type(compare_value) not in (int, float, bool):
+            return None
+        matches: Iterator[bool] = map(compare, self.__degrees(key), repeat(compare_value))
+        rows: Iterator[int] = compress(range(len(self.__nodes)), map(operators.and_, self.__present, matches))
+        return list(map(self.__nodes.__getitem__, rows))
+
+    def top(self, key: str = DEGREE, k: int = 10) -> List[Tuple[Node, int]]:
+        """
+        Get the nodes with the highest degrees.
+
+        :param key: One of 'degree', 'in_degree' and 'out_degree'.
+        :type key: str
+        :param k: The maximum number of nodes to return.
+        :type k: int
+
+        :return: Up to `k` nodes and their degrees, the highest degree first. Nodes with equal
+                 degrees are in the order of the graph.
+        :rtype: List[Tuple[Node, int]]
+
+        :raises ValueError: If the key does not name a degree.
+        """
+        degrees: List[int] = list(self.__degrees(key))
+        rows: List[int] = heapq.nlargest(
+            k, compress(range(len(self.__nodes)), self.__present), key=degrees.__getitem__
+        )
+        return [(self.__nodes[row], degrees[row]) for row in rows]
+
+    def on_change(self, change: GraphChange) -> None:
+        """
+        Update the index after a change of the graph.
+
+        :param change: The change made to the graph.
+        :type change: GraphChange
+        """
+        if self.__stale:
+            return
+        if change.type == ChangeType.CLEARED:
+            self.__stale = True
+        elif change.type == ChangeType.EDGE_INSERTED:
+            self.__out_degrees[self.__rows[change.entity.source.id]] += 1
+            self.__in_degrees[self.__rows[change.entity.destination.id]] += 1
+        elif change.type == ChangeType.EDGE_REMOVED:
+            self.__out_degrees[self.__rows[change.entity.source.id]] -= 1
+            self.__in_degrees[self.__rows[change.entity.destination.id]] -= 1
+        elif change.type == ChangeType.NODE_INSERTED:
+            self.__rows[change.entity.id] = len(self.__nodes)
+            self.__nodes.append(change.entity)
+            self.__present.append(1)
+            self.__in_degrees.append(0)
+            self.__out_degrees.append(0)
+        elif change.type == ChangeType.NODE_REMOVED:
+            # only nodes without edges can be removed, so their degrees are already 0
+            row: int = self.__rows.pop(change.old_value)
+            self.__nodes[row] = None
+            self.__present[row] = 0
+            # rows are never reused, so start over once most of them belong to removed nodes
+            if len(self.__rows) < len(self.__nodes) // 2:
+                self.__stale = True
+
+    def __row(self, node: Node) -> int:
+        if self.__stale:
+            self.__rebuild()
+        return self.__rows[node.id]
+
+    def __degrees(self, key: str) -> Iterator[int]:
+        if self.__stale:
+            self.__rebuild()
+        if key == IN_DEGREE:
+            return iter(self.__in_degrees)
+        if key == OUT_DEGREE:
+            return iter(self.__out_degrees)
+        if key == DEGREE:
+            return map(operators.add, self.__in_degrees, self.__out_degrees)
+        raise ValueError(f"Unknown degree '{key}'. Expected one of: {', '.join(DEGREE_KEYS)}.")
+
+    def __rebuild(self) -> None:
+        storage = self.__graph.storage
+        self.__nodes: List[Optional[Node]] = list(storage.nodes())
+        self.__rows: Dict[str, int] = {node.id: row for row, node in enumerate(self.__nodes)}
+        self.__present: bytearray = bytearray(b"\x01") * len(self.__nodes)
+        self.__in_degrees: array = array("q", map(storage.in_degree, self.__nodes))
+        self.__out_degrees: array = array("q", map(storage.out_degree, self.__nodes))
+        self.__stale = False
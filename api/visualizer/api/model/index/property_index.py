@@ -0,0 +1,297 @@
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from ..graph_change import ChangeType, GraphChange
+from ..node import Node
+from ..observable import MISSING
+
+RANGE_OPERATORS: Tuple[str, ...] = ("<", "<=", ">", ">=")
+
+
+class SortedValues:
+    """
+    Property values of one type kept in sorted order, together with the order of their nodes in
+    the graph and the nodes themselves.
+
+    The entries are kept in three parallel lists instead of a list of tuples, so that an entry
+    does not allocate a container the garbage collector would have to track.
+    """
+
+    __slots__ = ["__values", "__orders", "__nodes"]
+
+    def __init__(self) -> None:
+        self.__values: List[Any] = []
+        self.__orders: List[int] = []
+        self.__nodes: List[Node] = []
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def append(self, value: Any, order: int, node: Node) -> None:
+        """ Add an entry without keeping the order; `sort` must be called afterwards. """
+        self.__values.append(value)
+        self.__orders.append(order)
+        self.__nodes.append(node)
+
+    def sort(self) -> None:
+        """ Sort the entries by value. Entries with equal values keep their relative order. """
+        permutation: List[int] = sorted(range(len(self.__values)), key=self.__values.__getitem__)
+        self.__values = [self.__values[index] for index in permutation]
+        self.__orders = [self.__orders[index] for index in permutation]
+        self.__nodes = [self.__nodes[index] for index in permutation]
+
+    def insert(self, value: Any, order: int, node: Node) -> None:
+        """ Add an entry at its sorted position. """
+        position: int = self.__position(value, order)
+        self.__values.insert(position, value)
+        self.__orders.insert(position, order)
+        self.__nodes.insert(position, node)
+
+    def remove(self, value: Any, order: int) -> None:
+        """ Remove the entry with the given value and order. """
+        position: int = self.__position(value, order)
+        del self.__values[position]
+        del self.__orders[position]
+        del self.__nodes[position]
+
+    def lower_bound(self, value: Any) -> int:
+        """ Get the position of the first entry that is not smaller than `value`. """
+        return bisect_left(self.__values, value)
+
+    def upper_bound(self, value: Any) -> int:
+        """ Get the position of the first entry that is greater than `value`. """
+        return bisect_right(self.__values, value)
+
+    def nodes(self, start: int, end: int) -> List[Node]:
+        """ Get the nodes of the entries between two positions, in the order of the graph. """
+        orders: List[int] = self.__orders[start:end]
+        nodes: List[Node] = self.__nodes[start:end]
+        return [nodes[index] for index in sorted(range(len(orders)), key=orders.__getitem__)]
+
+    def __position(self, value: Any, order: int) -> int:
+        start: int = bisect_left(self.__values, value)
+        end: int = bisect_right(self.__values, value, start)
+        return bisect_left(self.__orders, order, start, end)
+
+
+class PropertyIndex:
+    """
+    A secondary index over the values of one node property, kept up to date with the graph.
+
+    The index stores the values the way `filter` compares them: strings are stored lowercased
+    (case-folded shadow keys). Equality is answered from a hash index and the operators `<`,
+    `<=`, `>` and `>=` by a bisect range scan over sorted values, so a lookup costs O(log n + k)
+    for k matching nodes instead of a scan over every node. Matches are returned in the order of
+    the graph.
+
+    Numbers and strings are sorted separately, because they cannot be compared with each other.
+    NaN is kept apart from both: it matches no range of numbers, but still cannot be compared
+    with a string. When a query meets values that cannot be compared with the compared value,
+    `find` returns `None` and the caller falls back to a scan, which reports the error like
+    before.
+
+    The index subscribes to the changes of its graph. When the graph is replaced as a whole (e.g.
+    cleared or restored from a snapshot), the index is rebuilt on the next lookup.
+    """
+
+    __slots__ = ["__graph", "__key", "__stale", "__orders", "__next_order", "__values", "__equal", "__unhashable",
+                 "__numbers", "__strings", "__nans", "__others"]
+
+    def __init__(self, graph: Any, key: str) -> None:
+        """
+        Initialize an index over the property `key` of the nodes of `graph` and subscribe to
+        the changes of the graph.
+
+        :param graph: The graph whose nodes are indexed.
+        :type graph: Graph
+        :param key: The name of the indexed property.
+        :type key: str
+        """
+        self.__graph = graph
+        self.__key: str = key
+        self.__stale: bool = True
+        graph.subscribe(self.on_change)
+
+    @property
+    def key(self) -> str:
+        """
+        Get the name of the indexed property.
+
+        :return: The property name.
+        :rtype: str
+        """
+        return self.__key
+
+    def close(self) -> None:
+        """ Stop following the changes of the graph. """
+        self.__graph.unsubscribe(self.on_change)
+
+    def find(self, operator: str, compare_value: Any) -> Optional[List[Node]]:
+        """
+        Find the nodes whose indexed property compares to `compare_value` with `operator`.
+
+        Strings in `compare_value` must already be lowercased, as `filter` does.
+
+        :param operator: One of '==', '!=', '<', '<=', '>' and '>='.
+        :type operator: str
+        :param compare_value: The value to compare the property values with.
+        :type compare_value: Any
+
+        :return: The matching nodes in the order of the graph, or `None` if the index cannot
+                 answer the query and the nodes have to be scanned instead.
+        :rtype: Optional[List[Node]]
+        """
+        if self.__stale:
+            self.__rebuild()
+
+        if operator == "==":
+            return self.__find_equal(compare_value)
+        if operator == "!=":
+            equal: Optional[List[Node]] = self.__find_equal(compare_value)
+            if equal is None:
+                return None
+            equal_ids = {node.id for node in equal}
+            node_ids: List[str] = sorted(
+                (node_id for node_id in self.__values if node_id not in equal_ids), key=self.__orders.__getitem__
+            )
+            return [self.__graph.get_node(node_id) for node_id in node_ids]
+        if operator in RANGE_OPERATORS:
+            return self.__find_range(operator, compare_value)
+        return None
+
+    def on_change(self, change: GraphChange) -> None:
+        """
+        Update the index after a change of the graph.
+
+        :param change: The change made to the graph.
+        :type change: GraphChange
+        """
+        if self.__stale:
+            return
+        if change.type == ChangeType.CLEARED:
+            self.__stale = True
+        elif change.type == ChangeType.NODE_INSERTED:
+            self.__orders[change.entity.id] = self.__next_order
+            self.__next_order += 1
+            self.__add(change.entity)
+        elif change.type == ChangeType.NODE_REMOVED:
+            self.__remove(change.old_value)
+            del self.__orders[change.old_value]
+        elif change.type == ChangeType.PROPERTY_CHANGED and isinstance(change.entity, Node):
+            if change.key is None or change.key == self.__key:
+                self.__remove(change.entity.id)
+                self.__add(change.entity)
+
+    def __rebuild(self) -> None:
+        self.__orders: Dict[str, int] = {}
+        self.__next_order: int = 0
+        self.__values: Dict[str, Any] = {}
+        # a value maps to its only node, or to a dictionary of its nodes by order
+        self.__equal: Dict[Hashable, Union[Node, Dict[int, Node]]] = {}
+        self.__unhashable: Dict[int, Node] = {}
+        self.__numbers: SortedValues = SortedValues()
+        self.__strings: SortedValues = SortedValues()
+        self.__nans: Dict[int, Node] = {}
+        self.__others: Dict[int, Node] = {}
+        for node in self.__graph.get_nodes():
+            self.__orders[node.id] = self.__next_order
+            self.__next_order += 1
+            self.__add(node, keep_sorted=False)
+        self.__numbers.sort()
+        self.__strings.sort()
+        self.__stale = False
+
+    def __add(self, node: Node, keep_sorted: bool = True) -> None:
+        value: Any = node.properties.get(self.__key, MISSING)
+        if value is MISSING:
+            return
+        if isinstance(value, str):
+            value = value.lower()
+        order: int = self.__orders[node.id]
+        self.__values[node.id] = value
+
+        try:
+            nodes: Union[Node, Dict[int, Node], None] = self.__equal.get(value, None)
+            if nodes is None:
+                self.__equal[value] = node
+            elif isinstance(nodes, Node):
+                self.__equal[value] = {self.__orders[nodes.id]: nodes, order: node}
+            else:
+                nodes[order] = node
+        except TypeError:
+            self.__unhashable[order] = node
+
+        values: Union[SortedValues, Dict[int, Node], None] = self.__sorted_values(value)
+        if isinstance(values, dict):
+            values[order] = node
+        elif values is not None and keep_sorted:
+            values.insert(value, order, node)
+        elif values is not None:
+            values.append(value, order, node)
+
+    def __remove(self, node_id: str) -> None:
+        value: Any = self.__values.pop(node_id, MISSING)
+        if value is MISSING:
+            return
+        order: int = self.__orders[node_id]
+
+        if order in self.__unhashable:
+            del self.__unhashable[order]
+        else:
+            nodes: Union[Node, Dict[int, Node]] = self.__equal[value]
+            if isinstance(nodes, Node):
+                del self.__equal[value]
+            else:
+                del nodes[order]
+                if len(nodes) == 1:
+                    self.__equal[value] = next(iter(nodes.values()))
+
+        values: Union[SortedValues, Dict[int, Node], None] = self.__sorted_values(value)
+        if isinstance(values, dict):
+            del values[order]
+        elif values is not None:
+            values.remove(value, order)
+
+    def __sorted_values(self, value: Any) -> Union[SortedValues, Dict[int, Node], None]:
+        if value is None:
+            return None  # never matches a range, like in CompareUtil
+        if isinstance(value, (bool, int)) or (isinstance(value, float) and not math.isnan(value)):
+            return self.__numbers
+        if isinstance(value, str):
+            return self.__strings
+        if isinstance(value, float):
+            return self.__nans  # neither smaller nor greater than any number, but not comparable with strings
+        return self.__others
+
+    def __find_equal(self, compare_value: Any) -> Optional[List[Node]]:
+        if self.__unhashable:
+            return None
+        try:
+            nodes: Union[Node, Dict[int, Node], None] = self.__equal.get(compare_value, None)
+        except TypeError:
+            return None
+        if nodes is None:
+            return []
+        if isinstance(nodes, Node):
+            return [nodes]
+        return [node for _, node in sorted(nodes.items())]
+
+    def __find_range(self, operator: str, compare_value: Any) -> Optional[List[Node]]:
+        values: Union[SortedValues, Dict[int, Node], None] = self.__sorted_values(compare_value)
+        if values is self.__numbers:
+            incomparable: bool = bool(self.__strings)
+        elif values is self.__strings:
+            incomparable = bool(self.__numbers or self.__nans)
+        else:
+            return None
+        if incomparable or self.__others or self.__unhashable:
+            return None
+
+        if operator == "<":
+            return values.nodes(0, values.lower_bound(compare_value))
+        if operator == "<=":
+            return values.nodes(0, values.upper_bound(compare_value))
+        if operator == ">":
+            return values.nodes(values.upper_bound(compare_value), len(values))
+        return values.nodes(values.lower_bound(compare_value), len(values))
@@ -0,0 +1,239 @@
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Set
+
+from visualizer.api.algorithm.traversal import bfs, condensation, strongly_connected_components
+
+from ..adjacency import INDEX_TYPE, AdjacencyMatrix
+from ..graph_change import ChangeType, GraphChange
+from ..node import Node
+
+
+class ReachabilityIndex:
+    """
+    An index answering which nodes of a graph can reach which others, following the direction
+    of the edges.
+
+    The index contracts every strongly connected component of the graph to a single node, which
+    leaves an acyclic graph of components (the condensation), and labels every component with
+    intervals from a depth-first traversal of the condensation:
+
+    - `pre` and `post`, the steps at which the traversal entered and left the component. A
+      component inside the interval of another one was reached through it, so a query whose
+      target is inside the interval of the source is answered right away.
+    - `low`, the lowest `post` of any component the component can reach. A component can only
+      reach components whose interval `[low, post]` is inside its own, so most queries between
+      unrelated components are rejected by comparing the intervals.
+
+    Only the remaining queries search the condensation, skipping every component whose interval
+    rules it out. Listing all nodes reachable from a node visits the condensation instead of the
+    edges of the nodes, and finding the nodes that reach a node follows its transpose.
+
+    The index is built on the first query. Edges that connect nodes which were already connected
+    and nodes inserted or removed without edges keep it valid; any other change of the structure
+    rebuilds it on the next query.
+    """
+
+    __slots__ = ["__graph", "__stale", "__nodes", "__rows", "__components", "__member_offsets", "__members",
+                 "__condensation", "__transposed", "__pre", "__post", "__low"]
+
+    def __init__(self, graph: Any) -> None:
+        """
+        Initialize a reachability index over `graph` and subscribe to the changes of the graph.
+
+        :param graph: The graph whose reachability is indexed.
+        :type graph: Graph
+        """
+        self.__graph = graph
+        self.__stale: bool = True
+        graph.subscribe(self.on_change)
+
+    def close(self) -> None:
+        """ Stop following the changes of the graph. """
+        self.__graph.unsubscribe(self.on_change)
+
+    def can_reach(self, source: Node, destination: Node) -> bool:
+        """
+        Check whether there is a path from one node to another. Every node reaches itself.
+
+        :param source: The node the path starts at.
+        :type source: Node
+        :param destination: The node the path ends at.
+        :type destination: Node
+
+        :return: Whether `destination` can be reached from `source`.
+        :rtype: bool
+
+        :raises KeyError: If a node is not in the graph.
+        """
+        if source is destination or source.id == destination.id:
+            self.__component(source)  # a node that is not in the graph still raises
+            return True
+        source_component: int = self.__component(source)
+        destination_component: int = self.__component(destination)
+        return self.__reaches(source_component, destination_component)
+
+    def descendants(self, node: Node) -> List[Node]:
+        """
+        Find the nodes that can be reached from a node through one or more edges, e.g. every
+        function a function calls, directly or not.
+
+        :param node: The node to start at.
+        :type node: Node
+
+        :return: The reachable nodes except `node` itself, in the order of the graph.
+        :rtype: List[Node]
+
+        :raises KeyError: If the node is not in the graph.
+        """
+        component: int = self.__component(node)
+        if component < 0:
+            return []
+        return self.__expand(bfs(self.__condensation, [component]), node)
+
+    def ancestors(self, node: Node) -> List[Node]:
+        """
+        Find the nodes that can reach a node through one or more edges, e.g. every caller of a
+        function, directly or not.
+
+        :param node: The node to end at.
+        :type node: Node
+
+        :return: The nodes reaching `node`, except `node` itself, in the order of the graph.
+        :rtype: List[Node]
+
+        :raises KeyError: If the node is not in the graph.
+        """
+        component: int = self.__component(node)
+        if component < 0:
+            return []
+        if self.__transposed is None:
+            self.__transposed = self.__condensation.transpose()
+        return self.__expand(bfs(self.__transposed, [component]), node)
+
+    def on_change(self, change: GraphChange) -> None:
+        """
+        Update the index after a change of the graph.
+
+        :param change: The change made to the graph.
+        :type change: GraphChange
+        """
+        if self.__stale or change.type == ChangeType.PROPERTY_CHANGED:
+            return
+        if change.type == ChangeType.EDGE_INSERTED:
+            # an edge between nodes that are already connected changes no answer
+            edge = change.entity
+            source: Optional[int] = self.__rows.get(edge.source.id, None)
+            destination: Optional[int] = self.__rows.get(edge.destination.id, None)
+            if source is None or destination is None or \
+                    not self.__reaches(self.__components[source], self.__components[destination]):
+                self.__stale = True
+        elif change.type == ChangeType.NODE_INSERTED:
+            # a node without edges is a component of its own, reaching nothing but itself
+            row: int = len(self.__nodes)
+            self.__rows[change.entity.id] = row
+            self.__nodes.append(change.entity)
+            self.__components.append(-1)
+        elif change.type == ChangeType.NODE_REMOVED:
+            # only nodes without edges can be removed, so no other node reached the node
+            row = self.__rows.pop(change.old_value)
+            self.__nodes[row] = None
+            self.__components[row] = -1
+        else:
+            self.__stale = True
+
+    def __component(self, node: Node) -> int:
+        if self.__stale:
+            self.__rebuild()
+        return self.__components[self.__rows[node.id]]
+
+    def __reaches(self, source: int, destination: int) -> bool:
+        # nodes inserted after the build have no component (-1), and no edges
+        if source < 0 or destination < 0:
+            return False
+        if source == destination:
+            return True
+        if not self.__may_reach(source, destination):
+            return False
+        pre: array = self.__pre
+        post: array = self.__post
+        visited: Set[int] = {source}
+        stack: List[int] = [source]
+        while stack:
+            component: int = stack.pop()
+            if pre[component] <= pre[destination] and post[destination] <= post[component]:
+                return True
+            for successor in self.__condensation.successors(component):
+                if successor not in visited and self.__may_reach(successor, destination):
+                    visited.add(successor)
+                    stack.append(successor)
+        return False
+
+    def __may_reach(self, source: int, destination: int) -> bool:
+        # components are numbered in reverse topological order, so edges lead to lower numbers
+        return source >= destination and self.__low[source] <= self.__low[destination] and \
+            self.__post[destination] <= self.__post[source]
+
+    def __expand(self, components: List[int], node: Node) -> List[Node]:
+        rows: List[int] = []
+        for component in components:
+            rows.extend(self.__members[self.__member_offsets[component]:self.__member_offsets[component + 1]])
+        rows.sort()
+        return [self.__nodes[row] for row in rows if self.__nodes[row] is not None and self.__nodes[row] is not node]
+
+    def __rebuild(self) -> None:
+        adjacency: AdjacencyMatrix = self.__graph.to_adjacency()
+        self.__nodes: List[Optional[Node]] = list(self.__graph.get_nodes())
+        self.__rows: Dict[str, int] = {node.id: row for row, node in enumerate(self.__nodes)}
+        count, self.__components = strongly_connected_components(adjacency)
+        self.__condensation: AdjacencyMatrix = condensation(adjacency, count, self.__components)
+        self.__transposed: Optional[AdjacencyMatrix] = None
+
+        sizes: List[int] = [0] * (count + 1)
+        for component in self.__components:
+            sizes[component + 1] += 1
+        self.__member_offsets: List[int] = list(accumulate(sizes))
+        self.__members: array = array(INDEX_TYPE, sorted(range(len(self.__nodes)), key=self.__components.__getitem__))
+
+        self.__label(count)
+        self.__stale = False
+
+    def __label(self, count: int) -> None:
+        offsets: array = self.__condensation.offsets
+        targets: array = self.__condensation.targets
+        pre: array = array(INDEX_TYPE, [-1]) * count
+        post: array = array(INDEX_TYPE, [0]) * count
+        step: int = 0
+        # components without incoming edges have the highest numbers, so start there
+        for root in range(count - 1, -1, -1):
+            if pre[root] >= 0:
+                continue
+            pre[root] = step
+            step += 1
+            path: List[List[int]] = [[root, offsets[root]]]
+            while path:
+                position: List[int] = path[-1]
+                component: int = position[0]
+                end: int = offsets[component + 1]
+                while position[1] < end:
+                    successor: int = targets[position[1]]
+                    position[1] += 1
+                    if pre[successor] < 0:
+                        pre[successor] = step
+                        step += 1
+                        path.append([successor, offsets[successor]])
+                        break
+                else:
+                    path.pop()
+                    post[component] = step
+                    step += 1
+
+        # successors have lower numbers, so they are labeled before the components reaching them
+        low: array = array(INDEX_TYPE, post)
+        for component in range(count):
+            for successor in targets[offsets[component]:offsets[component + 1]]:
+                if low[successor] < low[component]:
+                    low[component] = low[successor]
+        self.__pre: array = pre
+        self.__post: array = post
+        self.__low: array = low
@@ -0,0 +1,156 @@
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..graph_change import ChangeType, GraphChange
+from ..node import Node
+
+GRAM_LENGTH: int = 3
+
+
+class TextIndex:
+    """
+    An inverted trigram index over the text of the nodes of a graph, kept up to date with the
+    graph.
+
+    The text of a node is made of the same parts `search` looks at: the node ID, the property
+    keys (also of nested dictionaries) and the property values, with values that are not strings
+    converted with `str`. Every part is lowercased and split into its trigrams; parts shorter than
+    a trigram are indexed whole. A node can only contain a query if it contains every trigram of
+    the query, so intersecting the postings of those trigrams narrows the search down to a few
+    candidates. Queries shorter than a trigram are matched against the indexed trigrams instead.
+
+    The index only finds candidates: they may not contain the query (e.g. when its trigrams come
+    from different parts), so the caller still has to check them.
+
+    The index is built on the first lookup and then follows the changes of its graph. Changes
+    made inside a property value (e.g. appending to a list) are not reported by the graph and are
+    not seen by the index; such properties should be replaced instead.
+    """
+
+    __slots__ = ["__graph", "__stale", "__orders", "__next_order", "__texts", "__postings"]
+
+    def __init__(self, graph: Any) -> None:
+        """
+        Initialize an index over the text of the nodes of `graph` and subscribe to the changes
+        of the graph.
+
+        :param graph: The graph whose nodes are indexed.
+        :type graph: Graph
+        """
+        self.__graph = graph
+        self.__stale: bool = True
+        graph.subscribe(self.on_change)
+
+    def close(self) -> None:
+        """ Stop following the changes of the graph. """
+        self.__graph.unsubscribe(self.on_change)
+
+    def find(self, query: str) -> Optional[List[Node]]:
+        """
+        Find the nodes that may contain `query` in their ID, property keys or property values.
+
+        :param query: The text to search for, case-insensitively.
+        :type query: str
+
+        :return: The candidate nodes in the order of the graph, or `None` if the query is empty
+                 and every node has to be checked.
+        :rtype: Optional[List[Node]]
+        """
+        if not query:
+            return None
+        if self.__stale:
+            self.__rebuild()
+
+        query = query.lower()
+        node_ids: Set[str]
+        if len(query) < GRAM_LENGTH:
+            node_ids = set()
+            for gram, postings in self.__postings.items():
+                if query in gram:
+                    node_ids.update(postings)
+        else:
+            postings_list: List[Set[str]] = []
+            for gram in self.__split(query):
+                postings: Optional[Set[str]] = self.__postings.get(gram, None)
+                if postings is None:
+                    return []
+                postings_list.append(postings)
+            postings_list.sort(key=len)
+            node_ids = postings_list[0].intersection(*postings_list[1:])
+
+        return [self.__graph.get_node(node_id) for node_id in sorted(node_ids, key=self.__orders.__getitem__)]
+
+    def on_change(self, change: GraphChange) -> None:
+        """
+        Update the index after a change of the graph.
+
+        :param change: The change made to the graph.
+        :type change: GraphChange
+        """
+        if self.__stale:
+            return
+        if change.type == ChangeType.CLEARED:
+            self.__stale = True
+        elif change.type == ChangeType.NODE_INSERTED:
+            self.__orders[change.entity.id] = self.__next_order
+            self.__next_order += 1
+            self.__add(change.entity)
+        elif change.type == ChangeType.NODE_REMOVED:
+            self.__remove(change.old_value)
+            del self.__orders[change.old_value]
+        elif change.type == ChangeType.PROPERTY_CHANGED and isinstance(change.entity, Node):
+            self.__remove(change.entity.id)
+            self.__add(change.entity)
+
+    def __rebuild(self) -> None:
+        self.__orders: Dict[str, int] = {}
+        self.__next_order: int = 0
+        # the texts of each node are kept instead of its trigrams, which take far more memory
+        self.__texts: Dict[str, Tuple[str, ...]] = {}
+        self.__postings: DefaultDict[str, Set[str]] = defaultdict(set)
+        for node in self.__graph.get_nodes():
+            self.__orders[node.id] = self.__next_order
+            self.__next_order += 1
+            self.__add(node)
+        self.__stale = False
+
+    def __add(self, node: Node) -> None:
+        texts: Set[str] = {node.id.lower()}
+        self.__collect_texts(node.properties, texts)
+        self.__texts[node.id] = tuple(texts)
+        for gram in self.__grams(texts):
+            self.__postings[gram].add(node.id)
+
+    def __remove(self, node_id: str) -> None:
+        for gram in self.__grams(self.__texts.pop(node_id, ())):
+            postings: Set[str] = self.__postings[gram]
+            postings.discard(node_id)
+            if not postings:
+                del self.__postings[gram]
+
+    def __collect_texts(self, prop: Any, texts: Set[str]) -> None:
+        # walks the properties like `search` does, so every text it matches is indexed
+        if isinstance(prop, dict):
+            for key, value in prop.items():
+                texts.add(key.lower())
+                self.__collect_texts(value, texts)
+        elif isinstance(prop, (list, tuple, set)):
+            for value in prop:
+                self.__collect_texts(value, texts)
+        elif isinstance(prop, str):
+            texts.add(prop.lower())
+        else:
+            texts.add(str(prop).lower())
+
+    @staticmethod
+    def __grams(texts: Iterable[str]) -> Set[str]:
+        grams: Set[str] = set()
+        for text in texts:
+            grams.update(TextIndex.__split(text))
+        return grams
+
+    @staticmethod
+    def __split(text: str) -> List[str]:
+        if len(text) <= GRAM_LENGTH:
+            return [text]
+        return [text[start:start + GRAM_LENGTH] for start in range(len(text) - GRAM_LENGTH + 1)]
@@ -1,9 +1,11 @@
 import copy
-import uuid
-from typing import Dict, Any, TypedDict
+from typing import ClassVar, Dict, Any, TypedDict
 
 from typing_extensions import Optional
 
+from .id_allocator import IdAllocator, UuidIdAllocator
+from .observable import MISSING, PropertyObservable
+
 
 class NodeDict(TypedDict):
     """
@@ -16,22 +18,29 @@ class NodeDict(TypedDict):
     id: str
     properties: Dict[str, Any]
 
-class Node:
+class Node(PropertyObservable):
     """
     A Node class to represent a node in a graph with associated properties.
 
     This class allows for the creation of nodes with custom properties stored as
     a dictionary. The properties can be any key-value pairs where the key is a
-    string, and the value can be of any type.
+    string, and the value can be of any type. Changes made through the Node's methods are
+    reported to its listeners (see `PropertyObservable`).
+
+    Nodes created without an ID get one from `Node.id_allocator`, which generates random UUIDs
+    by default. Loaders that want short IDs that stay the same across reloads should pass IDs
+    from their own `SequentialIdAllocator` instead.
     """
 
     __slots__ = ['__properties', "__id"]
 
+    id_allocator: ClassVar[IdAllocator] = UuidIdAllocator()
+
     def __init__(self, node_id: Optional[str] = None, **properties) -> None:
         """
         Initializes a Node object with properties and id.
 
-        :param node_id: The id of the node. If not provided, a new id is generated.
+        :param node_id: The id of the node. If not provided, a new id is generated by `id_allocator`.
         :ptype node_id: Optional[str]
         :param properties: A dictionary of properties where keys are strings
                            representing property names and values can be of any type.
@@ -40,7 +49,8 @@ class Node:
             node = Node(name="A", value=10)
             # Creates a node with properties {'name': 'A', 'value': 10} and random generated id
         """
-        self.__id: str = node_id if node_id else str(uuid.uuid4())
+        super().__init__()
+        self.__id: str = node_id if node_id else Node.id_allocator.allocate()
         self.__properties: Dict[str, Any] = properties
 
     @property
@@ -65,7 +75,9 @@ class Node:
         """
         if not isinstance(properties, dict):
             raise TypeError(f"expected properties to be a dict, but got { type(properties) }")
+        old_properties = self.__properties
         self.__properties = properties
+        self._notify_listeners(None, old_properties, properties)
 
     @property
     def id(self) -> str:
@@ -105,7 +117,12 @@ class Node:
         if not isinstance(key, str):
             raise TypeError(f"expected key to be a str, but got { type(key) }")
 
-        self.__properties[key] = value
+        if self._has_listeners():
+            old_value = self.__properties.get(key, MISSING)
+            self.__properties[key] = value
+            self._notify_listeners(key, old_value, value)
+        else:
+            self.__properties[key] = value
 
     def add_properties(self, properties: Dict[str, Any]) -> None:
         """
@@ -134,9 +151,13 @@ class Node:
 
         :raises TypeError: If the key is not a string.
         """
-        return self.__properties.pop(key, None)
+        value = self.__properties.pop(key, MISSING)
+        if value is MISSING:
+            return None
+        self._notify_listeners(key, value, MISSING)
+        return value
 
-    def to_dict(self) -> NodeDict:
+    def to_dict(self, deep_copy: bool = True) -> NodeDict:
         """
         Return a dictionary representation of the node using only JSON-serializable types.
 
@@ -144,11 +165,16 @@ class Node:
             - 'id': ID of the node
             - 'properties': dictionary of properties associated with the node
 
+        :param deep_copy: Whether to deep-copy the properties. If `False`, the returned dictionary
+                          shares the node's own properties dictionary, which must then be treated
+                          as read-only.
+        :type deep_copy: bool
+
         :return: A dictionary representation of the node.
         :rtype: NodeDict
         """
 
-        return {'id': self.id, 'properties': copy.deepcopy(self.properties)}
+        return {'id': self.id, 'properties': copy.deepcopy(self.properties) if deep_copy else self.properties}
 
     def __eq__(self, other: object) -> bool:
         """
@@ -0,0 +1,80 @@
+from typing import Any, Callable, Optional, Tuple, Union
+
+
+class _Missing:
+    """ Marker for a property value that does not exist before or after a change. """
+
+    __slots__ = []
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+PropertyListener = Callable[[Any, Optional[str], Any, Any], None]
+"""
+Callback invoked after a property of a node or edge changes, with the arguments
+``(entity, key, old_value, new_value)``. `old_value` or `new_value` is `MISSING` when the
+property was added or removed. When all properties are replaced at once, `key` is `None`
+and the values are the old and new property dictionaries.
+"""
+
+
+class PropertyObservable:
+    """
+    Base class for model objects that report property changes to listeners.
+
+    Most objects have at most one listener (the graph that contains them), so a single
+    listener is kept without allocating a container.
+    """
+
+    __slots__ = ['__listeners']
+
+    def __init__(self) -> None:
+        self.__listeners: Union[None, PropertyListener, Tuple[PropertyListener, ...]] = None
+
+    def add_listener(self, listener: PropertyListener) -> None:
+        """
+        Register a listener that is called after every tracked property change.
+
+        Adding a listener that is already registered has no effect.
+
+        :param listener: The callback to register.
+        :type listener: PropertyListener
+        """
+        listeners = self.__listeners
+        if listeners is None:
+            self.__listeners = listener
+        elif isinstance(listeners, tuple):
+            if listener not in listeners:
+                self.__listeners = listeners + (listener,)
+        elif listeners != listener:
+            self.__listeners = (listeners, listener)
+
+    def remove_listener(self, listener: PropertyListener) -> None:
+        """
+        Unregister a previously registered listener.
+
+        :param listener: The callback to unregister.
+        :type listener: PropertyListener
+        """
+        listeners = self.__listeners
+        if isinstance(listeners, tuple):
+            remaining = tuple(registered for registered in listeners if registered != listener)
+            self.__listeners = remaining if len(remaining) > 1 else (remaining[0] if remaining else None)
+        elif listeners == listener:
+            self.__listeners = None
+
+    def _has_listeners(self) -> bool:
+        return self.__listeners is not None
+
+    def _notify_listeners(self, key: Optional[str], old_value: Any, new_value: Any) -> None:
+        listeners = self.__listeners
+        if listeners is None:
+            return
+        if isinstance(listeners, tuple):
+            for listener in listeners:
+                listener(self, key, old_value, new_value)
+        else:
+            listeners(self, key, old_value, new_value)
@@ -0,0 +1,27 @@
+from typing import Dict, Type
+
+from .compact_storage import CompactStorage
+from .dict_storage import DictStorage
+from .graph_storage import GraphStorage
+
+STORAGES: Dict[str, Type[GraphStorage]] = {
+    "dict": DictStorage,
+    "compact": CompactStorage,
+}
+
+
+def create_storage(name: str) -> GraphStorage:
+    """
+    Create a graph storage engine by its name.
+
+    :param name: The name of the storage engine ('dict' or 'compact').
+    :type name: str
+
+    :return: A new, empty storage engine.
+    :rtype: GraphStorage
+
+    :raises ValueError: If no storage engine is registered under the given name.
+    """
+    if name not in STORAGES:
+        raise ValueError(f"Unknown graph storage '{name}'. Expected one of: {', '.join(STORAGES)}.")
+    return STORAGES[name]()
@@ -0,0 +1,380 @@
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .graph_storage import GraphStorage
+from ..edge import Edge
+from ..edge_label import EdgeLabel
+from ..node import Node
+from ..observable import PropertyListener
+
+INDEX_TYPE: str = "q"
+
+
+class CompactStorage(GraphStorage):
+    """
+    Graph storage that maps node ids to dense integers and keeps adjacency in arrays.
+
+    Edges are kept in compressed sparse row (CSR) form for outgoing adjacency, with a compressed
+    sparse column (CSC) index for incoming adjacency that points back into the CSR arrays. An
+    edge therefore costs a few machine integers and a reference to its properties instead of two
+    dictionary slots and an `Edge` object.
+
+    Mutations are collected in a small write buffer (pending edges and tombstones of removed
+    edges) and merged into the arrays by `compact` once the buffer grows past `buffer_size`
+    or an eighth of the stored edges, whichever is larger.
+
+    `Edge` objects are materialized only when they are requested. A materialized edge shares its
+    properties dictionary with the storage, so property edits made through it are preserved,
+    and replacing its properties dictionary replaces the stored one. Copies of the storage share
+    the dictionaries too, so the `Graph` passes a replacement on to the storages of its
+    snapshots (see `sync_edge_properties`).
+    Replacing its source or destination has no effect on the storage.
+
+    The storage keeps just the label of an edge whose only property is its label (see
+    `Edge.labeled`) and materializes it as a labeled edge. The properties dictionary the edge
+    creates on its first change is written back to the storage.
+    """
+
+    DEFAULT_BUFFER_SIZE: int = 1024
+
+    __slots__ = [
+        "__buffer_size", "__node_slots", "__nodes", "__node_count", "__edge_count",
+        "__out_offsets", "__out_targets", "__out_properties",
+        "__in_offsets", "__in_sources", "__in_positions",
+        "__pending_out", "__pending_in", "__deleted", "__deleted_out", "__deleted_in", "__dirty",
+        "__property_listener"
+    ]
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """
+        Initialize an empty compact storage.
+
+        :param buffer_size: The minimal number of buffered mutations that triggers compaction.
+        :type buffer_size: int
+        """
+        self.__buffer_size: int = buffer_size
+        self.__property_listener: PropertyListener = self.__on_property_change
+        self.__reset()
+
+    def __reset(self) -> None:
+        self.__node_slots: Dict[str, int] = {}
+        self.__nodes: List[Optional[Node]] = []
+        self.__node_count: int = 0
+        self.__edge_count: int = 0
+
+        self.__out_offsets: array = array(INDEX_TYPE, [0])
+        self.__out_targets: array = array(INDEX_TYPE)
+        self.__out_properties: List[Union[None, Dict[str, Any], EdgeLabel]] = []
+        self.__in_offsets: array = array(INDEX_TYPE, [0])
+        self.__in_sources: array = array(INDEX_TYPE)
+        self.__in_positions: array = array(INDEX_TYPE)
+
+        self.__pending_out: Dict[int, Dict[int, Union[None, Dict[str, Any], EdgeLabel]]] = {}
+        self.__pending_in: Dict[int, Dict[int, None]] = {}
+        self.__deleted: Set[int] = set()
+        self.__deleted_out: Dict[int, int] = {}
+        self.__deleted_in: Dict[int, int] = {}
+        self.__dirty: int = 0
+
+    @property
+    def outgoing(self) -> Dict[Node, Dict[Node, Edge]]:
+        return {node: {edge.destination: edge for edge in self.out_edges(node)} for node in self.nodes()}
+
+    @property
+    def incoming(self) -> Dict[Node, Dict[Node, Edge]]:
+        return {node: {edge.source: edge for edge in self.in_edges(node)} for node in self.nodes()}
+
+    def add_node(self, node: Node) -> None:
+        self.__node_slots[node.id] = len(self.__nodes)
+        self.__nodes.append(node)
+        self.__node_count += 1
+
+    def remove_node(self, node: Node) -> None:
+        slot: int = self.__node_slots.pop(node.id)
+        self.__nodes[slot] = None
+        self.__node_count -= 1
+        self.__dirty += 1
+        self.__compact_if_needed()
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        slot: Optional[int] = self.__node_slots.get(node_id, None)
+        return None if slot is None else self.__nodes[slot]
+
+    def nodes(self) -> Iterator[Node]:
+        for node in self.__nodes:
+            if node is not None:
+                yield node
+
+    def node_count(self) -> int:
+        return self.__node_count
+
+    def add_edge(self, edge: Edge) -> None:
+        source: int = self.__node_slots[edge.source.id]
+        destination: int = self.__node_slots[edge.destination.id]
+        self.__pending_out.setdefault(source, {})[destination] = edge.label or edge.properties or None
+        self.__pending_in.setdefault(destination, {})[source] = None
+        self.__edge_count += 1
+        self.__dirty += 1
+        self.__compact_if_needed()
+
+    def add_all(self, nodes: List[Node], edges: List[Edge]) -> None:
+        for node in nodes:
+            self.add_node(node)
+        slots, pending_out, pending_in = self.__node_slots, self.__pending_out, self.__pending_in
+        for edge in edges:
+            source: int = slots[edge.source.id]
+            destination: int = slots[edge.destination.id]
+            pending_out.setdefault(source, {})[destination] = edge.label or edge.properties or None
+            pending_in.setdefault(destination, {})[source] = None
+        self.__edge_count += len(edges)
+        self.__dirty += len(edges)
+        if self.__dirty:
+            self.compact()
+
+    def remove_edge(self, source: Node, destination: Node) -> bool:
+        source_slot: Optional[int] = self.__node_slots.get(source.id, None)
+        destination_slot: Optional[int] = self.__node_slots.get(destination.id, None)
+        if source_slot is None or destination_slot is None:
+            return False
+
+        pending: Optional[Dict[int, Optional[Dict[str, Any]]]] = self.__pending_out.get(source_slot, None)
+        if pending is not None and destination_slot in pending:
+            del pending[destination_slot]
+            del self.__pending_in[destination_slot][source_slot]
+            self.__edge_count -= 1
+            self.__dirty -= 1
+            return True
+
+        position: int = self.__find(source_slot, destination_slot)
+        if position < 0:
+            return False
+        self.__deleted.add(position)
+        self.__deleted_out[source_slot] = self.__deleted_out.get(source_slot, 0) + 1
+        self.__deleted_in[destination_slot] = self.__deleted_in.get(destination_slot, 0) + 1
+        self.__edge_count -= 1
+        self.__dirty += 1
+        self.__compact_if_needed()
+        return True
+
+    def get_edge(self, source: Node, destination: Node) -> Optional[Edge]:
+        source_slot: Optional[int] = self.__node_slots.get(source.id, None)
+        destination_slot: Optional[int] = self.__node_slots.get(destination.id, None)
+        if source_slot is None or destination_slot is None:
+            return None
+
+        pending: Optional[Dict[int, Optional[Dict[str, Any]]]] = self.__pending_out.get(source_slot, None)
+        if pending is not None and destination_slot in pending:
+            return self.__pending_edge(source_slot, destination_slot)
+
+        position: int = self.__find(source_slot, destination_slot)
+        return self.__stored_edge(source_slot, position) if position >= 0 else None
+
+    def out_edges(self, node: Node) -> Iterator[Edge]:
+        yield from self.__out_edges(self.__node_slots[node.id])
+
+    def successors(self, node: Node) -> Iterator[Node]:
+        slot: int = self.__node_slots[node.id]
+        start, end = self.__range(self.__out_offsets, slot)
+        if self.__deleted:
+            destinations = (self.__out_targets[position] for position in range(start, end) if position not in self.__deleted)
+        else:
+            destinations = self.__out_targets[start:end]
+        yield from map(self.__nodes.__getitem__, destinations)
+        yield from map(self.__nodes.__getitem__, list(self.__pending_out.get(slot, ())))
+
+    def in_edges(self, node: Node) -> Iterator[Edge]:
+        slot: int = self.__node_slots[node.id]
+        start, end = self.__range(self.__in_offsets, slot)
+        for index in range(start, end):
+            position: int = self.__in_positions[index]
+            if position not in self.__deleted:
+                yield self.__stored_edge(self.__in_sources[index], position)
+        for source in list(self.__pending_in.get(slot, ())):
+            yield self.__pending_edge(source, slot)
+
+    def predecessors(self, node: Node) -> Iterator[Node]:
+        slot: int = self.__node_slots[node.id]
+        start, end = self.__range(self.__in_offsets, slot)
+        if self.__deleted:
+            sources = (self.__in_sources[index] for index in range(start, end) if self.__in_positions[index] not in self.__deleted)
+        else:
+            sources = self.__in_sources[start:end]
+        yield from map(self.__nodes.__getitem__, sources)
+        yield from map(self.__nodes.__getitem__, list(self.__pending_in.get(slot, ())))
+
+    def out_degree(self, node: Node) -> int:
+        slot: int = self.__node_slots[node.id]
+        start, end = self.__range(self.__out_offsets, slot)
+        return end - start - self.__deleted_out.get(slot, 0) + len(self.__pending_out.get(slot, ()))
+
+    def in_degree(self, node: Node) -> int:
+        slot: int = self.__node_slots[node.id]
+        start, end = self.__range(self.__in_offsets, slot)
+        return end - start - self.__deleted_in.get(slot, 0) + len(self.__pending_in.get(slot, ()))
+
+    def edges(self) -> Iterator[Edge]:
+        for slot, node in enumerate(self.__nodes):
+            if node is not None:
+                yield from self.__out_edges(slot)
+
+    def edge_count(self) -> int:
+        return self.__edge_count
+
+    def clear(self) -> None:
+        self.__reset()
+
+    def copy(self) -> "CompactStorage":
+        # the index arrays are only ever replaced, never written in place, so they can be shared
+        storage: CompactStorage = CompactStorage(self.__buffer_size)
+        storage.__node_slots = dict(self.__node_slots)
+        storage.__nodes = list(self.__nodes)
+        storage.__node_count = self.__node_count
+        storage.__edge_count = self.__edge_count
+        storage.__out_offsets, storage.__out_targets = self.__out_offsets, self.__out_targets
+        storage.__out_properties = list(self.__out_properties)
+        storage.__in_offsets, storage.__in_sources, storage.__in_positions = \
+            self.__in_offsets, self.__in_sources, self.__in_positions
+        storage.__pending_out = {slot: dict(destinations) for slot, destinations in self.__pending_out.items()}
+        storage.__pending_in = {slot: dict(sources) for slot, sources in self.__pending_in.items()}
+        storage.__deleted = set(self.__deleted)
+        storage.__deleted_out = dict(self.__deleted_out)
+        storage.__deleted_in = dict(self.__deleted_in)
+        storage.__dirty = self.__dirty
+        return storage
+
+    def create_empty(self) -> "CompactStorage":
+        return CompactStorage(self.__buffer_size)
+
+    def compact(self) -> None:
+        """
+        Merge the write buffer into the adjacency arrays.
+
+        Live nodes are renumbered densely, removed edges are dropped and the neighbours of every
+        node are sorted, so edge lookups become a binary search within one CSR row.
+        """
+        new_slots: array = array(INDEX_TYPE, [-1]) * len(self.__nodes)
+        nodes: List[Node] = []
+        for slot, node in enumerate(self.__nodes):
+            if node is not None:
+                new_slots[slot] = len(nodes)
+                nodes.append(node)
+
+        rows: List[List[Tuple[int, Optional[Dict[str, Any]]]]] = [[] for _ in nodes]
+        for slot in range(len(self.__out_offsets) - 1):
+            for position in range(self.__out_offsets[slot], self.__out_offsets[slot + 1]):
+                if position not in self.__deleted:
+                    rows[new_slots[slot]].append(
+                        (new_slots[self.__out_targets[position]], self.__out_properties[position])
+                    )
+        for slot, destinations in self.__pending_out.items():
+            row = rows[new_slots[slot]]
+            for destination, properties in destinations.items():
+                row.append((new_slots[destination], properties))
+
+        out_offsets: array = array(INDEX_TYPE, [0])
+        out_targets: array = array(INDEX_TYPE)
+        out_properties: List[Optional[Dict[str, Any]]] = []
+        in_counts: List[int] = [0] * (len(nodes) + 1)
+        for row in rows:
+            row.sort(key=itemgetter(0))
+            for destination, properties in row:
+                out_targets.append(destination)
+                out_properties.append(properties)
+                in_counts[destination + 1] += 1
+            out_offsets.append(len(out_targets))
+
+        in_offsets: array = array(INDEX_TYPE, accumulate(in_counts))
+        in_sources: array = array(INDEX_TYPE, [0]) * len(out_targets)
+        in_positions: array = array(INDEX_TYPE, [0]) * len(out_targets)
+        cursors: List[int] = list(in_offsets[:-1])
+        for source in range(len(nodes)):
+            for position in range(out_offsets[source], out_offsets[source + 1]):
+                destination = out_targets[position]
+                index = cursors[destination]
+                in_sources[index] = source
+                in_positions[index] = position
+                cursors[destination] = index + 1
+
+        edge_count, buffer_size = self.__edge_count, self.__buffer_size
+        self.__reset()
+        self.__buffer_size = buffer_size
+        self.__edge_count = edge_count
+        self.__nodes = nodes
+        self.__node_count = len(nodes)
+        self.__node_slots = {node.id: slot for slot, node in enumerate(nodes)}
+        self.__out_offsets, self.__out_targets, self.__out_properties = out_offsets, out_targets, out_properties
+        self.__in_offsets, self.__in_sources, self.__in_positions = in_offsets, in_sources, in_positions
+
+    def __compact_if_needed(self) -> None:
+        if self.__dirty > max(self.__buffer_size, self.__edge_count >> 3):
+            self.compact()
+
+    @staticmethod
+    def __range(offsets: array, slot: int) -> Tuple[int, int]:
+        if slot + 1 < len(offsets):
+            return offsets[slot], offsets[slot + 1]
+        return 0, 0
+
+    def __find(self, source: int, destination: int) -> int:
+        start, end = self.__range(self.__out_offsets, source)
+        position: int = bisect_left(self.__out_targets, destination, start, end)
+        if position < end and self.__out_targets[position] == destination and position not in self.__deleted:
+            return position
+        return -1
+
+    def __out_edges(self, slot: int) -> Iterator[Edge]:
+        start, end = self.__range(self.__out_offsets, slot)
+        for position in range(start, end):
+            if position not in self.__deleted:
+                yield self.__stored_edge(slot, position)
+        for destination in list(self.__pending_out.get(slot, ())):
+            yield self.__pending_edge(slot, destination)
+
+    def __stored_edge(self, source: int, position: int) -> Edge:
+        properties: Union[None, Dict[str, Any], EdgeLabel] = self.__out_properties[position]
+        if properties is None:
+            properties = self.__out_properties[position] = {}
+        return self.__edge(source, self.__out_targets[position], properties)
+
+    def __pending_edge(self, source: int, destination: int) -> Edge:
+        properties: Union[None, Dict[str, Any], EdgeLabel] = self.__pending_out[source][destination]
+        if properties is None:
+            properties = self.__pending_out[source][destination] = {}
+        return self.__edge(source, destination, properties)
+
+    def __edge(self, source: int, destination: int, properties: Union[Dict[str, Any], EdgeLabel]) -> Edge:
+        if isinstance(properties, EdgeLabel):
+            edge: Edge = Edge.labeled(self.__nodes[source], self.__nodes[destination], properties.key, properties.value)
+        else:
+            edge = Edge(self.__nodes[source], self.__nodes[destination])
+            edge.properties = properties
+        edge.add_listener(self.__property_listener)
+        return edge
+
+    def sync_edge_properties(self, edge: Edge, key: Optional[str], old_value: Any) -> None:
+        # Edits in place already are shared, so only a replaced dictionary and the dictionary a
+        # labeled edge creates on its first change have to be written back.
+        source_slot: Optional[int] = self.__node_slots.get(edge.source.id, None)
+        destination_slot: Optional[int] = self.__node_slots.get(edge.destination.id, None)
+        if source_slot is None or destination_slot is None:
+            return
+
+        pending: Optional[Dict[int, Union[None, Dict[str, Any], EdgeLabel]]] = self.__pending_out.get(source_slot, None)
+        if pending is not None and destination_slot in pending:
+            if self.__is_replaced(pending[destination_slot], key, old_value):
+                pending[destination_slot] = edge.properties
+            return
+
+        position: int = self.__find(source_slot, destination_slot)
+        if position >= 0 and self.__is_replaced(self.__out_properties[position], key, old_value):
+            self.__out_properties[position] = edge.properties
+
+    def __on_property_change(self, edge: Edge, key: Optional[str], old_value: Any, new_value: Any) -> None:
+        self.sync_edge_properties(edge, key, old_value)
+
+    @staticmethod
+    def __is_replaced(stored: Union[None, Dict[str, Any], EdgeLabel], key: Optional[str], old_value: Any) -> bool:
+        return isinstance(stored, EdgeLabel) or (key is None and stored is old_value)
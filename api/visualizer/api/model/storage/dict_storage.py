@@ -0,0 +1,129 @@
+from typing import Dict, Iterator, List, Optional
+
+from .graph_storage import GraphStorage
+from ..edge import Edge
+from ..node import Node
+
+
+class DictStorage(GraphStorage):
+    """
+    Default graph storage that keeps adjacency as dictionaries of `Edge` objects.
+
+    - `outgoing` maps each node to a dictionary of destination nodes and edges.
+    - `incoming` maps each node to a dictionary of source nodes and edges.
+    """
+
+    __slots__ = ["__outgoing", "__incoming", "__nodes_by_id", "__edge_count"]
+
+    def __init__(self) -> None:
+        self.__outgoing: Dict[Node, Dict[Node, Edge]] = {}
+        self.__incoming: Dict[Node, Dict[Node, Edge]] = {}
+        self.__nodes_by_id: Dict[str, Node] = {}
+        self.__edge_count: int = 0
+
+    @property
+    def outgoing(self) -> Dict[Node, Dict[Node, Edge]]:
+        return self.__outgoing
+
+    @outgoing.setter
+    def outgoing(self, value: Dict[Node, Dict[Node, Edge]]) -> None:
+        self.__outgoing = value
+        self.__edge_count = sum(len(destinations) for destinations in value.values())
+
+    @property
+    def incoming(self) -> Dict[Node, Dict[Node, Edge]]:
+        return self.__incoming
+
+    @incoming.setter
+    def incoming(self, value: Dict[Node, Dict[Node, Edge]]) -> None:
+        self.__incoming = value
+
+    def copy(self) -> "DictStorage":
+        storage: DictStorage = DictStorage()
+        storage.__outgoing = {node: dict(destinations) for node, destinations in self.__outgoing.items()}
+        storage.__incoming = {node: dict(sources) for node, sources in self.__incoming.items()}
+        storage.__nodes_by_id = dict(self.__nodes_by_id)
+        storage.__edge_count = self.__edge_count
+        return storage
+
+    def add_node(self, node: Node) -> None:
+        self.__outgoing[node] = {}
+        self.__incoming[node] = {}
+        self.__nodes_by_id[node.id] = node
+
+    def remove_node(self, node: Node) -> None:
+        del self.__outgoing[node]
+        del self.__incoming[node]
+        del self.__nodes_by_id[node.id]
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        return self.__nodes_by_id.get(node_id, None)
+
+    def nodes(self) -> Iterator[Node]:
+        yield from self.__outgoing.keys()
+
+    def node_count(self) -> int:
+        return len(self.__outgoing)
+
+    def add_edge(self, edge: Edge) -> None:
+        self.__outgoing[edge.source][edge.destination] = edge
+        self.__incoming[edge.destination][edge.source] = edge
+        self.__edge_count += 1
+
+    def add_all(self, nodes: List[Node], edges: List[Edge]) -> None:
+        outgoing, incoming, nodes_by_id = self.__outgoing, self.__incoming, self.__nodes_by_id
+        for node in nodes:
+            outgoing[node] = {}
+            incoming[node] = {}
+            nodes_by_id[node.id] = node
+        for edge in edges:
+            outgoing[edge.source][edge.destination] = edge
+            incoming[edge.destination][edge.source] = edge
+        self.__edge_count += len(edges)
+
+    def remove_edge(self, source: Node, destination: Node) -> bool:
+        removed = False
+        if source in self.__outgoing and destination in self.__outgoing[source]:
+            del self.__outgoing[source][destination]
+            self.__edge_count -= 1
+            removed = True
+        if destination in self.__incoming and source in self.__incoming[destination]:
+            del self.__incoming[destination][source]
+        return removed
+
+    def get_edge(self, source: Node, destination: Node) -> Optional[Edge]:
+        destinations: Optional[Dict[Node, Edge]] = self.__outgoing.get(source, None)
+        if destinations is None or destination not in self.__outgoing:
+            return None
+        return destinations.get(destination, None)
+
+    def out_edges(self, node: Node) -> Iterator[Edge]:
+        yield from self.__outgoing[node].values()
+
+    def successors(self, node: Node) -> Iterator[Node]:
+        yield from self.__outgoing[node]
+
+    def in_edges(self, node: Node) -> Iterator[Edge]:
+        yield from self.__incoming[node].values()
+
+    def predecessors(self, node: Node) -> Iterator[Node]:
+        yield from self.__incoming[node]
+
+    def out_degree(self, node: Node) -> int:
+        return len(self.__outgoing[node])
+
+    def in_degree(self, node: Node) -> int:
+        return len(self.__incoming[node])
+
+    def edges(self) -> Iterator[Edge]:
+        for destinations in self.__outgoing.values():
+            yield from destinations.values()
+
+    def edge_count(self) -> int:
+        return self.__edge_count
+
+    def clear(self) -> None:
+        self.__outgoing.clear()
+        self.__incoming.clear()
+        self.__nodes_by_id.clear()
+        self.__edge_count = 0
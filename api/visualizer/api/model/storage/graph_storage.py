@@ -0,0 +1,318 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..edge import Edge
+from ..node import Node
+from ..observable import PropertyListener
+
+
+class GraphStorage(ABC):
+    """
+    An abstraction representing the storage engine behind a `Graph`.
+
+    A storage only keeps nodes and edges; it performs no validation. The owning `Graph` is
+    responsible for type checks, duplicate detection and merging of edge properties before
+    it delegates to the storage. Nodes are identified by their `id`.
+    """
+
+    @abstractmethod
+    def add_node(self, node: Node) -> None:
+        """
+        Add a node that is not yet stored.
+
+        :param node: The node to add.
+        :type node: Node
+        """
+        ...
+
+    @abstractmethod
+    def remove_node(self, node: Node) -> None:
+        """
+        Remove a stored node that has no edges attached.
+
+        :param node: The node to remove.
+        :type node: Node
+        """
+        ...
+
+    @abstractmethod
+    def get_node(self, node_id: str) -> Optional[Node]:
+        """
+        Retrieve a node by its ID.
+
+        :param node_id: The ID of the node.
+        :type node_id: str
+
+        :return: The stored node, or `None` if it does not exist.
+        :rtype: Optional[Node]
+        """
+        ...
+
+    @abstractmethod
+    def nodes(self) -> Iterator[Node]:
+        """
+        Get an iterator over all stored nodes in insertion order.
+
+        :return: An iterator over the nodes.
+        :rtype: Iterator[Node]
+        """
+        ...
+
+    @abstractmethod
+    def node_count(self) -> int:
+        """
+        Get the number of stored nodes.
+
+        :return: The number of nodes.
+        :rtype: int
+        """
+        ...
+
+    @abstractmethod
+    def add_edge(self, edge: Edge) -> None:
+        """
+        Add an edge whose endpoints are stored and which does not exist yet.
+
+        :param edge: The edge to add.
+        :type edge: Edge
+        """
+        ...
+
+    def add_all(self, nodes: List[Node], edges: List[Edge]) -> None:
+        """
+        Add a validated batch of new nodes and edges.
+
+        Storages can override this method to build their structures in one pass instead of
+        item by item.
+
+        :param nodes: The nodes to add. None of them is stored yet.
+        :type nodes: List[Node]
+        :param edges: The edges to add. Their endpoints are stored or among `nodes`, and none of
+                      them exists yet.
+        :type edges: List[Edge]
+        """
+        for node in nodes:
+            self.add_node(node)
+        for edge in edges:
+            self.add_edge(edge)
+
+    @abstractmethod
+    def remove_edge(self, source: Node, destination: Node) -> bool:
+        """
+        Remove the edge between two nodes.
+
+        :param source: The source node of the edge.
+        :type source: Node
+        :param destination: The destination node of the edge.
+        :type destination: Node
+
+        :return: `True` if an edge was removed, `False` otherwise.
+        :rtype: bool
+        """
+        ...
+
+    @abstractmethod
+    def get_edge(self, source: Node, destination: Node) -> Optional[Edge]:
+        """
+        Get the edge between two stored nodes.
+
+        :param source: The source node of the edge.
+        :type source: Node
+        :param destination: The destination node of the edge.
+        :type destination: Node
+
+        :return: The edge, or `None` if no such edge exists.
+        :rtype: Optional[Edge]
+        """
+        ...
+
+    @abstractmethod
+    def out_edges(self, node: Node) -> Iterator[Edge]:
+        """
+        Get an iterator over the edges leaving a stored node.
+
+        :param node: The source node.
+        :type node: Node
+
+        :return: An iterator over the outgoing edges.
+        :rtype: Iterator[Edge]
+        """
+        ...
+
+    def successors(self, node: Node) -> Iterator[Node]:
+        """
+        Get an iterator over the destinations of the edges leaving a stored node, in the order
+        of `out_edges`.
+
+        Storages can override this method to list the destinations without creating edges.
+
+        :param node: The source node.
+        :type node: Node
+
+        :return: An iterator over the successor nodes.
+        :rtype: Iterator[Node]
+        """
+        for edge in self.out_edges(node):
+            yield edge.destination
+
+    def predecessors(self, node: Node) -> Iterator[Node]:
+        """
+        Get an iterator over the sources of the edges entering a stored node, in the order of
+        `in_edges`.
+
+        Storages can override this method to list the sources without creating edges.
+
+        :param node: The destination node.
+        :type node: Node
+
+        :return: An iterator over the predecessor nodes.
+        :rtype: Iterator[Node]
+        """
+        for edge in self.in_edges(node):
+            yield edge.source
+
+    @abstractmethod
+    def in_edges(self, node: Node) -> Iterator[Edge]:
+        """
+        Get an iterator over the edges entering a stored node.
+
+        :param node: The destination node.
+        :type node: Node
+
+        :return: An iterator over the incoming edges.
+        :rtype: Iterator[Edge]
+        """
+        ...
+
+    @abstractmethod
+    def out_degree(self, node: Node) -> int:
+        """
+        Get the number of edges leaving a stored node.
+
+        :param node: The source node.
+        :type node: Node
+
+        :return: The out-degree of the node.
+        :rtype: int
+        """
+        ...
+
+    @abstractmethod
+    def in_degree(self, node: Node) -> int:
+        """
+        Get the number of edges entering a stored node.
+
+        :param node: The destination node.
+        :type node: Node
+
+        :return: The in-degree of the node.
+        :rtype: int
+        """
+        ...
+
+    @abstractmethod
+    def edges(self) -> Iterator[Edge]:
+        """
+        Get an iterator over all stored edges, grouped by source node.
+
+        :return: An iterator over the edges.
+        :rtype: Iterator[Edge]
+        """
+        ...
+
+    @abstractmethod
+    def edge_count(self) -> int:
+        """
+        Get the number of stored edges.
+
+        :return: The number of edges.
+        :rtype: int
+        """
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """ Remove all nodes and edges. """
+        ...
+
+    @abstractmethod
+    def copy(self) -> "GraphStorage":
+        """
+        Create a storage with the same nodes and edges that can be modified independently.
+
+        The nodes, edges and their properties are shared with this storage; only the structure
+        that records which nodes and edges are stored is copied.
+
+        :return: The copy of the storage.
+        :rtype: GraphStorage
+        """
+        ...
+
+    def create_empty(self) -> "GraphStorage":
+        """
+        Create an empty storage of the same kind and configuration.
+
+        :return: A new, empty storage.
+        :rtype: GraphStorage
+        """
+        return type(self)()
+
+    @property
+    def read_only(self) -> bool:
+        """
+        Check if the storage cannot be modified. A `Graph` copies a read-only storage (see
+        `copy`) before it changes it.
+
+        :return: `True` if the storage is read-only, `False` otherwise.
+        :rtype: bool
+        """
+        return False
+
+    def set_property_listener(self, listener: PropertyListener) -> None:
+        """
+        Set the listener to register on the nodes and edges the storage creates itself, e.g.
+        when it reads them from a file. Storages that only keep the nodes and edges they are
+        given ignore it.
+
+        :param listener: The listener of the graph that owns the storage.
+        :type listener: PropertyListener
+        """
+        pass
+
+    def sync_edge_properties(self, edge: Edge, key: Optional[str], old_value: Any) -> None:
+        """
+        Bring the properties stored for an edge up to date after they changed on an `Edge`
+        object the storage may not have created itself, e.g. one created by a copy of it that
+        shares its property dictionaries. Storages that keep the `Edge` objects they are given
+        share the change already and ignore it.
+
+        :param edge: The edge whose properties changed.
+        :type edge: Edge
+        :param key: The changed property, or `None` if the properties dictionary was replaced.
+        :type key: Optional[str]
+        :param old_value: The previous value, or the previous dictionary if it was replaced.
+        :type old_value: Any
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def outgoing(self) -> Dict[Node, Dict[Node, Edge]]:
+        """
+        Get the outgoing adjacency as a dictionary of dictionaries.
+
+        :return: A dictionary mapping each node to a dictionary of destination nodes and edges.
+        :rtype: Dict[Node, Dict[Node, Edge]]
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def incoming(self) -> Dict[Node, Dict[Node, Edge]]:
+        """
+        Get the incoming adjacency as a dictionary of dictionaries.
+
+        :return: A dictionary mapping each node to a dictionary of source nodes and edges.
+        :rtype: Dict[Node, Dict[Node, Edge]]
+        """
+        ...
@@ -0,0 +1,343 @@
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .dict_storage import DictStorage
+from .graph_storage import GraphStorage
+from ..edge import Edge
+from ..node import Node
+from ..observable import PropertyListener
+
+MAGIC: bytes = b"GVSNAPSH"
+FORMAT_VERSION: int = 1
+
+# magic, format version, flags, node count, edge count and the offsets of the sections:
+# id offsets, id data, sorted ids, out offsets, out targets, in offsets, in sources,
+# in positions, node properties, edge properties and blobs
+HEADER: struct.Struct = struct.Struct("<8sII13Q")
+ALIGNMENT: int = 8
+
+# an array of unsigned 64-bit integers read from a snapshot file
+ArrayLike = Union[memoryview, array]
+
+
+def write_snapshot(path: str, storage: GraphStorage) -> None:
+    """
+    Write the nodes and edges of a storage to a snapshot file that `MappedStorage` can open.
+
+    The file contains:
+
+    - a string table with the node IDs in UTF-8 and their order when sorted, for lookups by ID,
+    - the edges as compressed sparse row arrays (offsets and targets by source node), with a
+      compressed sparse column index for the incoming edges,
+    - the properties of every node and edge as a pickled blob (empty properties take no space).
+
+    All integers are unsigned 64-bit little-endian and every section is aligned to 8 bytes.
+    The file is written next to `path`, forced to disk and then moved over it, so a storage that
+    maps the previous file keeps working and a crash never leaves a partly written file.
+
+    :param path: The path of the snapshot file.
+    :type path: str
+    :param storage: The storage to write.
+    :type storage: GraphStorage
+    """
+    nodes: List[Node] = list(storage.nodes())
+    node_count: int = len(nodes)
+    indices: Dict[str, int] = {node.id: index for index, node in enumerate(nodes)}
+    encoded_ids: List[bytes] = [node.id.encode("utf-8") for node in nodes]
+
+    node_blobs: bytearray = bytearray()
+    edge_blobs: bytearray = bytearray()
+    node_properties: array = array("Q", [0])
+    edge_properties: array = array("Q", [0])
+    out_offsets: array = array("Q", [0])
+    out_targets: array = array("Q")
+    for node in nodes:
+        for edge in storage.out_edges(node):
+            out_targets.append(indices[edge.destination.id])
+            __append_blob(edge_blobs, edge_properties, edge.peek_properties())
+        out_offsets.append(len(out_targets))
+        __append_blob(node_blobs, node_properties, node.properties)
+
+    counts: List[int] = [0] * (node_count + 1)
+    for target in out_targets:
+        counts[target + 1] += 1
+    in_offsets: array = array("Q", accumulate(counts))
+    next_positions: List[int] = list(in_offsets[:-1])
+    in_sources: array = array("Q", bytes(8 * len(out_targets)))
+    in_positions: array = array("Q", bytes(8 * len(out_targets)))
+    for source in range(node_count):
+        for position in range(out_offsets[source], out_offsets[source + 1]):
+            target: int = out_targets[position]
+            in_sources[next_positions[target]] = source
+            in_positions[next_positions[target]] = position
+            next_positions[target] += 1
+
+    sections: List[bytes] = [
+        __to_bytes(array("Q", accumulate(map(len, encoded_ids), initial=0))),
+        b"".join(encoded_ids),
+        __to_bytes(array("Q", sorted(range(node_count), key=encoded_ids.__getitem__))),
+        __to_bytes(out_offsets),
+        __to_bytes(out_targets),
+        __to_bytes(in_offsets),
+        __to_bytes(in_sources),
+        __to_bytes(in_positions),
+        __to_bytes(node_properties),
+        # the blobs of the edges follow the ones of the nodes
+        __to_bytes(array("Q", (offset + len(node_blobs) for offset in edge_properties))),
+        bytes(node_blobs + edge_blobs)
+    ]
+    offsets: List[int] = []
+    offset: int = __aligned(HEADER.size)
+    for section in sections:
+        offsets.append(offset)
+        offset = __aligned(offset + len(section))
+
+    temporary_path: str = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, node_count, len(out_targets), *offsets))
+        for offset, section in zip(offsets, sections):
+            file.write(bytes(offset - file.tell()))
+            file.write(section)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+
+
+def __append_blob(blobs: bytearray, offsets: array, properties: Dict[str, Any]) -> None:
+    if properties:
+        blobs += pickle.dumps(properties, protocol=pickle.HIGHEST_PROTOCOL)
+    offsets.append(len(blobs))
+
+
+def __to_bytes(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array("Q", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def __aligned(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class MappedStorage(GraphStorage):
+    """
+    Read-only graph storage backed by a memory-mapped snapshot file (see `write_snapshot`).
+
+    Opening a snapshot only maps the file and reads its header. Nodes and edges are decoded from
+    the file the first time they are requested and then kept, so the same objects are returned
+    on every request and changes to their properties are preserved. Looking up a node by its ID
+    is a binary search over the sorted string table.
+
+    The storage cannot be modified. A `Graph` copies it into a `DictStorage` before its first
+    change, just like a storage shared with a snapshot.
+
+    The properties are stored with `pickle`, so only snapshot files from a trusted source may be
+    opened.
+    """
+
+    __slots__ = [
+        "__map", "__node_count", "__edge_count", "__id_offsets", "__id_data", "__sorted_ids",
+        "__out_offsets", "__out_targets", "__in_offsets", "__in_sources", "__in_positions",
+        "__node_properties", "__edge_properties", "__blobs", "__nodes", "__indices", "__edges",
+        "__property_listener"
+    ]
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a snapshot file.
+
+        :param path: The path of the snapshot file.
+        :type path: str
+
+        :raises ValueError: If the file is not a snapshot or has an unsupported format version.
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                raise ValueError(f"Invalid snapshot: '{path}' is too short.")
+            self.__map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, node_count, edge_count, *offsets = HEADER.unpack_from(self.__map)
+        if magic != MAGIC:
+            raise ValueError(f"Invalid snapshot: '{path}' is not a graph snapshot.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot: Expected format version {FORMAT_VERSION}, but got {version}.")
+
+        (id_offsets, self.__id_data, sorted_ids, out_offsets, out_targets, in_offsets, in_sources,
+         in_positions, node_properties, edge_properties, self.__blobs) = offsets
+        self.__node_count: int = node_count
+        self.__edge_count: int = edge_count
+        self.__id_offsets: ArrayLike = self.__array(id_offsets, node_count + 1)
+        self.__sorted_ids: ArrayLike = self.__array(sorted_ids, node_count)
+        self.__out_offsets: ArrayLike = self.__array(out_offsets, node_count + 1)
+        self.__out_targets: ArrayLike = self.__array(out_targets, edge_count)
+        self.__in_offsets: ArrayLike = self.__array(in_offsets, node_count + 1)
+        self.__in_sources: ArrayLike = self.__array(in_sources, edge_count)
+        self.__in_positions: ArrayLike = self.__array(in_positions, edge_count)
+        self.__node_properties: ArrayLike = self.__array(node_properties, node_count + 1)
+        self.__edge_properties: ArrayLike = self.__array(edge_properties, edge_count + 1)
+
+        self.__nodes: List[Optional[Node]] = [None] * node_count
+        self.__indices: Dict[str, int] = {}
+        self.__edges: Dict[int, Edge] = {}
+        self.__property_listener: Optional[PropertyListener] = None
+
+    @property
+    def read_only(self) -> bool:
+        return True
+
+    def set_property_listener(self, listener: PropertyListener) -> None:
+        self.__property_listener = listener
+
+    @property
+    def outgoing(self) -> Dict[Node, Dict[Node, Edge]]:
+        return {node: {edge.destination: edge for edge in self.out_edges(node)} for node in self.nodes()}
+
+    @property
+    def incoming(self) -> Dict[Node, Dict[Node, Edge]]:
+        return {node: {edge.source: edge for edge in self.in_edges(node)} for node in self.nodes()}
+
+    def add_node(self, node: Node) -> None:
+        self.__reject_change()
+
+    def remove_node(self, node: Node) -> None:
+        self.__reject_change()
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        index: int = self.__find(node_id)
+        return self.__node(index) if index >= 0 else None
+
+    def nodes(self) -> Iterator[Node]:
+        yield from map(self.__node, range(self.__node_count))
+
+    def node_count(self) -> int:
+        return self.__node_count
+
+    def add_edge(self, edge: Edge) -> None:
+        self.__reject_change()
+
+    def remove_edge(self, source: Node, destination: Node) -> bool:
+        self.__reject_change()
+
+    def get_edge(self, source: Node, destination: Node) -> Optional[Edge]:
+        source_index: int = self.__find(source.id)
+        destination_index: int = self.__find(destination.id)
+        if source_index < 0 or destination_index < 0:
+            return None
+        start: int = self.__out_offsets[source_index]
+        try:
+            position: int = start + self.__out_targets[start:self.__out_offsets[source_index + 1]].tolist().index(destination_index)
+        except ValueError:
+            return None
+        return self.__edge(source_index, position)
+
+    def out_edges(self, node: Node) -> Iterator[Edge]:
+        index: int = self.__find(node.id)
+        for position in range(self.__out_offsets[index], self.__out_offsets[index + 1]):
+            yield self.__edge(index, position)
+
+    def successors(self, node: Node) -> Iterator[Node]:
+        index: int = self.__find(node.id)
+        yield from map(self.__node, self.__out_targets[self.__out_offsets[index]:self.__out_offsets[index + 1]])
+
+    def in_edges(self, node: Node) -> Iterator[Edge]:
+        index: int = self.__find(node.id)
+        for position in range(self.__in_offsets[index], self.__in_offsets[index + 1]):
+            yield self.__edge(self.__in_sources[position], self.__in_positions[position])
+
+    def predecessors(self, node: Node) -> Iterator[Node]:
+        index: int = self.__find(node.id)
+        yield from map(self.__node, self.__in_sources[self.__in_offsets[index]:self.__in_offsets[index + 1]])
+
+    def out_degree(self, node: Node) -> int:
+        index: int = self.__find(node.id)
+        return self.__out_offsets[index + 1] - self.__out_offsets[index]
+
+    def in_degree(self, node: Node) -> int:
+        index: int = self.__find(node.id)
+        return self.__in_offsets[index + 1] - self.__in_offsets[index]
+
+    def edges(self) -> Iterator[Edge]:
+        for index in range(self.__node_count):
+            for position in range(self.__out_offsets[index], self.__out_offsets[index + 1]):
+                yield self.__edge(index, position)
+
+    def edge_count(self) -> int:
+        return self.__edge_count
+
+    def clear(self) -> None:
+        self.__reject_change()
+
+    def copy(self) -> DictStorage:
+        storage: DictStorage = DictStorage()
+        storage.add_all(list(self.nodes()), list(self.edges()))
+        return storage
+
+    def create_empty(self) -> DictStorage:
+        return DictStorage()
+
+    def __array(self, offset: int, count: int) -> ArrayLike:
+        view: memoryview = memoryview(self.__map)[offset:offset + 8 * count]
+        if sys.byteorder == "little":
+            return view.cast("Q")
+        values: array = array("Q", view.tobytes())
+        values.byteswap()
+        return values
+
+    def __id_bytes(self, index: int) -> bytes:
+        return self.__map[self.__id_data + self.__id_offsets[index]:self.__id_data + self.__id_offsets[index + 1]]
+
+    def __find(self, node_id: str) -> int:
+        index: Optional[int] = self.__indices.get(node_id, None)
+        if index is not None:
+            return index
+
+        encoded: bytes = node_id.encode("utf-8")
+        low, high = 0, self.__node_count
+        while low < high:
+            middle: int = (low + high) // 2
+            if self.__id_bytes(self.__sorted_ids[middle]) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.__node_count and self.__id_bytes(self.__sorted_ids[low]) == encoded:
+            return self.__sorted_ids[low]
+        return -1
+
+    def __properties(self, offsets: ArrayLike, index: int) -> Dict[str, Any]:
+        start: int = offsets[index]
+        end: int = offsets[index + 1]
+        if start == end:
+            return {}
+        return pickle.loads(self.__map[self.__blobs + start:self.__blobs + end])
+
+    def __node(self, index: int) -> Node:
+        node: Optional[Node] = self.__nodes[index]
+        if node is None:
+            node = Node(self.__id_bytes(index).decode("utf-8"))
+            node.properties = self.__properties(self.__node_properties, index)
+            if self.__property_listener is not None:
+                node.add_listener(self.__property_listener)
+            self.__nodes[index] = node
+            self.__indices[node.id] = index
+        return node
+
+    def __edge(self, source: int, position: int) -> Edge:
+        edge: Optional[Edge] = self.__edges.get(position, None)
+        if edge is None:
+            edge = Edge(self.__node(source), self.__node(self.__out_targets[position]))
+            edge.properties = self.__properties(self.__edge_properties, position)
+            if self.__property_listener is not None:
+                edge.add_listener(self.__property_listener)
+            self.__edges[position] = edge
+        return edge
+
+    @staticmethod
+    def __reject_change() -> None:
+        raise TypeError("Cannot modify a mapped storage: Snapshot files are read-only.")
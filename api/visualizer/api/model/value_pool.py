@@ -0,0 +1,169 @@
+import sys
+import threading
+from typing import Any, Dict, Hashable
+
+
+class ValuePool:
+    """
+    A pool of immutable property values, so that equal values read by loaders or parsed from
+    commands are stored once instead of once per node (e.g. the `rdf:type` URI of every
+    resource of an RDF dataset, or an enum-like string of a JSON dataset).
+
+    Only strings, bytes, integers and floats are pooled. Other values, such as lists or
+    booleans, are returned unchanged. Values of different types (e.g. `1` and `1.0`) are
+    pooled separately, so interning never changes the type of a value.
+
+    The pool holds a reference to every value it stores. To keep it from growing without limit
+    when a loader reads mostly unique values, strings and bytes longer than `max_length` are not
+    pooled, and once the pool holds `max_size` values, new values are no longer added, although
+    values already in the pool are still shared.
+    """
+
+    __slots__ = ["__values", "__lock", "__max_size", "__max_length", "__hits", "__misses", "__bytes_saved"]
+
+    def __init__(self, max_size: int = 1_000_000, max_length: int = 256) -> None:
+        """
+        :param max_size: The maximum number of values the pool stores.
+        :type max_size: int
+        :param max_length: The maximum length of a pooled string or bytes value.
+        :type max_length: int
+        """
+        self.__values: Dict[Hashable, Any] = {}
+        self.__lock: threading.Lock = threading.Lock()
+        self.__max_size: int = max_size
+        self.__max_length: int = max_length
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__bytes_saved: int = 0
+
+    @property
+    def size(self) -> int:
+        """
+        Get the number of values in the pool.
+
+        :return: The number of pooled values.
+        :rtype: int
+        """
+        return len(self.__values)
+
+    @property
+    def hits(self) -> int:
+        """
+        Get the number of interned values that were already in the pool.
+
+        :return: The number of hits.
+        :rtype: int
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Get the number of interned values that were not in the pool yet.
+
+        :return: The number of misses.
+        :rtype: int
+        """
+        return self.__misses
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Get the share of interned values that were already in the pool.
+
+        :return: The hit rate between 0 and 1, or 0 if nothing was interned yet.
+        :rtype: float
+        """
+        total: int = self.__hits + self.__misses
+        return self.__hits / total if total else 0.0
+
+    @property
+    def bytes_saved(self) -> int:
+        """
+        Get an estimate of the memory saved by the pool: The size of every value that was
+        replaced by an equal value from the pool, and can therefore be freed.
+
+        :return: The number of bytes saved.
+        :rtype: int
+        """
+        return self.__bytes_saved
+
+    def intern(self, value: Any) -> Any:
+        """
+        Get the pooled value equal to the given one, adding the value to the pool if it is new.
+
+        :param value: The value to intern.
+        :type value: Any
+
+        :return: The pooled value, or the given value if it cannot be pooled.
+        :rtype: Any
+        """
+        key: Hashable = value if type(value) is str and 0 < len(value) <= self.__max_length else self.__key(value)
+        if key is None:
+            return value
+
+        pooled: Any = self.__values.get(key, None)
+        if pooled is not None:
+            # counted without the lock, so concurrent loaders may lose a few counts
+            self.__hits += 1
+            if pooled is not value:
+                self.__bytes_saved += sys.getsizeof(value)
+            return pooled
+
+        with self.__lock:
+            pooled = self.__values.get(key, None)
+            if pooled is None:
+                self.__misses += 1
+                if len(self.__values) >= self.__max_size:
+                    return value
+                self.__values[key] = pooled = value
+            else:
+                self.__hits += 1
+        return pooled
+
+    def clear(self) -> None:
+        """
+        Remove all values from the pool and reset its statistics.
+        """
+        with self.__lock:
+            self.__values = {}
+            self.__hits = self.__misses = self.__bytes_saved = 0
+
+    def __key(self, value: Any) -> Hashable:
+        # strings that can be pooled are keyed by themselves, and handled by `intern` directly
+        value_type: type = type(value)
+        if value_type is bytes:
+            return (bytes, value) if 0 < len(value) <= self.__max_length else None
+        if value_type is int:
+            # CPython already shares the small integers
+            return (int, value) if not -5 <= value <= 256 else None
+        if value_type is float:
+            # -0.0 equals 0.0, and NaN equals nothing, so neither can be looked up
+            return (float, value) if value == value and value != 0.0 else None
+        return None
+
+
+__pool: ValuePool = ValuePool()
+
+
+def intern_value(value: Any) -> Any:
+    """
+    Get the value equal to the given one from the process-wide value pool.
+
+    :param value: The value to intern.
+    :type value: Any
+
+    :return: The pooled value, or the given value if it cannot be pooled.
+    :rtype: Any
+    """
+    return __pool.intern(value)
+
+
+def get_value_pool() -> ValuePool:
+    """
+    Get the process-wide value pool, e.g. to report its statistics.
+
+    :return: The value pool.
+    :rtype: ValuePool
+    """
+    return __pool
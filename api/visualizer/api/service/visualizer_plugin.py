@@ -44,7 +44,8 @@ class VisualizerPlugin(Plugin):
         
         Visualizer plugin must call the ``window.updateBirdView()`` function every time the simulation tick happens.
 
-        :param graph: The graph to visualize.
+        :param graph: The graph to visualize. It can also be a read-only `GraphView` of a graph, which offers
+                      the same read methods.
         :param kwargs: Arbitrary keyword arguments for customization (e.g., layout options).
         :type graph: Graph
         :type kwargs: any
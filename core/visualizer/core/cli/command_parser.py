@@ -1,12 +1,13 @@
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from visualizer.api.model.graph import Graph
 from visualizer.api.model.node import Node
+from visualizer.api.model.value_pool import intern_value
 from visualizer.core.cli.exception.parser_exception import ParserError
 from visualizer.core.command import (
     Command, CreateNodeCommand, DeleteNodeCommand, EditNodeCommand,
     CreateEdgeCommand, EditEdgeCommand, DeleteEdgeCommand, ClearCommand,
-    SearchCommand, FilterCommand
+    SearchCommand, FilterCommand, ReachCommand, GroupCommand, StatsCommand, PathCommand, ScriptCommand
 )
 
 
@@ -18,6 +19,8 @@ def parse_command(graph: Graph, input_line: str) -> Command:
     if len(tokens) == 1:
         if tokens[0] == "clear":
             return ClearCommand(graph)
+        elif tokens[0] == "stats":
+            return StatsCommand(graph)
         else:
             raise NotImplementedError("Incomplete command. A command requires more details (e.g., 'create node ...').")
 
@@ -26,6 +29,12 @@ def parse_command(graph: Graph, input_line: str) -> Command:
             return __parse_filter_command(graph, tokens)
         case "search":
             return __parse_search_command(graph, tokens)
+        case "reach":
+            return __parse_reach_command(graph, tokens)
+        case "group" | "stats":
+            return __parse_aggregation_command(graph, tokens)
+        case "path":
+            return __parse_path_command(graph, tokens)
         case "create" | "edit" | "delete":
             match tokens[1]:
                 case "node":
@@ -38,6 +47,22 @@ def parse_command(graph: Graph, input_line: str) -> Command:
             raise ParserError(f"Unknown command: '{tokens[0]}'.")
 
 
+# handled by the command service itself rather than parsed into commands, so they cannot be undone
+__SESSION_COMMANDS = ("undo", "redo", "reload", "reset", "help")
+
+
+def parse_script(graph: Graph, script: str) -> ScriptCommand:
+    # blank lines and comments are skipped, but lines keep their numbers for error messages
+    stripped: Iterator[Tuple[int, str]] = ((number, line.strip()) for number, line in enumerate(script.splitlines(), 1))
+    lines: List[Tuple[int, str]] = [(number, line) for number, line in stripped if line and not line.startswith("#")]
+    if not lines:
+        raise ParserError("The script contains no commands.")
+    for number, line in lines:
+        if line in __SESSION_COMMANDS:
+            raise ParserError(f"Line {number}: '{line}' cannot be part of a script.")
+    return ScriptCommand(graph, lines, parse_command)
+
+
 def __parse_edge_command(graph: Graph, tokens: List[str]) -> Command:
     if len(tokens) < 4:
         raise ParserError("Incomplete edge command. Expected syntax: '<action> edge <source> <destination> [--property key=value ...]'")
@@ -107,7 +132,7 @@ def __parse_properties(tokens: List[str]) -> Tuple[Optional[str], Dict[str, Any]
                 value = ast.literal_eval(value_str)
             except (ValueError, SyntaxError):
                 value = value_str
-            properties[key] = value
+            properties[key] = intern_value(value)
             i += 1
         else:
             raise ParserError(f"Unrecognized token: '{tokens[i]}'. Did you mean to use '--id=' or '--property'?")
@@ -126,3 +151,36 @@ def __parse_filter_command(graph: Graph, tokens: List[str]) -> Command:
     if len(tokens) < 4:
         raise ParserError("Incomplete filter command. Expected syntax: 'filter <key> <operator> <value>'")
     return FilterCommand(graph, tokens[1], tokens[2], tokens[3])
+
+
+def __parse_reach_command(graph: Graph, tokens: List[str]) -> Command:
+    if len(tokens) < 2:
+        raise ParserError("No node ID provided. Expected syntax: 'reach <node_id> [--reverse]'")
+    if len(tokens) > 3 or (len(tokens) == 3 and tokens[2] != "--reverse"):
+        raise ParserError(f"Unrecognized token: '{tokens[-1]}'. Expected syntax: 'reach <node_id> [--reverse]'")
+    return ReachCommand(graph, tokens[1], len(tokens) == 3)
+
+
+def __parse_aggregation_command(graph: Graph, tokens: List[str]) -> Command:
+    if len(tokens) != 2:
+        raise ParserError("Expected syntax: 'group <key>'" if tokens[0] == "group" else "Expected syntax: 'stats [key]'")
+    if tokens[0] == "group":
+        return GroupCommand(graph, tokens[1])
+    return StatsCommand(graph, tokens[1])
+
+
+def __parse_path_command(graph: Graph, tokens: List[str]) -> Command:
+    if len(tokens) < 3:
+        raise ParserError("Incomplete path command. Expected syntax: 'path <source> <destination> [--weight key]'")
+    if len(tokens) != 3 and (len(tokens) != 5 or tokens[3] != "--weight"):
+        raise ParserError(f"Unrecognized token: '{tokens[3]}'. Expected syntax: 'path <source> <destination> [--weight key]'")
+
+    source: Optional[Node] = graph.get_node(tokens[1])
+    if not source:
+        raise ValueError(f"Source node not found. Make sure both source and destination nodes exist.")
+
+    destination: Optional[Node] = graph.get_node(tokens[2])
+    if not destination:
+        raise ValueError(f"Destination node not found. Make sure both source and destination nodes exist.")
+
+    return PathCommand(graph, source, destination, tokens[4] if len(tokens) == 5 else None)
@@ -1,10 +1,15 @@
-from .command import Command
+from .command import Command, QueryCommand
 from .edge.create_edge_command import CreateEdgeCommand
 from .edge.delete_edge_command import DeleteEdgeCommand
 from .edge.edit_edge_command import EditEdgeCommand
 from .general.clear_command import ClearCommand
 from .general.filter_command import FilterCommand
+from .general.group_command import GroupCommand
+from .general.path_command import PathCommand
+from .general.reach_command import ReachCommand
+from .general.script_command import ScriptCommand, ScriptError
 from .general.search_command import SearchCommand
+from .general.stats_command import StatsCommand
 from .node.create_node_command import CreateNodeCommand
 from .node.delete_node_command import DeleteNodeCommand
 from .node.edit_node_command import EditNodeCommand
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from visualizer.api.model.graph_view import GraphView
 
 class Command(ABC):
     """
@@ -26,4 +29,40 @@ class Command(ABC):
         This method should be implemented by subclasses to define how to revert
         the action performed by `execute`.
         """
-        ...
\ No newline at end of file
+        ...
+
+class QueryCommand(Command):
+    """
+    Abstract base class for commands that only read the graph and report a result.
+
+    Queries leave the graph unchanged, so they have nothing to undo and are not added to the
+    command history. Subclasses must implement `query`, and may offer a view of the graph that
+    shows the result by overriding `view`.
+    """
+
+    @abstractmethod
+    def query(self) -> str:
+        """
+        Compute the result of the command.
+
+        :return: The result, formatted for the command line.
+        :rtype: str
+        """
+        ...
+
+    def execute(self) -> None:
+        """ Compute the result of the command, discarding it. """
+        self.query()
+
+    def undo(self) -> None:
+        """ Do nothing, since the command did not change the graph. """
+        ...
+
+    def view(self) -> Optional[GraphView]:
+        """
+        Get a view of the graph that shows the result of the last `query`.
+
+        :return: The view, or `None` if the result is only reported as text.
+        :rtype: Optional[GraphView]
+        """
+        return None
@@ -1,17 +1,21 @@
-from django.db import NotSupportedError
-from visualizer.api.model.graph import Graph
+from typing import Optional
+
+from visualizer.api.model.graph import Graph, GraphSnapshot
 from visualizer.core.command import Command
 
 
 class ClearCommand(Command):
 
-    __slots__ = ["__graph"]
+    __slots__ = ["__graph", "__snapshot"]
 
     def __init__(self, graph: Graph) -> None:
         self.__graph: Graph = graph
+        self.__snapshot: Optional[GraphSnapshot] = None
 
     def execute(self) -> None:
+        self.__snapshot = self.__graph.snapshot()
         self.__graph.clear()
 
     def undo(self) -> None:
-        raise NotSupportedError("Undo for ClearCommand is not supported. The previous graph state is not preserved.")
+        self.__graph.restore(self.__snapshot)
+        self.__snapshot = None
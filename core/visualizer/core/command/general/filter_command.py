@@ -1,21 +1,31 @@
-from django.db import NotSupportedError
-from visualizer.api.model.graph import Graph
+from typing import Optional
+
+from visualizer.api.model.graph import Graph, GraphSnapshot
 from visualizer.core.command import Command
 from visualizer.core.usecase import graph_util
 
 
 class FilterCommand(Command):
 
-    __slots__ = ["__graph", "__key", "__operator", "__compare_value"]
+    __slots__ = ["__graph", "__key", "__operator", "__compare_value", "__before", "__after"]
 
     def __init__(self, graph: Graph, key: str, operator: str, compare_value: str) -> None:
         self.__graph = graph
         self.__key = key
         self.__operator = operator
         self.__compare_value = compare_value
+        self.__before: Optional[GraphSnapshot] = None
+        self.__after: Optional[GraphSnapshot] = None
 
     def execute(self) -> None:
-        graph_util.filter_graph(self.__graph, self.__key, self.__operator, self.__compare_value)
+        self.__before = self.__graph.snapshot()
+        if self.__after is not None: # redo restores the filtered graph instead of filtering again
+            self.__graph.restore(self.__after)
+            self.__after = None
+        else:
+            graph_util.filter_graph(self.__graph, self.__key, self.__operator, self.__compare_value)
 
     def undo(self) -> None:
-        raise NotSupportedError("Undo for FilterCommand is not supported. The previous graph state is not preserved.")
+        self.__after = self.__graph.snapshot()
+        self.__graph.restore(self.__before)
+        self.__before = None
@@ -0,0 +1,29 @@
+from typing import Any, Dict, List
+
+from visualizer.api.model.graph import Graph
+from visualizer.core.command import QueryCommand
+from visualizer.core.usecase import aggregation
+
+# the number of groups listed before the rest are summarized in one line
+MAX_GROUPS: int = 20
+
+
+class GroupCommand(QueryCommand):
+
+    __slots__ = ["__graph", "__key"]
+
+    def __init__(self, graph: Graph, key: str) -> None:
+        self.__graph = graph
+        self.__key = key
+
+    def query(self) -> str:
+        counts: Dict[Any, int] = aggregation.group_by(self.__graph, self.__key)
+        node_count: int = sum(counts.values())
+        lines: List[str] = [f"{self.__key}: {len(counts)} values over {node_count} nodes"]
+        lines.extend(f"  {value}: {count}" for value, count in list(counts.items())[:MAX_GROUPS])
+        if len(counts) > MAX_GROUPS:
+            lines.append(f"  ... {len(counts) - MAX_GROUPS} more values")
+        missing: int = self.__graph.get_node_count() - node_count
+        if missing:
+            lines.append(f"  (missing): {missing}")
+        return "\n".join(lines)
@@ -0,0 +1,37 @@
+from typing import List, Optional
+
+from visualizer.api.algorithm.path import shortest_path, weighted_shortest_path
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_view import GraphView
+from visualizer.api.model.node import Node
+from visualizer.core.command import QueryCommand
+from visualizer.core.usecase import graph_util
+
+
+class PathCommand(QueryCommand):
+
+    __slots__ = ["__graph", "__source", "__destination", "__weight_key", "__path"]
+
+    def __init__(self, graph: Graph, source: Node, destination: Node, weight_key: Optional[str] = None) -> None:
+        self.__graph = graph
+        self.__source = source
+        self.__destination = destination
+        self.__weight_key = weight_key
+        self.__path: Optional[List[Node]] = None
+
+    def query(self) -> str:
+        if self.__weight_key is None:
+            self.__path = shortest_path(self.__graph, self.__source, self.__destination)
+            total: str = f"{len(self.__path) - 1} edges" if self.__path is not None else ""
+        else:
+            result = weighted_shortest_path(self.__graph, self.__source, self.__destination, self.__weight_key)
+            self.__path = result[1] if result is not None else None
+            total = f"{self.__weight_key} {result[0]:g}" if result is not None else ""
+        if self.__path is None:
+            return f"No path from '{self.__source.id}' to '{self.__destination.id}'."
+        return f"{' -> '.join(node.id for node in self.__path)} ({total})"
+
+    def view(self) -> Optional[GraphView]:
+        if self.__path is None:
+            return None
+        return graph_util.nodes_view(self.__graph, self.__path)
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from visualizer.api.model.graph import Graph, GraphSnapshot
+from visualizer.core.command import Command
+from visualizer.core.usecase import graph_util
+
+
+class ReachCommand(Command):
+
+    __slots__ = ["__graph", "__node_id", "__reverse", "__before", "__after"]
+
+    def __init__(self, graph: Graph, node_id: str, reverse: bool = False) -> None:
+        self.__graph = graph
+        self.__node_id = node_id
+        self.__reverse = reverse
+        self.__before: Optional[GraphSnapshot] = None
+        self.__after: Optional[GraphSnapshot] = None
+
+    def execute(self) -> None:
+        self.__before = self.__graph.snapshot()
+        if self.__after is not None: # redo restores the reduced graph instead of traversing again
+            self.__graph.restore(self.__after)
+            self.__after = None
+        else:
+            graph_util.reach_graph(self.__graph, self.__node_id, self.__reverse)
+
+    def undo(self) -> None:
+        self.__after = self.__graph.snapshot()
+        self.__graph.restore(self.__before)
+        self.__before = None
@@ -0,0 +1,58 @@
+from typing import Callable, List, Tuple
+
+from visualizer.api.model.graph import Graph
+from visualizer.core.command import Command, QueryCommand
+
+
+class ScriptError(Exception):
+    """Raised when a line of a script fails, after the lines before it were rolled back."""
+    ...
+
+
+class ScriptCommand(Command):
+    """
+    A script of commands executed as a single transaction.
+
+    A line may refer to nodes created by the lines before it, so every line is parsed right
+    before it is executed, against the graph the previous lines left. If a line fails to parse
+    or execute, the lines already executed are undone in reverse order and a `ScriptError` is
+    raised, so the graph is left as it was. The parsed commands are kept, so undoing and redoing
+    the script does not parse it again.
+    """
+
+    __slots__ = ["__graph", "__lines", "__parse", "__commands"]
+
+    def __init__(self, graph: Graph, lines: List[Tuple[int, str]], parse: Callable[[Graph, str], Command]) -> None:
+        self.__graph = graph
+        self.__lines = lines
+        self.__parse = parse
+        self.__commands: List[Command] = []
+
+    def __len__(self) -> int:
+        return len(self.__lines)
+
+    def execute(self) -> None:
+        parsed: bool = len(self.__commands) == len(self.__lines)
+        executed: List[Command] = []
+        for index, (number, line) in enumerate(self.__lines):
+            try:
+                command: Command = self.__commands[index] if parsed else self.__parse(self.__graph, line)
+                if isinstance(command, QueryCommand):
+                    raise ScriptError(f"'{line.split()[0]}' only reports a result, so it cannot be part of a script.")
+                command.execute()
+            except Exception as e:
+                self.__roll_back(executed)
+                if not parsed:
+                    self.__commands.clear()
+                raise ScriptError(f"Line {number} ('{line}'): {e} The script was rolled back.") from e
+            executed.append(command)
+            if not parsed:
+                self.__commands.append(command)
+
+    def undo(self) -> None:
+        self.__roll_back(self.__commands)
+
+    @staticmethod
+    def __roll_back(commands: List[Command]) -> None:
+        for command in reversed(commands):
+            command.undo()
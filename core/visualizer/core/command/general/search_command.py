@@ -1,19 +1,29 @@
-from django.db import NotSupportedError
-from visualizer.api.model.graph import Graph
+from typing import Optional
+
+from visualizer.api.model.graph import Graph, GraphSnapshot
 from visualizer.core.command import Command
 from visualizer.core.usecase import graph_util
 
 
 class SearchCommand(Command):
 
-    __slots__ = ["__graph", "__query"]
+    __slots__ = ["__graph", "__query", "__before", "__after"]
 
     def __init__(self, graph: Graph, query: str)-> None:
         self.__graph = graph
         self.__query = query
+        self.__before: Optional[GraphSnapshot] = None
+        self.__after: Optional[GraphSnapshot] = None
 
     def execute(self) -> None:
-        graph_util.search_graph(self.__graph, self.__query)
+        self.__before = self.__graph.snapshot()
+        if self.__after is not None: # redo restores the searched graph instead of searching again
+            self.__graph.restore(self.__after)
+            self.__after = None
+        else:
+            graph_util.search_graph(self.__graph, self.__query)
 
     def undo(self) -> None:
-        raise NotSupportedError("Undo for SearchCommand is not supported. The previous graph state is not preserved.")
\ No newline at end of file
+        self.__after = self.__graph.snapshot()
+        self.__graph.restore(self.__before)
+        self.__before = None
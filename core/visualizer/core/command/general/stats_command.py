@@ -0,0 +1,46 @@
+from typing import List, Optional
+
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_stats import GraphStats
+from visualizer.core.command import QueryCommand
+from visualizer.core.usecase import aggregation
+from visualizer.core.usecase.aggregation import Number, PropertyStats
+
+
+class StatsCommand(QueryCommand):
+
+    __slots__ = ["__graph", "__key"]
+
+    def __init__(self, graph: Graph, key: Optional[str] = None) -> None:
+        self.__graph = graph
+        self.__key = key
+
+    def query(self) -> str:
+        if self.__key is None:
+            return self.__structure()
+        stats: PropertyStats = aggregation.property_stats(self.__graph, self.__key)
+        lines: List[str] = [
+            f"{stats.key}: {stats.value_count} of {stats.node_count} nodes have a value, {stats.number_count} numeric"
+        ]
+        if stats.number_count:
+            lines.append(
+                f"  min {self.__format(stats.minimum)}, max {self.__format(stats.maximum)}, mean {self.__format(stats.mean)}"
+            )
+            lines.extend(
+                f"  [{self.__format(start)}, {self.__format(end)}): {count}" for start, end, count in stats.histogram
+            )
+        return "\n".join(lines)
+
+    def __structure(self) -> str:
+        # only counters are read, outdated ones are shown as unknown
+        stats: GraphStats = self.__graph.get_stats()
+        count = lambda value: "?" if value is None else str(value)
+        return "\n".join([
+            f"{stats.node_count} nodes, {stats.edge_count} edges, {count(stats.component_count)} connected components",
+            f"  average degree {self.__format(float(stats.average_degree))}, {count(stats.self_loop_count)} self-loops, "
+            f"{count(stats.reciprocal_pair_count)} reciprocal edge pairs"
+        ])
+
+    @staticmethod
+    def __format(number: Number) -> str:
+        return f"{number:g}" if isinstance(number, float) else str(number)
@@ -1,24 +1,46 @@
+import os
+import threading
 from typing import List, Optional
 
 from visualizer.core.platform.workspace import Workspace
 from visualizer.core.service.plugin_service import PluginService
 
+WORKSPACES_FILE: str = "workspaces"
+
 
 class Platform:
 
-    def __init__(self, plugin_service: Optional[PluginService] = None):
+    def __init__(self, plugin_service: Optional[PluginService] = None, snapshot_directory: Optional[str] = None,
+                 journal_directory: Optional[str] = None):
         """
         Initialize a Platform instance with the given plugin service.
 
-        A new workspace is created during initialization and set as the current workspace.
+        The workspaces journaled in `journal_directory` are restored, in the order they were
+        created, and the first of them is set as the current workspace. If there are none, a new
+        workspace is created and set as the current workspace.
 
         :param plugin_service: The plugin service used by workspaces.
         :type plugin_service: Optional[PluginService]
+        :param snapshot_directory: A directory where workspaces keep snapshot files of their
+                                   graphs, so reloading a graph does not load its input again.
+        :type snapshot_directory: Optional[str]
+        :param journal_directory: A directory where workspaces journal the changes of their
+                                  graphs, so they are restored after a restart.
+        :type journal_directory: Optional[str]
         """
         self.plugin_service = plugin_service if plugin_service else PluginService()
+        self.snapshot_directory: Optional[str] = snapshot_directory
+        # guards the registry of workspaces, which request threads may change concurrently
+        self.lock: threading.RLock = threading.RLock()
+        self.journal_directory: Optional[str] = journal_directory
         self.workspaces: dict[str, Workspace] = {}
         self.current_workspace_id: str = ""
-        self.create_workspace()
+        for workspace_id in self.__journaled_workspace_ids():
+            self.workspaces[workspace_id] = self.__new_workspace(workspace_id)
+        if self.workspaces:
+            self.current_workspace_id = next(iter(self.workspaces))
+        else:
+            self.create_workspace()
 
 
     def create_workspace(self) -> Workspace:
@@ -31,17 +53,51 @@ class Platform:
         :return: The newly created workspace.
         :rtype: Workspace
         """
-        ws = Workspace(self.plugin_service)
-        self.workspaces[ws.id] = ws
-        self.current_workspace_id = ws.id
-        return ws
+        with self.lock:
+            ws = self.__new_workspace()
+            self.workspaces[ws.id] = ws
+            self.current_workspace_id = ws.id
+            self.__save_workspace_ids()
+            return ws
+
+
+    def __new_workspace(self, workspace_id: Optional[str] = None) -> Workspace:
+        return Workspace(self.plugin_service, workspace_id=workspace_id, snapshot_directory=self.snapshot_directory,
+                         journal_directory=self.journal_directory)
+
+
+    def __journaled_workspace_ids(self) -> List[str]:
+        if self.journal_directory is None or not os.path.isdir(self.journal_directory):
+            return []
+        path: str = os.path.join(self.journal_directory, WORKSPACES_FILE)
+        workspace_ids: List[str] = []
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                workspace_ids = file.read().split()
+        # a workspace created right before a crash may be missing from the list
+        directories: List[str] = sorted(
+            name for name in os.listdir(self.journal_directory) if os.path.isdir(os.path.join(self.journal_directory, name))
+        )
+        return [workspace_id for workspace_id in workspace_ids if workspace_id in directories] + \
+               [name for name in directories if name not in workspace_ids]
+
+
+    def __save_workspace_ids(self) -> None:
+        # the order of the workspaces, which their journal directories do not keep
+        if self.journal_directory is None:
+            return
+        path: str = os.path.join(self.journal_directory, WORKSPACES_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            file.write("\n".join(self.workspaces))
+        os.replace(f"{path}.tmp", path)
     
 
     def delete_workspace(self, workspace_id: str) -> bool:
         """
         Delete an existing workspace by ID.
 
-        If the workspace exists, it is removed and the current workspace is updated.
+        If the workspace exists, it is removed, its background computations are stopped, its
+        journal is deleted, and the current workspace is updated.
         If any workspaces remain, the next one is selected as current. If none remain,
         the current workspace is set to None.
 
@@ -53,28 +109,30 @@ class Platform:
         :return: True if deletion was successful, False if the workspace was not found.
         :rtype: bool
         """
-        if workspace_id not in self.workspaces:
-            return False
-
-        ids = list(self.workspaces.keys())
-        idx = ids.index(workspace_id)
-        del self.workspaces[workspace_id]
+        with self.lock:
+            if workspace_id not in self.workspaces:
+                return False
 
-        remaining_ids = list(self.workspaces.keys())
-        if remaining_ids:
-            if idx < len(remaining_ids):
-                self.current_workspace_id = remaining_ids[idx]
+            ids = list(self.workspaces.keys())
+            idx = ids.index(workspace_id)
+            self.workspaces.pop(workspace_id).delete()
+            self.__save_workspace_ids()
+
+            remaining_ids = list(self.workspaces.keys())
+            if remaining_ids:
+                if idx < len(remaining_ids):
+                    self.current_workspace_id = remaining_ids[idx]
+                else:
+                    self.current_workspace_id = remaining_ids[-1]
             else:
-                self.current_workspace_id = remaining_ids[-1]
-        else:
-            self.current_workspace_id = None
+                self.current_workspace_id = None
 
-        if self.current_workspace_id:
-            current_ws = self.workspaces[self.current_workspace_id]
-            if current_ws.data_file_string:
-                current_ws.generate_graph()
+            if self.current_workspace_id:
+                current_ws = self.workspaces[self.current_workspace_id]
+                if current_ws.data_file_string:
+                    current_ws.generate_graph()
 
-        return True
+            return True
 
 
     def get_selected_workspace(self) -> Workspace:
@@ -86,9 +144,10 @@ class Platform:
         :return: The currently selected workspace.
         :rtype: Workspace
         """
-        if self.current_workspace_id:
-            return self.workspaces[self.current_workspace_id]
-        return self.create_workspace()
+        with self.lock:
+            if self.current_workspace_id:
+                return self.workspaces[self.current_workspace_id]
+            return self.create_workspace()
 
 
     def switch_workspace(self, workspace_id: str) -> bool:
@@ -104,10 +163,11 @@ class Platform:
         :return: True if the workspace exists and switching succeeded, False otherwise.
         :rtype: bool
         """
-        if workspace_id in self.workspaces:
-            self.current_workspace_id = workspace_id
-            return True
-        return False
+        with self.lock:
+            if workspace_id in self.workspaces:
+                self.current_workspace_id = workspace_id
+                return True
+            return False
 
 
     def switch_workspace_by_offset(self, offset: int) -> bool:
@@ -122,16 +182,17 @@ class Platform:
         :return: True if the switch was successful, False otherwise.
         :rtype: bool
         """
-        ids = list(self.workspaces.keys())
-        if self.current_workspace_id and ids:
-            try:
-                idx = ids.index(self.current_workspace_id)
-            except ValueError:
-                return False
+        with self.lock:
+            ids = list(self.workspaces.keys())
+            if self.current_workspace_id and ids:
+                try:
+                    idx = ids.index(self.current_workspace_id)
+                except ValueError:
+                    return False
 
-            new_idx = max(0, min(len(ids) - 1, idx + offset))
-            return self.switch_workspace(ids[new_idx])
-        return False
+                new_idx = max(0, min(len(ids) - 1, idx + offset))
+                return self.switch_workspace(ids[new_idx])
+            return False
 
 
     def switch_to_next_workspace(self) -> bool:
@@ -161,4 +222,15 @@ class Platform:
         :return: A list of all workspaces.
         :rtype: List[Workspace]
         """
-        return list(self.workspaces.values())
+        with self.lock:
+            return list(self.workspaces.values())
+
+
+    def close(self) -> None:
+        """
+        Close all workspaces, e.g. when the server stops. Their journals are forced to disk, so
+        they are restored by the next platform with the same journal directory.
+        """
+        with self.lock:
+            for workspace in self.workspaces.values():
+                workspace.close()
@@ -1,24 +1,54 @@
-from typing import Tuple, Optional, Any
+from typing import Tuple, Optional, Any, Dict
+import logging
+import os
 import uuid
 
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_view import GraphView
+from visualizer.api.service.data_source_plugin import DataSourcePlugin
+from visualizer.core.service.command_journal import CommandJournal
 from visualizer.core.service.command_service import CommandService
 from visualizer.core.service.plugin_service import PluginService
-from visualizer.core.usecase import graph_util
 
-from ..command.command_result import CommandResult
+from ..command.command_result import CommandResult, CommandStatus
+from ..usecase.aggregation import PropertyStats
+from ..usecase.centrality_worker import CentralityWorker
 from ..usecase.graph_manager import GraphManager
 from ..usecase.plugin_manager import PluginManager
+from ..util.read_write_lock import ReadWriteLock
 from ..view import app_header_view, main_view, bird_view, tree_view
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class Workspace:
+    """
+    The plugins, graph and views a user works with.
+
+    A workspace may be used by several threads at once (e.g. the request threads of a web
+    server). Rendering only reads its state and runs concurrently, while changes to the plugins,
+    the graph or the views wait for each other and for running renders. After every change of
+    the graph, its structure statistics are brought up to date. The centrality scores of its
+    nodes are computed in a background thread once a filter, command or visualizer looked them
+    up, and the thread only holds the lock for reading while it reads the structure of the graph.
+
+    With a journal directory, the commands that change the graph are journaled, and the graph is
+    saved as a snapshot whenever it is generated and after every `compaction_interval` commands,
+    so a workspace created again with the same ID restores the graph, together with its data
+    source plugin and input, so it can be reloaded. The command history is kept in memory across
+    snapshots; an undo or redo of a command from before the last snapshot cannot be replayed
+    from the journal, so the graph is saved as a snapshot again instead.
+    """
 
     def __init__(
         self,
         plugin_service: PluginService,
         command_service: Optional[CommandService] = None,
         graph_manager: Optional[GraphManager] = None,
-        workspace_id: str = None
+        workspace_id: str = None,
+        snapshot_directory: Optional[str] = None,
+        journal_directory: Optional[str] = None,
+        compaction_interval: int = 1000
     ):
         """
         Initialize the Workspace with plugin and command services.
@@ -29,28 +59,54 @@ class Workspace:
 
         :param plugin_service: The service responsible for managing available plugins.
         :type plugin_service: PluginService
+        :param snapshot_directory: A directory to keep snapshot files of generated graphs in, so
+                                   regenerating the same graph opens its snapshot instead.
+        :type snapshot_directory: Optional[str]
+        :param journal_directory: A directory to journal the commands of workspaces in, each in
+                                  a directory named after its ID. The graph of a journal found
+                                  there is restored.
+        :type journal_directory: Optional[str]
+        :param compaction_interval: The number of journaled commands after which the graph is
+                                    saved as a snapshot and the journal started anew.
+        :type compaction_interval: int
         """
         self.id = workspace_id or str(uuid.uuid4())
-        self.__command_service = command_service or CommandService(self.generate_graph)
+        self.__command_service = command_service or CommandService(self.generate_graph, self.__show_view,
+                                                                   self.__reset_views)
         self.__plugin_manager = PluginManager(plugin_service)
-        self.__graph_manager = graph_manager or GraphManager(self.__plugin_manager)
+        self.__graph_manager = graph_manager or GraphManager(self.__plugin_manager, snapshot_directory)
+        self.__lock = ReadWriteLock()
+        self.__centrality_worker = CentralityWorker(self.__lock.read)
+        self.__journal: Optional[CommandJournal] = None
+        # counts the graphs generated, which are saved as snapshots instead of being journaled
+        self.__generations: int = 0
+        # the number of commands on the undo and redo stacks that were journaled since the snapshot
+        self.__journaled_undos: int = 0
+        self.__journaled_redos: int = 0
+        with self.__lock.write():
+            if journal_directory is not None:
+                self.__journal = CommandJournal(os.path.join(journal_directory, self.id), compaction_interval)
+                self.__recover()
+            self.__on_graph_change()
 
     def set_visualizer_plugin(self, identifier: str) -> None:
         """
         Set visualizer plugin via its identifier.
         :param identifier: plugin identifier
         """
-        self.__plugin_manager.set_visualizer(identifier)
+        with self.__lock.write():
+            self.__plugin_manager.set_visualizer(identifier)
 
     def set_data_source_plugin(self, identifier: str, **kwargs) -> None:
         """
         Set data source plugin via its identifier.
         :param identifier: plugin identifier
         """
-        old_identifier: str = self.__plugin_manager.data_source_plugin.identifier()
-        self.__plugin_manager.set_data_source(identifier)
-        if old_identifier != identifier:
-            self.generate_graph(**kwargs)
+        with self.__lock.write():
+            old_identifier: str = self.__plugin_manager.data_source_plugin.identifier()
+            self.__plugin_manager.set_data_source(identifier)
+            if old_identifier != identifier:
+                self.generate_graph(**kwargs)
 
     def __set_default_plugins(self) -> None:
         """ Set plugins to first available. """
@@ -64,7 +120,8 @@ class Workspace:
         :return: The string content of the data file.
         :rtype: str
         """
-        return self.__graph_manager.data_file_string
+        with self.__lock.read():
+            return self.__graph_manager.data_file_string
 
     @data_file_string.setter
     def data_file_string(self, data_file_string: str) -> None:
@@ -74,7 +131,8 @@ class Workspace:
         :param data_file_string: The string representation of the input data file.
         :type data_file_string: str
         """
-        self.__graph_manager.data_file_string = data_file_string
+        with self.__lock.write():
+            self.__graph_manager.data_file_string = data_file_string
 
     def execute_command(self, command_input: str) -> CommandResult:
         """
@@ -90,52 +148,233 @@ class Workspace:
         :return: A `CommandResult` indicating the outcome of the execution.
         :rtype: CommandResult
         """
-        return self.__command_service.execute_command(self.__graph_manager.graph, command_input)
+        with self.__lock.write():
+            graph: Graph = self.__graph_manager.graph
+            version: int = graph.version
+            generations: int = self.__generations
+            result: CommandResult = self.__command_service.execute_command(graph, command_input)
+            if graph.version != version:
+                # a path shown by an earlier command no longer matches the graph
+                self.__graph_manager.hide_shown_view()
+            if (self.__journal is not None and result.status != CommandStatus.ERROR and
+                    self.__generations == generations and graph.version != version):
+                self.__journal_command(command_input.strip())
+            self.__on_graph_change()
+            return result
 
     def generate_graph(self, use_properties: bool = False, **kwargs) -> None:
         """ Generate the graph using the currently selected data source plugin. """
-        if use_properties:
-            self.__graph_manager.generate(**self.__graph_manager.properties)
-        else:
-            self.__graph_manager.generate(file_content=self.__graph_manager.data_file_string, **kwargs)
+        with self.__lock.write():
+            if use_properties:
+                self.__graph_manager.generate(**self.__graph_manager.properties)
+            else:
+                self.__graph_manager.generate(file_content=self.__graph_manager.data_file_string, **kwargs)
+            self.__generations += 1
+            # the history may hold snapshots of the graph before it was loaded, which undo would restore
+            self.__command_service.clear_history()
+            if self.__journal is not None:
+                self.__compact()
+            self.__on_graph_change()
+
+    def __on_graph_change(self) -> None:
+        # called with the write lock held, after anything that may have changed the graph
+        graph: Graph = self.__graph_manager.graph
+        graph.get_stats().refresh()
+        self.__request_centrality()
+
+    def __request_centrality(self) -> None:
+        # only starts a computation if a lookup found the scores missing
+        self.__centrality_worker.request(self.__graph_manager.graph)
+
+    def __journal_command(self, command_input: str) -> None:
+        if not self.__count_journaled(command_input):
+            self.__compact()
+            return
+        self.__journal.append(command_input)
+        if self.__journal.compaction_due:
+            self.__compact()
+
+    def __count_journaled(self, command_input: str) -> bool:
+        # an undo or redo can only be replayed if the command it reverts was journaled after the snapshot
+        match command_input:
+            case "undo":
+                if not self.__journaled_undos:
+                    return False
+                self.__journaled_undos -= 1
+                self.__journaled_redos += 1
+            case "redo":
+                if not self.__journaled_redos:
+                    return False
+                self.__journaled_redos -= 1
+                self.__journaled_undos += 1
+            case _:
+                self.__journaled_undos += 1
+                self.__journaled_redos = 0
+        return True
+
+    def __recover(self) -> None:
+        # the graph of the latest snapshot, with the commands journaled after it executed again
+        graph, state, commands = self.__journal.recover()
+        if graph is not None:
+            self.__graph_manager.restore(graph)
+        if state.get("data_source_plugin") is not None:
+            try:
+                self.__plugin_manager.set_data_source(state["data_source_plugin"])
+            except (KeyError, StopIteration):
+                logger.warning("Workspace %s: the data source plugin '%s' is not installed, so the graph "
+                               "cannot be reloaded.", self.id, state["data_source_plugin"])
+        self.__graph_manager.data_file_string = state.get("data_file_string", "")
+        for command in commands:
+            result: CommandResult = self.__command_service.execute_command(self.__graph_manager.graph, command)
+            if result.status == CommandStatus.ERROR:
+                logger.warning("Workspace %s: the journaled command '%s' failed again: %s",
+                               self.id, command, result.output)
+            else:
+                self.__count_journaled(command.strip())
+
+    def __compact(self) -> None:
+        plugin: Optional[DataSourcePlugin] = self.__graph_manager.data_source_plugin
+        self.__journal.compact(self.__graph_manager.graph, {
+            "data_source_plugin": plugin.identifier() if plugin is not None else None,
+            "data_file_string": self.__graph_manager.data_file_string
+        })
+        self.__journaled_undos = self.__journaled_redos = 0
+
+    def close(self) -> None:
+        """
+        Stop the background computations of the workspace and force its journal to disk, e.g.
+        when the server stops. The workspace is restored from the journal by the next one.
+        """
+        self.__centrality_worker.close()
+        if self.__journal is not None:
+            self.__journal.close()
+
+    def delete(self) -> None:
+        """ Close the workspace and delete its journal, so it is not restored after a restart. """
+        self.close()
+        if self.__journal is not None:
+            self.__journal.delete()
 
     def filter_graph(self, key: str, operator: str, value: Any) -> str:
         """
         Apply a filter to the graph based on a key, operator, and value.
 
-        This method modifies the current graph by applying a filter condition.
-        If an error occurs during filtering, the error message is returned.
+        The graph itself is left unchanged; the filter is stacked on the views shown in the
+        workspace. Commands still change the whole graph, but only the nodes matching all views
+        are shown until `clear_views` is called. If an error occurs during filtering, the error
+        message is returned.
 
         :param key: The attribute key to filter on.
         :param operator: The comparison operator to use (e.g., '==', '!=', '<').
         :param value: The value to compare against.
         :return: An empty string if successful, otherwise an error message.
         """
-        try:
-            graph_util.filter_graph(self.__graph_manager.graph, key, operator, value)
-            return ""
-        except Exception as e:
-            return str(e)
+        with self.__lock.write():
+            message: str = self.__graph_manager.filter(key, operator, value)
+            self.__request_centrality()
+            return message
 
     def search_graph(self, query: str) -> None:
         """
         Perform a search operation on the current graph using the provided query.
 
+        Like `filter_graph`, the search is stacked on the views shown in the workspace.
+
         :param query: The search string used to find matching elements in the graph.
         """
-        graph_util.search_graph(self.__graph_manager.graph, query)
+        with self.__lock.write():
+            self.__graph_manager.search(query)
+
+    def __show_view(self, view: GraphView) -> None:
+        # called by commands, which already hold the write lock
+        self.__graph_manager.show_view(view)
+
+    def __reset_views(self) -> None:
+        # called by the `reset` command, which already holds the write lock
+        self.__graph_manager.clear_views()
+
+    def clear_views(self) -> None:
+        """
+        Remove the filter and search views stacked on the graph, so the whole graph is shown
+        again, including the nodes commands created or changed since that do not match them.
+        """
+        with self.__lock.write():
+            self.__graph_manager.clear_views()
+
+    def group_graph(self, key: str) -> Dict[Any, int]:
+        """
+        Count the nodes shown in the workspace by the value of a property.
+
+        The write lock is taken, since the counts may be read from a column of the graph that is
+        built on the first call.
+
+        :param key: The name of the property.
+        :type key: str
+
+        :return: The number of nodes with every value, the highest first.
+        :rtype: Dict[Any, int]
+        """
+        with self.__lock.write():
+            try:
+                return self.__graph_manager.group(key)
+            finally:
+                self.__request_centrality()
+
+    def graph_stats(self, key: str) -> PropertyStats:
+        """
+        Summarize the numbers of a property of the nodes shown in the workspace.
+
+        Like `group_graph`, this takes the write lock.
+
+        :param key: The name of the property.
+        :type key: str
+
+        :return: The count, minimum, maximum, mean and histogram of the numbers.
+        :rtype: PropertyStats
+        """
+        with self.__lock.write():
+            try:
+                return self.__graph_manager.stats(key)
+            finally:
+                self.__request_centrality()
+
+    def structure_stats(self) -> Dict[str, Any]:
+        """
+        Get the statistics of the structure of the graph: the numbers of nodes, edges, weakly
+        connected components, self-loops and reciprocal edge pairs, and the average degree.
+
+        The statistics are kept up to date with every change of the graph, so this only reads
+        counters. They describe the whole graph, not the filter and search views shown.
+
+        :return: The statistics by name.
+        :rtype: Dict[str, Any]
+        """
+        with self.__lock.read():
+            return self.__graph_manager.graph.get_stats().to_dict()
 
     def render_main_view(self) -> Tuple[str, str, str]:
         """
         Render the main view. Generates a graph if empty.
         :return: (main_view_head, plugin_head, body) html string that should be included in page
         """
-        if self.__plugin_manager.visualizer_plugin is None or self.__plugin_manager.data_source_plugin is None:
-            self.__set_default_plugins()
-        if not self.__graph_manager.graph_generated and (self.__graph_manager.graph is None or self.__graph_manager.graph.is_empty()):
-            self.generate_graph()
+        if self.__needs_setup():
+            with self.__lock.write():
+                # another thread may have set the workspace up while this one waited
+                if self.__plugin_manager.visualizer_plugin is None or self.__plugin_manager.data_source_plugin is None:
+                    self.__set_default_plugins()
+                if self.__needs_setup():
+                    self.generate_graph()
+
+        with self.__lock.read():
+            try:
+                return main_view.render(self.__graph_manager.view, self.__plugin_manager.visualizer_plugin)
+            finally:
+                self.__request_centrality()
 
-        return main_view.render(self.__graph_manager.graph, self.__plugin_manager.visualizer_plugin)
+    def __needs_setup(self) -> bool:
+        return (self.__plugin_manager.visualizer_plugin is None or self.__plugin_manager.data_source_plugin is None or
+                not self.__graph_manager.graph_generated and
+                (self.__graph_manager.graph is None or self.__graph_manager.graph.is_empty()))
     
     def render_bird_view(self) -> Tuple[str, str]:
         """
@@ -149,7 +388,8 @@ class Workspace:
         Render the tree view. Assumes the graph is already generated.
         :return: (head, body) html string that should be included in page
         """
-        return tree_view.render(self.__graph_manager.graph)
+        with self.__lock.read():
+            return tree_view.render(self.__graph_manager.view)
 
     def render_app_header(
         self, 
@@ -160,9 +400,10 @@ class Workspace:
         Returns the required header and body html content that needs to be included in page
         in order to display the app header.
         """
-        return app_header_view.render(
-            self.__plugin_manager,
-            workspaces=workspaces,
-            selected_workspace=selected_workspace
-        )
+        with self.__lock.read():
+            return app_header_view.render(
+                self.__plugin_manager,
+                workspaces=workspaces,
+                selected_workspace=selected_workspace
+            )
 
@@ -0,0 +1,223 @@
+import glob
+import json
+import os
+import shutil
+import threading
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from visualizer.api.model.graph import Graph
+
+JOURNAL_FILE: str = "journal.log"
+SNAPSHOT_PATTERN: str = "snapshot-{}.graph"
+STATE_PATTERN: str = "snapshot-{}.json"
+
+
+class CommandJournal:
+    """
+    An append-only journal of the commands that changed a graph, kept in a directory together
+    with a snapshot of the graph, so the graph can be restored after a restart.
+
+    Every command is appended as a line of JSON with its sequence number and handed to the
+    operating system right away, so it survives the process crashing. Forcing the lines to disk
+    is costly, so it is batched: the journal is synced once `sync_batch` lines wait for it, or
+    `sync_delay` seconds after the first of them, whichever comes first. A crash of the machine
+    loses at most the commands of that interval.
+
+    `compact` saves a snapshot of the graph, named after the sequence number of the last command
+    it includes, together with a state that is not part of the graph (e.g. where the graph was
+    loaded from), and starts the journal anew. `recover` opens the latest snapshot and returns
+    its state and the commands journaled after it, so only they have to be executed again. Commands the
+    snapshot already includes (if the journal was not started anew before a crash) and a last
+    line cut off by a crash are skipped.
+    """
+
+    __slots__ = ["__directory", "__compaction_interval", "__sync_delay", "__sync_batch", "__lock", "__file",
+                 "__sequence", "__snapshot_sequence", "__unsynced", "__timer"]
+
+    def __init__(self, directory: str, compaction_interval: int = 1000, sync_delay: float = 1.0,
+                 sync_batch: int = 64) -> None:
+        """
+        Initialize the journal kept in `directory`. The directory is created if it does not
+        exist. `recover` must be called before commands are appended.
+
+        :param directory: The directory of the journal and the snapshots.
+        :type directory: str
+        :param compaction_interval: The number of journaled commands after which `compaction_due`
+                                    suggests compacting the journal.
+        :type compaction_interval: int
+        :param sync_delay: The longest time, in seconds, an appended command waits to be synced.
+        :type sync_delay: float
+        :param sync_batch: The number of appended commands that are synced at once.
+        :type sync_batch: int
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.__directory: str = directory
+        self.__compaction_interval: int = compaction_interval
+        self.__sync_delay: float = sync_delay
+        self.__sync_batch: int = sync_batch
+        # guards the file, which the timer syncs from another thread
+        self.__lock: threading.Lock = threading.Lock()
+        self.__file: Optional[TextIO] = None
+        self.__sequence: int = 0
+        self.__snapshot_sequence: int = 0
+        self.__unsynced: int = 0
+        self.__timer: Optional[threading.Timer] = None
+
+    @property
+    def compaction_due(self) -> bool:
+        """
+        Check if enough commands were journaled since the last snapshot to compact the journal.
+
+        :return: True if the journal should be compacted.
+        :rtype: bool
+        """
+        return self.__sequence - self.__snapshot_sequence >= self.__compaction_interval
+
+    def recover(self) -> Tuple[Optional[Graph], Dict[str, Any], List[str]]:
+        """
+        Read the latest snapshot and the commands journaled after it, and open the journal for
+        appending.
+
+        :return: The graph of the snapshot, or `None` if there is none, the state saved with it
+                 (empty if there is none), and the commands to execute on the graph (or on an
+                 empty graph) in order.
+        :rtype: Tuple[Optional[Graph], Dict[str, Any], List[str]]
+        """
+        sequences: List[int] = self.__snapshot_sequences()
+        graph: Optional[Graph] = None
+        state: Dict[str, Any] = {}
+        if sequences:
+            self.__snapshot_sequence = self.__sequence = sequences[-1]
+            graph = Graph.open_snapshot(self.__snapshot_path(sequences[-1]))
+            state_path: str = self.__state_path(sequences[-1])
+            if os.path.exists(state_path):
+                with open(state_path, "r", encoding="utf-8") as file:
+                    state = json.load(file)
+
+        commands: List[str] = []
+        path: str = os.path.join(self.__directory, JOURNAL_FILE)
+        with open(path, "a+b") as file:
+            file.seek(0)
+            length: int = 0
+            for line in file:
+                try:
+                    entry = json.loads(line) if line.endswith(b"\n") else None
+                except ValueError:
+                    entry = None
+                if entry is None:
+                    break  # cut off by a crash, so nothing was journaled after it
+                length += len(line)
+                if entry["sequence"] > self.__snapshot_sequence:
+                    commands.append(entry["command"])
+                    self.__sequence = entry["sequence"]
+            file.truncate(length)
+        self.__file = open(path, "a", encoding="utf-8")
+        return graph, state, commands
+
+    def append(self, command: str) -> None:
+        """
+        Append a command that changed the graph to the journal.
+
+        :param command: The command, as it was entered.
+        :type command: str
+
+        :raises RuntimeError: If the journal was not recovered, or is closed.
+        """
+        with self.__lock:
+            if self.__file is None:
+                raise RuntimeError("The journal must be recovered before commands are appended.")
+            self.__sequence += 1
+            self.__file.write(json.dumps({"sequence": self.__sequence, "command": command}) + "\n")
+            self.__file.flush()
+            self.__unsynced += 1
+            if self.__unsynced >= self.__sync_batch:
+                self.__sync()
+            elif self.__timer is None:
+                self.__timer = threading.Timer(self.__sync_delay, self.sync)
+                self.__timer.daemon = True
+                self.__timer.start()
+
+    def sync(self) -> None:
+        """ Force the commands appended so far to disk. """
+        with self.__lock:
+            self.__sync()
+
+    def compact(self, graph: Graph, state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Save a snapshot of the graph, which includes the effects of all journaled commands, and
+        start the journal anew. Older snapshots are deleted.
+
+        :param graph: The graph the journaled commands were executed on.
+        :type graph: Graph
+        :param state: Values that are not part of the graph but restored with it, which must be
+                      serializable as JSON.
+        :type state: Optional[Dict[str, Any]]
+
+        :raises RuntimeError: If the journal was not recovered, or is closed.
+        """
+        with self.__lock:
+            if self.__file is None:
+                raise RuntimeError("The journal must be recovered before it is compacted.")
+            # the state is written first, since the snapshot is what makes it the latest
+            self.__write_state(self.__state_path(self.__sequence), state or {})
+            graph.save_snapshot(self.__snapshot_path(self.__sequence))
+            self.__sync_directory()
+            self.__snapshot_sequence = self.__sequence
+            self.__file.truncate(0)
+            self.__sync()
+            for sequence in self.__snapshot_sequences()[:-1]:
+                try:
+                    os.remove(self.__snapshot_path(sequence))
+                except OSError:
+                    continue  # still mapped by a graph on some platforms, so it is removed by a later compaction
+                if os.path.exists(self.__state_path(sequence)):
+                    os.remove(self.__state_path(sequence))
+
+    def close(self) -> None:
+        """ Force the appended commands to disk and close the journal. """
+        with self.__lock:
+            if self.__file is not None:
+                self.__sync()
+                self.__file.close()
+                self.__file = None
+
+    def delete(self) -> None:
+        """ Close the journal and delete its directory, with the snapshots. """
+        self.close()
+        shutil.rmtree(self.__directory, ignore_errors=True)
+
+    def __sync(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if self.__file is not None and self.__unsynced:
+            os.fsync(self.__file.fileno())
+            self.__unsynced = 0
+
+    @staticmethod
+    def __write_state(path: str, state: Dict[str, Any]) -> None:
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{path}.tmp", path)
+
+    def __sync_directory(self) -> None:
+        # the new name of a snapshot is only durable once its directory is synced
+        if os.name == "posix":
+            descriptor: int = os.open(self.__directory, os.O_RDONLY)
+            try:
+                os.fsync(descriptor)
+            finally:
+                os.close(descriptor)
+
+    def __snapshot_sequences(self) -> List[int]:
+        prefix, suffix = SNAPSHOT_PATTERN.split("{}")
+        names: List[str] = [os.path.basename(path) for path in glob.glob(os.path.join(self.__directory, prefix + "*" + suffix))]
+        return sorted(int(name[len(prefix):-len(suffix)]) for name in names if name[len(prefix):-len(suffix)].isdigit())
+
+    def __snapshot_path(self, sequence: int) -> str:
+        return os.path.join(self.__directory, SNAPSHOT_PATTERN.format(sequence))
+
+    def __state_path(self, sequence: int) -> str:
+        return os.path.join(self.__directory, STATE_PATTERN.format(sequence))
@@ -1,8 +1,9 @@
-from typing import List, Callable, Dict, Any
+from typing import List, Callable, Dict, Any, Optional
 
 from visualizer.api.model.graph import Graph
-from visualizer.core.cli.command_parser import parse_command
-from visualizer.core.command import Command
+from visualizer.api.model.graph_view import GraphView
+from visualizer.core.cli.command_parser import parse_command, parse_script
+from visualizer.core.command import Command, QueryCommand, ScriptCommand
 from visualizer.core.command.command_result import CommandResult, CommandStatus
 
 
@@ -12,16 +13,29 @@ class CommandHistoryEmptyError(Exception):
 
 class CommandService:
 
-    __slots__ = ["__undo_stack", "__redo_stack", "__graph_generator"]
+    __slots__ = ["__undo_stack", "__redo_stack", "__graph_generator", "__view_handler", "__view_resetter"]
 
-    def __init__(self, graph_generator: Callable[..., None]) -> None:
+    def __init__(self, graph_generator: Callable[..., None],
+                 view_handler: Optional[Callable[[GraphView], None]] = None,
+                 view_resetter: Optional[Callable[[], None]] = None) -> None:
         """
         Initialize the CommandService with undo and redo stacks.
 
         This sets up internal stacks to manage command history, allowing support for undoing
         and redoing commands.
+
+        :param graph_generator: Generates the graph again, for the `reload` command.
+        :type graph_generator: Callable[..., None]
+        :param view_handler: Shows the view of a query result (e.g. the path found by `path`)
+                             instead of the graph. Without it, query results are only reported
+                             as text.
+        :type view_handler: Optional[Callable[[GraphView], None]]
+        :param view_resetter: Removes the filter and search views, for the `reset` command.
+        :type view_resetter: Optional[Callable[[], None]]
         """
         self.__graph_generator: Callable[..., None] = graph_generator
+        self.__view_handler: Optional[Callable[[GraphView], None]] = view_handler
+        self.__view_resetter: Optional[Callable[[], None]] = view_resetter
         self.__undo_stack: List[Command] = []
         self.__redo_stack: List[Command] = []
 
@@ -29,10 +43,15 @@ class CommandService:
         """
         Parse and execute a command string.
 
+        A string of several lines is a script: its commands are executed as one transaction,
+        which is rolled back entirely if any of them fails, and undone as a single step.
+
         :param graph: The graph object on which the command will be executed.
-        :param command_input: The command string to parse and execute.
+        :param command_input: The command string, or script, to parse and execute.
         :return: A `CommandResult` indicating the outcome.
         """
+        # input from a text area often ends with a newline or a space
+        command_input = command_input.strip()
         try:
             match command_input:
                 case "undo":
@@ -50,8 +69,27 @@ class CommandService:
                     self.__graph_generator(**kwargs)
                     return CommandResult.success()
 
+                case "reset":
+                    if self.__view_resetter is None:
+                        return CommandResult(CommandStatus.INFO, "There are no views to reset.")
+                    self.__view_resetter()
+                    return CommandResult(CommandStatus.OK, "Showing the whole graph")
+
+                case _ if "\n" in command_input:
+                    script: ScriptCommand = parse_script(graph, command_input)
+                    self.execute(script)
+                    return CommandResult(CommandStatus.OK, f"Executed {len(script)} commands")
+
                 case _:
                     command: Command = parse_command(graph, command_input)
+                    if isinstance(command, QueryCommand):
+                        # queries change nothing, so they skip the history
+                        output: str = command.query()
+                        view: Optional[GraphView] = command.view()
+                        if view is None or self.__view_handler is None:
+                            return CommandResult(CommandStatus.INFO, output)
+                        self.__view_handler(view)
+                        return CommandResult(CommandStatus.OK, output)
                     self.execute(command)
                     return CommandResult.success()
 
@@ -100,6 +138,17 @@ class CommandService:
         else:
             raise CommandHistoryEmptyError("Nothing to redo.")
 
+    def clear_history(self) -> None:
+        """
+        Forget the executed and undone commands, so they can no longer be undone or redone
+        (e.g. once the graph they changed was saved as a snapshot they cannot be replayed on).
+        """
+        self.__undo_stack.clear()
+        self.__redo_stack.clear()
+
     def help(self) -> str:
         """ Return the help text. """
-        return "Possible commands are create, edit, delete, filter, search, reload, undo, redo and help."
\ No newline at end of file
+        return ("Possible commands are create, edit, delete, filter, search, reach, group, stats, path, reload, reset, undo, redo "
+                "and help. Several commands on separate lines run as a script, which is applied and undone as a whole. "
+                "Filters and searches of the Filters tab only hide nodes, also the ones commands create later; "
+                "reset shows the whole graph again.")
\ No newline at end of file
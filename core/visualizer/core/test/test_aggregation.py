@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.core.cli.command_parser import parse_command
+from visualizer.core.command.command_result import CommandStatus
+from visualizer.core.service.command_service import CommandService
+from visualizer.core.usecase import aggregation, graph_util
+
+
+class TestAggregation(TestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        types = ["Person", "person", "Place", None]
+        self.nodes = [Node(str(i), type=types[i % 4], age=i * 10) for i in range(8)]
+        self.nodes[7].properties.pop("age")
+        self.nodes[6].add_property("age", 2.5)
+        self.graph.bulk_load(self.nodes, [Edge(self.nodes[0], node) for node in self.nodes[1:]])
+
+    def test_group_by(self):
+        expected = {"person": 4, None: 2, "place": 2}
+
+        self.assertEqual(aggregation.group_by(self.graph, "type"), expected)
+        self.assertEqual(list(aggregation.group_by(self.graph, "type")), list(expected))
+        # views are counted in a pass over their nodes
+        self.assertEqual(aggregation.group_by(graph_util.filter_view(self.graph, "age", "<", "30"), "type"),
+                         {"person": 2, "place": 2})
+        self.assertEqual(aggregation.group_by(self.graph, "out_degree"), {0: 7, 7: 1})
+
+    def test_property_stats(self):
+        stats = aggregation.property_stats(self.graph, "age", bins=2)
+
+        self.assertEqual((stats.node_count, stats.value_count, stats.number_count), (8, 7, 7))
+        self.assertEqual((stats.minimum, stats.maximum, stats.mean), (0, 50, 152.5 / 7))
+        self.assertEqual(stats.histogram, [(0, 25.0, 4), (25.0, 50, 3)])
+
+        self.nodes[6].add_property("age", 3)
+        stats = aggregation.property_stats(self.graph, "age", bins=3)
+
+        self.assertEqual(stats.histogram, [(0, 17, 3), (17, 34, 2), (34, 51, 2)])
+        self.assertEqual(aggregation.property_stats(self.graph, "type").number_count, 0)
+
+    def test_commands_report_without_changing_the_graph(self):
+        command_service = CommandService(lambda **kwargs: None)
+        version = self.graph.version
+
+        result = command_service.execute_command(self.graph, "group type")
+
+        self.assertEqual(result.status, CommandStatus.INFO)
+        self.assertEqual(result.output.splitlines()[:2], ["type: 3 values over 8 nodes", "  person: 4"])
+        self.assertIn("min 0, max 50", parse_command(self.graph, "stats age").query())
+        self.assertEqual(self.graph.version, version)
+        self.assertEqual(command_service.execute_command(self.graph, "undo").status, CommandStatus.ERROR)
@@ -0,0 +1,92 @@
+import time
+from unittest import TestCase
+
+from visualizer.api.algorithm.centrality import betweenness, pagerank
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.core.platform.workspace import Workspace
+from visualizer.core.service.plugin_service import PluginService
+from visualizer.core.usecase import graph_util
+from visualizer.core.usecase.centrality_worker import CentralityWorker
+from visualizer.core.util.read_write_lock import ReadWriteLock
+
+
+class TestCentrality(TestCase):
+
+    def setUp(self):
+        # 1, 2 and 3 link to 0, which links to 4; every path into 4 passes through 0
+        self.nodes = [Node(str(i), kind="page") for i in range(5)]
+        self.graph = Graph()
+        self.graph.bulk_load(self.nodes, [
+            Edge(self.nodes[source], self.nodes[destination]) for source, destination in [(1, 0), (2, 0), (3, 0), (0, 4)]
+        ])
+        self.index = self.graph.get_centrality_index()
+
+    def test_measures(self):
+        ranks = pagerank(self.graph.to_adjacency())
+        scores = betweenness(self.graph.to_adjacency())
+
+        self.assertAlmostEqual(sum(ranks), 1)
+        self.assertEqual(max(range(5), key=ranks.__getitem__), 4)
+        self.assertGreater(ranks[0], ranks[1])
+        self.assertAlmostEqual(scores[0], 3 / 12)  # 3 of the 12 ordered pairs of other nodes
+        self.assertEqual(scores[1], 0)
+
+    def test_index_follows_structure(self):
+        with self.assertRaises(ValueError):
+            self.index.get("pagerank", self.nodes[0])
+
+        self.assertTrue(self.index.compute())
+        version = self.index.version
+        self.nodes[0].add_property("kind", "hub")
+        self.assertEqual(self.index.version, version)
+        self.assertEqual([node.id for node in self.index.find("pagerank", ">", 0.3)], ["0", "4"])
+
+        self.graph.insert_edge(Edge(self.nodes[4], self.nodes[1]))
+        self.assertFalse(self.index.ready())
+
+    def test_filter_by_score(self):
+        with self.assertRaises(ValueError):
+            graph_util.filter_view(self.graph, "betweenness", ">", "0")
+
+        self.index.compute()
+        view = graph_util.filter_view(self.graph, "betweenness", ">", "0")
+        self.assertEqual([node.id for node in view.get_nodes()], ["0"])
+
+    def test_worker_computes_in_background(self):
+        lock = ReadWriteLock()
+        worker = CentralityWorker(lock.read)
+        try:
+            worker.request(self.graph)
+            time.sleep(0.05)
+            self.assertFalse(self.index.wanted)  # nothing looked the scores up, so nothing is computed
+            with self.assertRaises(ValueError):
+                self.index.get("pagerank", self.graph.get_node("0"))
+
+            with lock.write():
+                worker.request(self.graph)
+                time.sleep(0.05)
+                self.assertFalse(self.index.ready())  # the worker waits for the writer
+
+            deadline = time.monotonic() + 5
+            while not self.index.ready() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(self.index.ready())
+        finally:
+            worker.close()
+
+    def test_workspace_computes_on_first_lookup(self):
+        workspace = Workspace(PluginService())
+        try:
+            workspace.execute_command("create node --id=a\ncreate node --id=b")
+            workspace.execute_command("create edge a b")
+            time.sleep(0.05)
+            self.assertNotEqual(workspace.filter_graph("pagerank", ">", "0"), "")  # not computed until now
+
+            deadline = time.monotonic() + 5
+            while workspace.filter_graph("pagerank", ">", "0") and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(workspace.filter_graph("pagerank", ">", "0"), "")
+        finally:
+            workspace.close()
@@ -0,0 +1,100 @@
+import random
+from unittest import TestCase
+
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.index.column_store import ColumnType
+from visualizer.api.model.node import Node
+from visualizer.core.util.compare_util import CompareUtil
+
+
+class TestColumnStore(TestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        self.graph.insert_nodes(
+            Node("a", count=3, weight=1.5, name="Apple", tags=["x"]),
+            Node("b", count=True, weight=2, name="banana", tags=None),
+            Node("c", count=None, name="apple"),
+            Node("d", count=-4, weight=None, name="Cherry", tags="x")
+        )
+        self.store = self.graph.get_column_store()
+
+    def find_ids(self, key, operator, value):
+        nodes = self.store.find(key, operator, value)
+        return None if nodes is None else [node.id for node in nodes]
+
+    def test_column_types(self):
+        self.assertEqual(self.store.column("count").type, ColumnType.INT)
+        self.assertEqual(self.store.column("weight").type, ColumnType.FLOAT)
+        self.assertEqual(self.store.column("name").type, ColumnType.CATEGORY)
+        self.assertEqual(self.store.column("tags").type, ColumnType.OBJECT)
+        self.assertEqual(self.store.column("weight").get(1), 2.0)
+        self.assertIsNone(self.store.column("weight").get(3))
+
+    def test_find_follows_compare_rules(self):
+        self.assertEqual(self.find_ids("count", ">", 0), ["a", "b"])
+        self.assertEqual(self.find_ids("count", "==", None), ["c"])
+        self.assertEqual(self.find_ids("count", "!=", 3), ["b", "c", "d"])
+        self.assertEqual(self.find_ids("name", "==", "apple"), ["a", "c"])
+        self.assertEqual(self.find_ids("name", ">=", "b"), ["b", "d"])
+        self.assertEqual(self.find_ids("tags", "==", "x"), ["d"])
+        self.assertIsNone(self.find_ids("count", "<", "text"))
+        self.assertIsNone(self.find_ids("tags", "<", "y"))
+
+    def test_nan_falls_back_for_strings(self):
+        self.graph.get_node("a").add_property("weight", float("nan"))
+        self.graph.get_node("c").add_property("name", float("nan"))
+
+        self.assertEqual(self.find_ids("weight", ">", 1), ["b"])
+        self.assertIsNone(self.find_ids("weight", ">", "abc"))
+        self.assertIsNone(self.find_ids("name", ">", "abc"))
+
+    def test_columns_follow_changes(self):
+        self.assertEqual(self.find_ids("count", ">", 0), ["a", "b"])
+
+        self.graph.get_node("c").add_property("count", 2.5)
+        self.graph.get_node("a").remove_property("count")
+        self.graph.remove_node("b")
+        self.graph.insert_node(Node("e", count=10, name="Date"))
+        self.graph.get_node("d").properties = {"count": 1}
+
+        self.assertEqual(self.store.column("count").type, ColumnType.FLOAT)
+        self.assertEqual(self.find_ids("count", ">", 0), ["c", "d", "e"])
+        self.assertEqual(self.find_ids("name", "==", "date"), ["e"])
+
+        self.graph.get_node("e").add_property("name", 5)
+        self.assertEqual(self.store.column("name").type, ColumnType.OBJECT)
+        self.assertEqual(self.find_ids("name", "==", 5), ["e"])
+
+        self.graph.clear()
+        self.assertEqual(self.find_ids("count", ">", 0), [])
+
+    def test_find_matches_compare_util(self):
+        random_generator = random.Random(3)
+        choices = [None, True, 0, 7, 2 ** 70, 1.5, float("nan"), "a", "b", "c"]
+        pools = {"ints": choices[:4], "numbers": choices[:7], "strings": choices[:1] + choices[7:], "mixed": choices}
+        graph = Graph()
+        for i in range(400):
+            properties = {}
+            for key, pool in pools.items():
+                if random_generator.random() < 0.8:
+                    properties[key] = random_generator.choice(pool)
+            graph.insert_node(Node(str(i), **properties))
+        store = graph.get_column_store()
+
+        for key in pools:
+            for operator in ("==", "!=", "<", "<=", ">", ">="):
+                for compare_value in (None, 1, 7.0, "b"):
+                    try:
+                        expected = [
+                            node.id for node in graph.get_nodes()
+                            if key in node.properties
+                            and CompareUtil.compare(operator, node.properties[key], compare_value)
+                        ]
+                    except TypeError:
+                        expected = None
+                    nodes = store.find(key, operator, compare_value)
+                    if expected is None:
+                        self.assertIsNone(nodes)
+                    elif nodes is not None:
+                        self.assertEqual([node.id for node in nodes], expected, (key, operator, compare_value))
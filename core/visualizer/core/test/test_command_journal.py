@@ -0,0 +1,118 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.core.command.command_result import CommandStatus
+from visualizer.core.platform.workspace import Workspace
+from visualizer.core.service.command_journal import CommandJournal, JOURNAL_FILE
+from visualizer.core.service.plugin_service import DATA_SOURCE_PLUGIN, PluginService
+from visualizer.core.test.test_graph_manager import CountingLoader
+from visualizer.core.usecase.graph_manager import GraphManager
+from visualizer.core.usecase.plugin_manager import PluginManager
+
+
+class TestCommandJournal(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_recover_replays_tail_after_snapshot(self):
+        journal = CommandJournal(self.directory.name)
+        self.assertEqual(journal.recover(), (None, {}, []))
+        journal.append("create node --id=a")
+        graph = Graph()
+        graph.insert_node(Node("a"))
+        journal.compact(graph, {"data_file_string": "a"})
+        journal.append("create node --id=b")
+        journal.close()
+        with open(os.path.join(self.directory.name, JOURNAL_FILE), "a", encoding="utf-8") as file:
+            file.write('{"sequence": 3, "comm')  # cut off by a crash
+
+        journal = CommandJournal(self.directory.name)
+        graph, state, commands = journal.recover()
+        self.assertEqual([node.id for node in graph.get_nodes()], ["a"])
+        self.assertEqual(state, {"data_file_string": "a"})
+        self.assertEqual(commands, ["create node --id=b"])
+
+        journal.append("create node --id=c")
+        journal.close()
+        _, _, commands = CommandJournal(self.directory.name).recover()
+        self.assertEqual(commands, ["create node --id=b", "create node --id=c"])
+
+    def test_workspace_is_restored(self):
+        workspace = Workspace(PluginService(), workspace_id="w", journal_directory=self.directory.name,
+                              compaction_interval=3)
+        workspace.execute_command("create node --id=a\ncreate node --id=b")
+        workspace.execute_command("create edge a b")
+        workspace.execute_command("path a b")  # not journaled, since the graph is unchanged
+        workspace.execute_command("delete edge a b")  # compacted after this one
+        self.assertEqual(workspace.execute_command("undo\n").status, CommandStatus.OK)  # the history is kept
+        workspace.execute_command("create edge b a")
+        workspace.execute_command("create node --id=c")
+        expected = workspace.structure_stats()
+        workspace.close()
+
+        restored = Workspace(PluginService(), workspace_id="w", journal_directory=self.directory.name)
+        try:
+            self.assertEqual(restored.structure_stats(), expected)
+            self.assertEqual(expected["edges"], 2)
+            # the commands replayed after the snapshot can be undone again
+            self.assertEqual(restored.execute_command("undo").status, CommandStatus.OK)
+            self.assertEqual(restored.structure_stats()["nodes"], 2)
+        finally:
+            restored.delete()
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "w")))
+
+    def test_undo_before_snapshot_is_restored(self):
+        workspace = Workspace(PluginService(), workspace_id="w", journal_directory=self.directory.name,
+                              compaction_interval=2)
+        workspace.execute_command("create node --id=a")
+        workspace.execute_command("create node --id=b")  # compacted after this one
+        workspace.execute_command("create node --id=c")
+        workspace.execute_command("undo")
+        workspace.execute_command("undo")  # reverts a command from before the snapshot
+        workspace.execute_command("redo")
+        expected = workspace.structure_stats()
+        workspace.close()
+
+        restored = Workspace(PluginService(), workspace_id="w", journal_directory=self.directory.name)
+        try:
+            self.assertEqual(restored.structure_stats(), expected)
+            self.assertEqual(expected["nodes"], 2)
+        finally:
+            restored.delete()
+
+    def test_restored_workspace_can_be_reloaded(self):
+        plugin_service = PluginService()
+        plugin_service.plugins[DATA_SOURCE_PLUGIN] = [CountingLoader()]
+        plugin_manager = PluginManager(plugin_service)
+        plugin_manager.set_data_source("counting_loader")
+        workspace = Workspace(plugin_service, graph_manager=GraphManager(plugin_manager), workspace_id="w",
+                              journal_directory=self.directory.name)
+        workspace.data_file_string = "a b c"
+        workspace.generate_graph()
+        workspace.execute_command("delete node --id=b")
+        workspace.close()
+
+        restored = Workspace(plugin_service, workspace_id="w", journal_directory=self.directory.name)
+        try:
+            self.assertEqual(restored.data_file_string, "a b c")
+            self.assertEqual(restored.structure_stats()["nodes"], 2)
+            self.assertEqual(restored.execute_command("reload").status, CommandStatus.OK)
+            self.assertEqual(restored.structure_stats()["nodes"], 3)
+        finally:
+            restored.delete()
+
+    def test_failed_replay_is_logged(self):
+        journal = CommandJournal(os.path.join(self.directory.name, "w"))
+        journal.recover()
+        journal.append("delete node --id=missing")
+        journal.close()
+
+        with self.assertLogs("visualizer.core.platform.workspace", "WARNING") as logs:
+            restored = Workspace(PluginService(), workspace_id="w", journal_directory=self.directory.name)
+        restored.delete()
+        self.assertIn("delete node --id=missing", logs.output[0])
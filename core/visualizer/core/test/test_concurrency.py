@@ -0,0 +1,75 @@
+import threading
+from typing import List
+from unittest import TestCase
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.core.command.command_result import CommandStatus
+from visualizer.core.platform.workspace import Workspace
+from visualizer.core.service.plugin_service import PluginService
+from visualizer.core.usecase import graph_util
+
+THREAD_COUNT: int = 8
+ROUNDS: int = 10
+
+
+class TestConcurrency(TestCase):
+    """ Hammers a workspace and a view from many threads at once, like a threaded server would. """
+
+    def run_threads(self, target) -> List[str]:
+        errors: List[str] = []
+        barrier = threading.Barrier(THREAD_COUNT, timeout=60)
+
+        def run(thread_index: int) -> None:
+            barrier.wait()
+            try:
+                target(thread_index, errors)
+            except Exception as e:
+                errors.append(repr(e))
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(THREAD_COUNT)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_concurrent_workspace_requests(self):
+        workspace = Workspace(PluginService())
+
+        def hammer(thread_index: int, errors: List[str]) -> None:
+            for round_index in range(ROUNDS):
+                node_id = f"t{thread_index}_{round_index}"
+                results = [
+                    workspace.execute_command(f"create node --id={node_id} --property x={round_index}"),
+                    workspace.execute_command(f"delete node --id={node_id}"),
+                ]
+                errors.extend(result.output for result in results if result.status == CommandStatus.ERROR)
+                workspace.filter_graph("x", ">=", "0")
+                workspace.search_graph(f"t{thread_index}")
+                workspace.group_graph("x")
+                workspace.structure_stats()
+                workspace.generate_graph()
+
+        self.assertEqual(self.run_threads(hammer), [])
+        self.assertEqual(workspace.structure_stats()["nodes"], 0)
+
+    def test_view_is_rebuilt_once_for_concurrent_readers(self):
+        graph = Graph()
+        nodes = [Node(str(i), value=i) for i in range(200)]
+        graph.insert_nodes(*nodes)
+        graph.insert_edges(*(Edge(nodes[i], nodes[i + 1]) for i in range(199)))
+        view = graph_util.filter_view(graph, "value", "<", "100")
+
+        for round_index in range(ROUNDS):
+            nodes[round_index].add_property("value", 1000)  # hides a node, so the caches are stale
+            expected = (99 - round_index, 98 - round_index)
+            results = []
+
+            def read(thread_index: int, errors: List[str]) -> None:
+                results.append((view.get_node_count(), view.get_edge_count(), len(view.to_dict()["edges"]),
+                                view.to_adjacency().get_edge_count()))
+
+            self.assertEqual(self.run_threads(read), [])
+            self.assertEqual(set(results), {expected + (expected[1], expected[1])})
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.api.model.storage.compact_storage import CompactStorage
+from visualizer.core.usecase import graph_util
+
+
+class TestDegreeIndex(TestCase):
+
+    def setUp(self):
+        self.nodes = [Node(str(i), degree="property") for i in range(5)]
+        self.graph = Graph()
+        # node 0 is a hub pointing to every other node, node 4 is isolated
+        self.graph.bulk_load(self.nodes, [Edge(self.nodes[0], node) for node in self.nodes[1:4]] + [
+            Edge(self.nodes[1], self.nodes[2])
+        ])
+
+    def test_degrees_follow_changes(self):
+        for storage in (None, CompactStorage()):
+            graph = Graph(storage)
+            graph.bulk_load(self.nodes, [Edge(self.nodes[0], self.nodes[1])])
+            index = graph.get_degree_index()
+            self.assertEqual((index.out_degree(self.nodes[0]), index.in_degree(self.nodes[1])), (1, 1))
+
+            graph.insert_edge(Edge(self.nodes[2], self.nodes[0]))
+            graph.remove_edge(self.nodes[0], self.nodes[1])
+            graph.remove_node(self.nodes[1])
+            graph.insert_node(Node("5"))
+
+            self.assertEqual(index.degree(self.nodes[0]), 1)
+            self.assertEqual(index.get("in_degree", self.nodes[0]), 1)
+            self.assertEqual(index.out_degree(self.nodes[2]), 1)
+            self.assertEqual([node.id for node in index.find("degree", "==", 0)], ["3", "4", "5"])
+
+    def test_filter_by_degree(self):
+        ids = lambda view: [node.id for node in view.get_nodes()]
+
+        self.assertEqual(ids(graph_util.filter_view(self.graph, "degree", ">", "1")), ["0", "1", "2"])
+        self.assertEqual(ids(graph_util.filter_view(self.graph, "in_degree", "==", "0")), ["0", "4"])
+        self.assertEqual(ids(graph_util.filter_view(self.graph, "degree", "==", "property")), [])
+
+        graph_util.filter_graph(self.graph, "out_degree", ">=", "1")
+
+        self.assertEqual(ids(self.graph), ["0", "1"])
+        self.assertEqual(self.graph.get_degree_index().degree(self.nodes[1]), 1)
+
+    def test_top(self):
+        index = self.graph.get_degree_index()
+
+        self.assertEqual([(node.id, degree) for node, degree in index.top("degree", 3)], [("0", 3), ("1", 2), ("2", 2)])
+        self.assertEqual([node.id for node, _ in index.top("in_degree", 1)], ["2"])
+        with self.assertRaises(ValueError):
+            index.top("weight")
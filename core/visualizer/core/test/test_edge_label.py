@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.edge_label import get_label, intern_label
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.api.model.storage.compact_storage import CompactStorage
+
+
+class TestEdgeLabel(TestCase):
+
+    def setUp(self):
+        self.source, self.destination = Node("1"), Node("2")
+
+    def test_labels_are_interned(self):
+        label = intern_label("contains")
+
+        self.assertIs(intern_label("contains", True), label)
+        self.assertIsNot(intern_label("contains", 1), label)
+        self.assertIs(get_label(label.id), label)
+        self.assertIs(Edge.labeled(self.source, self.destination, "contains").label, label)
+
+    def test_labeled_edge_is_backward_compatible(self):
+        edge = Edge.labeled(self.source, self.destination, "predicate", "knows")
+
+        self.assertEqual(edge.to_dict(), {'source': '1', 'destination': '2', 'properties': {'predicate': 'knows'}})
+        self.assertEqual(edge.peek_properties(), {'predicate': 'knows'})
+        self.assertIsNotNone(edge.label)
+
+        edge.add_property("weight", 2)
+
+        self.assertIsNone(edge.label)
+        self.assertEqual(edge.properties, {'predicate': 'knows', 'weight': 2})
+
+    def test_storages_keep_changes_of_labeled_edges(self):
+        for storage in (None, CompactStorage()):
+            graph = Graph(storage)
+            graph.bulk_load([self.source, self.destination], [Edge.labeled(self.source, self.destination, "calls")])
+
+            graph.get_edge(self.source, self.destination).add_property("count", 3)
+
+            self.assertEqual(graph.get_edge(self.source, self.destination).properties, {'calls': True, 'count': 3})
+            self.assertEqual(graph.to_dict()['edges'][0]['properties'], {'calls': True, 'count': 3})
@@ -0,0 +1,143 @@
+from unittest import TestCase
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.api.model.storage.compact_storage import CompactStorage
+from visualizer.core.cli.command_parser import parse_command
+from visualizer.core.command.command_result import CommandStatus
+from visualizer.core.service.command_service import CommandService
+
+
+class TestGeneralCommand(TestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        self.nodes = [Node(str(i), value=i) for i in range(4)]
+        self.graph.insert_nodes(*self.nodes)
+        self.graph.insert_edges(Edge(self.nodes[0], self.nodes[1]), Edge(self.nodes[1], self.nodes[2]),
+                                Edge(self.nodes[2], self.nodes[3]))
+        self.command_service = CommandService(lambda **kwargs: None)
+
+    def assert_graph(self, node_ids, edge_count):
+        self.assertEqual([node.id for node in self.graph.get_nodes()], node_ids)
+        self.assertEqual(self.graph.get_edge_count(), edge_count)
+
+    def test_filter_undo_and_redo(self):
+        self.command_service.execute(parse_command(self.graph, "filter value < 3"))
+        self.assert_graph(["0", "1", "2"], 2)
+
+        self.command_service.undo()
+        self.assert_graph(["0", "1", "2", "3"], 3)
+
+        self.command_service.redo()
+        self.assert_graph(["0", "1", "2"], 2)
+
+    def test_search_undo(self):
+        self.command_service.execute(parse_command(self.graph, "search 2"))
+        self.assert_graph(["2"], 0)
+
+        self.command_service.undo()
+        self.assert_graph(["0", "1", "2", "3"], 3)
+
+    def test_reach_undo(self):
+        self.command_service.execute(parse_command(self.graph, "reach 1"))
+        self.assert_graph(["1", "2", "3"], 2)
+
+        self.command_service.undo()
+        self.command_service.execute(parse_command(self.graph, "reach 2 --reverse"))
+        self.assert_graph(["0", "1", "2"], 2)
+
+    def test_clear_undo(self):
+        self.command_service.execute(parse_command(self.graph, "clear"))
+        self.assertTrue(self.graph.is_empty())
+
+        self.command_service.undo()
+        self.assert_graph(["0", "1", "2", "3"], 3)
+
+    def test_changes_after_snapshot_do_not_reach_it(self):
+        for graph in (self.graph, Graph(CompactStorage())):
+            if graph is not self.graph:
+                graph.insert_nodes(*self.nodes)
+                graph.insert_edge(Edge(self.nodes[0], self.nodes[1]))
+            snapshot = graph.snapshot()
+            storage = graph.storage
+
+            graph.remove_edge(self.nodes[0], self.nodes[1])
+            graph.insert_node(Node("new"))
+
+            self.assertIsNot(graph.storage, storage)
+            self.assertEqual(storage.node_count(), 4)
+            self.assertIsNotNone(storage.get_edge(self.nodes[0], self.nodes[1]))
+            graph.restore(snapshot)
+            self.assertFalse(graph.contains_node("new"))
+            self.assertIsNotNone(graph.get_edge(self.nodes[0], self.nodes[1]))
+
+    def test_undo_restores_edge_properties(self):
+        for graph in (self.graph, Graph(CompactStorage())):
+            if graph is not self.graph:
+                graph.insert_nodes(*self.nodes)
+                graph.insert_edges(Edge(self.nodes[0], self.nodes[1]), Edge(self.nodes[1], self.nodes[2]))
+            graph.get_edge(self.nodes[0], self.nodes[1]).properties = {"weight": 1}
+
+            for command_input in ("filter value < 3", "edit edge 0 1 --property weight=2"):
+                self.command_service.execute(parse_command(graph, command_input))
+            self.command_service.undo()
+            self.command_service.undo()
+
+            self.assertEqual(graph.get_node_count(), 4)
+            self.assertEqual(graph.get_edge(self.nodes[0], self.nodes[1]).properties, {"weight": 1})
+
+    def test_released_snapshot_does_not_copy_storage(self):
+        self.graph.snapshot()
+        storage = self.graph.storage
+
+        self.graph.insert_node(Node("new"))
+
+        self.assertIs(self.graph.storage, storage)
+
+    def test_script_is_one_history_entry(self):
+        result = self.command_service.execute_command(self.graph, "\n".join([
+            "create node --id=a --property value=10",
+            "# edges may refer to nodes created above",
+            "create node --id=b",
+            "",
+            "create edge a b",
+            "create edge 3 a"
+        ]))
+        self.assertEqual(result.status, CommandStatus.OK)
+        self.assert_graph(["0", "1", "2", "3", "a", "b"], 5)
+
+        self.command_service.undo()
+        self.assert_graph(["0", "1", "2", "3"], 3)
+
+        self.command_service.redo()
+        self.assert_graph(["0", "1", "2", "3", "a", "b"], 5)
+
+    def test_trailing_whitespace_is_ignored(self):
+        self.assertEqual(self.command_service.execute_command(self.graph, "create node --id=a \n").status, CommandStatus.OK)
+        self.assertEqual(self.command_service.execute_command(self.graph, "undo\n").status, CommandStatus.OK)
+        self.assert_graph(["0", "1", "2", "3"], 3)
+        self.assertEqual(self.command_service.execute_command(self.graph, " redo ").status, CommandStatus.OK)
+        self.assert_graph(["0", "1", "2", "3", "a"], 3)
+
+        result = self.command_service.execute_command(self.graph, "delete node --id=a\nundo \n")
+        self.assertEqual(result.status, CommandStatus.ERROR)  # session commands cannot be scripted
+
+    def test_failed_script_is_rolled_back(self):
+        version = self.graph.version
+        result = self.command_service.execute_command(self.graph, "\n".join([
+            "create node --id=a",
+            "delete edge 0 1",
+            "create edge a missing"
+        ]))
+        self.assertEqual(result.status, CommandStatus.ERROR)
+        self.assertTrue(result.output.startswith("Line 3"))
+        self.assert_graph(["0", "1", "2", "3"], 3)
+        self.assertIsNotNone(self.graph.get_edge(self.nodes[0], self.nodes[1]))
+        self.assertGreater(self.graph.version, version)
+
+        for script in ("create node --id=a\nundo", "create node --id=a\npath 0 3"):
+            self.assertEqual(self.command_service.execute_command(self.graph, script).status, CommandStatus.ERROR)
+        self.assert_graph(["0", "1", "2", "3"], 3)
+        self.assertEqual(self.command_service.execute_command(self.graph, "undo").status, CommandStatus.ERROR)
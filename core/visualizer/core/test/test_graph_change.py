@@ -0,0 +1,93 @@
+from unittest import TestCase
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_change import ChangeType
+from visualizer.api.model.node import Node
+from visualizer.api.model.observable import MISSING
+from visualizer.api.model.storage.compact_storage import CompactStorage
+from visualizer.core.usecase import graph_util
+
+
+class TestGraphChange(TestCase):
+
+    def setUp(self):
+        self.graph = Graph(journal_size=100)
+        self.node_1, self.node_2 = Node("1"), Node("2")
+        self.graph.insert_nodes(self.node_1, self.node_2)
+
+    def test_every_change_increments_version(self):
+        self.graph.insert_edge(Edge(self.node_1, self.node_2))
+        self.graph.get_edge(self.node_1, self.node_2).add_properties(weight=1)
+        self.node_1.add_property("name", "a")
+        self.graph.remove_edge(self.node_1, self.node_2)
+        self.graph.update_node_id("2", "3")
+        self.graph.clear()
+
+        self.assertEqual(self.graph.version, 9)
+        self.assertEqual([change.type for change in self.graph.changes_since(2)], [
+            ChangeType.EDGE_INSERTED, ChangeType.PROPERTY_CHANGED, ChangeType.PROPERTY_CHANGED,
+            ChangeType.EDGE_REMOVED, ChangeType.NODE_REMOVED, ChangeType.NODE_INSERTED, ChangeType.CLEARED
+        ])
+
+    def test_property_change_records_old_and_new_value(self):
+        self.node_1.add_property("name", "a")
+        self.node_1.add_property("name", "b")
+        self.node_1.remove_property("name")
+
+        self.assertEqual([(change.old_value, change.new_value) for change in self.graph.changes_since(2)],
+                         [(MISSING, "a"), ("a", "b"), ("b", MISSING)])
+
+    def test_bounded_journal_reports_missing_history(self):
+        self.graph.journal_size = 2
+        self.node_1.add_property("a", 1)
+        self.node_1.add_property("b", 2)
+
+        self.assertIsNone(self.graph.changes_since(1))
+        self.assertEqual(len(self.graph.changes_since(2)), 2)
+        self.assertEqual(self.graph.changes_since(self.graph.version), [])
+
+    def test_subscriber_receives_merged_edge_properties(self):
+        graph = Graph(CompactStorage())
+        graph.insert_nodes(self.node_1, self.node_2)
+        graph.insert_edge(Edge(self.node_1, self.node_2))
+        changes = []
+        graph.subscribe(changes.append)
+
+        graph.insert_edge(Edge(self.node_1, self.node_2, weight=1))
+
+        self.assertEqual([(change.type, change.key) for change in changes], [(ChangeType.PROPERTY_CHANGED, "weight")])
+
+    def test_restored_node_reports_property_changes(self):
+        self.graph.create_index("kind")
+        snapshot = self.graph.snapshot()
+        self.graph.remove_node(self.node_2)
+        self.graph.restore(snapshot)
+
+        version = self.graph.version
+        self.node_2.add_property("kind", "hub")
+
+        self.assertEqual(self.graph.version, version + 1)
+        self.assertEqual([node.id for node in graph_util.filter_view(self.graph, "kind", "==", "hub").get_nodes()], ["2"])
+
+    def test_renamed_node_is_restored_with_old_id(self):
+        for graph in (Graph(), Graph(CompactStorage())):
+            node_1, node_2 = Node("1", name="a"), Node("2")
+            graph.insert_nodes(node_1, node_2)
+            graph.insert_edges(Edge(node_1, node_2, weight=1), Edge(node_2, node_1), Edge(node_1, node_1))
+            snapshot = graph.snapshot()
+
+            graph.update_node_id("1", "3")
+            renamed = graph.get_node("3")
+            self.assertEqual(renamed.properties, {"name": "a"})
+            self.assertEqual(graph.get_edge(renamed, node_2).properties, {"weight": 1})
+            self.assertIsNotNone(graph.get_edge(renamed, renamed))
+            self.assertEqual(graph.get_edge_count(), 3)
+
+            graph.restore(snapshot)
+            self.assertEqual(node_1.id, "1")
+            self.assertIs(graph.get_node("1"), node_1)
+            self.assertFalse(graph.contains_node("3"))
+            graph.insert_node(Node("3"))
+            self.assertEqual(graph.storage.in_degree(graph.get_node("3")), 0)
+            self.assertEqual(graph.get_edge(node_1, node_2).properties, {"weight": 1})
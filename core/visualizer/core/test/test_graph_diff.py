@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_change import ChangeType
+from visualizer.api.model.node import Node
+from visualizer.api.model.storage.compact_storage import CompactStorage
+
+
+def build_graph(nodes, edges, storage=None):
+    graph = Graph(storage)
+    by_id = {node_id: Node(node_id, **properties) for node_id, properties in nodes.items()}
+    graph.bulk_load(by_id.values(), [Edge(by_id[source], by_id[destination], **properties)
+                                     for (source, destination), properties in edges.items()])
+    return graph
+
+
+class TestGraphDiff(TestCase):
+
+    def setUp(self):
+        self.nodes = {"a": {"name": "A"}, "b": {"name": "B"}, "c": {}}
+        self.edges = {("a", "b"): {"weight": 1}, ("b", "c"): {}, ("c", "a"): {}}
+        self.other_nodes = {"a": {"name": "A"}, "b": {"name": "B2"}, "d": {"name": "D"}}
+        self.other_edges = {("a", "b"): {"weight": 2}, ("b", "d"): {}}
+
+    def test_diff(self):
+        graph = build_graph(self.nodes, self.edges)
+        graph_diff = graph.diff(build_graph(self.other_nodes, self.other_edges))
+
+        self.assertEqual([node.id for node in graph_diff.added_nodes], ["d"])
+        self.assertEqual([node.id for node in graph_diff.removed_nodes], ["c"])
+        self.assertEqual([node.id for node in graph_diff.changed_nodes], ["b"])
+        self.assertEqual([(edge.source.id, edge.destination.id) for edge in graph_diff.added_edges], [("b", "d")])
+        self.assertEqual(sorted((edge.source.id, edge.destination.id) for edge in graph_diff.removed_edges),
+                         [("b", "c"), ("c", "a")])
+        self.assertEqual([edge.properties for edge in graph_diff.changed_edges], [{"weight": 2}])
+        self.assertTrue(graph.diff(build_graph(self.nodes, self.edges, CompactStorage())).is_empty())
+
+    def test_apply_patch(self):
+        for storage in (None, CompactStorage()):
+            graph = build_graph(self.nodes, self.edges, storage)
+            graph.journal_size = 100
+            other = build_graph(self.other_nodes, self.other_edges)
+            version = graph.version
+
+            graph.apply_patch(graph.diff(other))
+
+            self.assertTrue(graph.diff(other).is_empty())
+            self.assertIsNot(graph.get_node("d"), other.get_node("d"))
+            self.assertNotIn(ChangeType.CLEARED, [change.type for change in graph.changes_since(version)])
+            self.assertEqual(len(graph.changes_since(version)), 7)
+
+    def test_apply_patch_rejects_other_graph(self):
+        graph = build_graph(self.nodes, self.edges)
+        graph_diff = graph.diff(build_graph(self.other_nodes, self.other_edges))
+
+        with self.assertRaises(ValueError):
+            build_graph({"x": {}}, {}).apply_patch(graph_diff)
@@ -0,0 +1,107 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.api.service.data_source_plugin import DataSourcePlugin
+from visualizer.core.command.command_result import CommandStatus
+from visualizer.core.platform.workspace import Workspace
+from visualizer.core.service.plugin_service import PluginService
+from visualizer.core.usecase.graph_manager import GraphManager
+from visualizer.core.usecase.plugin_manager import PluginManager
+
+
+class CountingLoader(DataSourcePlugin):
+    """ Loads a node for every word of the file content, and counts its loads. """
+
+    def __init__(self):
+        self.loads = 0
+
+    def identifier(self) -> str:
+        return "counting_loader"
+
+    def name(self) -> str:
+        return "Counting loader"
+
+    def load(self, **kwargs) -> Graph:
+        self.loads += 1
+        graph = Graph()
+        graph.insert_nodes(*(Node(word, value=index) for index, word in enumerate(kwargs["file_content"].split())))
+        return graph
+
+
+class TestGraphManager(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.loader = CountingLoader()
+        plugin_manager = PluginManager(PluginService())
+        plugin_manager.data_source_plugin = self.loader
+        self.manager = GraphManager(plugin_manager, self.directory.name, snapshot_cache_size=1)
+
+    def generate(self, content):
+        self.manager.data_file_string = content
+        self.manager.generate(file_content=content)
+
+    def test_snapshots_are_reused_and_evicted(self):
+        self.generate("a b c")
+        self.generate("a b c")
+        self.assertEqual(self.loader.loads, 1)
+
+        self.generate("d e")
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)  # the cache only holds the latest file
+        self.generate("a b c")
+        self.assertEqual(self.loader.loads, 3)
+        self.assertEqual([node.id for node in self.manager.graph.get_nodes()], ["a", "b", "c"])
+
+    def test_reload_keeps_loader_order(self):
+        self.generate("a b c")
+        self.generate("a x b c")
+        self.assertEqual([node.id for node in self.manager.graph.get_nodes()], ["a", "x", "b", "c"])
+
+    def test_reload_cannot_be_undone(self):
+        workspace = Workspace(PluginService(), graph_manager=self.manager)
+        workspace.data_file_string = "a b c d"
+        workspace.generate_graph()
+        self.assertEqual(workspace.execute_command("filter value < 2").status, CommandStatus.OK)
+
+        workspace.data_file_string = "a b c d e"
+        self.assertEqual(workspace.execute_command("reload").status, CommandStatus.OK)
+        self.assertEqual(workspace.execute_command("undo").status, CommandStatus.ERROR)
+        self.assertEqual([node.id for node in self.manager.graph.get_nodes()], ["a", "b", "c", "d", "e"])
+
+    def test_reset_shows_nodes_hidden_by_filters(self):
+        workspace = Workspace(PluginService(), graph_manager=self.manager)
+        workspace.data_file_string = "a b c"
+        workspace.generate_graph()
+        self.assertEqual(workspace.filter_graph("value", ">", "0"), "")
+
+        workspace.execute_command("create node --id=d --property value=0")
+        self.assertEqual([node.id for node in self.manager.view.get_nodes()], ["b", "c"])
+        self.assertTrue(self.manager.graph.contains_node("d"))
+
+        self.assertEqual(workspace.execute_command("reset").status, CommandStatus.OK)
+        self.assertEqual([node.id for node in self.manager.view.get_nodes()], ["a", "b", "c", "d"])
+
+        workspace.search_graph("a")
+        workspace.clear_views()
+        self.assertIs(self.manager.view, self.manager.graph)
+
+    def test_path_view_is_hidden_once_graph_changes(self):
+        workspace = Workspace(PluginService(), graph_manager=self.manager)
+        workspace.data_file_string = "a b c"
+        workspace.generate_graph()
+        workspace.execute_command("create edge a b\ncreate edge b c")
+
+        self.assertEqual(workspace.execute_command("path a c").status, CommandStatus.OK)
+        self.assertEqual(workspace.execute_command("path a b").status, CommandStatus.OK)
+        self.assertEqual([node.id for node in self.manager.view.get_nodes()], ["a", "b"])
+
+        workspace.execute_command("create node --id=z")
+        self.assertEqual([node.id for node in self.manager.view.get_nodes()], ["a", "b", "c", "z"])
+
+        workspace.execute_command("path a b")
+        self.assertEqual(workspace.filter_graph("value", ">=", "1"), "")  # filters the graph, not the path
+        self.assertEqual([node.id for node in self.manager.view.get_nodes()], ["b", "c"])
@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from visualizer.api.algorithm.traversal import connected_components
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.core.cli.command_parser import parse_command
+
+
+class TestGraphStats(TestCase):
+
+    def setUp(self):
+        # a <-> b -> c, d -> d, e alone
+        self.nodes = {node_id: Node(node_id) for node_id in "abcde"}
+        self.graph = Graph()
+        self.graph.bulk_load(self.nodes.values(), [
+            Edge(self.nodes[source], self.nodes[destination]) for source, destination in ("ab", "ba", "bc", "dd")
+        ])
+        self.stats = self.graph.get_stats()
+        self.stats.refresh()
+
+    def assert_stats(self, components, self_loops, reciprocal_pairs):
+        self.assertEqual((self.stats.component_count, self.stats.self_loop_count, self.stats.reciprocal_pair_count),
+                         (components, self_loops, reciprocal_pairs))
+
+    def test_counts(self):
+        self.assert_stats(3, 1, 1)
+        self.assertEqual(self.stats.average_degree, 8 / 5)
+        self.assertEqual(self.stats.to_dict()["edges"], 4)
+
+    def test_insertions_are_counted_incrementally(self):
+        self.graph.insert_node(Node("f"))
+        self.graph.insert_edge(Edge(self.nodes["c"], self.nodes["b"]))
+        self.graph.insert_edge(Edge(self.nodes["e"], self.nodes["d"]))
+        self.assert_stats(3, 1, 2)
+
+        self.graph.remove_node("f")
+        self.graph.remove_edge(self.nodes["d"], self.nodes["d"])
+        self.graph.remove_edge(self.nodes["b"], self.nodes["c"])  # c -> b still connects them
+        self.assert_stats(2, 0, 1)
+
+    def test_removals_outdate_components_until_refresh(self):
+        self.graph.remove_edge(self.nodes["b"], self.nodes["c"])
+        self.assert_stats(None, 1, 1)
+
+        self.stats.refresh()
+        self.assert_stats(4, 1, 1)
+        self.assertEqual(self.stats.component_count, connected_components(self.graph.to_adjacency())[0])
+
+        self.graph.retain_nodes([self.nodes["a"], self.nodes["b"]])
+        self.assert_stats(None, None, None)
+        self.stats.refresh()
+        self.assert_stats(1, 0, 1)
+
+    def test_stats_command(self):
+        output = parse_command(self.graph, "stats").query()
+
+        self.assertIn("5 nodes, 4 edges, 3 connected components", output)
+        self.assertIn("1 self-loops, 1 reciprocal edge pairs", output)
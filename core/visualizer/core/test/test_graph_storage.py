@@ -0,0 +1,145 @@
+from unittest import TestCase
+
+from visualizer.api.exception.node_exception import NodeHasEdgesError
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.api.model.storage.compact_storage import CompactStorage
+
+
+class TestCompactStorage(TestCase):
+
+    def setUp(self):
+        self.graph = Graph(CompactStorage(buffer_size=2))
+        self.nodes = [Node(str(i), value=i) for i in range(5)]
+        self.graph.insert_nodes(*self.nodes)
+        self.graph.insert_edges(
+            Edge(self.nodes[0], self.nodes[1], weight=1),
+            Edge(self.nodes[0], self.nodes[2]),
+            Edge(self.nodes[1], self.nodes[2]),
+            Edge(self.nodes[3], self.nodes[0]),
+            Edge(self.nodes[4], self.nodes[4]),
+        )
+
+    def test_edges_survive_compaction(self):
+        self.graph.storage.compact()
+
+        self.assertEqual(self.graph.get_edge_count(), 5)
+        self.assertEqual(self.graph.get_edge(self.nodes[0], self.nodes[1]).properties, {"weight": 1})
+        self.assertEqual({edge.destination.id for edge in self.graph.get_incident_edges(self.nodes[0])}, {"1", "2"})
+        self.assertEqual({edge.source.id for edge in self.graph.storage.in_edges(self.nodes[2])}, {"0", "1"})
+
+    def test_insert_existing_edge_merges_properties(self):
+        self.graph.insert_edge(Edge(self.nodes[0], self.nodes[2], label="new"))
+
+        self.assertEqual(self.graph.get_edge_count(), 5)
+        self.assertEqual(self.graph.get_edge(self.nodes[0], self.nodes[2]).properties, {"label": "new"})
+
+    def test_property_edit_through_materialized_edge_is_kept(self):
+        self.graph.get_edge(self.nodes[3], self.nodes[0]).add_property("seen", True)
+        self.graph.storage.compact()
+
+        self.assertEqual(self.graph.get_edge(self.nodes[3], self.nodes[0]).properties, {"seen": True})
+
+    def test_replaced_properties_of_materialized_edge_are_kept(self):
+        self.graph.get_edge(self.nodes[0], self.nodes[1]).properties = {"weight": 2}
+        self.graph.get_edge(self.nodes[4], self.nodes[4]).properties = {"loop": True}
+        self.graph.storage.compact()
+
+        self.assertEqual(self.graph.get_edge(self.nodes[0], self.nodes[1]).properties, {"weight": 2})
+        self.assertEqual(self.graph.get_edge(self.nodes[4], self.nodes[4]).properties, {"loop": True})
+
+    def test_remove_edges_and_node(self):
+        self.graph.remove_edge(self.nodes[0], self.nodes[1])
+        self.graph.remove_edge(self.nodes[3], self.nodes[0])
+
+        with self.assertRaises(NodeHasEdgesError):
+            self.graph.remove_node(self.nodes[0])
+        self.graph.remove_edge(self.nodes[0], self.nodes[2])
+        self.graph.remove_node(self.nodes[0])
+        self.graph.storage.compact()
+
+        self.assertFalse(self.graph.contains_node("0"))
+        self.assertEqual(self.graph.get_node_count(), 4)
+        self.assertEqual(self.graph.get_edge_count(), 2)
+        self.assertEqual(self.graph.storage.in_degree(self.nodes[2]), 1)
+        self.assertIsNotNone(self.graph.get_edge(self.nodes[4], self.nodes[4]))
+
+    def test_to_dict_matches_dict_storage(self):
+        reference = Graph()
+        reference.insert_nodes(*self.nodes)
+        for edge in self.graph.storage.edges():
+            reference.insert_edge(Edge(edge.source, edge.destination, **edge.properties))
+
+        def key(edge):
+            return edge['source'], edge['destination']
+
+        self.assertEqual(self.graph.to_dict()['nodes'], reference.to_dict()['nodes'])
+        self.assertEqual(sorted(self.graph.to_dict()['edges'], key=key), sorted(reference.to_dict()['edges'], key=key))
+
+
+class TestBulkLoad(TestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        self.existing = Node("existing")
+        self.graph.insert_node(self.existing)
+
+    def test_bulk_load_merges_duplicate_edges(self):
+        node_1, node_2 = Node("1"), Node("2")
+
+        self.graph.bulk_load(
+            [node_1, node_2],
+            [Edge(node_1, node_2, a=1), Edge(node_1, node_2, b=2), Edge(self.existing, node_1)]
+        )
+
+        self.assertEqual(self.graph.get_node_count(), 3)
+        self.assertEqual(self.graph.get_edge_count(), 2)
+        self.assertEqual(self.graph.get_edge(node_1, node_2).properties, {"a": 1, "b": 2})
+
+    def test_bulk_load_with_missing_endpoint_leaves_graph_unchanged(self):
+        node_1 = Node("1")
+
+        with self.assertRaises(ValueError):
+            self.graph.bulk_load([node_1], [Edge(node_1, Node("missing"))])
+
+        self.assertFalse(self.graph.contains_node(node_1))
+        self.assertEqual(self.graph.get_edge_count(), 0)
+
+    def test_bulk_load_with_duplicate_node_should_raise_value_error(self):
+        with self.assertRaises(ValueError) as exception:
+            self.graph.bulk_load([Node("existing")], [])
+
+        self.assertEqual(str(exception.exception), "Node insertion failed: Node with id 'existing' already exists in the graph.")
+
+
+class TestSerializationMemo(TestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        self.node_1, self.node_2 = Node("1", name="a"), Node("2")
+        self.graph.insert_nodes(self.node_1, self.node_2)
+        self.graph.insert_edge(Edge(self.node_1, self.node_2))
+
+    def test_unchanged_graph_returns_memoized_dict(self):
+        self.assertIs(self.graph.to_dict(), self.graph.to_dict())
+
+    def test_property_edits_invalidate_memo(self):
+        graph_dict = self.graph.to_dict()
+
+        self.node_1.add_property("name", "b")
+        self.assertIsNot(self.graph.to_dict(), graph_dict)
+
+        graph_dict = self.graph.to_dict()
+        self.graph.get_edge(self.node_1, self.node_2).add_properties(weight=2)
+        self.assertEqual(self.graph.to_dict()['edges'][0]['properties'], {"weight": 2})
+        self.assertIsNot(self.graph.to_dict(), graph_dict)
+
+    def test_removed_node_no_longer_invalidates_memo(self):
+        self.graph.remove_edge(self.node_1, self.node_2)
+        self.graph.remove_node(self.node_2)
+        graph_dict = self.graph.to_dict()
+
+        self.node_2.add_property("name", "c")
+
+        self.assertIs(self.graph.to_dict(), graph_dict)
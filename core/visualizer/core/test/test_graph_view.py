@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.core.usecase import graph_util
+
+
+class TestGraphView(TestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        self.nodes = [Node(str(i), value=i, name=f"node {i}") for i in range(6)]
+        self.graph.insert_nodes(*self.nodes)
+        self.graph.insert_edges(*(Edge(self.nodes[i], self.nodes[i + 1]) for i in range(5)))
+
+    def test_filter_view_leaves_graph_unchanged(self):
+        view = graph_util.filter_view(self.graph, "value", ">=", "2")
+
+        self.assertEqual([node.id for node in view.get_nodes()], ["2", "3", "4", "5"])
+        self.assertEqual(view.get_edge_count(), 3)
+        self.assertEqual(self.graph.get_node_count(), 6)
+        self.assertEqual(self.graph.get_edge_count(), 5)
+
+    def test_stacked_views(self):
+        view = graph_util.search_view(graph_util.filter_view(self.graph, "value", "<", "4"), "node 1")
+
+        self.assertEqual(view.to_dict(), {
+            'nodes': [{'id': '1', 'properties': {'value': 1, 'name': 'node 1'}}],
+            'edges': []
+        })
+        self.assertIs(view.graph, self.graph)
+        with self.assertRaises(KeyError):
+            list(view.get_incident_edges(self.nodes[2]))
+
+    def test_view_follows_graph_changes(self):
+        view = graph_util.filter_view(self.graph, "value", "<", "2")
+        serialized = view.to_dict()
+
+        self.nodes[3].add_property("value", 0)
+
+        self.assertIsNot(view.to_dict(), serialized)
+        self.assertEqual([node.id for node in view.get_nodes()], ["0", "1", "3"])
+        self.assertEqual(view.get_edge_count(), 1)
+
+    def test_invalid_filter_is_reported_immediately(self):
+        with self.assertRaises(TypeError):
+            graph_util.filter_view(self.graph, "value", "<", "text")
@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from visualizer.api.model.id_allocator import SequentialIdAllocator, UuidIdAllocator, create_id_allocator
+from visualizer.api.model.node import Node
+
+
+class TestIdAllocator(TestCase):
+
+    def test_sequential_ids_are_short_interned_and_repeatable(self):
+        allocator = SequentialIdAllocator()
+        first = [allocator.allocate() for _ in range(3)]
+        allocator.reset()
+        second = [allocator.allocate() for _ in range(3)]
+
+        self.assertEqual(first, ["n0", "n1", "n2"])
+        self.assertEqual(first, second)
+        self.assertTrue(all(a is b for a, b in zip(first, second)))
+
+    def test_node_uses_class_allocator(self):
+        previous = Node.id_allocator
+        Node.id_allocator = SequentialIdAllocator("tmp")
+        try:
+            self.assertEqual([Node().id, Node().id, Node("given").id], ["tmp0", "tmp1", "given"])
+        finally:
+            Node.id_allocator = previous
+
+        self.assertIsInstance(create_id_allocator("uuid"), UuidIdAllocator)
+        self.assertRaises(ValueError, create_id_allocator, "unknown")
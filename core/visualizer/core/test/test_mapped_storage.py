@@ -0,0 +1,67 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_change import ChangeType
+from visualizer.api.model.node import Node
+from visualizer.api.model.storage.compact_storage import CompactStorage
+from visualizer.api.model.storage.dict_storage import DictStorage
+
+
+class TestMappedStorage(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "graph.snapshot")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create_graph(self, storage):
+        graph = Graph(storage)
+        nodes = [Node("b", name="B", tags=("x", 1)), Node("ä"), Node("a", nested={"k": [1, 2.5, None]})]
+        graph.insert_nodes(*nodes)
+        graph.insert_edge(Edge(nodes[0], nodes[1], weight=3))
+        graph.insert_edge(Edge(nodes[0], nodes[2]))
+        graph.insert_edge(Edge(nodes[2], nodes[0], label="back"))
+        return graph
+
+    def test_round_trip(self):
+        for storage in (DictStorage(), CompactStorage()):
+            graph = self.create_graph(storage)
+            graph.save_snapshot(self.path)
+            opened = Graph.open_snapshot(self.path)
+
+            self.assertEqual(opened.to_dict(), graph.to_dict())
+            self.assertEqual(opened.get_node("a").properties, {"nested": {"k": [1, 2.5, None]}})
+            self.assertIs(opened.get_node("b"), opened.get_node("b"))
+            self.assertIsNone(opened.get_node("c"))
+            b, a = opened.get_node("b"), opened.get_node("a")
+            self.assertEqual(opened.get_edge(b, a).properties, {})
+            self.assertIsNone(opened.get_edge(a, opened.get_node("ä")))
+            self.assertEqual([edge.source.id for edge in opened.storage.in_edges(a)], ["b"])
+            self.assertEqual((opened.get_node_count(), opened.get_edge_count()), (3, 3))
+
+    def test_changes_copy_the_storage(self):
+        self.create_graph(DictStorage()).save_snapshot(self.path)
+        graph = Graph.open_snapshot(self.path)
+        graph.journal_size = 10
+        node = graph.get_node("ä")
+
+        node.add_property("seen", True)
+        graph.insert_node(Node("new"))
+        graph.insert_edge(Edge(node, graph.get_node("new")))
+
+        self.assertIsInstance(graph.storage, DictStorage)
+        self.assertIs(graph.get_node("ä"), node)
+        self.assertEqual(node.properties, {"seen": True})
+        self.assertEqual([change.type for change in graph.changes_since(0)],
+                         [ChangeType.PROPERTY_CHANGED, ChangeType.NODE_INSERTED, ChangeType.EDGE_INSERTED])
+        self.assertEqual(Graph.open_snapshot(self.path).get_node("ä").properties, {})
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a snapshot" * 10)
+        self.assertRaises(ValueError, Graph.open_snapshot, self.path)
@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from visualizer.api.algorithm.path import shortest_path, weighted_shortest_path
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.api.model.storage.compact_storage import CompactStorage
+from visualizer.core.cli.command_parser import parse_command
+from visualizer.core.command.command_result import CommandStatus
+from visualizer.core.service.command_service import CommandService
+
+
+class TestPath(TestCase):
+
+    def setUp(self):
+        # 0 -> 1 -> 2 -> 3 is the shortest path, 0 -> 4 -> 5 -> 6 -> 3 the lightest; 7 is isolated
+        self.nodes = [Node(str(i)) for i in range(8)]
+        self.graph = self.create_graph(Graph())
+
+    def create_graph(self, graph):
+        edges = [(0, 1, 5), (1, 2, 5), (2, 3, 5), (0, 4, 1), (4, 5, 1), (5, 6, 1), (6, 3, 1)]
+        graph.bulk_load(self.nodes, [
+            Edge(self.nodes[source], self.nodes[destination], cost=cost) for source, destination, cost in edges
+        ])
+        return graph
+
+    def ids(self, path):
+        return [node.id for node in path]
+
+    def test_shortest_path(self):
+        for graph in (self.graph, self.create_graph(Graph(CompactStorage(buffer_size=2)))):
+            self.assertEqual(self.ids(shortest_path(graph, self.nodes[0], self.nodes[3])), ["0", "1", "2", "3"])
+            self.assertEqual(self.ids(shortest_path(graph, self.nodes[4], self.nodes[4])), ["4"])
+            self.assertIsNone(shortest_path(graph, self.nodes[3], self.nodes[0]))
+            self.assertIsNone(shortest_path(graph, self.nodes[0], self.nodes[7]))
+
+    def test_weighted_shortest_path(self):
+        cost, path = weighted_shortest_path(self.graph, self.nodes[0], self.nodes[3], "cost")
+
+        self.assertEqual(cost, 4)
+        self.assertEqual(self.ids(path), ["0", "4", "5", "6", "3"])
+        # edges without the property weigh 1
+        self.assertEqual(weighted_shortest_path(self.graph, self.nodes[0], self.nodes[3], "length")[0], 3)
+
+        self.graph.get_edge(self.nodes[4], self.nodes[5]).add_property("cost", -1)
+        with self.assertRaises(ValueError):
+            weighted_shortest_path(self.graph, self.nodes[0], self.nodes[3], "cost")
+
+    def test_path_command_shows_view(self):
+        views = []
+        command_service = CommandService(lambda **kwargs: None, views.append)
+
+        result = command_service.execute_command(self.graph, "path 0 3 --weight cost")
+        self.assertEqual(result.status, CommandStatus.OK)
+        self.assertEqual(self.ids(views[0].get_nodes()), ["0", "4", "5", "6", "3"])
+        self.assertEqual(views[0].get_edge_count(), 4)
+        # the graph itself is left as it is
+        self.assertEqual(self.graph.get_node_count(), 8)
+
+        result = command_service.execute_command(self.graph, "path 3 0")
+        self.assertEqual(result.status, CommandStatus.INFO)
+        self.assertEqual(len(views), 1)
+        self.assertEqual(command_service.execute_command(self.graph, "path 0 9").status, CommandStatus.ERROR)
@@ -0,0 +1,74 @@
+import random
+from unittest import TestCase
+
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+from visualizer.core.usecase import graph_util
+
+
+class TestPropertyIndex(TestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        values = [5, 2.5, "Apple", "banana", None, True, [1], 7, "apple", 2]
+        self.graph.insert_nodes(*(Node(str(i), value=value) for i, value in enumerate(values)))
+        self.graph.insert_nodes(Node("missing"), Node("n1", value=1), Node("n2", value=10), Node("s", value="Cherry"))
+        self.index = self.graph.create_index("value")
+
+    def find_ids(self, operator, value):
+        nodes = self.index.find(operator, value)
+        return None if nodes is None else [node.id for node in nodes]
+
+    def test_equality_is_case_insensitive_and_keeps_graph_order(self):
+        self.assertEqual(self.find_ids("==", "apple"), None)  # the list value is not hashable
+
+        self.graph.get_node("6").add_property("value", 6)
+
+        self.assertEqual(self.find_ids("==", "apple"), ["2", "8"])
+        self.assertEqual(self.find_ids("==", 1), ["5", "n1"])
+
+    def test_range_falls_back_when_types_are_mixed(self):
+        self.assertIsNone(self.find_ids("<", 3))
+
+        for node_id in ("2", "3", "6", "8", "s"):
+            self.graph.get_node(node_id).remove_property("value")
+
+        self.assertEqual(self.find_ids("<", 3), ["1", "5", "9", "n1"])
+        self.assertEqual(self.find_ids(">=", 7), ["7", "n2"])
+
+    def test_index_follows_structural_changes(self):
+        self.find_ids("==", 5)
+        self.graph.get_node("6").remove_property("value")
+        self.graph.remove_node("0")
+        self.graph.insert_node(Node("new", value=5))
+        self.graph.get_node("1").properties = {"value": 5}
+
+        self.assertEqual(self.find_ids("==", 5), ["1", "new"])
+
+        self.graph.clear()
+        self.assertEqual(self.find_ids("==", 5), [])
+
+    def test_filter_with_index_matches_scan(self):
+        random_generator = random.Random(7)
+        graph = Graph()
+        graph.insert_nodes(*(Node(str(i), value=random_generator.randint(0, 50)) for i in range(300)))
+        indexed = Graph()
+        indexed.insert_nodes(*(Node(node.id, **node.properties) for node in graph.get_nodes()))
+        indexed.create_index("value")
+
+        for operator in ("==", "!=", "<", "<=", ">", ">="):
+            expected = [node.id for node in graph_util.filter_view(graph, "value", operator, "25").get_nodes()]
+            actual = [node.id for node in graph_util.filter_view(indexed, "value", operator, "25").get_nodes()]
+            self.assertEqual(actual, expected)
+
+    def test_range_with_nan_matches_scan(self):
+        graph = Graph()
+        graph.insert_nodes(Node("1", value=float("nan")), Node("2", value=3), Node("3", value=8))
+        index = graph.create_index("value")
+
+        self.assertEqual([node.id for node in index.find(">", 4)], ["3"])
+        graph.get_node("2").add_property("value", "x")
+        graph.get_node("3").add_property("value", "zed")
+        self.assertIsNone(index.find(">", "abc"))  # NaN cannot be compared with a string
+        with self.assertRaises(TypeError):
+            graph_util.filter_view(graph, "value", ">", "abc").get_nodes()
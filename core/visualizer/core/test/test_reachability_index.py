@@ -0,0 +1,59 @@
+import random
+from unittest import TestCase
+
+from visualizer.api.algorithm.traversal import reachable, strongly_connected_components
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.node import Node
+
+
+class TestReachabilityIndex(TestCase):
+
+    def setUp(self):
+        # 0 -> 1 -> 2 -> 0 is a cycle leading to 3, which 4 leads to as well; 5 is isolated
+        self.nodes = [Node(str(i)) for i in range(6)]
+        self.graph = Graph()
+        self.graph.bulk_load(self.nodes, [
+            Edge(self.nodes[source], self.nodes[destination]) for source, destination in [(0, 1), (1, 2), (2, 0), (2, 3), (4, 3)]
+        ])
+        self.index = self.graph.get_reachability_index()
+
+    def test_components(self):
+        count, labels = strongly_connected_components(self.graph.to_adjacency())
+
+        self.assertEqual(count, 4)
+        self.assertEqual(len({labels[0], labels[1], labels[2]}), 1)
+        self.assertGreater(labels[2], labels[3])  # the edge 2 -> 3 leads to a lower number
+
+    def test_queries(self):
+        ids = lambda nodes: [node.id for node in nodes]
+
+        self.assertEqual(ids(self.index.descendants(self.nodes[1])), ["0", "2", "3"])
+        self.assertEqual(ids(self.index.ancestors(self.nodes[3])), ["0", "1", "2", "4"])
+        self.assertTrue(self.index.can_reach(self.nodes[0], self.nodes[3]))
+        self.assertFalse(self.index.can_reach(self.nodes[3], self.nodes[0]))
+        self.assertFalse(self.index.can_reach(self.nodes[4], self.nodes[5]))
+
+    def test_index_follows_changes(self):
+        self.graph.insert_node(Node("6"))
+        self.graph.insert_edge(Edge(self.nodes[1], self.nodes[3]))  # already connected
+        self.assertFalse(self.index.can_reach(self.graph.get_node("6"), self.nodes[0]))
+
+        self.graph.insert_edge(Edge(self.nodes[3], self.nodes[4]))
+        self.graph.remove_edge(self.nodes[2], self.nodes[0])
+
+        self.assertEqual([node.id for node in self.index.descendants(self.nodes[4])], ["3"])
+        self.assertTrue(self.index.can_reach(self.nodes[0], self.nodes[4]))
+        self.assertFalse(self.index.can_reach(self.nodes[2], self.nodes[0]))
+
+    def test_matches_traversal(self):
+        random.seed(7)
+        for _ in range(20):
+            nodes = [Node(str(i)) for i in range(30)]
+            graph = Graph()
+            graph.bulk_load(nodes, [Edge(random.choice(nodes), random.choice(nodes)) for _ in range(40)])
+            index = graph.get_reachability_index()
+            adjacency = graph.to_adjacency()
+            for source, node in enumerate(nodes):
+                marks = reachable(adjacency, [source])
+                self.assertEqual([index.can_reach(node, other) for other in nodes], [bool(mark) for mark in marks])
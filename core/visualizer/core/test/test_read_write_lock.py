@@ -0,0 +1,70 @@
+import threading
+import time
+from unittest import TestCase
+
+from visualizer.core.util.read_write_lock import ReadWriteLock
+
+
+class TestReadWriteLock(TestCase):
+
+    def setUp(self):
+        self.lock = ReadWriteLock()
+
+    def test_readers_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read():
+            with self.lock.read():
+                barrier.wait()  # only passes if all readers hold the lock at once
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(barrier.broken)
+
+    def test_writers_are_exclusive(self):
+        counter = {"value": 0, "active": 0, "overlaps": 0}
+
+        def write():
+            for _ in range(50):
+                with self.lock.write():
+                    counter["active"] += 1
+                    if counter["active"] > 1:
+                        counter["overlaps"] += 1
+                    value = counter["value"]
+                    time.sleep(0)
+                    counter["value"] = value + 1
+                    counter["active"] -= 1
+                with self.lock.read():
+                    self.assertEqual(counter["active"], 0)
+
+        threads = [threading.Thread(target=write) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counter["value"], 400)
+        self.assertEqual(counter["overlaps"], 0)
+
+    def test_reentrancy(self):
+        with self.lock.write():
+            with self.lock.read():
+                with self.lock.write():
+                    pass
+        with self.lock.read():
+            with self.lock.read():
+                with self.assertRaises(RuntimeError):
+                    with self.lock.write():
+                        pass
+
+        # the lock is free again
+        written = threading.Event()
+
+        def write():
+            with self.lock.write():
+                written.set()
+
+        threading.Thread(target=write).start()
+        self.assertTrue(written.wait(5))
@@ -0,0 +1,81 @@
+import random
+from unittest import TestCase
+
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_view import GraphView
+from visualizer.api.model.node import Node
+from visualizer.core.usecase import graph_util
+
+
+class TestTextIndex(TestCase):
+
+    def setUp(self):
+        self.graph = Graph()
+        self.graph.insert_nodes(
+            Node("Alpha", name="Ada Lovelace", year=1815),
+            Node("b", tags=["Engine", ("x", 42)], meta={"Nested": {"deep": "Value"}}),
+            Node("c", name="Bob", score=3.5, flag=None),
+            Node("d")
+        )
+
+    def search_ids(self, graph, query):
+        return [node.id for node in graph_util.search_view(graph, query).get_nodes()]
+
+    def scan_ids(self, graph, query):
+        def contains(prop):
+            if isinstance(prop, dict):
+                return any(query in key.lower() or contains(value) for key, value in prop.items())
+            if isinstance(prop, list):
+                return any(contains(value) for value in prop)
+            return query in str(prop).lower()
+
+        query = query.lower()
+        return [node.id for node in graph.get_nodes() if query in node.id.lower() or contains(node.properties)]
+
+    def test_search_matches_ids_keys_and_values(self):
+        self.assertEqual(self.search_ids(self.graph, "ALP"), ["Alpha"])
+        self.assertEqual(self.search_ids(self.graph, "love"), ["Alpha"])
+        self.assertEqual(self.search_ids(self.graph, "181"), ["Alpha"])
+        self.assertEqual(self.search_ids(self.graph, "nested"), ["b"])
+        self.assertEqual(self.search_ids(self.graph, "valu"), ["b"])
+        self.assertEqual(self.search_ids(self.graph, "42"), ["b"])
+        self.assertEqual(self.search_ids(self.graph, "none"), ["c"])
+        self.assertEqual(self.search_ids(self.graph, "3.5"), ["c"])
+        self.assertEqual(self.search_ids(self.graph, "a"), ["Alpha", "b", "c"])
+        self.assertEqual(self.search_ids(self.graph, ""), ["Alpha", "b", "c", "d"])
+        self.assertEqual(self.search_ids(self.graph, "zzz"), [])
+
+    def test_index_follows_changes(self):
+        self.assertEqual(self.search_ids(self.graph, "bob"), ["c"])
+
+        self.graph.get_node("c").add_property("name", "Carol")
+        self.graph.get_node("d").add_property("friend", "Bobby")
+        self.graph.insert_node(Node("bob"))
+        self.graph.remove_node("Alpha")
+
+        self.assertEqual(self.search_ids(self.graph, "bob"), ["d", "bob"])
+        self.assertEqual(self.search_ids(self.graph, "love"), [])
+
+        graph_util.search_graph(self.graph, "bob")
+        self.assertEqual([node.id for node in self.graph.get_nodes()], ["d", "bob"])
+        self.assertEqual(self.search_ids(self.graph, "o"), ["d", "bob"])
+
+    def test_search_with_index_matches_scan(self):
+        random_generator = random.Random(3)
+        alphabet = "abcAB1 "
+        graph = Graph()
+        for i in range(200):
+            words = ["".join(random_generator.choice(alphabet) for _ in range(random_generator.randint(0, 6)))
+                     for _ in range(3)]
+            graph.insert_node(Node(str(i), first=words[0], nested={words[1]: [words[2], i]}))
+
+        for query in ("", "a", "B1", "ab", "abc", "a b", "1a", "cab", "bca1", "5", "xyz"):
+            self.assertEqual(self.search_ids(graph, query), self.scan_ids(graph, query))
+
+        for i in range(0, 200, 3):
+            graph.get_node(str(i)).add_property("first", "cab1")
+        for i in range(1, 200, 7):
+            graph.remove_node(str(i))
+
+        for query in ("a", "cab", "ab1", "b1"):
+            self.assertEqual(self.search_ids(graph, query), self.scan_ids(graph, query))
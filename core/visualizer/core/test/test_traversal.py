@@ -0,0 +1,75 @@
+import importlib.util
+from unittest import TestCase, skipUnless
+
+from visualizer.api.algorithm import traversal
+from visualizer.api.model.adjacency import AdjacencyMatrix
+from visualizer.api.model.edge import Edge
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_view import GraphView
+from visualizer.api.model.node import Node
+from visualizer.api.model.storage.compact_storage import CompactStorage
+
+
+class TestTraversal(TestCase):
+
+    def setUp(self):
+        # a -> b -> c -> a, c -> d, e -> d, f alone
+        self.graph = Graph()
+        self.nodes = {node_id: Node(node_id, odd=index % 2 == 1) for index, node_id in enumerate("abcdef")}
+        self.graph.insert_nodes(*self.nodes.values())
+        for source, destination in ("ab", "bc", "ca", "cd", "ed"):
+            self.graph.insert_edge(Edge(self.nodes[source], self.nodes[destination]))
+        self.adjacency = self.graph.to_adjacency()
+
+    def test_adjacency_follows_graph(self):
+        self.assertEqual(self.adjacency.node_ids, list("abcdef"))
+        self.assertEqual(self.adjacency.offsets.tolist(), [0, 1, 2, 4, 4, 5, 5])
+        self.assertEqual(self.adjacency.targets.tolist(), [1, 2, 0, 3, 3])
+        self.assertEqual(self.adjacency.transpose().successors(3).tolist(), [2, 4])
+
+        self.graph.get_node("a").add_property("name", "A")
+        self.assertIs(self.graph.to_adjacency(), self.adjacency)
+        self.graph.remove_edge(self.nodes["c"], self.nodes["d"])
+        self.assertEqual(self.graph.to_adjacency().successors(2).tolist(), [0])
+
+        compact = Graph(CompactStorage())
+        compact.bulk_load(list(self.graph.get_nodes()), [Edge(self.nodes["a"], self.nodes["f"])])
+        self.assertEqual(compact.to_adjacency().successors(0).tolist(), [5])
+
+    def test_view_and_round_trip(self):
+        view = GraphView(self.graph, lambda node: not node.properties["odd"])
+        adjacency = view.to_adjacency()
+        self.assertEqual(adjacency.node_ids, ["a", "c", "e"])
+        self.assertEqual(adjacency.targets.tolist(), [0])
+
+        graph = Graph.from_adjacency(self.adjacency)
+        self.assertEqual(graph.to_adjacency().targets.tolist(), self.adjacency.targets.tolist())
+        self.assertEqual(graph.get_edge_count(), 5)
+        self.assertRaises(ValueError, AdjacencyMatrix, ["a"], [0, 1], [1])
+
+    def test_traversals(self):
+        self.assertEqual(traversal.bfs(self.adjacency, [0]), [0, 1, 2, 3])
+        self.assertEqual(traversal.bfs_levels(self.adjacency, [0]).tolist(), [0, 1, 2, 3, -1, -1])
+        self.assertEqual(list(traversal.reachable(self.adjacency, [4])), [0, 0, 0, 1, 1, 0])
+        self.assertEqual(traversal.neighborhood(self.adjacency, 3, 1), [3])
+        self.assertEqual(traversal.neighborhood(self.adjacency, 3, 1, directed=False), [3, 2, 4])
+        self.assertEqual(traversal.traversal_roots(self.adjacency), [0, 4, 5])
+        count, labels = traversal.connected_components(self.adjacency)
+        self.assertEqual((count, labels.tolist()), (2, [0, 0, 0, 0, 0, 1]))
+
+    def test_cycle_aware_roots(self):
+        # b -> c -> b is entered from a, which comes last
+        adjacency = AdjacencyMatrix(["b", "c", "a"], [0, 1, 2, 3], [1, 0, 0])
+
+        self.assertEqual(traversal.traversal_roots(adjacency), [0, 2])
+        self.assertEqual(traversal.condensation_roots(adjacency), [2])
+        self.assertEqual(list(traversal.back_edges(adjacency, [2])), [0, 1, 0])  # c -> b
+        self.assertEqual(traversal.condensation_roots(self.adjacency), [0, 4, 5])
+        self.assertEqual(list(traversal.back_edges(self.adjacency, [0, 4, 5])), [0, 0, 1, 0, 0])
+
+    @skipUnless(importlib.util.find_spec("scipy"), "SciPy is not installed")
+    def test_scipy_round_trip(self):
+        matrix = self.adjacency.to_scipy()
+        self.assertEqual(matrix.nnz, 5)
+        adjacency = AdjacencyMatrix.from_scipy(matrix, self.adjacency.node_ids)
+        self.assertEqual(adjacency.targets.tolist(), self.adjacency.targets.tolist())
@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+from visualizer.api.model.value_pool import ValuePool
+
+
+class TestValuePool(TestCase):
+
+    def setUp(self):
+        self.pool = ValuePool(max_size=3, max_length=8)
+
+    def test_equal_values_are_shared(self):
+        first = self.pool.intern("".join(["per", "son"]))
+        second = "".join(["per", "son"])
+
+        self.assertIsNot(first, second)
+        self.assertIs(self.pool.intern(second), first)
+        self.assertEqual(self.pool.hits, 1)
+        self.assertEqual(self.pool.misses, 1)
+        self.assertEqual(self.pool.hit_rate, 0.5)
+        self.assertGreater(self.pool.bytes_saved, 0)
+
+    def test_types_are_kept(self):
+        self.assertIs(type(self.pool.intern(1000)), int)
+        self.assertIs(type(self.pool.intern(1000.0)), float)
+        self.assertIs(type(self.pool.intern(b"1000")), bytes)
+        self.assertIs(self.pool.intern(-0.0), -0.0)
+
+    def test_unpooled_values_are_returned_unchanged(self):
+        values = [True, None, [1], "a very long string", 7, float("nan")]
+
+        for value in values:
+            self.assertIs(self.pool.intern(value), value)
+        self.assertEqual(self.pool.size, 0)
+
+    def test_size_is_limited(self):
+        for value in ["a", "b", "c", "d"]:
+            self.pool.intern(value)
+        fifth = "".join(["d", ""]) + "d"
+
+        self.assertEqual(self.pool.size, 3)
+        self.assertIs(self.pool.intern(fifth), fifth)
+
+        self.pool.clear()
+        self.assertEqual((self.pool.size, self.pool.hits, self.pool.misses), (0, 0, 0))
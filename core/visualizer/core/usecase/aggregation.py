@@ -0,0 +1,159 @@
+import math
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_view import GraphView
+from visualizer.api.model.index.centrality_index import CENTRALITY_KEYS
+from visualizer.api.model.index.column_store import Column
+from visualizer.api.model.index.degree_index import DEGREE_KEYS
+from visualizer.api.model.node import Node
+from visualizer.api.model.observable import MISSING
+
+Number = Union[int, float]
+
+
+@dataclass(frozen=True)
+class PropertyStats:
+    """
+    A numeric summary of a node property.
+
+    :param key: The name of the property.
+    :type key: str
+    :param node_count: The number of nodes summarized.
+    :type node_count: int
+    :param value_count: The number of nodes that have the property, including `None` values.
+    :type value_count: int
+    :param number_count: The number of nodes whose value is a number. Booleans count as 0 and 1.
+    :type number_count: int
+    :param minimum: The lowest number, or `None` if there are no numbers.
+    :type minimum: Optional[Number]
+    :param maximum: The highest number, or `None` if there are no numbers.
+    :type maximum: Optional[Number]
+    :param mean: The mean of the numbers, or `None` if there are no numbers.
+    :type mean: Optional[float]
+    :param histogram: The bins of the numbers as (start, end, count), from the lowest. A bin
+                      counts the numbers from its start up to, but not including, its end. The
+                      last bin of floats includes its end, the maximum.
+    :type histogram: List[Tuple[Number, Number, int]]
+    """
+    key: str
+    node_count: int
+    value_count: int
+    number_count: int
+    minimum: Optional[Number]
+    maximum: Optional[Number]
+    mean: Optional[float]
+    histogram: List[Tuple[Number, Number, int]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ Return the summary as a JSON-serializable dictionary. """
+        return asdict(self)
+
+
+def group_by(base: Union[Graph, GraphView], key: str) -> Dict[Any, int]:
+    """
+    Count the nodes of graph or view by the value of a property, in a single pass.
+
+    Strings are lowercased, the way `filter` compares them, and `None` counts as a value.
+    Nodes without the property are not counted. The keys 'id', 'degree', 'in_degree' and
+    'out_degree' count the ids and degrees of the nodes, like `filter` does.
+    The counts of a graph are taken from the columnar property store when its column of the key
+    holds strings, so repeated groupings do not visit the nodes again.
+    Returns the counts, the highest first, and equal counts ordered by value.
+    """
+    counts: Optional[Dict[Any, int]] = None
+    column: Optional[Column] = __column(base, key)
+    if column is not None:
+        counts = column.counts()
+    if counts is None:
+        values = map(__value_function(base, key), base.get_nodes())
+        counts = Counter(__hashable(value) for value in values if value is not MISSING)
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], str(item[0]))))
+
+
+def property_stats(base: Union[Graph, GraphView], key: str, bins: int = 10) -> PropertyStats:
+    """
+    Summarize the numbers of a property of the nodes of graph or view.
+
+    The keys 'degree', 'in_degree' and 'out_degree' summarize the degrees of the nodes, and
+    'pagerank' and 'betweenness' their scores in the centrality index.
+    The numbers of a graph are taken from the columnar property store when its column of the key
+    is numeric, otherwise they are collected in a single pass over the nodes. NaN is not counted
+    as a number.
+    If all numbers are whole, the bins are bounded by whole numbers too, so a small range of
+    integers gets a bin per integer.
+    """
+    if bins < 1:
+        raise ValueError(f"Invalid number of bins: Expected at least 1, but got {bins}.")
+    numbers: Optional[List[Number]] = None
+    column: Optional[Column] = __column(base, key)
+    if column is not None:
+        numbers = column.numbers()
+        value_count: int = column.value_count()
+    if numbers is None:
+        values: List[Any] = [value for value in map(__value_function(base, key), base.get_nodes()) if value is not MISSING]
+        value_count = len(values)
+        numbers = [value for value in values if type(value) in (int, float, bool)]
+    numbers = [number for number in numbers if number == number]
+
+    if not numbers:
+        return PropertyStats(key, base.get_node_count(), value_count, 0, None, None, None, [])
+    minimum: Number = min(numbers)
+    maximum: Number = max(numbers)
+    return PropertyStats(
+        key, base.get_node_count(), value_count, len(numbers), minimum, maximum, math.fsum(numbers) / len(numbers),
+        __histogram(numbers, minimum, maximum, bins)
+    )
+
+
+def __histogram(numbers: List[Number], minimum: Number, maximum: Number, bins: int) -> List[Tuple[Number, Number, int]]:
+    integral: bool = all(number % 1 == 0 for number in numbers)
+    if integral:
+        width: Number = max(1, math.ceil((maximum - minimum + 1) / bins))
+        bins = math.ceil((maximum - minimum + 1) / width)
+    elif maximum == minimum:
+        return [(minimum, maximum, len(numbers))]
+    else:
+        width = (maximum - minimum) / bins
+    counts: List[int] = [0] * bins
+    last: int = bins - 1
+    for number in numbers:
+        counts[min(int((number - minimum) // width), last)] += 1
+    bounds: List[Number] = [minimum + width * position for position in range(bins + 1)]
+    if not integral:
+        bounds[-1] = maximum  # instead of a sum that may be rounded below it
+    return [(bounds[position], bounds[position + 1], count) for position, count in enumerate(counts)]
+
+
+def __column(base: Union[Graph, GraphView], key: str) -> Optional[Column]:
+    # views hold only some of the nodes, so they are visited instead
+    if not isinstance(base, Graph) or key.lower() == "id" or key in DEGREE_KEYS or key in CENTRALITY_KEYS:
+        return None
+    return base.get_column_store().column(key)
+
+
+def __value_function(base: Union[Graph, GraphView], key: str) -> Callable[[Node], Any]:
+    if key.lower() == "id":
+        return lambda node: node.id.lower()
+    if key in DEGREE_KEYS:
+        graph: Graph = base if isinstance(base, Graph) else base.graph
+        return lambda node: graph.get_degree_index().get(key, node)
+    if key in CENTRALITY_KEYS:
+        graph = base if isinstance(base, Graph) else base.graph
+        return lambda node: graph.get_centrality_index().get(key, node)
+
+    def value(node: Node) -> Any:
+        property_value: Any = node.properties.get(key, MISSING)
+        return property_value.lower() if isinstance(property_value, str) else property_value
+
+    return value
+
+
+def __hashable(value: Any) -> Hashable:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return str(value)
@@ -0,0 +1,74 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Optional
+
+from visualizer.api.model.graph import Graph
+from visualizer.api.model.index.centrality_index import CentralityIndex
+
+
+class CentralityWorker:
+    """
+    Computes the centrality scores of the graph of a workspace in a background thread, so the
+    threads serving requests never wait for them.
+
+    Every workspace has one worker with a single thread. `request` is cheap and may be called
+    after every change or lookup; it only starts the thread once a lookup found the scores of
+    the graph missing (see `CentralityIndex.wanted`). The thread computes the scores of the
+    latest requested graph until they match its current structure, and then waits for the next
+    request.
+    """
+
+    __slots__ = ["__executor", "__read", "__lock", "__index", "__running", "__requested"]
+
+    def __init__(self, read: Callable[[], ContextManager] = nullcontext) -> None:
+        """
+        :param read: Returns a context manager holding the graph unchanged while it is read,
+                     e.g. the read side of the lock of the workspace.
+        :type read: Callable[[], ContextManager]
+        """
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="centrality")
+        self.__read: Callable[[], ContextManager] = read
+        self.__lock: threading.Lock = threading.Lock()
+        self.__index: Optional[CentralityIndex] = None
+        self.__running: bool = False
+        self.__requested: bool = False
+
+    def request(self, graph: Graph) -> None:
+        """
+        Have the scores of the current structure of `graph` computed, if a lookup found them
+        missing and they are not being computed.
+
+        :param graph: The graph whose nodes should be ranked.
+        :type graph: Graph
+        """
+        index: CentralityIndex = graph.get_centrality_index()
+        with self.__lock:
+            self.__index = index
+            if self.__running:
+                self.__requested = True  # picked up by the running computation once it is done
+                return
+            if not index.wanted:
+                return
+            self.__running = True
+        self.__executor.submit(self.__run)
+
+    def close(self) -> None:
+        """ Stop the background thread after the running computation. """
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __run(self) -> None:
+        while True:
+            with self.__lock:
+                index: CentralityIndex = self.__index
+                self.__requested = False
+            try:
+                index.compute(self.__read)
+            except Exception:
+                with self.__lock:
+                    self.__running = False
+                raise
+            with self.__lock:
+                if not self.__requested and not index.wanted:
+                    self.__running = False
+                    return
@@ -1,18 +1,48 @@
-from typing import Dict, Any
+import hashlib
+import inspect
+import os
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
 
 from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_diff import GraphDiff
+from visualizer.api.model.graph_view import GraphView
+from visualizer.api.model.index.centrality_index import CENTRALITY_KEYS
+from visualizer.api.model.index.degree_index import DEGREE_KEYS
+from visualizer.api.model.storage.mapped_storage import FORMAT_VERSION
 from visualizer.api.service.data_source_plugin import DataSourcePlugin
-from visualizer.core.usecase import graph_util
+from visualizer.core.usecase import aggregation, graph_util
+from visualizer.core.usecase.aggregation import PropertyStats
 from visualizer.core.usecase.plugin_manager import PluginManager
 
 
-class GraphManager:
+SNAPSHOT_SUFFIX: str = ".graph"
+
 
-    __slots__ = ["__plugin_manager", "__graph", "__graph_generated", "__data_file_string", "__properties"]
+class GraphManager:
 
-    def __init__(self, plugin_manager: PluginManager, **properties):
+    __slots__ = ["__plugin_manager", "__graph", "__views", "__shown_view", "__graph_generated", "__data_file_string", "__properties",
+                 "__snapshot_directory", "__snapshot_cache_size"]
+
+    def __init__(self, plugin_manager: PluginManager, snapshot_directory: Optional[str] = None,
+                 snapshot_cache_size: int = 1 << 30, **properties):
+        """
+        :param plugin_manager: The manager of the selected plugins.
+        :type plugin_manager: PluginManager
+        :param snapshot_directory: A directory to keep snapshot files of generated graphs in.
+                                   Generating a graph from the same data source, loader and input
+                                   again then opens its snapshot instead of loading the input.
+        :type snapshot_directory: Optional[str]
+        :param snapshot_cache_size: The number of bytes the snapshot files may take up together.
+                                    The least recently used files are deleted beyond it.
+        :type snapshot_cache_size: int
+        """
         self.__plugin_manager: PluginManager = plugin_manager
+        self.__snapshot_directory: Optional[str] = snapshot_directory
+        self.__snapshot_cache_size: int = snapshot_cache_size
         self.__graph = Graph()
+        self.__views: List[GraphView] = []
+        # a view shown on top of the filters until the graph changes, e.g. a path found by a command
+        self.__shown_view: Optional[GraphView] = None
         self.__graph_generated = False
         self.__data_file_string = ""
         self.__properties: Dict[str, Any] = properties
@@ -25,6 +55,40 @@ class GraphManager:
     def graph(self) -> Graph:
         return self.__graph
 
+    @property
+    def view(self) -> Union[Graph, GraphView]:
+        """
+        The view shown by a command, or else the most recent filter or search view of the graph,
+        or the graph itself if there is none.
+        """
+        if self.__shown_view is not None:
+            return self.__shown_view
+        return self.__filtered_view
+
+    @property
+    def __filtered_view(self) -> Union[Graph, GraphView]:
+        return self.__views[-1] if self.__views else self.__graph
+
+    def show_view(self, view: GraphView) -> None:
+        """
+        Show a view of the graph, e.g. a path found by a command, instead of the filter and
+        search views. It replaces the view shown before and is not stacked on: it is hidden again
+        by `hide_shown_view`, once the graph changes, or by the next filter or search.
+        """
+        self.__shown_view = view
+
+    def hide_shown_view(self) -> None:
+        """ Hide the view shown by a command, so the filter and search views are shown again. """
+        self.__shown_view = None
+
+    def clear_views(self) -> None:
+        """
+        Remove all filter and search views, so the whole graph is shown again (the `reset`
+        command and the reset button of the web app).
+        """
+        self.__views.clear()
+        self.__shown_view = None
+
     @property
     def properties(self) -> Dict[str, Any]:
         return self.__properties
@@ -52,15 +116,109 @@ class GraphManager:
             self.__properties = { 'file_content' : kwargs.get('file_content', '') }
 
         if self.data_source_plugin and self.__data_file_string:
-            self.__graph = self.data_source_plugin.load(**self.__properties)
+            graph: Graph = self.__load()
+            graph_diff: Optional[GraphDiff] = self.__graph.diff(graph) if self.__graph_generated else None
+            if (graph_diff is not None and len(graph_diff.removed_nodes) <= self.__graph.get_node_count() // 2 and
+                    self.__keeps_order(graph, graph_diff)):
+                # reloading usually changes little, so only the delta is applied and reported
+                self.__graph.apply_patch(graph_diff)
+            else:
+                self.__graph = graph
+            self.clear_views()
             self.__graph_generated = True
 
+    def __keeps_order(self, graph: Graph, graph_diff: GraphDiff) -> bool:
+        # patching appends the added nodes, so it only matches a fresh load if the loader put them last
+        removed_ids: Set[str] = {node.id for node in graph_diff.removed_nodes}
+        patched_ids: List[str] = [node.id for node in self.__graph.get_nodes() if node.id not in removed_ids]
+        patched_ids.extend(node.id for node in graph_diff.added_nodes)
+        return patched_ids == [node.id for node in graph.get_nodes()]
+
+    def restore(self, graph: Graph) -> None:
+        """
+        Show a graph restored after a restart (see `CommandJournal`) instead of the current one.
+        The graph counts as generated, so it is not generated again before it is rendered.
+        """
+        self.__graph = graph
+        self.clear_views()
+        self.__graph_generated = True
+
+    def __load(self) -> Graph:
+        path: Optional[str] = self.__snapshot_path()
+        if path is not None and os.path.exists(path):
+            try:
+                graph: Graph = Graph.open_snapshot(path)
+                os.utime(path)  # recently used snapshots are deleted last
+                return graph
+            except ValueError:
+                pass  # saved in another format version, so it is replaced below
+
+        graph = self.data_source_plugin.load(**self.__properties)
+        if path is not None:
+            os.makedirs(self.__snapshot_directory, exist_ok=True)
+            graph.save_snapshot(path)
+            self.__evict_snapshots(path)
+        return graph
+
+    def __snapshot_path(self) -> Optional[str]:
+        if self.__snapshot_directory is None:
+            return None
+        digest = hashlib.sha256(self.data_source_plugin.identifier().encode("utf-8"))
+        # a changed loader or snapshot format must not be served the graphs cached by the old one
+        digest.update(str(FORMAT_VERSION).encode("utf-8"))
+        source: Optional[str] = inspect.getsourcefile(type(self.data_source_plugin))
+        if source is not None:
+            with open(source, "rb") as file:
+                digest.update(file.read())
+        digest.update(repr(sorted(self.__properties.items())).encode("utf-8"))
+        return os.path.join(self.__snapshot_directory, f"{digest.hexdigest()}{SNAPSHOT_SUFFIX}")
+
+    def __evict_snapshots(self, kept_path: str) -> None:
+        # other workspaces may delete the same files at the same time, so missing files are skipped
+        snapshots: List[Tuple[float, int, str]] = []
+        for entry in os.scandir(self.__snapshot_directory):
+            if entry.name.endswith(SNAPSHOT_SUFFIX) and entry.path != kept_path:
+                try:
+                    snapshots.append((entry.stat().st_mtime, entry.stat().st_size, entry.path))
+                except OSError:
+                    continue
+        total_size: int = os.path.getsize(kept_path) + sum(size for _, size, _ in snapshots)
+        for _, size, path in sorted(snapshots):
+            if total_size <= self.__snapshot_cache_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # already deleted, or still mapped by a graph on some platforms
+            total_size -= size
+
     def filter(self, key: str, operator: str, value: any) -> str:
+        """
+        Show the nodes of the current view that match a filter, on top of the other views.
+
+        Views leave the graph unchanged and follow its changes: commands still change the whole
+        graph, and nodes they create or edit are only shown if they match every stacked filter
+        and search, until the views are cleared (see `clear_views`).
+
+        :return: An empty string if successful, otherwise an error message.
+        """
         try:
-            graph_util.filter_graph(self.__graph, key, operator, value)
+            if key.lower() != "id" and key not in DEGREE_KEYS and key not in CENTRALITY_KEYS:
+                # keys filtered once are likely filtered again, so later filters can use the index
+                self.__graph.create_index(key)
+            self.__views.append(graph_util.filter_view(self.__filtered_view, key, operator, value))
+            self.__shown_view = None
             return ""
         except Exception as e:
             return str(e)
 
     def search(self, query: str):
-        graph_util.search_graph(self.__graph, query)
\ No newline at end of file
+        """ Show the nodes of the current view that match a search, on top of the other views (see `filter`). """
+        self.__views.append(graph_util.search_view(self.__filtered_view, query))
+        self.__shown_view = None
+
+    def group(self, key: str) -> Dict[Any, int]:
+        return aggregation.group_by(self.view, key)
+
+    def stats(self, key: str) -> PropertyStats:
+        return aggregation.property_stats(self.view, key)
\ No newline at end of file
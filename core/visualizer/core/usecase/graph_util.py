@@ -1,8 +1,10 @@
 import ast
-from typing import List, Set
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
-from visualizer.api.model.edge import Edge
 from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_view import GraphView
+from visualizer.api.model.index.centrality_index import CENTRALITY_KEYS
+from visualizer.api.model.index.degree_index import DEGREE_KEYS
 from visualizer.api.model.node import Node
 from visualizer.core.util.compare_util import CompareUtil
 
@@ -12,14 +14,26 @@ def search_graph(graph: Graph, query: str) -> None:
     Search graph according to given query.
 
     This function will modify the graph directly.
+    Only the nodes the full-text index of the graph finds for the query are checked.
     """
-    nodes = graph.get_nodes()
+    predicate = __search_predicate(query)
+    nodes: Optional[List[Node]] = graph.get_text_index().find(query)
+    graph.retain_nodes([node for node in (graph.get_nodes() if nodes is None else nodes) if predicate(node)])
+
+def search_view(base: Union[Graph, GraphView], query: str) -> GraphView:
+    """
+    Search graph or view according to given query.
+
+    Unlike `search_graph`, this function leaves the graph unchanged and returns a view of the
+    matching nodes.
+    Only the nodes the full-text index of the underlying graph finds for the query are checked.
+    """
+    graph: Graph = base if isinstance(base, Graph) else base.graph
+    return __evaluated(GraphView(base, __search_predicate(query), lambda: graph.get_text_index().find(query)))
+
+def __search_predicate(query: str) -> Callable[[Node], bool]:
     query = query.lower()
-    good_nodes = set()
-    for node in nodes:
-        if query in node.id.lower() or __search_property(node.properties, query):
-            good_nodes.add(node)
-    __recreate_graph(good_nodes, graph)
+    return lambda node: query in node.id.lower() or __search_property(node.properties, query)
 
 def __search_property(prop: any, query: str) -> bool:
     if isinstance(prop, dict):
@@ -45,44 +59,113 @@ def filter_graph(graph: Graph, key: str, operator: str, compare_value: any) -> N
 
     This function will modify the graph directly.
     If compare value is a string, it will be safely evaluated.
+    The keys 'degree', 'in_degree' and 'out_degree' compare the number of edges of the nodes
+    instead of a property, and are looked up in the degree index of the graph. The keys
+    'pagerank' and 'betweenness' compare the scores in the centrality index of the graph, and
+    fail while they are still being computed.
+    If the graph has an index over the key, the matching nodes are looked up in it, otherwise
+    they are found in the column of the key in the columnar property store of the graph.
+    """
+    compare_value = __parse_compare_value(operator, compare_value)
+    nodes: Optional[List[Node]] = __find_in_index(graph, key, operator, compare_value)
+    if nodes is None:
+        predicate = __filter_predicate(graph, key, operator, compare_value)
+        nodes = [node for node in graph.get_nodes() if predicate(node)]
+    graph.retain_nodes(nodes)
+
+def filter_view(base: Union[Graph, GraphView], key: str, operator: str, compare_value: any) -> GraphView:
+    """
+    Filter graph or view according to operator and compare_value, for matching key.
+
+    Unlike `filter_graph`, this function leaves the graph unchanged and returns a view of the
+    matching nodes. Stacking views filters only the nodes that are still visible.
+    The degree and centrality keys compare the degrees and scores of the nodes in the underlying
+    graph, not in the view.
+    If the underlying graph has an index over the key, the candidate nodes are looked up in it,
+    otherwise they are found in the columnar property store of the graph.
+    """
+    compare_value = __parse_compare_value(operator, compare_value)
+    graph: Graph = base if isinstance(base, Graph) else base.graph
+    return __evaluated(GraphView(
+        base,
+        __filter_predicate(graph, key, operator, compare_value),
+        lambda: __find_in_index(graph, key, operator, compare_value)
+    ))
+
+def reach_graph(graph: Graph, node_id: str, reverse: bool = False) -> None:
+    """
+    Keep only a node and the nodes it reaches, following the direction of the edges.
+
+    This function will modify the graph directly.
+    If reverse is set, the nodes that reach the node are kept instead (e.g. every caller of a
+    function). The nodes are looked up in the reachability index of the graph.
+    """
+    node: Optional[Node] = graph.get_node(node_id)
+    if node is None:
+        raise ValueError(f"Node with ID '{node_id}' not found in the graph.")
+    index = graph.get_reachability_index()
+    graph.retain_nodes([node] + (index.ancestors(node) if reverse else index.descendants(node)))
+
+def nodes_view(base: Union[Graph, GraphView], nodes: Iterable[Node]) -> GraphView:
+    """
+    Show only the given nodes of graph or view, e.g. the nodes of a path.
+
+    Unlike `retain_nodes`, this function leaves the graph unchanged and returns a view of the
+    nodes and the edges between them. The view lists the nodes in the given order, not in the
+    order of the graph.
     """
+    node_ids: Dict[str, None] = dict.fromkeys(node.id for node in nodes)
+    graph: Graph = base if isinstance(base, Graph) else base.graph
+    return GraphView(base, lambda node: node.id in node_ids, lambda: [
+        node for node in map(graph.get_node, node_ids) if node is not None
+    ])
+
+def __find_in_index(graph: Graph, key: str, operator: str, compare_value: any) -> Optional[List[Node]]:
+    if key.lower() == "id":
+        return None
+    if key in DEGREE_KEYS:
+        return graph.get_degree_index().find(key, operator, compare_value)
+    if key in CENTRALITY_KEYS:
+        return graph.get_centrality_index().find(key, operator, compare_value)
+    index = graph.get_index(key)
+    if index is not None:
+        return index.find(operator, compare_value)
+    return graph.get_column_store().find(key, operator, compare_value)
+
+def __parse_compare_value(operator: str, compare_value: any) -> any:
     # Test if the operator is invalid to get the exception early
     CompareUtil.compare(operator, 1, 2)
 
     if operator != "==" and operator != "!=" and compare_value == "None":
         raise Exception(f"Cannot compare None using '{operator}'.")
 
-
-    nodes = graph.get_nodes()
     try:
         compare_value = ast.literal_eval(compare_value)
     except (ValueError, SyntaxError):
         pass # leave it as string
     if isinstance(compare_value, str):
         compare_value = compare_value.lower()
+    return compare_value
 
-
-    good_nodes = set()
-    for node in nodes:
+def __filter_predicate(graph: Graph, key: str, operator: str, compare_value: any) -> Callable[[Node], bool]:
+    def predicate(node: Node) -> bool:
         if key.lower() == "id":
             property_value = node.id
+        elif key in DEGREE_KEYS:
+            property_value = graph.get_degree_index().get(key, node)
+        elif key in CENTRALITY_KEYS:
+            property_value = graph.get_centrality_index().get(key, node)
         elif key in node.properties:
             property_value = node.properties[key]
         else:
-            continue
+            return False
         if isinstance(property_value, str):
             property_value = property_value.lower()
-        if CompareUtil.compare(operator, property_value, compare_value):
-            good_nodes.add(node)
-
-    __recreate_graph(good_nodes, graph)
-
-def __recreate_graph(nodes: Set[Node], graph: Graph) -> None:
-    edges: List[Edge] = []
-    for node in nodes:
-        for edge in graph.get_incident_edges(node):
-            if edge.destination in nodes:
-                edges.append(edge)
-    graph.clear()
-    graph.insert_nodes(*nodes)
-    graph.insert_edges(*edges)
+        return CompareUtil.compare(operator, property_value, compare_value)
+
+    return predicate
+
+def __evaluated(view: GraphView) -> GraphView:
+    # evaluate the predicate right away, so invalid comparisons are reported to the caller
+    view.get_node_count()
+    return view
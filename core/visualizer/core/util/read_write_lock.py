@@ -0,0 +1,81 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class ReadWriteLock:
+    """
+    A lock that lets any number of threads read at the same time, while a thread that writes
+    has exclusive access.
+
+    Waiting writers are preferred: once a writer waits, new readers wait until it is done, so a
+    steady stream of reads cannot starve writes.
+
+    Both sides are reentrant. A thread that writes may also read or write again (e.g. a command
+    that renders the graph it changed), and a thread that reads may read again. A reading thread
+    must not start to write, since two readers doing so would wait for each other forever;
+    `write` raises a `RuntimeError` instead.
+    """
+
+    __slots__ = ["__condition", "__readers", "__writer", "__writes", "__waiting_writers"]
+
+    def __init__(self) -> None:
+        self.__condition: threading.Condition = threading.Condition(threading.Lock())
+        # the number of nested reads of every reading thread, by thread ID
+        self.__readers: Dict[int, int] = {}
+        self.__writer: Optional[int] = None
+        self.__writes: int = 0
+        self.__waiting_writers: int = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """
+        Hold the lock for reading for the duration of a `with` block.
+
+        Blocks while another thread writes or waits to write.
+        """
+        thread: int = threading.get_ident()
+        with self.__condition:
+            if self.__writer != thread and thread not in self.__readers:
+                self.__condition.wait_for(lambda: self.__writer is None and not self.__waiting_writers)
+            self.__readers[thread] = self.__readers.get(thread, 0) + 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                if self.__readers[thread] == 1:
+                    del self.__readers[thread]
+                    if not self.__readers:
+                        self.__condition.notify_all()
+                else:
+                    self.__readers[thread] -= 1
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """
+        Hold the lock for writing for the duration of a `with` block.
+
+        Blocks while other threads read or write.
+
+        :raises RuntimeError: If the thread holds the lock for reading, but not for writing.
+        """
+        thread: int = threading.get_ident()
+        with self.__condition:
+            if self.__writer != thread:
+                if thread in self.__readers:
+                    raise RuntimeError("Cannot write while reading: The read lock must be released first.")
+                self.__waiting_writers += 1
+                try:
+                    self.__condition.wait_for(lambda: self.__writer is None and not self.__readers)
+                finally:
+                    self.__waiting_writers -= 1
+                self.__writer = thread
+            self.__writes += 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__writes -= 1
+                if self.__writes == 0:
+                    self.__writer = None
+                    self.__condition.notify_all()
@@ -1,17 +1,18 @@
 import os
 import sys
-from typing import Tuple
+from typing import Tuple, Union
 
 from jinja2 import Template
 from visualizer.api.model.graph import Graph
+from visualizer.api.model.graph_view import GraphView
 from visualizer.api.service.visualizer_plugin import VisualizerPlugin
 
 
-def render(graph: Graph, visualizer: VisualizerPlugin, **kwargs) -> Tuple[str, str, str]:
+def render(graph: Union[Graph, GraphView], visualizer: VisualizerPlugin, **kwargs) -> Tuple[str, str, str]:
     """
     Returns the required header and body html content that needs to be included in page
     in order to display the graph using the selected visualizer.
-    :param graph: Graph to render.
+    :param graph: Graph or view of a graph to render.
     :param visualizer: Visualizer to use.
     :param kwargs: Arguments for the visualizer plugin.
     :return: (main_view_head, plugin_head, body) html string that should be included in page.
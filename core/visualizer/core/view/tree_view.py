@@ -1,19 +1,23 @@
-from collections import deque
-from typing import Tuple, List, Set
+from typing import Tuple, Union
+from weakref import WeakKeyDictionary
 
 from jinja2 import Template
-from visualizer.api.model.node import Node
+from visualizer.api.algorithm import traversal
 from visualizer.api.service.visualizer_plugin import VisualizerPlugin
 from visualizer.core.service.plugin_service import PluginService
 
 from visualizer.api.model.graph import Graph, GraphDict
+from visualizer.api.model.graph_view import GraphView
 import os
 import sys
 
-def render(graph: Graph) -> Tuple[str, str]:
+# rendered bodies keyed by graph, valid as long as the graph's version does not change
+__rendered_bodies: "WeakKeyDictionary[Union[Graph, GraphView], Tuple[int, str]]" = WeakKeyDictionary()
+
+def render(graph: Union[Graph, GraphView]) -> Tuple[str, str]:
     """
     Returns the required head and body html content for the tree view.
-    :param graph: Graph to render.
+    :param graph: Graph or view of a graph to render.
     :return: (head, body) html string that should be included in page.
     """
     with open(os.path.join(sys.prefix, 'templates/tree_view_head_template.html'), 'r', encoding='utf-8') as file:
@@ -24,42 +28,37 @@ def render(graph: Graph) -> Tuple[str, str]:
     if not graph or graph.is_empty():
         return head, '<div id="tree-view"><p style=\"margin: 1rem\">-----------</p></div>'
 
+    cached = __rendered_bodies.get(graph)
+    if cached is not None and cached[0] == graph.version:
+        return head, cached[1]
+
     graph_dict = __prepare_data(graph)
 
     rendered_body = Template(body).render(graph=graph_dict)
+    __rendered_bodies[graph] = (graph.version, rendered_body)
     return head, rendered_body
 
 
-def __prepare_data(graph: Graph) -> GraphDict:
-    graph_dict = graph.to_dict()
+def __prepare_data(graph: Union[Graph, GraphView]) -> GraphDict:
+    shared_dict = graph.to_dict()
+    # the matrix has the nodes in the same order as the dictionary, so indices match
+    adjacency = graph.to_adjacency()
 
-    # since tree view doesn't show edge data, we will remove it and embed it into nodes
-    node_table: dict[str, int] = {node['id']: index for index, node in enumerate(graph_dict['nodes'])}
-    for edge in graph_dict['edges']:
-        source_node_index = node_table[edge['source']]
-        source_node = graph_dict['nodes'][source_node_index]
-        destination_node_index = node_table[edge['destination']]
-        if 'children' not in source_node:
-            source_node['children'] = []
-        source_node['children'].append(destination_node_index)
+    # roots in the components nothing else leads to, so cycles are entered where the data enters them
+    start_nodes = traversal.condensation_roots(adjacency)
+    # children reached through these edges are shown, but not expanded, so cycles are not repeated
+    marks = traversal.back_edges(adjacency, start_nodes)
+    offsets = adjacency.offsets
 
-    visited = set()
-    graph_dict['start_nodes'] = []
-    for node in graph.get_nodes():
-        if node not in visited:
-            graph_dict['start_nodes'].append(node_table[node.id])
-            __bfs(graph, node, visited)
+    # since tree view doesn't show edge data, we will leave it out and embed it into (copied) nodes
+    graph_dict = {'nodes': [dict(node) for node in shared_dict['nodes']]}
+    for index, node in enumerate(graph_dict['nodes']):
+        children = adjacency.successors(index)
+        if children:
+            node['children'] = children.tolist()
+            if marks.find(1, offsets[index], offsets[index + 1]) >= 0:
+                node['back_edges'] = [child for child, mark in zip(children, marks[offsets[index]:offsets[index + 1]]) if mark]
 
-    graph_dict.pop('edges')
+    graph_dict['start_nodes'] = start_nodes
 
     return graph_dict
-
-
-def __bfs(graph: Graph, start_node: Node, visited: Set[Node]) -> None:
-    queue = deque([start_node])
-    while queue:
-        node = queue.popleft()
-        visited.add(node)
-        for edge in graph.get_incident_edges(node):
-            if edge.destination not in visited:
-                queue.append(edge.destination)
\ No newline at end of file
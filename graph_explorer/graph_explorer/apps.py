@@ -1,4 +1,7 @@
+import atexit
+
 from django.apps import AppConfig
+from django.conf import settings
 from visualizer.core.platform.platform import Platform
 from visualizer.core.service.plugin_service import PluginService
 
@@ -9,8 +12,12 @@ class GraphExplorerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'graph_explorer'
     plugin_service = PluginService()
-    platform = Platform(plugin_service)
+    platform: Platform = None
 
     def ready(self):
         self.plugin_service.load_plugins(datasource_group)
-        self.plugin_service.load_plugins(visualizer_group)
\ No newline at end of file
+        self.plugin_service.load_plugins(visualizer_group)
+        # built once the plugins are loaded, since restored workspaces look up their data source plugins
+        self.platform = Platform(self.plugin_service, getattr(settings, 'GRAPH_SNAPSHOT_DIR', None),
+                                 getattr(settings, 'GRAPH_JOURNAL_DIR', None))
+        atexit.register(self.platform.close)
\ No newline at end of file
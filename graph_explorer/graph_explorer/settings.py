@@ -122,3 +122,16 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Directory for snapshot files of loaded graphs, so reloading a graph (also after a restart)
+# does not parse its data file again, e.g. BASE_DIR / 'snapshots'. The files are pickle-backed,
+# so only a directory no one else can write to may be used. None disables snapshots.
+
+GRAPH_SNAPSHOT_DIR = None
+
+# Directory for the journals of the commands run in workspaces, with snapshots of their graphs,
+# so the workspaces are restored after a restart, e.g. BASE_DIR / 'journal'. The snapshots are
+# pickle-backed, so only a directory no one else can write to may be used. None keeps
+# workspaces in memory only.
+
+GRAPH_JOURNAL_DIR = None
@@ -0,0 +1,82 @@
+import sys
+import threading
+from typing import List
+
+from django.apps import apps
+from django.test import Client, SimpleTestCase
+from visualizer.core.command.command_result import CommandStatus
+from visualizer.core.platform.platform import Platform
+
+THREAD_COUNT: int = 8
+ROUNDS: int = 20
+
+
+class ConcurrentRequestsTest(SimpleTestCase):
+    """ Hammers the views from many threads at once, like a threaded server would. """
+
+    def setUp(self):
+        self.config = apps.get_app_config('graph_explorer')
+        self.platform = self.config.platform
+        self.config.platform = Platform(self.config.plugin_service)
+        # threads are switched far more often, so races show up within a few requests
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+        self.config.platform.close()
+        self.config.platform = self.platform
+
+    def run_threads(self, target) -> List[str]:
+        errors: List[str] = []
+        barrier = threading.Barrier(THREAD_COUNT, timeout=60)
+
+        def run(thread_index: int) -> None:
+            client = Client(raise_request_exception=True)
+            barrier.wait()
+            try:
+                for round_index in range(ROUNDS):
+                    responses = target(client, thread_index, round_index)
+                    errors.extend(
+                        f"{response.request['PATH_INFO']}: {response.status_code}"
+                        for response in responses if response.status_code != 200
+                    )
+            except Exception as e:
+                errors.append(repr(e))
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(THREAD_COUNT)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_concurrent_commands_and_workspace_switching(self):
+        failed_commands: List[str] = []
+
+        def hammer(client: Client, thread_index: int, round_index: int):
+            if thread_index % 2:
+                # every thread deletes a workspace only after creating one, so one always remains
+                return [
+                    client.post("/create-workspace/"),
+                    client.post("/switch-workspace-back/"),
+                    client.get("/graph-stats/"),
+                    client.post("/delete-workspace/"),
+                    client.post("/switch-workspace-next/"),
+                ]
+            command = f"create node --id=t{thread_index}_{round_index} --property x={round_index}"
+            response = client.post("/execute-command/", {"command": command})
+            if f'terminal-line {CommandStatus.OK.value}' not in response.content.decode():
+                failed_commands.append(command)
+            return [
+                response,
+                client.post("/filter-graph/", {"key": "x", "operator": ">=", "value": "0"}),
+                client.get("/group-graph/", {"key": "x"}),
+                client.post("/reset-views/"),
+            ]
+
+        self.assertEqual(self.run_threads(hammer), [])
+        self.assertEqual(failed_commands, [])
+        platform: Platform = self.config.platform
+        self.assertEqual(len(platform.list_workspaces()), 1)
+        self.assertIn(platform.current_workspace_id, platform.workspaces)
@@ -31,6 +31,9 @@ urlpatterns = [
     path('execute-command/', views.execute_command, name='execute-command'),
     path('filter-graph/', views.filter_graph, name='filter-graph'),
     path('search-graph/', views.search_graph, name='search-graph'),
+    path('reset-views/', views.reset_views, name='reset-views'),
+    path('group-graph/', views.group_graph, name='group-graph'),
+    path('graph-stats/', views.graph_stats, name='graph-stats'),
     path('reload-graph/', views.reload_graph, name='reload-graph'),
 
     path('create-workspace/', views.create_workspace, name='create-workspace'),
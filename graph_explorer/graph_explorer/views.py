@@ -1,6 +1,6 @@
 from django.apps import apps
 from django.core.files.uploadedfile import UploadedFile
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render
 from django.template.loader import render_to_string
 from visualizer.core.command.command_result import CommandResult, CommandStatus
@@ -120,6 +120,37 @@ def search_graph(request):
     return __build_views_response(workspace)
 
 
+def reset_views(_request):
+    workspace: Workspace = __get_workspace()
+    workspace.clear_views()
+    return __build_views_response(workspace)
+
+
+def group_graph(request):
+    key: str = request.GET.get('key', '').strip()
+    if not key:
+        return JsonResponse({"error": "No key provided."}, status=400)
+    workspace: Workspace = __get_workspace()
+    try:
+        counts = workspace.group_graph(key)
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    return JsonResponse({"key": key, "groups": [[__json_value(value), count] for value, count in counts.items()]})
+
+
+def graph_stats(request):
+    key: str = request.GET.get('key', '').strip()
+    workspace: Workspace = __get_workspace()
+    if not key:
+        # the counts of the structure are kept up to date, so they are only read
+        return JsonResponse(workspace.structure_stats())
+    try:
+        stats = workspace.graph_stats(key)
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    return JsonResponse(stats.to_dict())
+
+
 def reload_graph(_request):
     workspace: Workspace = __get_workspace()
     workspace.generate_graph(True)
@@ -134,8 +165,9 @@ def create_workspace(_request):
 
 def delete_workspace(_request):
     platform = apps.get_app_config('graph_explorer').platform
-    current_id = platform.current_workspace_id
-    platform.delete_workspace(current_id)
+    # the current workspace is read and deleted at once, so two requests do not delete the same one
+    with platform.lock:
+        platform.delete_workspace(platform.current_workspace_id)
     return __build_workspace_response(platform)
 
 
@@ -170,6 +202,11 @@ def __get_workspace() -> Workspace:
     return apps.get_app_config('graph_explorer').platform.get_selected_workspace()
 
 
+def __json_value(value):
+    # property values such as dates are not JSON-serializable, so they are sent as strings
+    return value if value is None or isinstance(value, (str, int, float, bool)) else str(value)
+
+
 def __build_cli_response(output: str, status: CommandStatus, trigger: str = None) -> HttpResponse:
     response = HttpResponse(render_to_string('cli_output.html', {
         "output": output,
@@ -5,13 +5,17 @@ from typing import Optional, Any, Dict, List, Tuple
 from visualizer.api.exception.data_source_exception import MissingRequiredParameterError, InvalidParameterValueError
 from visualizer.api.model.edge import Edge
 from visualizer.api.model.graph import Graph
+from visualizer.api.model.id_allocator import IdAllocator, create_id_allocator
 from visualizer.api.model.node import Node
+from visualizer.api.model.storage import create_storage
+from visualizer.api.model.value_pool import intern_value
 from visualizer.api.service.data_source_plugin import DataSourcePlugin
 
 
 class JsonLoader(DataSourcePlugin):
 
-    __slots__ = ['__id_field', '__ref_prefix', '__nodes', '__unresolved_edges']
+    __slots__ = ['__id_field', '__ref_prefix', '__nodes', '__graph_nodes', '__graph_edges', '__unresolved_edges',
+                 '__id_allocator', '__generated_nodes']
 
     CONFIG_PATH: str = os.path.join("..", "..", "config.json")
     DEFAULT_ID_FIELD: str = "@id"
@@ -22,7 +26,11 @@ class JsonLoader(DataSourcePlugin):
         self.__id_field: str
         self.__ref_prefix: str
         self.__nodes: Dict[str, Node] = {}
+        self.__graph_nodes: List[Node] = []
+        self.__graph_edges: List[Edge] = []
         self.__unresolved_edges: List[Tuple[Node, str, str]] = []
+        self.__id_allocator: IdAllocator
+        self.__generated_nodes: List[Node] = []
 
         if not os.path.exists(self.CONFIG_PATH):
             self.__id_field = self.DEFAULT_ID_FIELD
@@ -56,6 +64,10 @@ class JsonLoader(DataSourcePlugin):
             - file_content (str): [Required] The content of the file to load the graph from.
             - ref_prefix (str, optional): A prefix to prepend to all reference IDs in the graph.
             - id_field (str, optional): The field name used to uniquely identify nodes in the graph.
+            - storage (str, optional): The graph storage engine to use ('dict' or 'compact').
+            - id_allocator (str, optional): How IDs are generated for objects without an ID field
+              and for literals ('sequential' or 'uuid'). Sequential IDs are short and the same on
+              every load of the same content. Defaults to 'sequential'.
 
         :type kwargs: any
         :return: A Graph from the data source.
@@ -70,13 +82,22 @@ class JsonLoader(DataSourcePlugin):
         self.__ref_prefix: Optional[str] = kwargs.get("ref_prefix", self.DEFAULT_REF_PREFIX)
         self.__id_field = kwargs.get("id_field", self.DEFAULT_ID_FIELD)
 
-        graph: Graph = Graph()
+        try:
+            graph: Graph = Graph(create_storage(kwargs.get("storage", "dict")))
+            self.__id_allocator = create_id_allocator(kwargs.get("id_allocator", "sequential"))
+        except ValueError as e:
+            raise InvalidParameterValueError(str(e))
         self.__nodes = {}
+        self.__graph_nodes = []
+        self.__graph_edges = []
         self.__unresolved_edges = []
+        self.__generated_nodes = []
 
         try:
-            self.__generate_graph(graph, self.__load_json(file_content))
-            self.__resolve_edges(graph)
+            self.__generate_graph(self.__load_json(file_content))
+            self.__resolve_edges()
+            self.__resolve_id_collisions()
+            graph.bulk_load(self.__graph_nodes, self.__graph_edges)
         except json.JSONDecodeError:
             raise InvalidParameterValueError("Provided file_content is not valid JSON.")
         except ValueError as e:
@@ -101,67 +122,74 @@ class JsonLoader(DataSourcePlugin):
     def __load_json(file: str) -> Any:
         return json.loads(file)
 
-    def __resolve_edges(self, graph: Graph) -> None:
+    def __resolve_edges(self) -> None:
         for node, ref_id, relation_name in self.__unresolved_edges:
             ref_node: Optional[Node] = self.__get_node_by_id(ref_id)
             if not ref_node:
                 raise ValueError(f"invalid reference in JSON: {ref_id}")
-            edge: Edge = Edge(node, ref_node, **{relation_name: True})
-            graph.insert_edge(edge)
+            self.__graph_edges.append(Edge.labeled(node, ref_node, relation_name))
+
+    def __resolve_id_collisions(self) -> None:
+        # generated ids are only unique among themselves, so they must give way to the ids from the input
+        for node in self.__generated_nodes:
+            while node.id in self.__nodes and self.__nodes[node.id] is not node:
+                node.id = self.__id_allocator.allocate()
+
+    def __generate_node(self, **properties) -> Node:
+        node: Node = Node(self.__id_allocator.allocate(), **properties)
+        self.__graph_nodes.append(node)
+        self.__generated_nodes.append(node)
+        return node
 
     def __generate_graph(
         self,
-        graph: Graph,
         parsed_json: Any,
         parent_node: Optional[Node] = None,
         relation_name: Optional[str] = None
     ) -> None:
         match parsed_json:
             case dict():
-                node: Node = Node()
-                graph.insert_node(node)
+                node: Node = self.__generate_node()
                 if parent_node:
-                    edge: Edge = Edge(parent_node, node, **{relation_name: True})
-                    graph.insert_edge(edge)
+                    self.__graph_edges.append(Edge.labeled(parent_node, node, relation_name))
 
                 for key, value in parsed_json.items():
-                    self.__parse_dict_pair(graph, node, key, value)
+                    self.__parse_dict_pair(node, key, value)
             case list():
                 for item in parsed_json:
-                    self.__generate_graph(graph, item, parent_node, relation_name)
+                    self.__generate_graph(item, parent_node, relation_name)
             case _:
                 if self.__is_reference(parsed_json):
-                    self.__parse_reference(graph, parent_node, relation_name, parsed_json)
+                    self.__parse_reference(parent_node, relation_name, parsed_json)
                     return
 
-                literal_node: Node = Node(None, type="literal", value=parsed_json)
-                graph.insert_node(literal_node)
-                graph.insert_edge(Edge(parent_node, literal_node, **{relation_name: True}))
+                literal_node: Node = self.__generate_node(type="literal", value=intern_value(parsed_json))
+                self.__graph_edges.append(Edge.labeled(parent_node, literal_node, relation_name))
 
-    def __parse_dict_pair(self, graph: Graph, node: Node, key: str, value: Any) -> None:
+    def __parse_dict_pair(self, node: Node, key: str, value: Any) -> None:
         if key == self.id:
-            graph.update_node_id(node.id, value)
+            # The node is not in the graph yet, so its generated id can be replaced directly.
+            node.id = value
             self.__insert_node(value, node)
             return
 
         if self.__is_reference(value):
-            self.__parse_reference(graph, node, key, value)
+            self.__parse_reference(node, key, value)
             return
 
         if isinstance(value, dict) or isinstance(value, list):
-            self.__generate_graph(graph, value, node, key)
+            self.__generate_graph(value, node, key)
         else:
-            node.add_property(key, value)
+            node.add_property(key, intern_value(value))
 
-    def __parse_reference(self, graph: Graph, parent_node: Node, key: str, value: str) -> None:
+    def __parse_reference(self, parent_node: Node, key: str, value: str) -> None:
         ref_id: str = self.__get_reference_id(value)
         ref_node: Optional[Node] = self.__get_node_by_id(ref_id)
         if not ref_node:
             self.__insert_unresolved_edge(parent_node, ref_id, key)
             return
 
-        edge: Edge = Edge(parent_node, ref_node, **{key: True})
-        graph.insert_edge(edge)
+        self.__graph_edges.append(Edge.labeled(parent_node, ref_node, key))
 
     def __get_reference_id(self, value: str) -> str:
         return value[len(self.ref_prefix):]
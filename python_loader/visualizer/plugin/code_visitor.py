@@ -1,20 +1,23 @@
 import ast
 from _ast import FunctionDef, Call, ClassDef, expr
 from ast import NodeVisitor
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 from visualizer.api.model.edge import Edge
 from visualizer.api.model.graph import Graph
 from visualizer.api.model.node import Node
+from visualizer.api.model.value_pool import intern_value
 
 
 class CodeVisitor(NodeVisitor):
 
-    __slots__ = ["__graph", "__current_function"]
+    __slots__ = ["__graph", "__current_function", "__nodes", "__edges"]
 
     def __init__(self) -> None:
         self.__graph: Graph = Graph()
         self.__current_function: Optional[Node] = None
+        self.__nodes: Dict[str, Node] = {}
+        self.__edges: List[Edge] = []
 
     @property
     def graph(self) -> Graph:
@@ -24,15 +27,26 @@ class CodeVisitor(NodeVisitor):
     def graph(self, graph: Graph) -> None:
         self.__graph = graph
 
+    def build(self, tree: ast.AST) -> None:
+        """
+        Visit the tree and bulk load the collected nodes and edges into the graph.
+
+        :param tree: The parsed module to visit.
+        """
+        self.__current_function = None
+        self.__nodes = {}
+        self.__edges = []
+        self.visit(tree)
+        self.__graph.bulk_load(self.__nodes.values(), self.__edges)
+
     def visit_ClassDef(self, node: ClassDef) -> Any:
-        class_node = Node(f"class_{node.name}")
-        if not self.__graph.contains_node(class_node):
-            class_node.add_properties({"name": node.name})
-            self.__graph.insert_node(class_node)
+        class_node: Optional[Node] = self.__nodes.get(f"class_{node.name}")
+        if not class_node:
+            class_node = Node(f"class_{node.name}", name=intern_value(node.name))
+            self.__nodes[class_node.id] = class_node
 
         if self.__current_function:
-            edge = Edge(self.__current_function, class_node, defines=True)
-            self.__graph.insert_edge(edge)
+            self.__edges.append(Edge.labeled(self.__current_function, class_node, "defines"))
 
         previous_function = self.__current_function
         self.__current_function = class_node
@@ -40,17 +54,17 @@ class CodeVisitor(NodeVisitor):
         self.__current_function = previous_function
 
     def visit_FunctionDef(self, node: FunctionDef) -> Any:
-        function_node: Node = Node(f"fn_{node.name}")
-        if not self.__graph.contains_node(function_node):
-            function_node.add_properties({ "name": node.name,  "args" : [arg.arg for arg in node.args.args]})
+        function_node: Optional[Node] = self.__nodes.get(f"fn_{node.name}")
+        if not function_node:
+            function_node = Node(f"fn_{node.name}")
+            function_node.add_properties({ "name": intern_value(node.name),  "args" : [intern_value(arg.arg) for arg in node.args.args]})
             if node.returns:
                 return_type = ast.unparse(node.returns)
-                function_node.add_property("return_type", return_type)
-            self.__graph.insert_node(function_node)
+                function_node.add_property("return_type", intern_value(return_type))
+            self.__nodes[function_node.id] = function_node
 
         if self.__current_function:
-            edge: Edge = Edge(self.__current_function, function_node, defines=True)
-            self.__graph.insert_edge(edge)
+            self.__edges.append(Edge.labeled(self.__current_function, function_node, "defines"))
 
         previous_function = self.__current_function
         self.__current_function = function_node
@@ -59,15 +73,14 @@ class CodeVisitor(NodeVisitor):
 
     def visit_Call(self, node: Call) -> Any:
         function_name: str = self.__get_function_name(node.func)
-        call_node: Optional[Node] = self.__graph.get_node(function_name)
+        call_node: Optional[Node] = self.__nodes.get(function_name)
 
         if not call_node:
             call_node = Node(function_name)
-            self.__graph.insert_node(call_node)
+            self.__nodes[function_name] = call_node
 
         if self.__current_function:
-            edge: Edge = Edge(self.__current_function, call_node, calls=True)
-            self.graph.insert_edge(edge)
+            self.__edges.append(Edge.labeled(self.__current_function, call_node, "calls"))
 
         self.generic_visit(node)
 
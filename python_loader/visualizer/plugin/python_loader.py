@@ -4,6 +4,7 @@ from typing import Optional
 
 from visualizer.api.exception.data_source_exception import MissingRequiredParameterError, InvalidParameterValueError
 from visualizer.api.model.graph import Graph
+from visualizer.api.model.storage import create_storage
 from visualizer.api.service.data_source_plugin import DataSourcePlugin
 from visualizer.plugin.code_visitor import CodeVisitor
 
@@ -18,12 +19,15 @@ class PythonLoader(DataSourcePlugin):
         if not file_content:
             raise MissingRequiredParameterError("file_content must be provided")
 
-        self.__visitor.graph = Graph()
+        try:
+            self.__visitor.graph = Graph(create_storage(kwargs.get('storage', 'dict')))
+        except ValueError as e:
+            raise InvalidParameterValueError(str(e))
         try:
             tree = ast.parse(file_content)
         except SyntaxError:
             raise InvalidParameterValueError(f"Provided file_content is not valid Python code.")
-        self.__visitor.visit(tree)
+        self.__visitor.build(tree)
         return self.__visitor.graph
 
     def identifier(self) -> str:
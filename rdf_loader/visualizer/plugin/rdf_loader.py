@@ -6,6 +6,8 @@ from visualizer.api.exception.data_source_exception import MissingRequiredParame
 from visualizer.api.model.graph import Graph
 from visualizer.api.model.node import Node
 from visualizer.api.model.edge import Edge
+from visualizer.api.model.storage import create_storage
+from visualizer.api.model.value_pool import intern_value
 from visualizer.api.service.data_source_plugin import DataSourcePlugin
 
 class RDFLoader(DataSourcePlugin):
@@ -13,15 +15,20 @@ class RDFLoader(DataSourcePlugin):
     def __init__(self):
         self._graph = Graph()
         self._nodes_by_uri = {}
+        self._edges = []
 
     def load(self, **kwargs) -> Graph:
-        self._graph.clear()
         self._nodes_by_uri.clear()
+        self._edges = []
 
         file_content: Optional[str] = kwargs.get("file_content", None)
         if not file_content:
             raise MissingRequiredParameterError("file_content must be provided")
         rdf_format: str = kwargs.get("rdf_format", "turtle")
+        try:
+            self._graph = Graph(create_storage(kwargs.get("storage", "dict")))
+        except ValueError as e:
+            raise InvalidParameterValueError(str(e))
 
         rdf_graph = RDFGraph()
         try:
@@ -33,7 +40,7 @@ class RDFLoader(DataSourcePlugin):
             subj_node = self._get_or_create_node(subj)
 
             if pred == RDF.type and isinstance(obj, URIRef):
-                subj_node.add_property("type", str(obj))
+                subj_node.add_property("type", intern_value(str(obj)))
                 continue
 
             try:
@@ -45,7 +52,7 @@ class RDFLoader(DataSourcePlugin):
 
             if isinstance(obj, Literal):
                 try:
-                    subj_node.add_property(pred_name, obj.value)
+                    subj_node.add_property(pred_name, intern_value(obj.value))
                 except Exception as e:
                     raise InvalidParameterValueError(
                         f"Failed to add literal property '{pred_name}' to node '{subj}': {e}"
@@ -53,21 +60,22 @@ class RDFLoader(DataSourcePlugin):
             elif isinstance(obj, URIRef):
                 try:
                     obj_node = self._get_or_create_node(obj)
-                    edge = Edge(subj_node, obj_node, predicate=pred_name)
-                    self._graph.insert_edge(edge)
+                    self._edges.append(Edge.labeled(subj_node, obj_node, "predicate", pred_name))
                 except Exception as e:
                     raise InvalidParameterValueError(
                         f"Failed to create edge from '{subj}' to '{obj}' with predicate '{pred_name}': {e}"
                     )
 
+        try:
+            self._graph.bulk_load(self._nodes_by_uri.values(), self._edges)
+        except Exception as e:
+            raise InvalidParameterValueError(f"Failed to build graph from RDF content: {e}")
         return self._graph
 
     def _get_or_create_node(self, uri: URIRef) -> Node:
         uri_str = str(uri)
         if uri_str not in self._nodes_by_uri:
-            node = Node(uri_str)
-            self._graph.insert_node(node)
-            self._nodes_by_uri[uri_str] = node
+            self._nodes_by_uri[uri_str] = Node(uri_str)
         return self._nodes_by_uri[uri_str]
 
     def identifier(self) -> str:
@@ -1,6 +1,7 @@
 import os
 import sys
 from typing import Tuple, List
+from weakref import WeakKeyDictionary
 
 from jinja2 import Template
 from visualizer.api.model.edge import EdgeDict
@@ -10,6 +11,10 @@ from visualizer.api.service.visualizer_plugin import VisualizerPlugin
 
 class SimpleVisualizer(VisualizerPlugin):
 
+    def __init__(self) -> None:
+        # prepared data keyed by graph, valid as long as the graph's version does not change
+        self.__prepared: WeakKeyDictionary[Graph, Tuple[int, GraphDict]] = WeakKeyDictionary()
+
     def visualize(self, graph: Graph, **kwargs) -> Tuple[str, str]:
         with open(os.path.join(sys.prefix, 'templates/simple_visualizer_head_template.html'), 'r', encoding='utf-8') as file:
             head = file.read()
@@ -19,13 +24,24 @@ class SimpleVisualizer(VisualizerPlugin):
         if not graph or graph.is_empty():
             return head, ""
 
-        graph_dict: GraphDict = graph.to_dict()
-        self.__modify_data(graph_dict)
+        graph_dict: GraphDict = self.__prepare_data(graph)
 
         body = Template(body_template).render(graph=graph_dict, **kwargs)
 
         return head, body
 
+    def __prepare_data(self, graph: Graph) -> GraphDict:
+        prepared = self.__prepared.get(graph)
+        if prepared is not None and prepared[0] == graph.version:
+            return prepared[1]
+
+        # the graph's dictionary is shared, so the edges are copied before they are modified
+        shared_dict: GraphDict = graph.to_dict()
+        graph_dict: GraphDict = {'nodes': shared_dict['nodes'], 'edges': [dict(edge) for edge in shared_dict['edges']]}
+        self.__modify_data(graph_dict)
+        self.__prepared[graph] = (graph.version, graph_dict)
+        return graph_dict
+
     def identifier(self) -> str:
         return "simple_visualizer"
 